@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-19 12:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analysis', '0007_add_technical_contribution'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='signalattribution',
+            name='idx_sigattr_outcome_date',
+        ),
+        migrations.AddIndex(
+            model_name='signalattribution',
+            index=models.Index(fields=['outcome', 'recorded_at', 'asset_class', 'strategy'], name='idx_sigattr_outcome_window'),
+        ),
+    ]
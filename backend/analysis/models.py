@@ -359,9 +359,11 @@ class SignalAttribution(models.Model):
                 fields=["strategy", "asset_class", "-recorded_at"],
                 name="idx_sigattr_strat_asset",
             ),
+            # Resolved-outcome window scans, optionally per asset class and
+            # strategy (SignalFeedbackService.get_source_accuracy)
             models.Index(
-                fields=["outcome", "-recorded_at"],
-                name="idx_sigattr_outcome_date",
+                fields=["outcome", "recorded_at", "asset_class", "strategy"],
+                name="idx_sigattr_outcome_window",
             ),
         ]
 
@@ -45,8 +45,10 @@ class MLService:
         except ImportError as e:
             return {"error": f"ML modules not available: {e}"}
 
+        # symbol keys the cached feature selection across retrains
         x_feat, y_target, feature_names = build_feature_matrix(
-            df, include_temporal=True, include_volatility_regime=True,
+            df, config={"symbol": symbol},
+            include_temporal=True, include_volatility_regime=True,
         )
         if len(x_feat) < 100:
             return {"error": f"Insufficient data: {len(x_feat)} rows (need >= 100)"}
@@ -57,6 +59,12 @@ class MLService:
             test_ratio=test_ratio, fit_calibration=True,
         )
 
+        # Warm-start retraining resumes from the last labeled bar
+        result["metadata"]["exchange"] = exchange
+        last_ts = x_feat.index[-1] if hasattr(x_feat, "index") else None
+        if hasattr(last_ts, "isoformat"):
+            result["metadata"]["data_end"] = last_ts.isoformat()
+
         progress_cb(0.8, "Saving model...")
         registry = ModelRegistry()
         model_id = registry.save_model(
@@ -67,6 +75,7 @@ class MLService:
             symbol=symbol,
             timeframe=timeframe,
             label=f"{asset_class}_{symbol}",
+            lineage={"mode": "full", "parent_model_id": None, "rows_added": len(x_feat)},
         )
 
         progress_cb(1.0, "Complete")
@@ -77,6 +86,133 @@ class MLService:
             "metrics": result["metrics"],
         }
 
+    @staticmethod
+    def train_incremental(params: dict, progress_cb: Callable) -> dict:
+        """Warm-start a LightGBM model on bars appended since it was trained.
+
+        Falls back to a full train() when there is no usable parent model
+        (none saved, not LightGBM, no ``data_end`` recorded, feature mismatch).
+
+        Params:
+            parent_model_id: Model to continue from (default: newest LightGBM
+                model for symbol/timeframe)
+            symbol, timeframe, exchange, asset_class, test_ratio: as for train()
+            min_new_rows: Minimum new labeled rows to update (default 12)
+        """
+        ensure_platform_imports()
+
+        symbol = params.get("symbol", "BTC/USDT")
+        timeframe = params.get("timeframe", "1h")
+        min_new_rows = params.get("min_new_rows", 12)
+
+        try:
+            import pandas as pd
+
+            from common.data_pipeline.pipeline import load_ohlcv
+            from common.ml.features import build_feature_matrix
+            from common.ml.registry import ModelRegistry
+            from common.ml.trainer import train_incremental
+        except ImportError as e:
+            return {"error": f"ML modules not available: {e}"}
+
+        registry = ModelRegistry()
+        parent_id = params.get("parent_model_id") or MLService._latest_model_id(
+            registry, symbol, timeframe,
+        )
+        manifest = registry.get_model_detail(parent_id) if parent_id else None
+        parent_meta = (manifest or {}).get("metadata", {})
+        if (
+            not manifest
+            or manifest.get("model_format", "lightgbm") != "lightgbm"
+            or not parent_meta.get("data_end")
+            or not parent_meta.get("feature_names")
+        ):
+            logger.info("No warm-start parent for %s %s — full retrain", symbol, timeframe)
+            return {**MLService.train(params, progress_cb), "mode": "full"}
+
+        symbol = manifest.get("symbol") or symbol
+        timeframe = manifest.get("timeframe") or timeframe
+        exchange = parent_meta.get("exchange") or params.get("exchange", "kraken")
+        data_end = pd.Timestamp(parent_meta["data_end"])
+        feature_names = parent_meta["feature_names"]
+
+        progress_cb(0.1, "Loading data...")
+        df = load_ohlcv(symbol, timeframe, exchange)
+        if df.empty:
+            return {"error": f"No data for {symbol} {timeframe} on {exchange}"}
+
+        progress_cb(0.3, "Building features for new bars...")
+        x_new, y_new, names = build_feature_matrix(
+            df, config={"max_features": 0}, since=data_end,
+            include_temporal=True, include_volatility_regime=True,
+        )
+        if len(x_new) < min_new_rows:
+            progress_cb(1.0, "No new data")
+            return {
+                "model_id": parent_id,
+                "symbol": symbol,
+                "timeframe": timeframe,
+                "mode": "unchanged",
+                "rows_added": 0,
+            }
+        if set(feature_names) - set(names):
+            logger.info("Feature set changed since %s — full retrain", parent_id)
+            return {**MLService.train(params, progress_cb), "mode": "full"}
+
+        progress_cb(0.5, "Continuing boosting from parent model...")
+        parent_model, _ = registry.load_model(parent_id)
+        result = train_incremental(
+            parent_model, x_new, y_new, feature_names,
+            params=parent_meta.get("params"),
+            parent_metrics=manifest.get("metrics", {}),
+        )
+
+        metadata = {
+            **parent_meta,
+            **result["metadata"],
+            "data_end": x_new.index[-1].isoformat(),
+        }
+
+        progress_cb(0.8, "Saving model...")
+        model_id = registry.save_model(
+            model=result["model"],
+            metrics=result["metrics"],
+            metadata=metadata,
+            feature_importance=result["feature_importance"],
+            symbol=symbol,
+            timeframe=timeframe,
+            label=manifest.get("label", ""),
+            lineage={
+                "mode": "incremental",
+                "parent_model_id": parent_id,
+                "rows_added": len(x_new),
+            },
+        )
+
+        progress_cb(1.0, "Complete")
+        return {
+            "model_id": model_id,
+            "symbol": symbol,
+            "timeframe": timeframe,
+            "mode": "incremental",
+            "parent_model_id": parent_id,
+            "rows_added": len(x_new),
+            "metrics": result["metrics"],
+        }
+
+    @staticmethod
+    def _latest_model_id(registry, symbol: str, timeframe: str) -> str | None:
+        """Newest LightGBM model trained on symbol/timeframe, if any."""
+        sym_clean = symbol.replace("/", "")
+        for m in registry.list_models():  # newest first
+            if (
+                m.get("symbol", "").replace("/", "") == sym_clean
+                and m.get("timeframe") == timeframe
+                and m.get("model_format", "lightgbm") == "lightgbm"
+            ):
+                return m["model_id"]
+        return None
+
     @staticmethod
     def predict(params: dict) -> dict:
         """Generate predictions from a trained model.
@@ -4,7 +4,10 @@ Bridges the common.signals feedback/tracker with Django ORM persistence
 and provides methods for API views and task executors.
 """
 
+import copy
 import logging
+import threading
+import time
 from datetime import timedelta
 from typing import Any
 
@@ -15,6 +18,23 @@ from core.platform_bridge import ensure_platform_imports
 
 logger = logging.getLogger(__name__)
 
+# get_source_accuracy results: (asset_class, strategy, window_days) ->
+# (monotonic time, result). Cleared whenever attributions are resolved; the
+# TTL bounds drift from the sliding window and from resolutions recorded by
+# other processes.
+ACCURACY_CACHE_TTL_SECONDS = 300.0
+_accuracy_cache: dict[tuple, tuple[float, dict[str, Any]]] = {}
+_accuracy_cache_lock = threading.Lock()
+_accuracy_generation = 0
+
+
+def clear_source_accuracy_cache() -> None:
+    """Drop cached source accuracy; call after resolving attribution outcomes."""
+    global _accuracy_generation
+    with _accuracy_cache_lock:
+        _accuracy_cache.clear()
+        _accuracy_generation += 1
+
 
 class SignalFeedbackService:
     """Django-side service for signal attribution and feedback."""
@@ -112,6 +132,8 @@ class SignalFeedbackService:
             except Exception as e:
                 logger.warning("Backfill failed for attr %s: %s", attr.id, e)
 
+        if resolved:
+            clear_source_accuracy_cache()
         logger.info("Backfilled %d attribution outcomes", resolved)
         return {"resolved": resolved, "checked": len(open_attrs)}
 
@@ -308,6 +330,8 @@ class SignalFeedbackService:
                 )
                 errors += 1
 
+        if created:
+            clear_source_accuracy_cache()
         logger.info(
             "Freqtrade attribution bridge: created=%d, skipped=%d, errors=%d",
             created, skipped, errors,
@@ -323,11 +347,22 @@ class SignalFeedbackService:
         """Compute per-source accuracy from resolved SignalAttribution records.
 
         Returns accuracy stats for each signal source (ml, sentiment, regime, etc).
+        All counts and averages come from a single conditional-aggregate query;
+        results are cached per (asset_class, strategy, window_days) until an
+        attribution is resolved (see :func:`clear_source_accuracy_cache`).
         """
-        from django.db.models import Avg
+        from django.db.models import Avg, Count, Q
 
         from analysis.models import SignalAttribution
 
+        cache_key = (asset_class, strategy, window_days)
+        now = time.monotonic()
+        with _accuracy_cache_lock:
+            cached = _accuracy_cache.get(cache_key)
+            if cached and now - cached[0] < ACCURACY_CACHE_TTL_SECONDS:
+                return copy.deepcopy(cached[1])
+            generation = _accuracy_generation
+
         cutoff = tz.now() - timedelta(days=window_days)
         qs = SignalAttribution.objects.filter(
             outcome__in=["win", "loss"],
@@ -338,34 +373,40 @@ class SignalFeedbackService:
         if strategy:
             qs = qs.filter(strategy=strategy)
 
-        total = qs.count()
-        wins = qs.filter(outcome="win").count()
-        win_rate = wins / total if total > 0 else 0.0
-
-        # Per-source average scores for wins vs losses
+        # Per-source average scores for wins vs losses, and how often each
+        # source contributed at all
         sources = ["technical", "ml", "sentiment", "regime", "scanner", "win_rate"]
-        source_stats: dict[str, Any] = {}
-
+        won = Q(outcome="win")
+        aggregates: dict[str, Any] = {
+            "total": Count("pk"),
+            "wins": Count("pk", filter=won),
+        }
         for src in sources:
             field_name = f"{src}_contribution"
-            win_avg = qs.filter(outcome="win").aggregate(
-                avg=Avg(field_name),
-            )["avg"]
-            loss_avg = qs.filter(outcome="loss").aggregate(
-                avg=Avg(field_name),
-            )["avg"]
-            src_total = qs.filter(**{f"{field_name}__gt": 0}).count()
-            src_wins = qs.filter(**{f"{field_name}__gt": 0}, outcome="win").count()
+            contributed = Q(**{f"{field_name}__gt": 0})
+            aggregates[f"{src}_win_avg"] = Avg(field_name, filter=won)
+            aggregates[f"{src}_loss_avg"] = Avg(field_name, filter=Q(outcome="loss"))
+            aggregates[f"{src}_total"] = Count("pk", filter=contributed)
+            aggregates[f"{src}_wins"] = Count("pk", filter=contributed & won)
+        row = qs.aggregate(**aggregates)
+
+        total = row["total"]
+        wins = row["wins"]
+        win_rate = wins / total if total > 0 else 0.0
 
+        source_stats: dict[str, Any] = {}
+        for src in sources:
+            src_total = row[f"{src}_total"]
+            src_wins = row[f"{src}_wins"]
             source_stats[src] = {
                 "total_trades": src_total,
                 "wins": src_wins,
                 "win_rate": src_wins / src_total if src_total > 0 else 0.0,
-                "avg_score_win": round(win_avg or 0.0, 2),
-                "avg_score_loss": round(loss_avg or 0.0, 2),
+                "avg_score_win": round(row[f"{src}_win_avg"] or 0.0, 2),
+                "avg_score_loss": round(row[f"{src}_loss_avg"] or 0.0, 2),
             }
 
-        return {
+        result = {
             "total_trades": total,
             "wins": wins,
             "overall_win_rate": round(win_rate, 4),
@@ -374,6 +415,11 @@ class SignalFeedbackService:
             "strategy": strategy,
             "sources": source_stats,
         }
+        with _accuracy_cache_lock:
+            # Don't cache a result computed before a concurrent resolution
+            if generation == _accuracy_generation:
+                _accuracy_cache[cache_key] = (now, copy.deepcopy(result))
+        return result
 
     @staticmethod
     def get_weight_recommendations(
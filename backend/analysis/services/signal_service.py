@@ -126,18 +126,17 @@ class SignalService:
                 logger.debug("No OHLCV data for ML prediction: %s", symbol)
                 return None, None
 
-            X, _y, _feature_names = build_feature_matrix(  # noqa: N806
+            # Only the final bar is needed — build it from the trailing lookback
+            X_latest, _y, _feature_names = build_feature_matrix(  # noqa: N806
                 df,
                 include_temporal=True,
                 include_volatility_regime=True,
+                mode="latest",
             )
-            if X is None or X.empty:
+            if X_latest is None or X_latest.empty:
                 logger.debug("Empty feature matrix for ML prediction: %s", symbol)
                 return None, None
 
-            # Use only the latest row for prediction
-            X_latest = X.tail(1)  # noqa: N806
-
             # Try ensemble first (accuracy-weighted, up to 5 models)
             ensemble = ModelEnsemble(mode="accuracy_weighted")
             n_models = ensemble.build_from_registry(
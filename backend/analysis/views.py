@@ -1191,6 +1191,10 @@ class SignalFeedbackView(APIView):
         attr.pnl = ser.validated_data.get("pnl")
         attr.resolved_at = tz.now()
         attr.save(update_fields=["outcome", "pnl", "resolved_at"])
+
+        from analysis.services.signal_feedback import clear_source_accuracy_cache
+
+        clear_source_accuracy_cache()
         return Response(SignalAttributionSerializer(attr).data)
 
 
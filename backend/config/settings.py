@@ -249,6 +249,13 @@ CHANNEL_LAYERS = {
     },
 }
 
+# System event broadcasts (core.services.ws_broadcast) are coalesced per
+# group over this window and sent as one batch frame. 0 sends each event
+# immediately (the default under tests).
+WS_BROADCAST_WINDOW_MS = float(
+    os.environ.get("WS_BROADCAST_WINDOW_MS", "0" if TESTING else "250"),
+)
+
 # ── Static files ──────────────────────────────────────────────
 STATIC_URL = "/static/"
 STATIC_ROOT = BASE_DIR / "staticfiles"
@@ -285,6 +292,19 @@ MAX_JOB_WORKERS = int(os.environ.get("MAX_JOB_WORKERS", "4"))
 
 ORDER_SYNC_TIMEOUT_HOURS = int(os.environ.get("ORDER_SYNC_TIMEOUT_HOURS", "24"))
 
+# Pooled ccxt clients (market.services.exchange_pool): in-flight requests per
+# exchange and how long cached market metadata is trusted before a reload.
+EXCHANGE_MAX_CONCURRENCY = int(os.environ.get("EXCHANGE_MAX_CONCURRENCY", "4"))
+EXCHANGE_MARKETS_TTL_SECONDS = int(os.environ.get("EXCHANGE_MARKETS_TTL_SECONDS", "3600"))
+
+# Ticker WebSocket: at most this many coalesced ticker messages per client
+# per second (market.consumers.MarketTickerConsumer).
+TICKER_MAX_UPDATES_PER_SECOND = float(os.environ.get("TICKER_MAX_UPDATES_PER_SECOND", "2"))
+
+# Latest-price snapshot (market.services.price_store): prices older than this
+# are refetched (one batched fetch_tickers call) before analytics/risk use them.
+PRICE_SNAPSHOT_MAX_AGE_SECONDS = float(os.environ.get("PRICE_SNAPSHOT_MAX_AGE_SECONDS", "30"))
+
 # ── Freqtrade Instances ─────────────────────────────────────
 # 2026-05-22 consolidation: cut 4 strategies after 6 weeks of paper trading.
 # Kept: MomentumScalper15m (3-0 wins), TrendReversal (first close +$0.14),
@@ -348,6 +368,20 @@ FREQTRADE_INSTANCES = [
     },
 ]
 
+# Dashboard polling of the instances above (core.services.freqtrade_pool):
+# status/profit snapshots are reused for the TTL, then served stale while a
+# background refresh runs (up to MAX_STALE). A KPI request waits at most the
+# deadline for an instance before falling back to its last snapshot.
+FREQTRADE_SNAPSHOT_TTL_SECONDS = float(os.environ.get("FREQTRADE_SNAPSHOT_TTL_SECONDS", "10"))
+FREQTRADE_SNAPSHOT_MAX_STALE_SECONDS = float(
+    os.environ.get("FREQTRADE_SNAPSHOT_MAX_STALE_SECONDS", "300"),
+)
+FREQTRADE_POLL_DEADLINE_SECONDS = float(os.environ.get("FREQTRADE_POLL_DEADLINE_SECONDS", "2"))
+
+# Dashboard KPI payloads are reused for this long unless a source model
+# (orders, jobs, predictions, holdings, risk state, ...) is written first.
+DASHBOARD_KPI_CACHE_TTL_SECONDS = float(os.environ.get("DASHBOARD_KPI_CACHE_TTL_SECONDS", "10"))
+
 # ── Scheduler ────────────────────────────────────────────────
 SCHEDULER_ENABLED = os.environ.get("SCHEDULER_ENABLED", "true").lower() in ("true", "1", "yes")
 SCHEDULER_MAX_WORKERS = int(os.environ.get("SCHEDULER_MAX_WORKERS", "2"))
@@ -507,7 +541,7 @@ SCHEDULED_TASKS = {
     },
     "ml_training": {
         "name": "ML Model Training",
-        "description": "Daily LightGBM model training on top crypto symbols",
+        "description": "Daily warm-start LightGBM update on top crypto symbols",
         "task_type": "ml_training",
         "cron_schedule": "0 6 * * *",
         "params": {
@@ -516,6 +550,7 @@ SCHEDULED_TASKS = {
                 "BNB/USDT", "ADA/USDT", "AVAX/USDT", "LINK/USDT", "DOT/USDT",
             ],
             "timeframe": "1h",
+            "incremental": True,
         },
     },
     "ml_feedback": {
@@ -88,6 +88,10 @@ class CoreConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
 
     def ready(self):
+        from core.services.dashboard import connect_kpi_cache_invalidation
+
+        connect_kpi_cache_invalidation()
+
         # Start scheduler once per process.
         # RUN_MAIN is only set by Django's autoreload (runserver).
         # Under Daphne/gunicorn/Docker, it's never set — so we also start
@@ -86,6 +86,7 @@ class DashboardPaperTradingInstanceSerializer(serializers.Serializer):
     pnl = serializers.FloatField()
     open_trades = serializers.IntegerField()
     closed_trades = serializers.IntegerField()
+    data_age_seconds = serializers.FloatField(required=False, allow_null=True)
 
 
 class DashboardPaperTradingKPISerializer(serializers.Serializer):
@@ -1,61 +1,78 @@
 """Dashboard KPI aggregation service."""
 
+import copy
 import logging
-import socket
+import threading
+import time
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from urllib.parse import urlparse
 
-import httpx
+from django.conf import settings
+from django.db.models import Count, Max, Q
 
 from core.platform_bridge import get_processed_dir
 
 logger = logging.getLogger(__name__)
 
-# Cache of unreachable hosts to avoid repeated 4s Docker DNS timeouts.
-# Cleared on module reload (container restart).
-_unreachable_hosts: dict[str, float] = {}
-_UNREACHABLE_TTL = 30.0  # seconds before retrying
-
-
-def _host_reachable(url: str) -> bool:
-    """Fast TCP connect check with timeout that covers DNS resolution."""
-    import time
-
-    parsed = urlparse(url)
-    host = parsed.hostname or ""
-    port = parsed.port or 80
-
-    now = time.monotonic()
-    cache_key = f"{host}:{port}"
-    if cache_key in _unreachable_hosts:
-        if now - _unreachable_hosts[cache_key] < _UNREACHABLE_TTL:
-            return False
-        del _unreachable_hosts[cache_key]
-
-    try:
-        sock = socket.create_connection((host, port), timeout=1.5)
-        sock.close()
-        return True
-    except Exception:
-        _unreachable_hosts[cache_key] = now
-        return False
-
-
-def _ft_get_sync(base_url: str, endpoint: str, username: str, password: str) -> dict:
-    """Synchronous Freqtrade API call — avoids async_to_sync event loop overhead."""
-    try:
-        auth = httpx.BasicAuth(username, password)
-        resp = httpx.get(
-            f"{base_url}/api/v1/{endpoint}",
-            auth=auth,
-            timeout=httpx.Timeout(3.0, connect=1.0),
+# Whole KPI payloads per asset_class filter: asset_class -> (monotonic_ts, kpis).
+# Dropped on saves/deletes of the models the collectors read (see
+# connect_kpi_cache_invalidation); the TTL bounds staleness of external data
+# (Freqtrade, prices) and of bulk writes that send no signals.
+_kpi_cache: dict[str | None, tuple[float, dict]] = {}
+_kpi_cache_lock = threading.Lock()
+_kpi_generation = 0
+
+# Models whose writes change the KPI payload
+KPI_SOURCE_MODELS = [
+    "trading.Order",
+    "analysis.BackgroundJob",
+    "analysis.MLPrediction",
+    "analysis.SignalAttribution",
+    "core.ScheduledTask",
+    "portfolio.Portfolio",
+    "portfolio.Holding",
+    "risk.RiskState",
+    "risk.AlertLog",
+]
+
+
+def clear_kpi_cache(**kwargs) -> None:
+    """Drop cached KPI payloads. Usable as a model signal receiver."""
+    global _kpi_generation
+    with _kpi_cache_lock:
+        _kpi_cache.clear()
+        _kpi_generation += 1
+
+
+def connect_kpi_cache_invalidation() -> None:
+    """Clear the KPI cache whenever a KPI source model is saved or deleted."""
+    from django.apps import apps
+    from django.db.models.signals import post_delete, post_save
+
+    for label in KPI_SOURCE_MODELS:
+        model = apps.get_model(label)
+        post_save.connect(clear_kpi_cache, sender=model, dispatch_uid=f"kpi_cache_save_{label}")
+        post_delete.connect(
+            clear_kpi_cache,
+            sender=model,
+            dispatch_uid=f"kpi_cache_delete_{label}",
         )
-        if resp.status_code == 200:
-            return resp.json()
-    except Exception as e:
-        logger.debug("Freqtrade API sync call failed (%s): %s", endpoint, e)
-    return {}
+
+
+def _freqtrade_instances() -> list:
+    """Freqtrade API endpoints of the enabled paper-trading services."""
+    from core.services.freqtrade_pool import FreqtradeInstance
+    from trading.views import _get_paper_trading_services
+
+    return [
+        FreqtradeInstance(
+            name=name,
+            url=svc._ft_api_url,
+            username=svc._ft_username,
+            password=svc._ft_password,
+        )
+        for name, svc in _get_paper_trading_services().items()
+    ]
 
 
 class DashboardService:
@@ -63,6 +80,31 @@ class DashboardService:
 
     @staticmethod
     def get_kpis(asset_class: str | None = None) -> dict:
+        """KPI payload for the dashboard, served from a short-lived snapshot.
+
+        A snapshot is reused for ``DASHBOARD_KPI_CACHE_TTL_SECONDS`` unless a
+        KPI source model changes first; payloads with a failed collector are
+        not cached.
+        """
+        ttl = getattr(settings, "DASHBOARD_KPI_CACHE_TTL_SECONDS", 10.0)
+        now = time.monotonic()
+        with _kpi_cache_lock:
+            cached = _kpi_cache.get(asset_class)
+            if cached and now - cached[0] < ttl:
+                return copy.deepcopy(cached[1])
+            generation = _kpi_generation
+
+        results, complete = DashboardService._collect_kpis(asset_class)
+        if complete and ttl > 0:
+            with _kpi_cache_lock:
+                # Don't cache a payload computed across a concurrent write
+                if generation == _kpi_generation:
+                    _kpi_cache[asset_class] = (now, copy.deepcopy(results))
+        return results
+
+    @staticmethod
+    def _collect_kpis(asset_class: str | None) -> tuple[dict, bool]:
+        """Run every collector; returns the payload and whether all succeeded."""
         svc = DashboardService
 
         # Pre-fetch portfolio once to avoid 3 redundant queries across collectors
@@ -85,15 +127,17 @@ class DashboardService:
             futures["learning_status"] = pool.submit(svc._get_learning_status)
 
         results = {}
+        complete = True
         for key, future in futures.items():
             try:
                 results[key] = future.result(timeout=30)
             except Exception as e:
                 logger.warning("KPI collector %s failed: %s", key, e)
                 results[key] = {} if key != "activity_feed" else []
+                complete = False
 
         results["generated_at"] = datetime.now(timezone.utc).isoformat()
-        return results
+        return results, complete
 
     @staticmethod
     def _get_portfolio_kpis(portfolio_id: int | None, asset_class: str | None = None) -> dict:
@@ -160,17 +204,26 @@ class DashboardService:
                 )
             else:
                 summary = {}
-            open_orders = Order.objects.filter(
-                status__in=[
-                    OrderStatus.PENDING,
-                    OrderStatus.SUBMITTED,
-                    OrderStatus.OPEN,
-                    OrderStatus.PARTIAL_FILL,
-                ],
-            ).count()
-            total_orders = Order.objects.count()
-            rejected_orders = Order.objects.filter(status=OrderStatus.REJECTED).count()
-            filled_orders = Order.objects.filter(status=OrderStatus.FILLED).count()
+            counts = Order.objects.aggregate(
+                total=Count("pk"),
+                open=Count(
+                    "pk",
+                    filter=Q(
+                        status__in=[
+                            OrderStatus.PENDING,
+                            OrderStatus.SUBMITTED,
+                            OrderStatus.OPEN,
+                            OrderStatus.PARTIAL_FILL,
+                        ],
+                    ),
+                ),
+                rejected=Count("pk", filter=Q(status=OrderStatus.REJECTED)),
+                filled=Count("pk", filter=Q(status=OrderStatus.FILLED)),
+            )
+            open_orders = counts["open"]
+            total_orders = counts["total"]
+            rejected_orders = counts["rejected"]
+            filled_orders = counts["filled"]
             return {
                 "total_trades": summary.get("total_trades", 0),
                 "win_rate": summary.get("win_rate", 0.0),
@@ -241,9 +294,11 @@ class DashboardService:
             "instances": [],
         }
         try:
-            from trading.views import _get_paper_trading_services
+            from core.services.freqtrade_pool import get_freqtrade_pool
 
-            services = _get_paper_trading_services()
+            # All instances are polled concurrently over keep-alive clients;
+            # cached snapshots are served while slow bots catch up.
+            snapshots = get_freqtrade_pool().snapshots(_freqtrade_instances())
             instances = []
             total_pnl = 0.0
             total_pnl_pct = 0.0
@@ -253,48 +308,8 @@ class DashboardService:
             losing = 0
             running_count = 0
 
-            for name, svc in services.items():
-                try:
-                    # Skip instances whose API is unreachable (avoids 4s Docker DNS timeout)
-                    if not _host_reachable(svc._ft_api_url):
-                        raise ConnectionError(f"{name} not reachable")
-
-                    status = svc.get_status()
-                    is_running = status.get("running", False)
-                    if is_running:
-                        running_count += 1
-
-                    # Synchronous httpx call — avoids async_to_sync overhead
-                    # (creating a new event loop) inside a thread pool worker.
-                    profit = _ft_get_sync(
-                        svc._ft_api_url, "profit",
-                        svc._ft_username, svc._ft_password,
-                    )
-
-                    pnl = profit.get("profit_all_coin", 0) or 0
-                    pnl_pct = profit.get("profit_all_percent", 0) or 0
-                    trade_count = profit.get("trade_count", 0) or 0
-                    closed_count = profit.get("closed_trade_count", 0) or 0
-                    wins = profit.get("winning_trades", 0) or 0
-                    losses = profit.get("losing_trades", 0) or 0
-
-                    total_pnl += pnl
-                    total_pnl_pct += pnl_pct
-                    open_trades += max(trade_count - closed_count, 0)
-                    closed_trades += closed_count
-                    winning += wins
-                    losing += losses
-
-                    instances.append({
-                        "name": name,
-                        "running": is_running,
-                        "strategy": status.get("strategy"),
-                        "pnl": round(pnl, 2),
-                        "open_trades": max(trade_count - closed_count, 0),
-                        "closed_trades": closed_count,
-                    })
-                except Exception as e:
-                    logger.debug("Paper trading instance %s unavailable: %s", name, e)
+            for name, snapshot in snapshots.items():
+                if snapshot is None or not snapshot.reachable:
                     instances.append({
                         "name": name,
                         "running": False,
@@ -302,7 +317,37 @@ class DashboardService:
                         "pnl": 0.0,
                         "open_trades": 0,
                         "closed_trades": 0,
+                        "data_age_seconds": (
+                            round(snapshot.age_seconds, 1) if snapshot is not None else None
+                        ),
                     })
+                    continue
+
+                running_count += 1
+                profit = snapshot.profit
+                pnl = profit.get("profit_all_coin", 0) or 0
+                pnl_pct = profit.get("profit_all_percent", 0) or 0
+                trade_count = profit.get("trade_count", 0) or 0
+                closed_count = profit.get("closed_trade_count", 0) or 0
+                wins = profit.get("winning_trades", 0) or 0
+                losses = profit.get("losing_trades", 0) or 0
+
+                total_pnl += pnl
+                total_pnl_pct += pnl_pct
+                open_trades += max(trade_count - closed_count, 0)
+                closed_trades += closed_count
+                winning += wins
+                losing += losses
+
+                instances.append({
+                    "name": name,
+                    "running": True,
+                    "strategy": snapshot.config.get("strategy", "unknown"),
+                    "pnl": round(pnl, 2),
+                    "open_trades": max(trade_count - closed_count, 0),
+                    "closed_trades": closed_count,
+                    "data_age_seconds": round(snapshot.age_seconds, 1),
+                })
 
             # Include forex paper trading P&L
             try:
@@ -417,43 +462,33 @@ class DashboardService:
             # Job stats
             from analysis.models import BackgroundJob
 
-            default["total_jobs_completed"] = BackgroundJob.objects.filter(
-                status="completed",
-            ).count()
-            default["total_jobs_failed"] = BackgroundJob.objects.filter(
-                status="failed",
-            ).count()
+            job_counts = BackgroundJob.objects.aggregate(
+                completed=Count("pk", filter=Q(status="completed")),
+                failed=Count("pk", filter=Q(status="failed")),
+            )
+            default["total_jobs_completed"] = job_counts["completed"]
+            default["total_jobs_failed"] = job_counts["failed"]
 
-            # Freqtrade instances (list of dicts in settings)
+            # Freqtrade instances (list of dicts in settings), from the shared
+            # snapshots the paper-trading KPIs use
             from django.conf import settings as django_settings
 
-            import requests as req_lib
+            from core.services.freqtrade_pool import get_freqtrade_pool
 
             ft_instances = getattr(django_settings, "FREQTRADE_INSTANCES", [])
-            ft_user = getattr(django_settings, "FREQTRADE_API_URL", "")
-            ft_creds = (
-                getattr(django_settings, "FREQTRADE_USERNAME", ""),
-                getattr(django_settings, "FREQTRADE_PASSWORD", ""),
+            polled = {
+                cfg.get("name") for cfg in ft_instances if cfg.get("enabled") and cfg.get("url")
+            }
+            snapshots = get_freqtrade_pool().snapshots(
+                [i for i in _freqtrade_instances() if i.name in polled],
             )
             for cfg in ft_instances:
                 name = cfg.get("name", "unknown")
-                port = cfg.get("port", 0)
-                url = cfg.get("url", "")
-                running = False
-                if cfg.get("enabled") and url and _host_reachable(url):
-                    try:
-                        r = req_lib.get(
-                            f"{url}/api/v1/ping",
-                            auth=ft_creds,
-                            timeout=(1, 2),
-                        )
-                        running = r.status_code == 200
-                    except Exception:
-                        pass
+                snapshot = snapshots.get(name)
                 default["freqtrade_instances"].append({
                     "name": name,
-                    "port": port,
-                    "running": running,
+                    "port": cfg.get("port", 0),
+                    "running": snapshot is not None and snapshot.reachable,
                     "enabled": cfg.get("enabled", False),
                 })
 
@@ -534,14 +569,15 @@ class DashboardService:
         try:
             from analysis.models import MLPrediction
 
-            total = MLPrediction.objects.count()
-            default["ml_predictions_total"] = total
-            if total > 0:
-                correct = MLPrediction.objects.filter(outcome="correct").count()
-                incorrect = MLPrediction.objects.filter(outcome="incorrect").count()
-                decided = correct + incorrect
-                if decided > 0:
-                    default["ml_accuracy"] = round(correct / decided * 100, 1)
+            counts = MLPrediction.objects.aggregate(
+                total=Count("pk"),
+                right=Count("pk", filter=Q(correct=True)),
+                wrong=Count("pk", filter=Q(correct=False)),
+            )
+            default["ml_predictions_total"] = counts["total"]
+            decided = counts["right"] + counts["wrong"]
+            if decided > 0:
+                default["ml_accuracy"] = round(counts["right"] / decided * 100, 1)
         except Exception:
             pass
 
@@ -555,17 +591,13 @@ class DashboardService:
         try:
             from analysis.models import BackgroundJob
 
-            last_ml = BackgroundJob.objects.filter(
+            trained = BackgroundJob.objects.filter(
                 job_type__contains="ml_training",
                 status="completed",
-            ).order_by("-completed_at").first()
-            if last_ml and last_ml.completed_at:
-                default["ml_last_trained"] = last_ml.completed_at.isoformat()
-
-            default["ml_models_count"] = BackgroundJob.objects.filter(
-                job_type__contains="ml_training",
-                status="completed",
-            ).count()
+            ).aggregate(count=Count("pk"), last=Max("completed_at"))
+            if trained["last"]:
+                default["ml_last_trained"] = trained["last"].isoformat()
+            default["ml_models_count"] = trained["count"]
         except Exception:
             pass
 
@@ -40,6 +40,7 @@ def _run_data_refresh(params: dict, progress_cb: ProgressCallback) -> dict[str,
         asset_class=asset_class,
     )
     progress_cb(0.9, "Data refresh complete")
+    _record_last_closes(results)
 
     succeeded = sum(1 for v in results.values() if isinstance(v, dict) and v.get("status") == "ok")
     failed = sum(1 for v in results.values() if isinstance(v, dict) and v.get("status") == "error")
@@ -57,6 +58,28 @@ def _run_data_refresh(params: dict, progress_cb: ProgressCallback) -> dict[str,
     }
 
 
+def _record_last_closes(results: dict) -> None:
+    """Feed the last candle close per symbol into the shared price snapshot.
+
+    Quotes are stamped with the candle's time, so they only count as fresh
+    if the candle is.
+    """
+    from market.services.price_store import get_price_store
+
+    store = get_price_store()
+    for key, result in results.items():
+        if not isinstance(result, dict) or result.get("status") != "ok":
+            continue
+        if result.get("last_close") is None or result.get("last_timestamp") is None:
+            continue
+        symbol = key.rsplit("_", 1)[0]
+        store.update(
+            {symbol: result["last_close"]},
+            source="data_refresh",
+            at=result["last_timestamp"],
+        )
+
+
 def _infer_asset_class(symbol: str, exchange: str = "") -> str:
     """Infer asset class from symbol format and exchange."""
     if exchange == "yfinance":
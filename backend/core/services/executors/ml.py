@@ -9,12 +9,17 @@ logger = logging.getLogger("scheduler")
 
 
 def _run_ml_training(params: dict, progress_cb: ProgressCallback) -> dict[str, Any]:
-    """Train ML models on OHLCV data for specified symbols."""
+    """Train ML models on OHLCV data for specified symbols.
+
+    With ``incremental: true`` each symbol's newest model is warm-started on the
+    bars appended since it was trained (full train when there is no parent).
+    """
     progress_cb(0.1, "Starting ML training")
     symbols = params.get("symbols", [params.get("symbol", "BTC/USDT")])
     if isinstance(symbols, str):
         symbols = [symbols]
     timeframe = params.get("timeframe", "1h")
+    incremental = bool(params.get("incremental", False))
 
     results = []
     for i, symbol in enumerate(symbols):
@@ -27,7 +32,8 @@ def _run_ml_training(params: dict, progress_cb: ProgressCallback) -> dict[str, A
                 "exchange": params.get("exchange", "kraken"),
                 "test_ratio": params.get("test_ratio", 0.2),
             }
-            result = MLService.train(
+            train_fn = MLService.train_incremental if incremental else MLService.train
+            result = train_fn(
                 train_params,
                 lambda p, m, _i=i: progress_cb(0.1 + 0.8 * (_i + p) / len(symbols), m),
             )
@@ -206,21 +212,32 @@ def _run_ml_feedback(params: dict, progress_cb: ProgressCallback) -> dict[str, A
 
 
 def _run_ml_retrain(params: dict, progress_cb: ProgressCallback) -> dict[str, Any]:
-    """Retrain ML models flagged by the feedback loop."""
+    """Retrain ML models flagged by the feedback loop.
+
+    Mild degradation warm-starts the flagged model on new bars; severe accuracy
+    loss or regime drift (see common.ml.feedback.select_retrain_mode) rebuilds
+    it from the full history.
+    """
     from analysis.models import MLModelPerformance
+    from core.platform_bridge import ensure_platform_imports
 
     progress_cb(0.1, "Checking for models needing retraining")
     flagged = list(
         MLModelPerformance.objects.filter(
             retrain_recommended=True,
-        ).values_list("model_id", flat=True),
+        ),
     )
 
     if not flagged:
         return {"status": "completed", "retrained": 0, "reason": "No models flagged for retraining"}
 
+    ensure_platform_imports()
+    from common.ml.feedback import select_retrain_mode
+
     retrained = 0
-    for i, model_id in enumerate(flagged[:5]):  # Max 5 retrains per run
+    modes: dict[str, str] = {}
+    for i, perf in enumerate(flagged[:5]):  # Max 5 retrains per run
+        model_id = perf.model_id
         try:
             from analysis.services.ml import MLService
 
@@ -236,7 +253,18 @@ def _run_ml_retrain(params: dict, progress_cb: ProgressCallback) -> dict[str, An
                 "exchange": exchange,
                 "test_ratio": 0.2,
             }
-            MLService.train(
+            mode = select_retrain_mode({
+                "total_predictions": perf.total_predictions,
+                "accuracy": perf.rolling_accuracy,
+                "accuracy_by_regime": perf.accuracy_by_regime or {},
+            })
+            if mode == "incremental":
+                train_fn = MLService.train_incremental
+                train_params["parent_model_id"] = model_id
+            else:
+                train_fn = MLService.train
+            modes[model_id] = mode
+            train_fn(
                 train_params,
                 lambda p, m, _i=i: progress_cb(
                     0.1 + 0.8 * (_i + p) / len(flagged),
@@ -252,7 +280,12 @@ def _run_ml_retrain(params: dict, progress_cb: ProgressCallback) -> dict[str, An
             logger.warning("ML retrain failed for %s: %s", model_id, e)
         progress_cb(0.1 + 0.8 * (i + 1) / len(flagged), f"Retrained {i + 1}/{len(flagged)}")
 
-    return {"status": "completed", "retrained": retrained, "flagged": len(flagged)}
+    return {
+        "status": "completed",
+        "retrained": retrained,
+        "flagged": len(flagged),
+        "modes": modes,
+    }
 
 
 def _run_conviction_audit(params: dict, progress_cb: ProgressCallback) -> dict[str, Any]:
@@ -141,6 +141,7 @@ def _sync_freqtrade_equity() -> dict[str, Any]:
     # ── Compute current equity: declared capital + P&L from all sources ──
     current_equity = declared_capital + total_crypto_pnl + forex_pnl
 
+    from market.services.price_store import get_price_store
     from portfolio.models import Portfolio
     from risk.models import CapitalLedger, RiskState
     from risk.services.risk import RiskManagementService
@@ -241,7 +242,8 @@ def _sync_freqtrade_equity() -> dict[str, Any]:
             except Exception:
                 logger.debug("Failed to write capital ledger entry", exc_info=True)
 
-    # Feed current mark prices into ReturnTracker for VaR/correlation.
+    # Feed current mark prices into ReturnTracker for VaR/correlation,
+    # and into the shared price snapshot.
     if open_positions:
         prices = {
             sym: pos.get("current_price") or pos.get("entry_price", 0)
@@ -250,6 +252,14 @@ def _sync_freqtrade_equity() -> dict[str, Any]:
         }
         if prices:
             RiskManagementService.record_prices(prices)
+        get_price_store().update(
+            {
+                sym: pos["current_price"]
+                for sym, pos in open_positions.items()
+                if pos.get("current_price")
+            },
+            source="freqtrade",
+        )
 
     return {
         "declared_capital": declared_capital,
@@ -0,0 +1,255 @@
+"""Keep-alive Freqtrade API clients and cached per-instance snapshots.
+
+The dashboard needs the status and profit of every Freqtrade instance on
+each KPI request. Polling them one after another, over a new connection
+per call, lets the slowest bot set the page latency. The pool instead:
+
+- keeps one keep-alive ``httpx.Client`` per instance (URL + credentials);
+- refreshes the requested instances concurrently on a small thread pool;
+- caches each instance's snapshot (stale-while-revalidate): within
+  ``ttl_seconds`` it is reused as is, up to ``max_stale_seconds`` it is
+  served marked stale while a background refresh runs, and only a missing
+  or expired snapshot is waited for, at most ``deadline_seconds``.
+
+Unreachable instances are cached too, so a dead bot costs one failed
+connect per TTL instead of one per request.
+"""
+
+import atexit
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field, replace
+
+import httpx
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_SECONDS = 10.0
+DEFAULT_MAX_STALE_SECONDS = 300.0
+DEFAULT_DEADLINE_SECONDS = 2.0
+DEFAULT_MAX_WORKERS = 8
+
+
+@dataclass(frozen=True)
+class FreqtradeInstance:
+    """Where and how to reach one Freqtrade REST API."""
+
+    name: str
+    url: str
+    username: str = ""
+    password: str = ""
+
+
+@dataclass(frozen=True)
+class InstanceSnapshot:
+    """``show_config`` and ``profit`` of an instance as of ``fetched_at``.
+
+    ``fetched_at`` is a ``time.monotonic()`` value. ``stale`` is set on
+    snapshots served past their TTL.
+    """
+
+    name: str
+    reachable: bool
+    config: dict = field(default_factory=dict)
+    profit: dict = field(default_factory=dict)
+    error: str | None = None
+    fetched_at: float = 0.0
+    stale: bool = False
+
+    @property
+    def age_seconds(self) -> float:
+        return max(0.0, time.monotonic() - self.fetched_at)
+
+
+def _json_dict(resp: httpx.Response) -> dict:
+    if resp.status_code != 200:
+        return {}
+    data = resp.json()
+    return data if isinstance(data, dict) else {}
+
+
+class FreqtradePool:
+    """Pooled Freqtrade API clients with stale-while-revalidate snapshots.
+
+    Args:
+        ttl_seconds: Age up to which a snapshot is served without refresh.
+        max_stale_seconds: Age up to which a snapshot is served (marked
+            stale) while it is refreshed in the background.
+        deadline_seconds: Longest a caller waits for an instance that has
+            no usable snapshot.
+        max_workers: Instances refreshed in parallel.
+
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_stale_seconds: float = DEFAULT_MAX_STALE_SECONDS,
+        deadline_seconds: float = DEFAULT_DEADLINE_SECONDS,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_stale_seconds = max_stale_seconds
+        self.deadline_seconds = deadline_seconds
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="freqtrade-poll",
+        )
+        self._clients: dict[FreqtradeInstance, httpx.Client] = {}
+        self._snapshots: dict[str, InstanceSnapshot] = {}
+        self._inflight: dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    # ── HTTP ──────────────────────────────────────────────
+
+    def _client(self, instance: FreqtradeInstance) -> httpx.Client:
+        with self._lock:
+            client = self._clients.get(instance)
+            if client is None:
+                # URL or credentials of this instance changed
+                for old in [i for i in self._clients if i.name == instance.name]:
+                    self._clients.pop(old).close()
+                client = httpx.Client(
+                    base_url=f"{instance.url.rstrip('/')}/api/v1",
+                    auth=httpx.BasicAuth(instance.username, instance.password),
+                    timeout=httpx.Timeout(3.0, connect=1.0),
+                    limits=httpx.Limits(max_connections=4, max_keepalive_connections=2),
+                )
+                self._clients[instance] = client
+            return client
+
+    def _fetch(self, instance: FreqtradeInstance) -> InstanceSnapshot:
+        try:
+            client = self._client(instance)
+            config_resp = client.get("show_config")
+            profit_resp = client.get("profit")
+            reachable = config_resp.status_code == 200
+            snapshot = InstanceSnapshot(
+                name=instance.name,
+                reachable=reachable,
+                config=_json_dict(config_resp),
+                profit=_json_dict(profit_resp),
+                error=None if reachable else f"HTTP {config_resp.status_code}",
+                fetched_at=time.monotonic(),
+            )
+        except Exception as e:
+            logger.debug("Freqtrade instance %s unavailable: %s", instance.name, e)
+            snapshot = InstanceSnapshot(
+                name=instance.name,
+                reachable=False,
+                error=str(e) or type(e).__name__,
+                fetched_at=time.monotonic(),
+            )
+        with self._lock:
+            self._snapshots[instance.name] = snapshot
+            self._inflight.pop(instance.name, None)
+        return snapshot
+
+    def _refresh(self, instance: FreqtradeInstance) -> Future:
+        """Start refreshing ``instance`` unless a refresh is already running."""
+        with self._lock:
+            future = self._inflight.get(instance.name)
+            if future is None:
+                future = self._executor.submit(self._fetch, instance)
+                self._inflight[instance.name] = future
+            return future
+
+    # ── Public API ────────────────────────────────────────
+
+    def snapshots(
+        self,
+        instances: list[FreqtradeInstance],
+    ) -> dict[str, InstanceSnapshot | None]:
+        """Snapshot per instance name, in ``instances`` order.
+
+        Fresh snapshots are returned immediately; stale ones too, with a
+        refresh started in the background. Instances without a usable
+        snapshot are refreshed concurrently and waited for up to
+        ``deadline_seconds``; on timeout their expired snapshot (if any) is
+        returned marked stale, else ``None``.
+        """
+        results: dict[str, InstanceSnapshot | None] = {}
+        waiting: dict[str, Future] = {}
+        for instance in instances:
+            with self._lock:
+                snapshot = self._snapshots.get(instance.name)
+            age = snapshot.age_seconds if snapshot is not None else None
+            if age is not None and age <= self.ttl_seconds:
+                results[instance.name] = snapshot
+            elif age is not None and age <= self.max_stale_seconds:
+                self._refresh(instance)
+                results[instance.name] = replace(snapshot, stale=True)
+            else:
+                waiting[instance.name] = self._refresh(instance)
+
+        if waiting:
+            wait(waiting.values(), timeout=self.deadline_seconds)
+            for name, future in waiting.items():
+                if future.done():
+                    results[name] = future.result()
+                    continue
+                logger.debug(
+                    "Freqtrade instance %s missed the %.1fs deadline", name, self.deadline_seconds
+                )
+                with self._lock:
+                    expired = self._snapshots.get(name)
+                results[name] = replace(expired, stale=True) if expired else None
+
+        return {instance.name: results[instance.name] for instance in instances}
+
+    def close(self) -> None:
+        """Stop background refreshes and close every client."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+            self._snapshots.clear()
+            self._inflight.clear()
+        for client in clients:
+            try:
+                client.close()
+            except Exception as e:
+                logger.warning("Failed to close Freqtrade client: %s", e)
+
+
+_pool: FreqtradePool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_freqtrade_pool() -> FreqtradePool:
+    """Get or create the process-wide Freqtrade client pool."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = FreqtradePool(
+                    ttl_seconds=getattr(
+                        settings,
+                        "FREQTRADE_SNAPSHOT_TTL_SECONDS",
+                        DEFAULT_TTL_SECONDS,
+                    ),
+                    max_stale_seconds=getattr(
+                        settings,
+                        "FREQTRADE_SNAPSHOT_MAX_STALE_SECONDS",
+                        DEFAULT_MAX_STALE_SECONDS,
+                    ),
+                    deadline_seconds=getattr(
+                        settings,
+                        "FREQTRADE_POLL_DEADLINE_SECONDS",
+                        DEFAULT_DEADLINE_SECONDS,
+                    ),
+                )
+                atexit.register(close_freqtrade_pool)
+    return _pool
+
+
+def close_freqtrade_pool() -> None:
+    """Close the process-wide pool (if any). Safe to call more than once."""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.close()
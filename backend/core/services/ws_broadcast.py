@@ -2,16 +2,32 @@
 
 Wraps channel_layer.group_send for sync callers (APScheduler threads, JobRunner threads).
 All broadcasts are fire-and-forget — failures never break core operations.
+
+Bursts (market scans, news fetches) are coalesced: events are buffered per
+group for ``WS_BROADCAST_WINDOW_MS`` and sent as one ``event_batch``
+message, which ``SystemEventsConsumer`` forwards as a single frame. Events
+sent with a key supersede a pending event of the same type and key (e.g.
+repeated regime updates for one symbol), so only the latest is delivered.
+A window of 0 sends every event immediately.
 """
 
+import atexit
+import itertools
 import logging
+import threading
+from collections import OrderedDict
 from datetime import datetime, timezone
 
+from django.conf import settings
+
 logger = logging.getLogger("ws_broadcast")
 
+SYSTEM_EVENTS_GROUP = "system_events"
+DEFAULT_MAX_BATCH = 200
 
-def _send(event_type: str, data: dict) -> None:
-    """Send an event to the system_events group. Safe for sync callers."""
+
+def _group_send(group: str, message: dict) -> None:
+    """Send one message to a channel layer group. Safe for sync callers."""
     try:
         from asgiref.sync import async_to_sync
         from channels.layers import get_channel_layer
@@ -19,12 +35,95 @@ def _send(event_type: str, data: dict) -> None:
         channel_layer = get_channel_layer()
         if channel_layer is None:
             return
-        async_to_sync(channel_layer.group_send)(
-            "system_events",
-            {"type": event_type, "data": data},
-        )
+        async_to_sync(channel_layer.group_send)(group, message)
     except Exception:
-        logger.debug("WS broadcast failed for %s", event_type, exc_info=True)
+        logger.debug("WS broadcast failed for %s", message.get("type"), exc_info=True)
+
+
+class BroadcastBuffer:
+    """Coalesces broadcasts per group into one message per time window.
+
+    Args:
+        window_seconds: How long the first event of a batch waits for others.
+        max_batch: Pending events per group that trigger an early flush.
+
+    """
+
+    def __init__(self, window_seconds: float, max_batch: int = DEFAULT_MAX_BATCH) -> None:
+        self.window_seconds = window_seconds
+        self.max_batch = max_batch
+        self._pending: dict[str, OrderedDict[tuple, dict]] = {}
+        self._seq = itertools.count()
+        self._timer: threading.Timer | None = None
+        self._lock = threading.Lock()
+
+    def add(self, group: str, event_type: str, data: dict, key=None) -> None:
+        """Queue an event; a pending event with the same type and key is replaced."""
+        with self._lock:
+            pending = self._pending.setdefault(group, OrderedDict())
+            slot = (event_type, key if key is not None else ("seq", next(self._seq)))
+            # Superseded events move to the end, in order of their latest update
+            pending.pop(slot, None)
+            pending[slot] = {"type": event_type, "data": data}
+            flush_now = len(pending) >= self.max_batch
+            if not flush_now and self._timer is None:
+                self._timer = threading.Timer(self.window_seconds, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+        if flush_now:
+            self.flush()
+
+    def flush(self) -> None:
+        """Send everything pending, one message per group."""
+        with self._lock:
+            batches, self._pending = self._pending, {}
+            timer, self._timer = self._timer, None
+        if timer is not None:
+            timer.cancel()
+        for group, pending in batches.items():
+            events = list(pending.values())
+            if len(events) == 1:
+                _group_send(group, events[0])
+            else:
+                _group_send(group, {"type": "event_batch", "events": events})
+
+
+_buffer: BroadcastBuffer | None = None
+_buffer_lock = threading.Lock()
+
+
+def get_broadcast_buffer() -> BroadcastBuffer:
+    """Get or create the process-wide broadcast buffer."""
+    global _buffer
+    if _buffer is None:
+        with _buffer_lock:
+            if _buffer is None:
+                _buffer = BroadcastBuffer(
+                    window_seconds=getattr(settings, "WS_BROADCAST_WINDOW_MS", 0) / 1000,
+                )
+                atexit.register(close_broadcast_buffer)
+    return _buffer
+
+
+def close_broadcast_buffer() -> None:
+    """Flush and drop the process-wide buffer (if any)."""
+    global _buffer
+    with _buffer_lock:
+        buffer, _buffer = _buffer, None
+    if buffer is not None:
+        buffer.flush()
+
+
+def _send(event_type: str, data: dict, key=None) -> None:
+    """Send an event to the system_events group. Safe for sync callers.
+
+    ``key`` identifies what the event describes; a newer event with the same
+    type and key supersedes one still waiting in the buffer.
+    """
+    if getattr(settings, "WS_BROADCAST_WINDOW_MS", 0) <= 0:
+        _group_send(SYSTEM_EVENTS_GROUP, {"type": event_type, "data": data})
+        return
+    get_broadcast_buffer().add(SYSTEM_EVENTS_GROUP, event_type, data, key=key)
 
 
 def broadcast_news_update(
@@ -54,7 +153,7 @@ def broadcast_sentiment_update(
         "overall_label": overall_label,
         "total_articles": total_articles,
         "timestamp": datetime.now(tz=timezone.utc).isoformat(),
-    })
+    }, key=asset_class)
 
 
 def broadcast_scheduler_event(
@@ -74,7 +173,7 @@ def broadcast_scheduler_event(
         "job_id": job_id,
         "message": message,
         "timestamp": datetime.now(tz=timezone.utc).isoformat(),
-    })
+    }, key=(task_id, job_id))
 
 
 def broadcast_opportunity(
@@ -90,7 +189,7 @@ def broadcast_opportunity(
         "score": score,
         "details": details,
         "timestamp": datetime.now(tz=timezone.utc).isoformat(),
-    })
+    }, key=(symbol, opportunity_type))
 
 
 def broadcast_strategy_status(
@@ -108,7 +207,7 @@ def broadcast_strategy_status(
         "alignment": alignment,
         "action": action,
         "timestamp": datetime.now(tz=timezone.utc).isoformat(),
-    })
+    }, key=(strategy, asset_class))
 
 
 def broadcast_regime_change(
@@ -124,4 +223,4 @@ def broadcast_regime_change(
         "new_regime": new_regime,
         "confidence": confidence,
         "timestamp": datetime.now(tz=timezone.utc).isoformat(),
-    })
+    }, key=symbol)
@@ -2,16 +2,27 @@
 
 import asyncio
 import logging
+import re
 
 from channels.db import database_sync_to_async
 from channels.generic.websocket import AsyncJsonWebsocketConsumer
 
+try:
+    import msgpack
+
+    HAS_MSGPACK = True
+except ImportError:  # pragma: no cover
+    HAS_MSGPACK = False
+
 logger = logging.getLogger(__name__)
 
 # Module-level WS connection tracker
 _connection_counts: dict[int, int] = {}  # user_id -> count
 _conn_lock = asyncio.Lock()
 MAX_WS_CONNECTIONS_PER_USER = 5
+MAX_TICKER_SUBSCRIPTIONS = 50
+SYMBOL_PATTERN = re.compile(r"^[A-Z0-9]{1,20}/[A-Z0-9]{1,20}$")
+MSGPACK_SUBPROTOCOL = "msgpack"
 
 
 class ConnectionLimiterMixin:
@@ -44,7 +55,14 @@ class MarketTickerConsumer(ConnectionLimiterMixin, AsyncJsonWebsocketConsumer):
     """Streams live ticker updates to authenticated clients.
 
     URL: /ws/market/tickers/
-    Group: market_tickers
+    Groups: market_tickers (all clients), ticker.<symbol> (per subscription)
+
+    Clients start subscribed to the poller's default symbols and manage
+    the set with ``{"action": "subscribe" | "unsubscribe", "symbols": [...]}``.
+    Each message is ``{"tickers": [...]}``: the full ticker for a newly
+    subscribed symbol, then only the fields that changed. Deltas arriving
+    faster than ``TICKER_MAX_UPDATES_PER_SECOND`` are merged per symbol and
+    sent together.
     """
 
     async def connect(self):
@@ -56,22 +74,117 @@ class MarketTickerConsumer(ConnectionLimiterMixin, AsyncJsonWebsocketConsumer):
             await self.close(code=4029)
             return
 
+        from django.conf import settings
+
+        max_rate = getattr(settings, "TICKER_MAX_UPDATES_PER_SECOND", 2)
+        self._min_interval = 1.0 / max_rate if max_rate > 0 else 0.0
+        self._pending: dict[str, dict] = {}
+        self._last_flush = 0.0
+        self._flush_task: asyncio.Task | None = None
+
         await self.channel_layer.group_add("market_tickers", self.channel_name)
         await self.accept()
 
-        # Lazily start the ticker poller on first connection
-        from market.services.ticker_poller import start_poller
+        from market.services.ticker_poller import DEFAULT_SYMBOLS, start_poller
+
+        await self._subscribe(DEFAULT_SYMBOLS)
 
+        # Lazily start the ticker poller on first connection
         await start_poller()
 
     async def disconnect(self, close_code):
         await self._release_connection()
         await self.channel_layer.group_discard("market_tickers", self.channel_name)
 
+        flush_task = getattr(self, "_flush_task", None)
+        if flush_task is not None:
+            flush_task.cancel()
+
+        from market.services.ticker_poller import get_ticker_hub, ticker_group
+
+        for symbol in get_ticker_hub().unsubscribe(self.channel_name):
+            await self.channel_layer.group_discard(ticker_group(symbol), self.channel_name)
+
+    async def receive_json(self, content, **kwargs):
+        """Handle subscribe/unsubscribe requests."""
+        action = content.get("action") if isinstance(content, dict) else None
+        symbols = content.get("symbols") if isinstance(content, dict) else None
+        if action not in ("subscribe", "unsubscribe"):
+            await self.send_json({"type": "error", "error": "Unknown action"})
+            return
+        if (
+            not isinstance(symbols, list)
+            or not symbols
+            or not all(isinstance(s, str) and SYMBOL_PATTERN.match(s.upper()) for s in symbols)
+        ):
+            await self.send_json({"type": "error", "error": "Invalid symbols"})
+            return
+
+        from market.services.ticker_poller import get_ticker_hub, ticker_group
+
+        symbols = [s.upper() for s in symbols]
+        hub = get_ticker_hub()
+        if action == "subscribe":
+            total = len(hub.subscriptions(self.channel_name) | set(symbols))
+            if total > MAX_TICKER_SUBSCRIPTIONS:
+                await self.send_json(
+                    {
+                        "type": "error",
+                        "error": f"At most {MAX_TICKER_SUBSCRIPTIONS} symbols per connection",
+                    },
+                )
+                return
+            await self._subscribe(symbols)
+        else:
+            for symbol in hub.unsubscribe(self.channel_name, symbols):
+                await self.channel_layer.group_discard(ticker_group(symbol), self.channel_name)
+                self._pending.pop(symbol, None)
+
+        await self.send_json(
+            {"type": "subscriptions", "symbols": sorted(hub.subscriptions(self.channel_name))},
+        )
+
+    async def _subscribe(self, symbols: list[str]) -> None:
+        from market.services.ticker_poller import get_ticker_hub, ticker_group
+
+        hub = get_ticker_hub()
+        added = hub.subscribe(self.channel_name, symbols)
+        for symbol in added:
+            await self.channel_layer.group_add(ticker_group(symbol), self.channel_name)
+        snapshot = hub.snapshot(added)
+        if snapshot:
+            await self.send_json({"tickers": snapshot})
+
     async def ticker_update(self, event):
         """Handle ticker_update messages from the channel layer."""
         await self.send_json(event["data"])
 
+    async def ticker_delta(self, event):
+        """Queue a per-symbol delta, sending at most once per interval."""
+        delta = event["data"]
+        self._pending.setdefault(delta["symbol"], {}).update(delta)
+        if self._flush_task is not None:
+            return  # a flush is already scheduled and will include this delta
+
+        wait = self._last_flush + self._min_interval - asyncio.get_running_loop().time()
+        if wait <= 0:
+            await self._flush()
+        else:
+            self._flush_task = asyncio.create_task(self._flush_later(wait))
+
+    async def _flush_later(self, delay: float) -> None:
+        await asyncio.sleep(delay)
+        self._flush_task = None
+        await self._flush()
+
+    async def _flush(self) -> None:
+        if not self._pending:
+            return
+        tickers = list(self._pending.values())
+        self._pending = {}
+        self._last_flush = asyncio.get_running_loop().time()
+        await self.send_json({"tickers": tickers})
+
     @database_sync_to_async
     def _is_authenticated(self) -> bool:
         user = self.scope.get("user")
@@ -83,8 +196,14 @@ class SystemEventsConsumer(ConnectionLimiterMixin, AsyncJsonWebsocketConsumer):
 
     URL: /ws/system/
     Group: system_events
+
+    Coalesced broadcasts arrive as ``event_batch`` and are sent as one
+    ``{"type": "batch", "events": [...]}`` frame. Clients that request the
+    ``msgpack`` subprotocol get msgpack-encoded binary frames instead of JSON.
     """
 
+    compact = False
+
     async def connect(self):
         if not await self._is_authenticated():
             await self.close(code=4001)
@@ -95,7 +214,17 @@ class SystemEventsConsumer(ConnectionLimiterMixin, AsyncJsonWebsocketConsumer):
             return
 
         await self.channel_layer.group_add("system_events", self.channel_name)
-        await self.accept()
+        if HAS_MSGPACK and MSGPACK_SUBPROTOCOL in self.scope.get("subprotocols", []):
+            self.compact = True
+            await self.accept(subprotocol=MSGPACK_SUBPROTOCOL)
+        else:
+            await self.accept()
+
+    async def send_json(self, content, close=False):
+        if self.compact:
+            await self.send(bytes_data=msgpack.packb(content), close=close)
+        else:
+            await super().send_json(content, close=close)
 
     async def disconnect(self, close_code):
         await self._release_connection()
@@ -182,6 +311,15 @@ class SystemEventsConsumer(ConnectionLimiterMixin, AsyncJsonWebsocketConsumer):
             },
         )
 
+    async def event_batch(self, event):
+        """Handle coalesced broadcasts (see core.services.ws_broadcast)."""
+        await self.send_json(
+            {
+                "type": "batch",
+                "events": event["events"],
+            },
+        )
+
     @database_sync_to_async
     def _is_authenticated(self) -> bool:
         user = self.scope.get("user")
@@ -17,7 +17,7 @@ class DataServiceRouter:
 
         from market.services.exchange import ExchangeService
 
-        service = ExchangeService()
+        service = ExchangeService(shared=True)
         try:
             return await service.fetch_ticker(symbol)
         finally:
@@ -34,7 +34,7 @@ class DataServiceRouter:
 
         from market.services.exchange import ExchangeService
 
-        service = ExchangeService()
+        service = ExchangeService(shared=True)
         try:
             return await service.fetch_tickers(symbols)
         finally:
@@ -55,7 +55,7 @@ class DataServiceRouter:
 
         from market.services.exchange import ExchangeService
 
-        service = ExchangeService()
+        service = ExchangeService(shared=True)
         try:
             return await service.fetch_ohlcv(symbol, timeframe, limit)
         finally:
@@ -37,13 +37,53 @@ def _load_db_config(config_id: int | None = None):
         return None
 
 
+def _build_exchange(exchange_id: str, db_config=None) -> ccxt.Exchange:
+    """Construct a ccxt client with DB-backed (or legacy env) credentials."""
+    exchange_class = getattr(ccxt, exchange_id)
+    config: dict[str, object] = {"enableRateLimit": True}
+
+    if db_config and db_config.api_key:
+        config["apiKey"] = db_config.api_key
+        config["secret"] = db_config.api_secret
+        if db_config.passphrase:
+            config["password"] = db_config.passphrase
+        if db_config.is_sandbox:
+            config["sandbox"] = True
+        if db_config.options:
+            config["options"] = db_config.options
+    elif settings.EXCHANGE_API_KEY:
+        config["apiKey"] = settings.EXCHANGE_API_KEY
+        config["secret"] = settings.EXCHANGE_API_SECRET
+
+    exchange = exchange_class(config)
+
+    if db_config and db_config.is_sandbox:
+        exchange.set_sandbox_mode(True)
+    return exchange
+
+
 class ExchangeService:
-    def __init__(self, exchange_id: str | None = None, config_id: int | None = None) -> None:
+    """Async ccxt access for one exchange.
+
+    By default the service owns a private client that :meth:`close` shuts
+    down. With ``shared=True`` it borrows a long-lived client from the
+    process-wide :func:`~market.services.exchange_pool.get_exchange_pool`
+    (open HTTP session, cached markets, per-exchange concurrency limit)
+    and :meth:`close` only drops the reference.
+    """
+
+    def __init__(
+        self,
+        exchange_id: str | None = None,
+        config_id: int | None = None,
+        shared: bool = False,
+    ) -> None:
         self._db_config = _load_db_config(config_id)
         if self._db_config:
             self._exchange_id = self._db_config.exchange_id
         else:
             self._exchange_id = exchange_id or settings.EXCHANGE_ID
+        self._shared = shared
         self._exchange: ccxt.Exchange | None = None
 
     async def _get_exchange(self) -> ccxt.Exchange:
@@ -56,31 +96,20 @@ class ExchangeService:
                 if self._db_config:
                     self._exchange_id = self._db_config.exchange_id
 
-            exchange_class = getattr(ccxt, self._exchange_id)
-            config: dict[str, object] = {"enableRateLimit": True}
-
-            if self._db_config and self._db_config.api_key:
-                config["apiKey"] = self._db_config.api_key
-                config["secret"] = self._db_config.api_secret
-                if self._db_config.passphrase:
-                    config["password"] = self._db_config.passphrase
-                if self._db_config.is_sandbox:
-                    config["sandbox"] = True
-                if self._db_config.options:
-                    config["options"] = self._db_config.options
-            elif settings.EXCHANGE_API_KEY:
-                config["apiKey"] = settings.EXCHANGE_API_KEY
-                config["secret"] = settings.EXCHANGE_API_SECRET
-
-            self._exchange = exchange_class(config)
-
-            if self._db_config and self._db_config.is_sandbox:
-                self._exchange.set_sandbox_mode(True)
+            if self._shared:
+                from market.services.exchange_pool import get_exchange_pool
+
+                self._exchange = await get_exchange_pool().acquire(
+                    self._exchange_id, self._db_config,
+                )
+            else:
+                self._exchange = _build_exchange(self._exchange_id, self._db_config)
         return self._exchange
 
     async def close(self) -> None:
         if self._exchange is not None:
-            await self._exchange.close()
+            if not self._shared:
+                await self._exchange.close()
             self._exchange = None
 
     def list_exchanges(self) -> list[dict]:
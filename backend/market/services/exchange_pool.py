@@ -0,0 +1,237 @@
+"""Process-wide pool of long-lived ccxt exchange clients.
+
+Creating an ``ExchangeService`` per operation opens a new aiohttp session
+(TCP/TLS handshake) and repeats the ``load_markets`` round trip on the
+first call. The pool keeps one client per (exchange, credentials) open for
+the life of the process instead:
+
+- Markets are loaded once and reloaded after ``EXCHANGE_MARKETS_TTL_SECONDS``.
+- In-flight requests per exchange are capped at ``EXCHANGE_MAX_CONCURRENCY``;
+  ccxt's own rate limiter paces them since the client is shared.
+- Clients live on a dedicated event-loop thread, so callers on any loop
+  (ASGI handlers, ``async_to_sync`` in scheduler threads) can share them.
+  Calls are forwarded to that loop through :class:`PooledExchange`.
+
+Use it through ``ExchangeService(..., shared=True)``. The pool is closed at
+interpreter exit, or explicitly with :func:`close_exchange_pool`.
+"""
+
+import asyncio
+import atexit
+import inspect
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONCURRENCY = 4
+DEFAULT_MARKETS_TTL_SECONDS = 3600
+
+
+@dataclass
+class _PoolEntry:
+    client: Any
+    version: Any
+    semaphore: asyncio.Semaphore
+    markets_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    markets_loaded_at: float | None = None
+
+
+class PooledExchange:
+    """Proxy for a pooled ccxt client, usable from any event loop.
+
+    Coroutine methods (``fetch_ticker``, ``create_order``, ...) run on the
+    pool's loop under the exchange's concurrency limit; other attributes
+    (``has``, ``markets``, ``id``) are read directly. ``close()`` is a
+    no-op because the client is shared.
+    """
+
+    def __init__(self, pool: "ExchangeClientPool", key: tuple, client: Any) -> None:
+        self._pool = pool
+        self._key = key
+        self._client = client
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._client, name)
+        if not inspect.iscoroutinefunction(attr):
+            return attr
+
+        async def call(*args, **kwargs):
+            return await self._pool._run(self._pool._call(self._key, name, args, kwargs))
+
+        return call
+
+    async def close(self) -> None:
+        """Shared clients are closed by the pool, not by borrowers."""
+
+
+class ExchangeClientPool:
+    """Long-lived ccxt clients keyed by (exchange_id, ExchangeConfig id).
+
+    Args:
+        max_concurrency: In-flight requests allowed per client.
+        markets_ttl_seconds: Age after which markets are reloaded.
+
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        markets_ttl_seconds: float = DEFAULT_MARKETS_TTL_SECONDS,
+    ) -> None:
+        self.max_concurrency = max_concurrency
+        self.markets_ttl_seconds = markets_ttl_seconds
+        self._entries: dict[tuple, _PoolEntry] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    # ── Event-loop thread ─────────────────────────────────
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=self._loop.run_forever,
+                    name="exchange-pool",
+                    daemon=True,
+                )
+                self._thread.start()
+            return self._loop
+
+    def _submit(self, coro) -> Future:
+        return asyncio.run_coroutine_threadsafe(coro, self._ensure_loop())
+
+    async def _run(self, coro) -> Any:
+        """Await ``coro`` on the pool loop from the caller's loop."""
+        return await asyncio.wrap_future(self._submit(coro))
+
+    # ── Client lifecycle (runs on the pool loop) ─────────
+
+    async def _open(self, key: tuple, exchange_id: str, db_config) -> Any:
+        from market.services.exchange import _build_exchange
+
+        version = getattr(db_config, "updated_at", None)
+        entry = self._entries.get(key)
+        if entry is not None and entry.version != version:
+            # Credentials changed since the client was created
+            logger.info("Exchange config for %s changed, replacing pooled client", exchange_id)
+            del self._entries[key]
+            await self._close_client(entry.client)
+            entry = None
+        if entry is None:
+            entry = _PoolEntry(
+                client=_build_exchange(exchange_id, db_config),
+                version=version,
+                semaphore=asyncio.Semaphore(self.max_concurrency),
+            )
+            self._entries[key] = entry
+            logger.info("Opened pooled %s client", exchange_id)
+        return entry.client
+
+    async def _ensure_markets(self, entry: _PoolEntry) -> None:
+        loaded_at = entry.markets_loaded_at
+        if loaded_at is not None and time.monotonic() - loaded_at < self.markets_ttl_seconds:
+            return
+        async with entry.markets_lock:
+            if entry.markets_loaded_at != loaded_at:
+                return  # another call refreshed them meanwhile
+            await entry.client.load_markets(reload=loaded_at is not None)
+            entry.markets_loaded_at = time.monotonic()
+
+    async def _call(self, key: tuple, name: str, args: tuple, kwargs: dict) -> Any:
+        entry = self._entries[key]
+        async with entry.semaphore:
+            if name != "load_markets":
+                await self._ensure_markets(entry)
+            return await getattr(entry.client, name)(*args, **kwargs)
+
+    @staticmethod
+    async def _close_client(client: Any) -> None:
+        try:
+            await client.close()
+        except Exception as e:
+            logger.warning("Failed to close pooled exchange client: %s", e)
+
+    async def _close_all(self) -> None:
+        entries = list(self._entries.values())
+        self._entries.clear()
+        for entry in entries:
+            await self._close_client(entry.client)
+
+    # ── Public API ────────────────────────────────────────
+
+    async def acquire(self, exchange_id: str, db_config=None) -> PooledExchange:
+        """Return the shared client for ``exchange_id`` and its credentials."""
+        key = (exchange_id, getattr(db_config, "pk", None))
+        client = await self._run(self._open(key, exchange_id, db_config))
+        return PooledExchange(self, key, client)
+
+    def stats(self) -> list[dict]:
+        """Open clients and their markets age, for health endpoints."""
+        now = time.monotonic()
+        return [
+            {
+                "exchange_id": key[0],
+                "config_id": key[1],
+                "markets_age_seconds": (
+                    round(now - entry.markets_loaded_at, 1)
+                    if entry.markets_loaded_at is not None
+                    else None
+                ),
+            }
+            for key, entry in list(self._entries.items())
+        ]
+
+    def close(self, timeout: float = 10.0) -> None:
+        """Close every pooled client and stop the pool's loop thread."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None:
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self._close_all(), loop).result(timeout)
+        except Exception as e:
+            logger.warning("Exchange pool shutdown incomplete: %s", e)
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout)
+        loop.close()
+
+
+_pool: ExchangeClientPool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_exchange_pool() -> ExchangeClientPool:
+    """Get or create the process-wide exchange client pool."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ExchangeClientPool(
+                    max_concurrency=getattr(
+                        settings, "EXCHANGE_MAX_CONCURRENCY", DEFAULT_MAX_CONCURRENCY,
+                    ),
+                    markets_ttl_seconds=getattr(
+                        settings, "EXCHANGE_MARKETS_TTL_SECONDS", DEFAULT_MARKETS_TTL_SECONDS,
+                    ),
+                )
+                atexit.register(close_exchange_pool)
+    return _pool
+
+
+def close_exchange_pool() -> None:
+    """Close the process-wide pool (if any). Safe to call more than once."""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.close()
@@ -0,0 +1,216 @@
+"""Process-wide snapshot of the latest known price per symbol.
+
+Portfolio analytics, risk valuation and paper trading all need the current
+price of a handful of symbols. Rather than each of them fetching tickers on
+every request, they read this store, which is fed by:
+
+- the ticker poller, on every poll of the subscribed symbols;
+- the data refresh job, with the last candle close of each watchlist symbol;
+- the risk sync, with Freqtrade's mark prices of open positions;
+- its own fallback: symbols that are missing or older than ``max_age`` are
+  fetched with one batched ``fetch_tickers`` call and stored.
+
+Prices are keyed by symbol only; which exchange a crypto price came from is
+recorded in ``source`` but not used for lookups.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from dataclasses import dataclass
+
+from asgiref.sync import async_to_sync
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_AGE_SECONDS = 30.0
+
+
+@dataclass(frozen=True)
+class PriceQuote:
+    """Last known price of a symbol and where and when it was observed."""
+
+    symbol: str
+    price: float
+    updated_at: float  # epoch seconds
+    source: str
+
+    @property
+    def age_seconds(self) -> float:
+        return max(0.0, time.time() - self.updated_at)
+
+    def is_stale(self, max_age: float) -> bool:
+        return self.age_seconds > max_age
+
+    def to_dict(self, max_age: float = DEFAULT_MAX_AGE_SECONDS) -> dict:
+        age = self.age_seconds
+        return {
+            "symbol": self.symbol,
+            "price": self.price,
+            "source": self.source,
+            "age_seconds": round(age, 3),
+            "stale": age > max_age,
+        }
+
+
+class PriceSnapshotStore:
+    """Thread-safe map of symbol -> :class:`PriceQuote`.
+
+    Args:
+        max_age_seconds: Default age after which a quote is refetched.
+
+    """
+
+    def __init__(self, max_age_seconds: float = DEFAULT_MAX_AGE_SECONDS) -> None:
+        self.max_age_seconds = max_age_seconds
+        self._quotes: dict[str, PriceQuote] = {}
+        self._lock = threading.Lock()
+
+    def update(self, prices: dict[str, float], source: str, at: float | None = None) -> int:
+        """Store ``prices`` observed at ``at`` (default: now); returns how many were kept.
+
+        Missing or non-positive prices are ignored, and a quote never replaces
+        a newer one for the same symbol.
+        """
+        at = time.time() if at is None else at
+        stored = 0
+        with self._lock:
+            for symbol, price in prices.items():
+                if not price or price <= 0:
+                    continue
+                current = self._quotes.get(symbol)
+                if current is not None and current.updated_at > at:
+                    continue
+                self._quotes[symbol] = PriceQuote(symbol, float(price), at, source)
+                stored += 1
+        return stored
+
+    def get_many(self, symbols: list[str]) -> dict[str, PriceQuote]:
+        """Known quotes for ``symbols``, fresh or not. Never fetches."""
+        with self._lock:
+            return {s: self._quotes[s] for s in symbols if s in self._quotes}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._quotes.clear()
+
+    def _lookup(
+        self,
+        symbols: list[str],
+        max_age: float | None,
+    ) -> tuple[dict[str, PriceQuote], list[str]]:
+        max_age = self.max_age_seconds if max_age is None else max_age
+        quotes = self.get_many(symbols)
+        stale = [
+            s for s in dict.fromkeys(symbols) if s not in quotes or quotes[s].is_stale(max_age)
+        ]
+        return quotes, stale
+
+    async def aget_prices(
+        self,
+        symbols: list[str],
+        asset_class: str = "crypto",
+        exchange_id: str | None = None,
+        max_age: float | None = None,
+    ) -> dict[str, PriceQuote]:
+        """Quotes for ``symbols``, refetching missing or stale ones in one batch.
+
+        If the refetch fails, the stale quotes (if any) are returned as they
+        are; check :meth:`PriceQuote.is_stale` where that matters.
+        """
+        quotes, stale = self._lookup(symbols, max_age)
+        if not stale:
+            return quotes
+        await self._refresh(stale, asset_class, exchange_id)
+        return self.get_many(symbols)
+
+    def get_prices(
+        self,
+        symbols: list[str],
+        asset_class: str = "crypto",
+        exchange_id: str | None = None,
+        max_age: float | None = None,
+    ) -> dict[str, PriceQuote]:
+        """Synchronous :meth:`aget_prices`; fresh reads don't touch an event loop."""
+        quotes, stale = self._lookup(symbols, max_age)
+        if not stale:
+            return quotes
+        async_to_sync(self._refresh)(stale, asset_class, exchange_id)
+        return self.get_many(symbols)
+
+    async def _refresh(
+        self,
+        symbols: list[str],
+        asset_class: str,
+        exchange_id: str | None,
+    ) -> None:
+        try:
+            if asset_class in ("equity", "forex"):
+                from market.services.data_router import DataServiceRouter
+
+                tickers = await DataServiceRouter().fetch_tickers(symbols, asset_class)
+                source = "yfinance"
+            else:
+                tickers, source = await _fetch_exchange_tickers(symbols, exchange_id)
+        except Exception as e:
+            logger.warning("Price refresh failed for %s: %s", ", ".join(symbols), e)
+            return
+        self.update(
+            {t["symbol"]: t.get("price") for t in tickers or [] if t.get("symbol")},
+            source=source,
+        )
+
+
+async def _fetch_exchange_tickers(
+    symbols: list[str],
+    exchange_id: str | None,
+) -> tuple[list[dict], str]:
+    """One ``fetch_tickers`` call for ``symbols``.
+
+    Exchanges reject the whole batch for one unknown symbol (or don't support
+    ``fetchTickers`` at all); the symbols are then fetched one by one,
+    concurrently, and failures are skipped.
+    """
+    from market.services.exchange import ExchangeService
+
+    source = exchange_id or settings.EXCHANGE_ID
+    service = ExchangeService(exchange_id=source, shared=True)
+    try:
+        try:
+            return await service.fetch_tickers(symbols), source
+        except Exception as e:
+            if len(symbols) == 1:
+                raise
+            logger.info("Batched ticker fetch on %s failed (%s), fetching per symbol", source, e)
+        results = await asyncio.gather(
+            *(service.fetch_ticker(s) for s in symbols),
+            return_exceptions=True,
+        )
+        for symbol, result in zip(symbols, results, strict=True):
+            if isinstance(result, Exception):
+                logger.warning("Failed to fetch price for %s on %s: %s", symbol, source, result)
+        return [r for r in results if isinstance(r, dict)], source
+    finally:
+        await service.close()
+
+
+_store: PriceSnapshotStore | None = None
+_store_lock = threading.Lock()
+
+
+def get_price_store() -> PriceSnapshotStore:
+    """Get or create the process-wide price snapshot store."""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = PriceSnapshotStore(
+                    max_age_seconds=getattr(
+                        settings,
+                        "PRICE_SNAPSHOT_MAX_AGE_SECONDS",
+                        DEFAULT_MAX_AGE_SECONDS,
+                    ),
+                )
+    return _store
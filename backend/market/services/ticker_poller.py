@@ -1,11 +1,21 @@
-"""Background ticker poller — fetches prices via ccxt and broadcasts to WebSocket clients."""
+"""Background ticker poller — fetches prices via ccxt and broadcasts to WebSocket clients.
+
+The poller only fetches the symbols some connected client has subscribed
+to (see :class:`TickerHub`). Each poll is diffed against the previous
+snapshot, and only changed fields are sent, to the per-symbol group of
+clients watching that symbol. Polled prices also feed the shared price
+snapshot (:mod:`market.services.price_store`).
+"""
 
 import asyncio
 import contextlib
 import logging
+import re
 
 from channels.layers import get_channel_layer
 
+from market.services.price_store import get_price_store
+
 logger = logging.getLogger(__name__)
 
 _poller_task: asyncio.Task | None = None
@@ -14,30 +24,113 @@ _poller_lock = asyncio.Lock()
 POLL_INTERVAL_SECONDS = 10
 DEFAULT_SYMBOLS = ["BTC/USDT", "ETH/USDT", "SOL/USDT", "XRP/USDT", "ADA/USDT"]
 
+# A change in these fields alone is not worth a message
+DIFF_IGNORED_FIELDS = frozenset({"timestamp"})
+
+
+def ticker_group(symbol: str) -> str:
+    """Channel-layer group for clients subscribed to ``symbol``."""
+    return "ticker." + re.sub(r"[^A-Za-z0-9_.-]", "_", symbol)
+
+
+class TickerHub:
+    """Per-client symbol subscriptions and the last broadcast ticker snapshot.
+
+    Lives on the ASGI event loop alongside the consumers and the poller,
+    so no locking is needed.
+    """
+
+    def __init__(self) -> None:
+        self._subscriptions: dict[str, set[str]] = {}  # channel_name -> symbols
+        self._snapshot: dict[str, dict] = {}
+
+    @property
+    def symbols(self) -> list[str]:
+        """Union of all subscribed symbols, i.e. what the poller fetches."""
+        return sorted(set().union(*self._subscriptions.values()))
+
+    def subscriptions(self, channel_name: str) -> set[str]:
+        return set(self._subscriptions.get(channel_name, ()))
+
+    def subscribe(self, channel_name: str, symbols: list[str]) -> list[str]:
+        """Add ``symbols`` for a client; returns the ones that were new."""
+        current = self._subscriptions.setdefault(channel_name, set())
+        added = [s for s in dict.fromkeys(symbols) if s not in current]
+        current.update(added)
+        return added
+
+    def unsubscribe(self, channel_name: str, symbols: list[str] | None = None) -> list[str]:
+        """Drop ``symbols`` (default: all) for a client; returns those removed."""
+        current = self._subscriptions.get(channel_name, set())
+        removed = sorted(current if symbols is None else current & set(symbols))
+        current.difference_update(removed)
+        if not current:
+            self._subscriptions.pop(channel_name, None)
+        # Forget prices nobody watches so a later subscriber gets a full entry
+        watched = set(self.symbols)
+        for symbol in removed:
+            if symbol not in watched:
+                self._snapshot.pop(symbol, None)
+        return removed
+
+    def snapshot(self, symbols: list[str]) -> list[dict]:
+        """Last known full tickers for ``symbols`` (unknown ones are skipped)."""
+        return [dict(self._snapshot[s]) for s in symbols if s in self._snapshot]
+
+    def apply(self, tickers: list[dict]) -> dict[str, dict]:
+        """Store ``tickers`` and return the changed fields per symbol.
+
+        A symbol seen for the first time yields its full ticker.
+        """
+        changes: dict[str, dict] = {}
+        for ticker in tickers:
+            symbol = ticker.get("symbol")
+            if not symbol:
+                continue
+            previous = self._snapshot.get(symbol, {})
+            changed = {k: v for k, v in ticker.items() if previous.get(k) != v}
+            self._snapshot[symbol] = dict(ticker)
+            if changed.keys() - DIFF_IGNORED_FIELDS - {"symbol"}:
+                changes[symbol] = {"symbol": symbol, **changed}
+        return changes
+
+
+_hub = TickerHub()
+
+
+def get_ticker_hub() -> TickerHub:
+    """The process-wide ticker hub."""
+    return _hub
+
 
 async def _poll_loop() -> None:
-    """Continuously fetch tickers and broadcast to the market_tickers group."""
+    """Fetch subscribed tickers and send per-symbol deltas to their groups."""
     channel_layer = get_channel_layer()
+    hub = get_ticker_hub()
 
     while True:
-        try:
-            from market.services.exchange import ExchangeService
-
-            service = ExchangeService()
+        symbols = hub.symbols
+        if symbols:
             try:
-                tickers = await service.fetch_tickers(DEFAULT_SYMBOLS)
-                if tickers:
+                from market.services.exchange import ExchangeService
+
+                service = ExchangeService(shared=True)
+                try:
+                    tickers = await service.fetch_tickers(symbols)
+                finally:
+                    await service.close()
+
+                get_price_store().update(
+                    {t["symbol"]: t.get("price") for t in tickers or [] if t.get("symbol")},
+                    source="ticker",
+                )
+                for symbol, delta in hub.apply(tickers or []).items():
                     await channel_layer.group_send(
-                        "market_tickers",
-                        {
-                            "type": "ticker_update",
-                            "data": {"tickers": tickers},
-                        },
+                        ticker_group(symbol),
+                        {"type": "ticker_delta", "data": delta},
                     )
-            finally:
-                await service.close()
-        except Exception as e:
-            logger.warning(f"Ticker poll failed: {e}")
+            except Exception as e:
+                logger.warning(f"Ticker poll failed: {e}")
 
         await asyncio.sleep(POLL_INTERVAL_SECONDS)
 
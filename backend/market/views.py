@@ -518,7 +518,7 @@ class TickerListView(APIView):
                 )
 
             async def _fetch():
-                service = ExchangeService()
+                service = ExchangeService(shared=True)
                 try:
                     return await service.fetch_tickers(symbol_list)
                 finally:
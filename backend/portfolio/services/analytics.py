@@ -2,8 +2,6 @@
 
 import logging
 
-from asgiref.sync import async_to_sync
-
 from portfolio.models import Holding, Portfolio
 
 logger = logging.getLogger(__name__)
@@ -97,30 +95,14 @@ class PortfolioAnalyticsService:
 
 
 def _fetch_prices(holdings: list[Holding], exchange_id: str) -> dict[str, float]:
-    """Fetch current prices for holdings. Returns {symbol: price}."""
-    prices: dict[str, float] = {}
-
-    try:
-        from market.services.exchange import ExchangeService
-
-        service = ExchangeService(exchange_id=exchange_id)
-
-        async def _fetch_all():
-            results = {}
-            for h in holdings:
-                try:
-                    ticker = await service.fetch_ticker(h.symbol)
-                    if ticker and ticker.get("price"):
-                        results[h.symbol] = ticker["price"]
-                except Exception:
-                    logger.warning("Failed to fetch price for %s on %s", h.symbol, exchange_id)
-            await service.close()
-            return results
-
-        prices = async_to_sync(_fetch_all)()
-    except ImportError:
-        logger.warning("ExchangeService not available, using cost basis for all holdings")
-    except (ConnectionError, TimeoutError, OSError) as e:
-        logger.warning("Price fetch failed (%s), using cost basis: %s", type(e).__name__, e)
-
-    return prices
+    """Current prices for holdings from the price snapshot. Returns {symbol: price}.
+
+    Symbols without a fresh snapshot price are fetched in one batch; a
+    stale price is still used when that fetch fails.
+    """
+    from market.services.price_store import get_price_store
+
+    quotes = get_price_store().get_prices(
+        [h.symbol for h in holdings], exchange_id=exchange_id,
+    )
+    return {symbol: quote.price for symbol, quote in quotes.items()}
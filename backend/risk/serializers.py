@@ -140,6 +140,8 @@ class HaltResponseSerializer(serializers.Serializer):
     is_halted = serializers.BooleanField()
     halt_reason = serializers.CharField()
     message = serializers.CharField()
+    cancelled_orders = serializers.IntegerField(required=False)
+    cancel_elapsed_ms = serializers.FloatField(required=False)
 
 
 class AlertLogSerializer(serializers.ModelSerializer):
@@ -2,6 +2,7 @@
 
 import logging
 import threading as _threading
+import time
 from datetime import datetime, timedelta, timezone
 
 from channels.layers import get_channel_layer
@@ -497,9 +498,15 @@ class RiskManagementService:
         state.is_halted = True
         state.halt_reason = reason
         await sync_to_async(state.save)()
+        halted_at = time.monotonic()
 
         # Cancel all open live orders
         cancelled = await LiveTradingService.cancel_all_open_orders(portfolio_id)
+        cancel_elapsed_ms = round((time.monotonic() - halted_at) * 1000, 1)
+        logger.warning(
+            f"Kill switch: portfolio {portfolio_id} halted, {cancelled} orders cancelled "
+            f"in {cancel_elapsed_ms} ms",
+        )
 
         # Broadcast halt status via WebSocket
         channel_layer = get_channel_layer()
@@ -512,6 +519,7 @@ class RiskManagementService:
                         "is_halted": True,
                         "halt_reason": reason,
                         "cancelled_orders": cancelled,
+                        "cancel_elapsed_ms": cancel_elapsed_ms,
                     },
                 },
             )
@@ -547,6 +555,7 @@ class RiskManagementService:
             "is_halted": True,
             "halt_reason": reason,
             "cancelled_orders": cancelled,
+            "cancel_elapsed_ms": cancel_elapsed_ms,
             "message": f"Trading halted: {reason} ({cancelled} orders cancelled)",
         }
 
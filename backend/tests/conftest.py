@@ -35,3 +35,39 @@ def _mock_btc_dominance():
         patch("common.market_data.coingecko.get_dominance_signal", return_value=neutral),
     ):
         yield
+
+
+@pytest.fixture(autouse=True)
+def _fresh_price_store():
+    """Start every test with an empty process-wide price snapshot."""
+    yield
+    from market.services.price_store import get_price_store
+
+    get_price_store().clear()
+
+
+@pytest.fixture(autouse=True)
+def _fresh_freqtrade_pool():
+    """Drop cached Freqtrade instance snapshots between tests."""
+    yield
+    from core.services.freqtrade_pool import close_freqtrade_pool
+
+    close_freqtrade_pool()
+
+
+@pytest.fixture(autouse=True)
+def _fresh_source_accuracy_cache():
+    """Drop cached signal source accuracy between tests."""
+    yield
+    from analysis.services.signal_feedback import clear_source_accuracy_cache
+
+    clear_source_accuracy_cache()
+
+
+@pytest.fixture(autouse=True)
+def _fresh_kpi_cache():
+    """Drop cached dashboard KPI payloads between tests."""
+    yield
+    from core.services.dashboard import clear_kpi_cache
+
+    clear_kpi_cache()
@@ -103,6 +103,35 @@ class TestLSTMModel:
         assert x.shape == (n_rows - seq_len, seq_len, n_features)
         assert y.shape == (n_rows - seq_len, 1)
 
+    def test_prepare_sequences_matches_loop(self):
+        from common.ml.lstm_model import is_available, prepare_sequences
+
+        if not is_available():
+            return
+
+        seq_len = 15
+        features = np.random.randn(80, 6)
+        target = np.random.randint(0, 2, 80).astype(np.float32)
+
+        x, y = prepare_sequences(features, target, seq_len)
+        expected = np.array(
+            [features[i - seq_len:i] for i in range(seq_len, 80)], dtype=np.float32,
+        )
+        np.testing.assert_array_equal(x.numpy(), expected)
+        np.testing.assert_array_equal(y.numpy().ravel(), target[seq_len:])
+
+    def test_prepare_sequences_is_zero_copy(self):
+        from common.ml.lstm_model import is_available, prepare_sequences
+
+        if not is_available():
+            return
+
+        features = np.random.randn(500, 8)
+        target = np.random.randint(0, 2, 500).astype(np.float32)
+        x, _ = prepare_sequences(features, target, seq_len=60)
+        # Windows share one (500, 8) float32 buffer instead of 440 copies
+        assert x.untyped_storage().nbytes() <= 500 * 8 * 4
+
     def test_prepare_sequences_too_short(self):
         from common.ml.lstm_model import is_available, prepare_sequences
 
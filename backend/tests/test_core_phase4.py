@@ -2038,20 +2038,24 @@ class TestDashboardService:
 
     def test_get_paper_trading_kpis_running_instance(self):
         from core.services.dashboard import DashboardService
-
-        mock_svc = MagicMock()
-        mock_svc.get_status.return_value = {"running": True, "strategy": "CIV1"}
-        mock_profit = {
-            "profit_all_coin": 100.0,
-            "profit_all_percent": 2.0,
-            "trade_count": 5,
-            "closed_trade_count": 3,
-            "winning_trades": 2,
-            "losing_trades": 1,
-        }
+        from core.services.freqtrade_pool import FreqtradePool, InstanceSnapshot
+
+        snapshot = InstanceSnapshot(
+            "inst1",
+            reachable=True,
+            config={"strategy": "CIV1"},
+            profit={
+                "profit_all_coin": 100.0,
+                "profit_all_percent": 2.0,
+                "trade_count": 5,
+                "closed_trade_count": 3,
+                "winning_trades": 2,
+                "losing_trades": 1,
+            },
+        )
         with (
-            patch("trading.views._get_paper_trading_services", return_value={"inst1": mock_svc}),
-            patch("asgiref.sync.async_to_sync", return_value=MagicMock(return_value=mock_profit)),
+            patch("trading.views._get_paper_trading_services", return_value={"inst1": MagicMock()}),
+            patch.object(FreqtradePool, "snapshots", return_value={"inst1": snapshot}),
         ):
             result = DashboardService._get_paper_trading_kpis()
         assert result["instances_running"] == 2  # 1 Freqtrade + 1 forex
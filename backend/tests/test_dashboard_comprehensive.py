@@ -372,22 +372,26 @@ class TestEmptyDataDefaults:
 class TestPaperTradingWidget:
     def test_paper_trading_with_running_instance(self):
         """Running instance is counted and aggregated."""
-        mock_svc = MagicMock()
-        mock_svc.get_status.return_value = {"running": True, "strategy": "CryptoInvestorV1"}
+        from core.services.freqtrade_pool import FreqtradePool, InstanceSnapshot
 
-        async def mock_profit():
-            return {
+        snapshot = InstanceSnapshot(
+            "civ1",
+            reachable=True,
+            config={"strategy": "CryptoInvestorV1"},
+            profit={
                 "profit_all_coin": 100.0,
                 "profit_all_percent": 10.0,
                 "trade_count": 5,
                 "closed_trade_count": 3,
                 "winning_trades": 2,
                 "losing_trades": 1,
-            }
+            },
+        )
 
-        mock_svc.get_profit = mock_profit
-
-        with patch("trading.views._get_paper_trading_services", return_value={"civ1": mock_svc}):
+        with (
+            patch("trading.views._get_paper_trading_services", return_value={"civ1": MagicMock()}),
+            patch.object(FreqtradePool, "snapshots", return_value={"civ1": snapshot}),
+        ):
             pt = DashboardService._get_paper_trading_kpis()
             assert pt["instances_running"] == 2  # 1 Freqtrade + 1 forex
             assert pt["total_pnl"] == 100.0
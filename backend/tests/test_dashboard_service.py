@@ -1,10 +1,33 @@
 """Tests for DashboardService — KPI aggregation service."""
 
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from core.services.dashboard import DashboardService
+from core.services.freqtrade_pool import FreqtradePool, InstanceSnapshot
+
+
+def _freqtrade_snapshots(**by_name):
+    """Answer Freqtrade polls with ``{name: (config, profit)}``; None = unreachable."""
+
+    def fetch(pool, instance):
+        canned = by_name.get(instance.name)
+        if canned is None:
+            return InstanceSnapshot(
+                instance.name, reachable=False, error="refused", fetched_at=time.monotonic(),
+            )
+        config, profit = canned
+        return InstanceSnapshot(
+            instance.name,
+            reachable=True,
+            config=config,
+            profit=profit,
+            fetched_at=time.monotonic(),
+        )
+
+    return patch.object(FreqtradePool, "_fetch", autospec=True, side_effect=fetch)
 
 
 @pytest.mark.django_db
@@ -137,27 +160,24 @@ class TestDashboardServicePaperTradingKpis:
 
     def test_paper_trading_with_mock_services(self):
         """Paper trading KPIs aggregate data from multiple instances."""
-        mock_svc = MagicMock()
-        mock_svc.get_status.return_value = {
-            "running": True,
-            "strategy": "TestStrategy",
+        profit = {
+            "profit_all_coin": 25.50,
+            "profit_all_percent": 5.1,
+            "trade_count": 3,
+            "closed_trade_count": 2,
+            "winning_trades": 1,
+            "losing_trades": 1,
         }
 
-        async def mock_profit():
-            return {
-                "profit_all_coin": 25.50,
-                "profit_all_percent": 5.1,
-                "trade_count": 3,
-                "closed_trade_count": 2,
-                "winning_trades": 1,
-                "losing_trades": 1,
-            }
-
-        mock_svc.get_profit = mock_profit
-
-        with patch(
-            "trading.views._get_paper_trading_services",
-            return_value={"civ1": mock_svc, "bmr": mock_svc},
+        with (
+            patch(
+                "trading.views._get_paper_trading_services",
+                return_value={"civ1": MagicMock(), "bmr": MagicMock()},
+            ),
+            _freqtrade_snapshots(
+                civ1=({"strategy": "TestStrategy"}, profit),
+                bmr=({"strategy": "TestStrategy"}, profit),
+            ),
         ):
             pt = DashboardService._get_paper_trading_kpis()
             assert pt["instances_running"] == 3  # 2 Freqtrade + 1 forex
@@ -178,31 +198,118 @@ class TestDashboardServicePaperTradingKpis:
 
     def test_paper_trading_instance_failure_isolated(self):
         """One failing instance doesn't break the whole aggregation."""
-        good_svc = MagicMock()
-        good_svc.get_status.return_value = {"running": True, "strategy": "Good"}
-
-        async def good_profit():
-            return {
-                "profit_all_coin": 10.0,
-                "profit_all_percent": 2.0,
-                "trade_count": 1,
-                "closed_trade_count": 1,
-                "winning_trades": 1,
-                "losing_trades": 0,
-            }
-
-        good_svc.get_profit = good_profit
-
-        bad_svc = MagicMock()
-        bad_svc.get_status.side_effect = Exception("connection refused")
+        profit = {
+            "profit_all_coin": 10.0,
+            "profit_all_percent": 2.0,
+            "trade_count": 1,
+            "closed_trade_count": 1,
+            "winning_trades": 1,
+            "losing_trades": 0,
+        }
 
-        with patch(
-            "trading.views._get_paper_trading_services",
-            return_value={"good": good_svc, "bad": bad_svc},
+        with (
+            patch(
+                "trading.views._get_paper_trading_services",
+                return_value={"good": MagicMock(), "bad": MagicMock()},
+            ),
+            _freqtrade_snapshots(good=({"strategy": "Good"}, profit), bad=None),
         ):
             pt = DashboardService._get_paper_trading_kpis()
             assert pt["instances_running"] == 2  # 1 good Freqtrade + 1 forex
             assert pt["total_pnl"] == 10.0
             assert len(pt["instances"]) == 3  # good + bad + forex
             assert pt["instances"][0]["running"] is True
+            assert pt["instances"][0]["strategy"] == "Good"
             assert pt["instances"][1]["running"] is False
+
+
+def _order(status):
+    from django.utils import timezone as dj_tz
+
+    from trading.models import Order
+
+    return Order.objects.create(
+        exchange_id="kraken",
+        symbol="BTC/USDT",
+        side="buy",
+        order_type="market",
+        amount=1.0,
+        status=status,
+        timestamp=dj_tz.now(),
+    )
+
+
+@pytest.mark.django_db
+class TestDashboardServiceQueries:
+    def test_order_counts_in_one_query(self, django_assert_num_queries):
+        from trading.models import OrderStatus
+
+        for status in ["open", "filled", "filled", "rejected"]:
+            _order(OrderStatus(status))
+
+        with django_assert_num_queries(1):
+            trading = DashboardService._get_trading_kpis(None)
+
+        assert trading["total_orders"] == 4
+        assert trading["open_orders"] == 1
+        assert trading["filled_orders"] == 2
+        assert trading["rejected_orders"] == 1
+        assert trading["rejection_rate"] == 25.0
+
+    def test_learning_status_one_query_per_table(self, django_assert_num_queries):
+        from analysis.models import MLPrediction
+
+        for correct in [True, True, False, None]:
+            MLPrediction.objects.create(
+                model_id="m1",
+                symbol="BTC/USDT",
+                asset_class="crypto",
+                probability=0.7,
+                confidence=0.8,
+                direction="up",
+                correct=correct,
+            )
+
+        # MLPrediction, SignalAttribution, BackgroundJob
+        with django_assert_num_queries(3):
+            status = DashboardService._get_learning_status()
+
+        assert status["ml_predictions_total"] == 4
+        assert status["ml_accuracy"] == pytest.approx(66.7)
+        assert status["ml_models_count"] == 0
+        assert status["ml_last_trained"] is None
+
+
+@pytest.mark.django_db
+class TestDashboardServiceKpiCache:
+    def test_snapshot_reused_per_asset_class(self):
+        with patch.object(
+            DashboardService, "_collect_kpis", return_value=({"trading": {}}, True),
+        ) as collect:
+            DashboardService.get_kpis()
+            DashboardService.get_kpis()["trading"]["mutated"] = True
+            assert DashboardService.get_kpis() == {"trading": {}}
+            DashboardService.get_kpis(asset_class="equity")
+
+        assert [c.args for c in collect.call_args_list] == [(None,), ("equity",)]
+
+    def test_model_save_invalidates_snapshot(self):
+        from trading.models import OrderStatus
+
+        with patch.object(
+            DashboardService, "_collect_kpis", return_value=({"trading": {}}, True),
+        ) as collect:
+            DashboardService.get_kpis()
+            _order(OrderStatus.OPEN)
+            DashboardService.get_kpis()
+
+        assert collect.call_count == 2
+
+    def test_partial_payload_not_cached(self):
+        with patch.object(
+            DashboardService, "_collect_kpis", return_value=({"trading": {}}, False),
+        ) as collect:
+            DashboardService.get_kpis()
+            DashboardService.get_kpis()
+
+        assert collect.call_count == 2
@@ -1295,3 +1295,40 @@ class TestDataQualityReport:
         assert report.symbol == "BTC/USDT"
         assert report.passed is True
         assert report.rows == 100
+
+
+class TestSharedFrame:
+    def _frame(self, tz="UTC"):
+        idx = pd.date_range("2024-01-01", periods=50, freq="h", tz=tz, name="timestamp")
+        rng = np.random.default_rng(0)
+        return pd.DataFrame(
+            {"open": rng.random(50), "close": rng.random(50), "volume": rng.random(50)},
+            index=idx,
+        )
+
+    def test_round_trip_preserves_values_and_index(self):
+        from common.data_pipeline.shared_frame import SharedFrame, attach_frame
+
+        df = self._frame()
+        with SharedFrame(df) as shared:
+            attached = attach_frame(shared.spec)
+            pd.testing.assert_frame_equal(attached, df, check_freq=False)
+
+    def test_attached_frame_is_read_only_view(self):
+        from common.data_pipeline.shared_frame import SharedFrame, attach_frame
+
+        df = self._frame(tz=None)
+        with SharedFrame(df) as shared:
+            attached = attach_frame(shared.spec)
+            assert attached.index.tz is None
+            assert not attached["close"].to_numpy().flags.writeable
+            assert attach_frame(shared.spec)["close"].iloc[0] == df["close"].iloc[0]
+
+    def test_non_datetime_index_travels_in_spec(self):
+        from common.data_pipeline.shared_frame import SharedFrame, attach_frame
+
+        df = pd.DataFrame({"close": [1.0, 2.0, 3.0]}, index=[10, 20, 30])
+        with SharedFrame(df) as shared:
+            attached = attach_frame(shared.spec)
+            assert list(attached.index) == [10, 20, 30]
+            assert list(attached["close"]) == [1.0, 2.0, 3.0]
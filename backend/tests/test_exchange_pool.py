@@ -0,0 +1,130 @@
+"""Tests for market.services.exchange_pool — pooled, long-lived ccxt clients."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from market.services.exchange_pool import ExchangeClientPool
+
+
+def _make_client():
+    client = MagicMock()
+    client.load_markets = AsyncMock(return_value={})
+    client.fetch_ticker = AsyncMock(return_value={"symbol": "BTC/USDT", "last": 50000.0})
+    client.close = AsyncMock()
+    client.has = {"fetchTickers": True}
+    return client
+
+
+@pytest.fixture
+def pool():
+    pool = ExchangeClientPool(max_concurrency=2, markets_ttl_seconds=60)
+    yield pool
+    pool.close()
+
+
+@pytest.fixture
+def build():
+    with patch(
+        "market.services.exchange._build_exchange",
+        side_effect=lambda *args: _make_client(),
+    ) as build:
+        yield build
+
+
+class TestExchangeClientPool:
+    def test_client_shared_across_event_loops(self, pool, build):
+        async def fetch():
+            exchange = await pool.acquire("kraken")
+            await exchange.fetch_ticker("BTC/USDT")
+            return exchange
+
+        first = asyncio.run(fetch())
+        second = asyncio.run(fetch())
+
+        build.assert_called_once()
+        assert first._client is second._client
+        assert first._client.fetch_ticker.await_count == 2
+        # Plain attributes are read straight from the client
+        assert second.has["fetchTickers"] is True
+
+    def test_markets_loaded_once_then_refreshed_after_ttl(self, pool, build):
+        async def fetch_twice():
+            exchange = await pool.acquire("kraken")
+            await exchange.fetch_ticker("BTC/USDT")
+            await exchange.fetch_ticker("ETH/USDT")
+            return exchange
+
+        client = asyncio.run(fetch_twice())._client
+        client.load_markets.assert_awaited_once_with(reload=False)
+
+        pool.markets_ttl_seconds = 0
+        asyncio.run(fetch_twice())
+        assert client.load_markets.await_args_list[-1].kwargs == {"reload": True}
+
+    def test_concurrency_limited_per_exchange(self, pool, build):
+        in_flight = 0
+        peak = 0
+
+        async def slow_ticker(symbol):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.02)
+            in_flight -= 1
+            return {"symbol": symbol}
+
+        async def fetch_many():
+            exchange = await pool.acquire("kraken")
+            exchange._client.fetch_ticker = AsyncMock(side_effect=slow_ticker)
+            return await asyncio.gather(*(exchange.fetch_ticker(f"S{i}") for i in range(6)))
+
+        results = asyncio.run(fetch_many())
+
+        assert len(results) == 6
+        assert peak == 2
+
+    def test_changed_credentials_replace_client(self, pool, build):
+        old_config = SimpleNamespace(pk=7, updated_at=1)
+        new_config = SimpleNamespace(pk=7, updated_at=2)
+
+        first = asyncio.run(pool.acquire("binance", old_config))
+        second = asyncio.run(pool.acquire("binance", new_config))
+
+        assert build.call_count == 2
+        assert first._client is not second._client
+        first._client.close.assert_awaited_once()
+
+    def test_close_closes_clients_but_borrower_close_does_not(self, pool, build):
+        async def borrow():
+            exchange = await pool.acquire("kraken")
+            await exchange.close()
+            return exchange
+
+        exchange = asyncio.run(borrow())
+        exchange._client.close.assert_not_awaited()
+        assert [s["exchange_id"] for s in pool.stats()] == ["kraken"]
+
+        pool.close()
+        exchange._client.close.assert_awaited_once()
+        assert pool.stats() == []
+
+
+@pytest.mark.django_db
+class TestSharedExchangeService:
+    def test_shared_service_borrows_pooled_client(self, pool, build):
+        from market.services.exchange import ExchangeService
+
+        async def use_service():
+            service = ExchangeService(exchange_id="kraken", shared=True)
+            exchange = await service._get_exchange()
+            await service.close()
+            return exchange
+
+        with patch("market.services.exchange_pool.get_exchange_pool", return_value=pool):
+            exchange = asyncio.run(use_service())
+
+        build.assert_called_once_with("kraken", None)
+        exchange._client.close.assert_not_awaited()
@@ -0,0 +1,124 @@
+"""Tests for core.services.freqtrade_pool — concurrent, cached Freqtrade polling."""
+
+import threading
+import time
+
+import httpx
+import pytest
+
+from core.services.freqtrade_pool import FreqtradeInstance, FreqtradePool
+
+PROFIT = {"profit_all_coin": 12.5, "trade_count": 3, "closed_trade_count": 2}
+
+
+class _FakeClient:
+    """Stands in for a pooled httpx.Client; counts requests per endpoint."""
+
+    def __init__(self, delay: float = 0.0, error: Exception | None = None):
+        self.delay = delay
+        self.error = error
+        self.calls: list[str] = []
+        self.lock = threading.Lock()
+
+    def get(self, endpoint):
+        with self.lock:
+            self.calls.append(endpoint)
+        time.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        body = {"strategy": "Scalper"} if endpoint == "show_config" else PROFIT
+        return httpx.Response(200, json=body)
+
+
+def _instances(n):
+    return [FreqtradeInstance(f"bot{i}", f"http://bot{i}:8080") for i in range(n)]
+
+
+@pytest.fixture
+def pool():
+    pool = FreqtradePool(ttl_seconds=60, max_stale_seconds=600, deadline_seconds=1.0)
+    yield pool
+    pool.close()
+
+
+def _use(pool, clients):
+    pool._client = lambda instance: clients[instance.name]
+
+
+class TestFreqtradePool:
+    def test_instances_polled_concurrently(self, pool):
+        clients = {f"bot{i}": _FakeClient(delay=0.2) for i in range(5)}
+        _use(pool, clients)
+
+        started = time.monotonic()
+        snapshots = pool.snapshots(_instances(5))
+        elapsed = time.monotonic() - started
+
+        assert list(snapshots) == [f"bot{i}" for i in range(5)]
+        assert all(s.reachable and s.profit == PROFIT for s in snapshots.values())
+        assert snapshots["bot0"].config["strategy"] == "Scalper"
+        # 5 instances x 2 requests x 0.2s sequentially would take 2s
+        assert elapsed < 1.0
+
+    def test_fresh_snapshot_reused(self, pool):
+        client = _FakeClient()
+        _use(pool, {"bot0": client})
+
+        first = pool.snapshots(_instances(1))["bot0"]
+        second = pool.snapshots(_instances(1))["bot0"]
+
+        assert second is first
+        assert client.calls == ["show_config", "profit"]
+
+    def test_stale_snapshot_served_while_refreshing(self, pool):
+        client = _FakeClient()
+        _use(pool, {"bot0": client})
+        pool.snapshots(_instances(1))
+
+        pool.ttl_seconds = 0
+        client.delay = 0.3
+        started = time.monotonic()
+        stale = pool.snapshots(_instances(1))["bot0"]
+
+        assert time.monotonic() - started < 0.2
+        assert stale.stale is True
+        assert stale.profit == PROFIT
+        pool._inflight["bot0"].result(timeout=2)
+        assert len(client.calls) == 4
+
+    def test_slow_instance_bounded_by_deadline(self, pool):
+        pool.deadline_seconds = 0.1
+        _use(pool, {"bot0": _FakeClient(), "bot1": _FakeClient(delay=0.5)})
+
+        started = time.monotonic()
+        snapshots = pool.snapshots(_instances(2))
+
+        assert time.monotonic() - started < 0.4
+        assert snapshots["bot0"].reachable is True
+        assert snapshots["bot1"] is None
+
+        # The refresh keeps running and serves the next request
+        pool._inflight["bot1"].result(timeout=2)
+        assert pool.snapshots(_instances(2))["bot1"].reachable is True
+
+    def test_unreachable_instance_cached(self, pool):
+        client = _FakeClient(error=httpx.ConnectError("Name or service not known"))
+        _use(pool, {"bot0": client})
+
+        first = pool.snapshots(_instances(1))["bot0"]
+        pool.snapshots(_instances(1))
+
+        assert first.reachable is False
+        assert "not known" in first.error
+        assert client.calls == ["show_config"]
+
+    def test_client_kept_alive_per_instance(self, pool):
+        instance = FreqtradeInstance("bot0", "http://bot0:8080", "user", "pw")
+
+        client = pool._client(instance)
+        assert pool._client(instance) is client
+        assert str(client.base_url) == "http://bot0:8080/api/v1/"
+
+        rotated = pool._client(FreqtradeInstance("bot0", "http://bot0:8080", "user", "new"))
+        assert rotated is not client
+        assert client.is_closed
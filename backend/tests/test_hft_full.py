@@ -176,6 +176,70 @@ class TestBaseStrategyEdgeCases:
         assert s.balance == pytest.approx(10000.0 - 0.1)
 
 
+# ══════════════════════════════════════════════════════
+# Base Class — Typed Tick / Fill Path
+# ══════════════════════════════════════════════════════
+
+
+class TestTypedTickPath:
+    def test_run_passes_scalars(self):
+        from hftbacktest.strategies.base import BUY, SELL, HFTBaseStrategy
+
+        seen = []
+
+        class Recorder(HFTBaseStrategy):
+            def on_tick_values(self, timestamp, price, volume, side):
+                seen.append((timestamp, price, volume, side))
+
+        Recorder().run(np.array([[1e9, 100.0, 0.5, 1.0], [2e9, 99.0, 0.25, -1.0]]))
+        assert seen == [(1_000_000_000, 100.0, 0.5, BUY), (2_000_000_000, 99.0, 0.25, SELL)]
+
+    def test_on_tick_dict_forwards_to_typed_hook(self):
+        from hftbacktest.strategies.base import SELL, HFTBaseStrategy
+
+        seen = []
+
+        class Recorder(HFTBaseStrategy):
+            def on_tick_values(self, timestamp, price, volume, side):
+                seen.append((timestamp, price, volume, side))
+
+        Recorder().on_tick({"timestamp": 5, "price": 100.0, "volume": 0.1, "side": "sell"})
+        assert seen == [(5, 100.0, 0.1, SELL)]
+
+    def test_fill_array_matches_fill_dicts(self):
+        from hftbacktest.strategies.base import BUY, FILL_DTYPE, SELL, HFTBaseStrategy
+
+        s = HFTBaseStrategy()
+        assert s.submit_order_values(BUY, 100.0, 0.2, 1_000) == 0
+        assert s.submit_order_values(SELL, 110.0, 0.1, 2_000) == 1
+
+        arr = s.fill_array
+        assert arr.dtype == FILL_DTYPE
+        assert arr["side"].tolist() == [BUY, SELL]
+        assert arr["pnl"][1] == pytest.approx(1.0)
+        assert s.fills[1]["side"] == "sell"
+        assert s.fills[1]["pnl"] == arr["pnl"][1]
+        assert s.fills[1]["position_after"] == pytest.approx(0.1)
+
+    def test_rejected_order_returns_minus_one(self):
+        from hftbacktest.strategies.base import BUY, HFTBaseStrategy
+
+        s = HFTBaseStrategy(config={"max_position": 0.5})
+        assert s.submit_order_values(BUY, 100.0, 1.0, 0) == -1
+        assert len(s.fill_array) == 0
+
+    def test_fill_buffer_grows(self):
+        from hftbacktest.strategies.base import BUY, FILL_CAPACITY, SELL, HFTBaseStrategy
+
+        s = HFTBaseStrategy()
+        for i in range(FILL_CAPACITY + 10):
+            s.submit_order_values(BUY if i % 2 == 0 else SELL, 100.0, 0.01, i)
+
+        assert len(s.fill_array) == FILL_CAPACITY + 10
+        assert s.fill_array["timestamp"][-1] == FILL_CAPACITY + 9
+        assert len(s.fills) == FILL_CAPACITY + 10
+
+
 # ══════════════════════════════════════════════════════
 # Base Class — FIFO get_trades_df
 # ══════════════════════════════════════════════════════
@@ -232,6 +296,38 @@ class TestFIFOTrades:
         assert len(df) == 1
         assert df["size"].iloc[0] == pytest.approx(0.1)
 
+    def test_flip_opens_opposite_entry(self):
+        from hftbacktest.strategies.base import HFTBaseStrategy
+        s = HFTBaseStrategy(config={"fee_rate": 0.0, "max_position": 10.0})
+        s.submit_order("buy", 100.0, 0.1, {"timestamp": 0})
+        s.submit_order("sell", 105.0, 0.3, {"timestamp": 1})
+        s.submit_order("buy", 95.0, 0.2, {"timestamp": 2})
+        df = s.get_trades_df()
+        assert df["side"].tolist() == ["buy", "sell"]
+        assert df["entry_price"].tolist() == [100.0, 105.0]
+        assert df["size"].tolist() == pytest.approx([0.1, 0.2])
+        assert df["pnl"].tolist() == pytest.approx([0.5, 2.0])
+
+    def test_one_million_fills(self):
+        """FIFO pairing stays linear: 500k buys closed by 500k sells."""
+        from hftbacktest.strategies.base import HFTBaseStrategy
+        n = 1_000_000
+        s = HFTBaseStrategy(config={"fee_rate": 0.0, "max_position": 1e9})
+        s.reserve_fills(n)
+        buf = s._fill_buf
+        buf["timestamp"][:n] = np.arange(n)
+        buf["side"][: n // 2] = 1
+        buf["side"][n // 2 : n] = -1
+        buf["price"][:n] = 100.0
+        buf["price"][n // 2 : n] = 101.0
+        buf["size"][:n] = 0.01
+        s._n_fills = n
+
+        df = s.get_trades_df()
+        assert len(df) == n // 2
+        assert (df["exit_time"] > df["entry_time"]).all()
+        assert df["pnl"].sum() == pytest.approx(n // 2 * 0.01)
+
 
 # ══════════════════════════════════════════════════════
 # Market Maker — Edge Cases
@@ -513,6 +609,69 @@ class TestTickConversion:
         assert len(ticks) == n * 4  # 4 ticks per bar
 
 
+class TestTickCache:
+    @pytest.fixture
+    def dirs(self, tmp_path):
+        data_dir = tmp_path / "processed"
+        data_dir.mkdir()
+        with (
+            patch("common.data_pipeline.pipeline.PROCESSED_DIR", data_dir),
+            patch("hftbacktest.hft_runner.TICKS_DIR", tmp_path),
+        ):
+            yield data_dir
+
+    @staticmethod
+    def _save(data_dir, n):
+        from common.data_pipeline.pipeline import save_ohlcv
+
+        dates = pd.date_range("2024-01-01", periods=n, freq="1h", tz="UTC")
+        df = pd.DataFrame(
+            {"open": 100.0, "high": 101.0, "low": 99.0, "close": 100.5, "volume": 10.0},
+            index=dates,
+        )
+        save_ohlcv(df, "CACHE/USDT", "1h", "testexch", directory=data_dir)
+
+    def test_ticks_memory_mapped_and_reused(self, dirs):
+        from hftbacktest import hft_runner
+
+        self._save(dirs, 20)
+        ticks = hft_runner.load_hft_ticks("CACHE/USDT", "1h", "testexch")
+        assert isinstance(ticks, np.memmap)
+        assert not ticks.flags.writeable
+        assert len(ticks) == 80
+
+        with patch.object(hft_runner, "convert_ohlcv_to_hft_ticks") as convert:
+            again = hft_runner.load_hft_ticks("CACHE/USDT", "1h", "testexch")
+        convert.assert_not_called()
+        assert len(again) == 80
+
+    def test_appended_candles_regenerate_ticks(self, dirs):
+        from hftbacktest.hft_runner import load_hft_ticks
+
+        self._save(dirs, 20)
+        load_hft_ticks("CACHE/USDT", "1h", "testexch")
+        self._save(dirs, 30)
+
+        assert len(load_hft_ticks("CACHE/USDT", "1h", "testexch")) == 120
+
+    def test_conversion_version_bump_regenerates(self, dirs):
+        from hftbacktest import hft_runner
+
+        self._save(dirs, 20)
+        hft_runner.load_hft_ticks("CACHE/USDT", "1h", "testexch")
+
+        with (
+            patch.object(hft_runner, "TICK_CONVERSION_VERSION", 2),
+            patch.object(
+                hft_runner,
+                "convert_ohlcv_to_hft_ticks",
+                wraps=hft_runner.convert_ohlcv_to_hft_ticks,
+            ) as convert,
+        ):
+            hft_runner.load_hft_ticks("CACHE/USDT", "1h", "testexch")
+        convert.assert_called_once()
+
+
 # ══════════════════════════════════════════════════════
 # Runner — Full Backtest Execution
 # ══════════════════════════════════════════════════════
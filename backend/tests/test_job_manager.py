@@ -0,0 +1,108 @@
+"""Tests for common.jobs.JobManager (background jobs for the Starlette workers)."""
+
+import asyncio
+import math
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from common.jobs import JobManager, JobQueueFullError  # noqa: E402
+
+
+@pytest.fixture
+def manager():
+    jobs = JobManager(max_workers=2, max_queue=6, history=2)
+    yield jobs
+    jobs.shutdown()
+
+
+@pytest.mark.asyncio
+class TestJobManager:
+    async def test_submit_returns_before_tasks_finish(self, manager):
+        job = manager.submit("sleep", time.sleep, [0.5, 0.5])
+
+        assert job.status == "queued"
+        assert job.completed == 0
+        assert manager.get(job.id) is job
+
+        # The event loop keeps serving while the pool works
+        started = time.monotonic()
+        await asyncio.sleep(0.01)
+        assert time.monotonic() - started < 0.4
+
+        await manager.wait(job)
+        assert job.status == "completed"
+        assert job.completed == 2
+
+    async def test_results_in_submission_order_with_task_errors(self, manager):
+        job = manager.submit("sqrt", math.sqrt, [16, -1, 9])
+        await manager.wait(job)
+
+        results = job.to_dict()["results"]
+        assert results[0] == 4.0
+        assert results[1]["status"] == "error"
+        assert "math domain error" in results[1]["error"]
+        assert results[2] == 3.0
+        assert manager.pending == 0
+
+    async def test_on_error_builds_entry(self, manager):
+        job = manager.submit(
+            "sqrt",
+            math.sqrt,
+            [-4],
+            on_error=lambda task, exc: {"task": task, "status": "error"},
+        )
+        await manager.wait(job)
+
+        assert job.finished_results == [{"task": -4, "status": "error"}]
+
+    async def test_on_done_runs_after_last_task(self, manager):
+        finished = []
+        job = manager.submit(
+            "sqrt", math.sqrt, [1, 4], on_done=lambda j: finished.append(j.completed)
+        )
+        await manager.wait(job)
+
+        assert finished == [2]
+
+    async def test_queue_depth_limit(self, manager):
+        job = manager.submit("sqrt", math.sqrt, [1, 4, 9, 16])
+
+        with pytest.raises(JobQueueFullError):
+            manager.submit("sqrt", math.sqrt, [1, 4, 9])
+
+        await manager.wait(job)
+        await manager.wait(manager.submit("sqrt", math.sqrt, [1, 4, 9]))
+
+    async def test_events_stream_each_result_then_done(self, manager):
+        job = manager.submit("sqrt", math.sqrt, [1, 4, 9], meta={"symbol": "BTC/USDT"})
+
+        events = [event async for event in manager.events(job)]
+
+        assert [name for name, _ in events] == ["result", "result", "result", "done"]
+        assert sorted(data["result"] for _, data in events[:3]) == [1.0, 2.0, 3.0]
+        assert [data["completed"] for _, data in events[:3]] == [1, 2, 3]
+        assert events[-1][1]["status"] == "completed"
+        assert events[-1][1]["symbol"] == "BTC/USDT"
+
+        # A late subscriber replays everything
+        chunks = [chunk async for chunk in manager.event_stream(job)]
+        assert len(chunks) == 4
+        assert chunks[-1].startswith("event: done\ndata: ")
+
+    async def test_finished_jobs_pruned_to_history(self, manager):
+        ids = []
+        for _ in range(4):
+            job = manager.submit("sqrt", math.sqrt, [1])
+            await manager.wait(job)
+            ids.append(job.id)
+
+        assert manager.get(ids[0]) is None
+        assert manager.get(ids[-1]) is not None
+        assert manager.stats()["active_jobs"] == 0
@@ -1,14 +1,18 @@
 """Tests for kill switch (halt/resume) endpoints and service-level cancellation.
 """
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from asgiref.sync import sync_to_async
+from asgiref.sync import async_to_sync, sync_to_async
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 
 from risk.services.risk import RiskManagementService
 from trading.models import Order, OrderStatus, TradingMode
+from trading.services.live_trading import LiveTradingService
 
 
 @pytest.mark.django_db(transaction=True)
@@ -107,6 +111,121 @@ class TestHaltWithCancellation:
         assert halt_calls[0][0][1]["data"]["is_halted"] is False
 
 
+def _live_order(exchange_id, symbol, exchange_order_id, portfolio_id=1):
+    return Order.objects.create(
+        exchange_id=exchange_id,
+        symbol=symbol,
+        side="buy",
+        order_type="limit",
+        amount=1.0,
+        price=100.0,
+        mode=TradingMode.LIVE,
+        status=OrderStatus.OPEN,
+        exchange_order_id=exchange_order_id,
+        portfolio_id=portfolio_id,
+        timestamp=timezone.now(),
+    )
+
+
+def _services(exchanges):
+    def build(exchange_id, shared):
+        service = MagicMock()
+        service._get_exchange = AsyncMock(return_value=exchanges[exchange_id])
+        service.close = AsyncMock()
+        return service
+
+    return patch("trading.services.live_trading.ExchangeService", side_effect=build)
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.asyncio
+class TestMassCancellationLatency:
+    async def test_halt_cancels_concurrently_and_reports_elapsed(self):
+        for i in range(6):
+            await sync_to_async(_live_order)("binance", f"S{i}/USDT", f"B-{i}")
+        for i in range(4):
+            await sync_to_async(_live_order)("kraken", f"S{i}/USD", f"K-{i}")
+
+        async def slow_cancel(order_id, symbol):
+            await asyncio.sleep(0.05)
+            return {"id": order_id, "status": "canceled"}
+
+        exchanges = {
+            "binance": MagicMock(cancel_order=AsyncMock(side_effect=slow_cancel)),
+            "kraken": MagicMock(cancel_order=AsyncMock(side_effect=slow_cancel)),
+        }
+        with (
+            _services(exchanges),
+            patch("trading.services.live_trading.get_channel_layer", return_value=None),
+            patch("risk.services.risk.get_channel_layer", return_value=None),
+        ):
+            result = await RiskManagementService.halt_trading_with_cancellation(
+                portfolio_id=1, reason="latency",
+            )
+
+        assert result["cancelled_orders"] == 10
+        # Ten sequential 50 ms cancels would take at least 500 ms
+        assert 50 <= result["cancel_elapsed_ms"] < 400
+        assert exchanges["binance"].cancel_order.await_count == 6
+        statuses = await sync_to_async(
+            lambda: set(Order.objects.values_list("status", flat=True)),
+        )()
+        assert statuses == {OrderStatus.CANCELLED}
+
+
+@pytest.mark.django_db
+class TestMassCancellationNative:
+    def test_native_cancel_all_used_only_for_unshared_symbols(self):
+        for i in range(3):
+            _live_order("binance", "BTC/USDT", f"BTC-{i}")
+        _live_order("binance", "ETH/USDT", "ETH-1")
+        _live_order("binance", "ETH/USDT", "ETH-2")
+        # Another portfolio also trades ETH/USDT there, so ETH is cancelled by id
+        other = _live_order("binance", "ETH/USDT", "ETH-9", portfolio_id=2)
+
+        exchange = MagicMock()
+        exchange.has = {"cancelAllOrders": True}
+        exchange.cancel_all_orders = AsyncMock(return_value=[])
+        exchange.cancel_order = AsyncMock(return_value={})
+
+        with (
+            _services({"binance": exchange}),
+            patch("trading.services.live_trading.get_channel_layer", return_value=None),
+            CaptureQueriesContext(connection) as ctx,
+        ):
+            cancelled = async_to_sync(LiveTradingService.cancel_all_open_orders)(1)
+
+        assert cancelled == 5
+        exchange.cancel_all_orders.assert_awaited_once_with("BTC/USDT")
+        assert sorted(c.args[0] for c in exchange.cancel_order.await_args_list) == [
+            "ETH-1",
+            "ETH-2",
+        ]
+        # All five results land in a single UPDATE
+        updates = [q for q in ctx.captured_queries if q["sql"].startswith("UPDATE")]
+        assert len(updates) == 1
+        other.refresh_from_db()
+        assert other.status == OrderStatus.OPEN
+
+    def test_failed_native_cancel_marks_symbol_orders_error(self):
+        _live_order("binance", "BTC/USDT", "BTC-1")
+        _live_order("binance", "BTC/USDT", "BTC-2")
+
+        exchange = MagicMock()
+        exchange.has = {"cancelAllOrders": True}
+        exchange.cancel_all_orders = AsyncMock(side_effect=ConnectionError("timeout"))
+
+        with (
+            _services({"binance": exchange}),
+            patch("trading.services.live_trading.get_channel_layer", return_value=None),
+        ):
+            cancelled = async_to_sync(LiveTradingService.cancel_all_open_orders)(1)
+
+        assert cancelled == 0
+        errors = list(Order.objects.values_list("status", "error_message"))
+        assert errors == [(OrderStatus.ERROR, "Cancel failed: timeout")] * 2
+
+
 @pytest.mark.django_db(transaction=True)
 @pytest.mark.asyncio
 class TestOrderRejectionDuringHalt:
@@ -2839,8 +2839,11 @@ class TestTickerPoller:
         """Test _poll_loop fetches tickers and broadcasts to group."""
         import market.services.ticker_poller as tp
 
+        hub = tp.TickerHub()
+        hub.subscribe("client-1", ["BTC/USDT"])
+
         mock_svc = MagicMock()
-        mock_svc.fetch_tickers = AsyncMock(return_value=[{"symbol": "BTC/USDT"}])
+        mock_svc.fetch_tickers = AsyncMock(return_value=[{"symbol": "BTC/USDT", "price": 1.0}])
         mock_svc.close = AsyncMock()
 
         mock_channel = MagicMock()
@@ -2862,6 +2865,7 @@ class TestTickerPoller:
         with (
             patch("market.services.exchange.ExchangeService", return_value=mock_svc),
             patch.object(tp, "get_channel_layer", return_value=mock_channel),
+            patch.object(tp, "get_ticker_hub", return_value=hub),
             patch("asyncio.sleep", side_effect=counting_sleep),
         ):
             with pytest.raises(asyncio.CancelledError):
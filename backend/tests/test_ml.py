@@ -4,6 +4,7 @@ All framework dependencies (lightgbm, etc.) are required — tests FAIL if missi
 
 import sys
 from pathlib import Path
+from unittest.mock import patch
 
 import numpy as np
 import pandas as pd
@@ -15,11 +16,15 @@ sys.path.insert(0, str(PROJECT_ROOT))
 pytest.importorskip("lightgbm")
 
 from common.ml.features import (
+    _abs_corr_matrix,
+    _reduce_features,
     add_lag_features,
     add_return_features,
     build_feature_matrix,
+    clear_feature_selection_cache,
     compute_indicator_features,
     compute_target,
+    feature_lookback,
 )
 from common.ml.registry import ModelRegistry
 from common.ml.trainer import time_series_split
@@ -179,6 +184,97 @@ class TestBuildFeatureMatrix:
         assert "return_10" not in names
 
 
+class TestLatestFeatureMode:
+    def test_returns_single_row_for_last_bar(self):
+        df = _make_ohlcv(1500)
+        x_feat, y_target, names = build_feature_matrix(df, mode="latest")
+        assert len(x_feat) == 1
+        assert x_feat.index[-1] == df.index[-1]
+        assert names == list(x_feat.columns)
+        assert y_target.isna().all()
+
+    def test_row_matches_full_history(self):
+        df = _make_ohlcv(3000)
+        kwargs = {"include_temporal": True, "include_volatility_regime": True}
+        full, _, _ = build_feature_matrix(
+            df, config={"drop_na": False, "max_features": 0}, **kwargs
+        )
+        latest, _, names = build_feature_matrix(df, mode="latest", **kwargs)
+        assert set(names) == set(full.columns)
+        np.testing.assert_allclose(
+            latest[names].to_numpy(), full.iloc[[-1]][names].to_numpy(), rtol=1e-6, atol=1e-9
+        )
+
+    def test_lookback_is_independent_of_history(self):
+        lookback = feature_lookback(include_volatility_regime=True)
+        assert lookback < 1000
+        assert feature_lookback(include_volatility_regime=True) >= feature_lookback()
+
+    def test_short_history_uses_all_rows(self, ohlcv_df):
+        x_feat, _, _ = build_feature_matrix(ohlcv_df, mode="latest")
+        assert len(x_feat) == 1
+        assert x_feat.notna().all().all()
+
+    def test_unknown_mode_raises(self, ohlcv_df):
+        with pytest.raises(ValueError, match="Unknown feature mode"):
+            build_feature_matrix(ohlcv_df, mode="bogus")
+
+
+class TestReduceFeatures:
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self):
+        clear_feature_selection_cache()
+        yield
+        clear_feature_selection_cache()
+
+    def test_corr_matches_pandas(self, ohlcv_df):
+        x_feat, _, _ = build_feature_matrix(ohlcv_df, config={"max_features": 0})
+        expected = x_feat.corr().abs().fillna(0.0).to_numpy()
+        np.testing.assert_allclose(_abs_corr_matrix(x_feat), expected, atol=1e-4)
+
+    def test_greedy_keeps_first_of_correlated_group(self):
+        rng = np.random.default_rng(0)
+        a = rng.normal(size=500)
+        b = rng.normal(size=500)
+        x_feat = pd.DataFrame({
+            "a": a,
+            "a_copy": a * 2 + 1,
+            "b": b,
+            "a_or_b": a + 0.2 * b,  # correlated with a only
+            "const": np.ones(500),
+        })
+        reduced = _reduce_features(x_feat, max_features=10)
+        assert list(reduced.columns) == ["a", "b", "const"]
+
+    def test_greedy_matches_reference_loop(self, ohlcv_df):
+        x_feat, _, _ = build_feature_matrix(ohlcv_df, config={"max_features": 0})
+        corr = x_feat.corr().abs().fillna(0.0)
+        kept: list[str] = []
+        for col in x_feat.columns:
+            if not any(corr.loc[k, col] > 0.95 for k in kept):
+                kept.append(col)
+
+        reduced = _reduce_features(x_feat, max_features=len(x_feat.columns))
+        assert list(reduced.columns) == kept
+
+    def test_selection_cached_per_symbol(self, ohlcv_df):
+        cfg = {"symbol": "BTC/USDT", "max_features": 20}
+        x1, _, names1 = build_feature_matrix(ohlcv_df, config=cfg)
+        assert len(names1) == 20
+
+        with patch("common.ml.features._abs_corr_matrix") as mock_corr:
+            x2, _, names2 = build_feature_matrix(_make_ohlcv(600), config=cfg)
+        mock_corr.assert_not_called()
+        assert names2 == names1
+
+        # Different symbol → computed afresh
+        with patch(
+            "common.ml.features._abs_corr_matrix", wraps=_abs_corr_matrix,
+        ) as mock_corr:
+            build_feature_matrix(ohlcv_df, config={**cfg, "symbol": "ETH/USDT"})
+        mock_corr.assert_called_once()
+
+
 # ── Trainer Tests ────────────────────────────────────────────────
 
 
@@ -6,6 +6,7 @@ Covers: prediction.py, calibration.py, ensemble.py, feedback.py,
 import json
 import sys
 import time
+from contextlib import closing
 from datetime import datetime, timezone
 from pathlib import Path
 from unittest.mock import patch
@@ -28,7 +29,7 @@ from common.ml.features import (
     add_volatility_regime_features,
     build_feature_matrix,
 )
-from common.ml.feedback import FeedbackTracker
+from common.ml.feedback import FeedbackTracker, select_retrain_mode
 from common.ml.prediction import PredictionResult, PredictionService
 from common.ml.registry import ModelRegistry
 
@@ -556,25 +557,25 @@ class TestFeedbackTracker:
         assert record["actual_direction"] is None
         assert record["correct"] is None
 
-    def test_record_creates_jsonl_file(self, tmp_feedback_dir):
+    def test_record_persists_to_database(self, tmp_feedback_dir):
         tracker = FeedbackTracker(feedback_dir=tmp_feedback_dir)
         tracker.record_prediction("m1", "BTC/USDT", "crypto", 0.5, "up")
-        today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-        filepath = tmp_feedback_dir / f"{today}.jsonl"
-        assert filepath.exists()
-        lines = filepath.read_text().strip().split("\n")
-        assert len(lines) == 1
-        data = json.loads(lines[0])
-        assert data["model_id"] == "m1"
+        assert (tmp_feedback_dir / FeedbackTracker.DB_FILENAME).exists()
+        assert not list(tmp_feedback_dir.glob("*.jsonl"))
+
+        # A fresh tracker on the same directory sees the record
+        reopened = FeedbackTracker(feedback_dir=tmp_feedback_dir)
+        reopened.backfill_outcomes({"BTC/USDT": 0.01})
+        assert reopened.get_model_accuracy("m1")["total_predictions"] == 1
 
     def test_record_multiple_predictions(self, tmp_feedback_dir):
         tracker = FeedbackTracker(feedback_dir=tmp_feedback_dir)
         for i in range(5):
             tracker.record_prediction(f"m{i}", "BTC/USDT", "crypto", 0.5 + i * 0.05, "up")
-        today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-        filepath = tmp_feedback_dir / f"{today}.jsonl"
-        lines = filepath.read_text().strip().split("\n")
-        assert len(lines) == 5
+        tracker.backfill_outcomes({"BTC/USDT": 0.01})
+        stats = tracker.get_all_model_stats(lookback_days=1)
+        assert [s["model_id"] for s in stats] == ["m0", "m1", "m2", "m3", "m4"]
+        assert all(s["total_predictions"] == 1 for s in stats)
 
     def test_backfill_outcomes(self, tmp_feedback_dir):
         tracker = FeedbackTracker(feedback_dir=tmp_feedback_dir)
@@ -592,11 +593,59 @@ class TestFeedbackTracker:
         )
         assert updated == 2
 
-        records = tracker._load_records(tmp_feedback_dir / f"{today}.jsonl")
-        assert records[0]["actual_direction"] == "up"
-        assert records[0]["correct"] is True
-        assert records[1]["actual_direction"] == "down"
-        assert records[1]["correct"] is True
+        with closing(tracker._connect()) as conn:
+            rows = conn.execute(
+                "SELECT symbol, actual_direction, correct, actual_return "
+                "FROM predictions ORDER BY id"
+            ).fetchall()
+        assert rows == [("BTC/USDT", "up", 1, 0.05), ("ETH/USDT", "down", 1, -0.02)]
+
+    def test_queries_use_indexes(self, tmp_feedback_dir):
+        tracker = FeedbackTracker(feedback_dir=tmp_feedback_dir)
+        with closing(tracker._connect()) as conn:
+            plan = conn.execute(
+                "EXPLAIN QUERY PLAN SELECT COUNT(*) FROM predictions "
+                "WHERE model_id = 'm1' AND date >= '2025-01-01'"
+            ).fetchall()
+            backfill_plan = conn.execute(
+                "EXPLAIN QUERY PLAN UPDATE predictions SET correct = 1 "
+                "WHERE symbol = 'BTC/USDT' AND date = '2025-01-01'"
+            ).fetchall()
+        assert "ix_pred_model_date" in str(plan)
+        assert "ix_pred_symbol_date" in str(backfill_plan)
+
+    def test_migrates_legacy_jsonl_once(self, tmp_feedback_dir):
+        today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        legacy = tmp_feedback_dir / f"{today}.jsonl"
+        records = [
+            {
+                "model_id": "m1",
+                "symbol": "BTC/USDT",
+                "asset_class": "crypto",
+                "probability": 0.7,
+                "direction": "up",
+                "regime": "TRENDING",
+                "timestamp": f"{today}T00:0{i}:00+00:00",
+                "actual_direction": "up" if i < 3 else None,
+                "correct": True if i < 3 else None,
+            }
+            for i in range(5)
+        ]
+        legacy.write_text("".join(json.dumps(r) + "\n" for r in records) + "not json\n")
+
+        tracker = FeedbackTracker(feedback_dir=tmp_feedback_dir)
+        assert not legacy.exists()
+        assert legacy.with_suffix(".jsonl.migrated").exists()
+
+        stats = tracker.get_model_accuracy("m1", lookback_days=1)
+        assert stats["total_predictions"] == 3
+        assert stats["correct_predictions"] == 3
+        # Unresolved legacy rows can still be backfilled in place
+        assert tracker.backfill_outcomes({"BTC/USDT": -0.01}, date=today) == 2
+
+        # Re-opening does not import again
+        FeedbackTracker(feedback_dir=tmp_feedback_dir)
+        assert tracker.get_model_accuracy("m1", lookback_days=1)["total_predictions"] == 5
 
     def test_backfill_no_file(self, tmp_feedback_dir):
         tracker = FeedbackTracker(feedback_dir=tmp_feedback_dir)
@@ -736,6 +785,39 @@ class TestFeedbackTracker:
         tracker.backfill_outcomes({"BTC/USDT": 0.01}, date=today)
         assert tracker.should_retrain("m1", min_predictions=50) is False
 
+    def test_select_retrain_mode_mild_drift_is_incremental(self):
+        stats = {
+            "total_predictions": 80,
+            "accuracy": 0.51,
+            "accuracy_by_regime": {"TRENDING": 0.55, "RANGING": 0.45},
+        }
+        assert select_retrain_mode(stats) == "incremental"
+
+    def test_select_retrain_mode_low_accuracy_is_full(self):
+        stats = {"total_predictions": 80, "accuracy": 0.40, "accuracy_by_regime": {}}
+        assert select_retrain_mode(stats) == "full"
+        # Too few samples to judge accuracy
+        assert select_retrain_mode({**stats, "total_predictions": 10}) == "incremental"
+
+    def test_select_retrain_mode_regime_drift_is_full(self):
+        stats = {
+            "total_predictions": 80,
+            "accuracy": 0.55,
+            "accuracy_by_regime": {"TRENDING": 0.80, "RANGING": 0.40},
+        }
+        assert select_retrain_mode(stats) == "full"
+
+    def test_retrain_mode_from_tracker(self, tmp_feedback_dir):
+        tracker = FeedbackTracker(feedback_dir=tmp_feedback_dir)
+        today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        for i in range(60):
+            tracker.record_prediction(
+                "m1", "BTC/USDT", "crypto", 0.7, "up",
+                timestamp=f"{today}T00:{i:02d}:00+00:00",
+            )
+        tracker.backfill_outcomes({"BTC/USDT": -0.01}, date=today)
+        assert tracker.retrain_mode("m1") == "full"
+
     def test_get_all_model_stats(self, tmp_feedback_dir):
         tracker = FeedbackTracker(feedback_dir=tmp_feedback_dir)
         today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
@@ -768,8 +850,9 @@ class TestFeedbackTracker:
             timestamp="2025-06-15T12:00:00+00:00",
         )
         assert record["timestamp"] == "2025-06-15T12:00:00+00:00"
-        filepath = tmp_feedback_dir / "2025-06-15.jsonl"
-        assert filepath.exists()
+        with closing(tracker._connect()) as conn:
+            row = conn.execute("SELECT timestamp, date FROM predictions").fetchone()
+        assert row == ("2025-06-15T12:00:00+00:00", "2025-06-15")
 
 
 # ══════════════════════════════════════════════════════════════════
@@ -942,6 +1025,83 @@ class TestTrainerCalibration:
         assert "calibration" not in result["metadata"]
 
 
+class TestIncrementalTraining:
+    def test_continues_boosting_from_parent(self):
+        from common.ml.trainer import train_incremental, train_model
+
+        df = _make_ohlcv(1200)
+        cfg = {"max_features": 0}
+        x, y, names = build_feature_matrix(df.iloc[:1000], config=cfg)
+        parent = train_model(x, y, names)
+        parent_trees = parent["model"].booster_.num_trees()
+
+        x_new, y_new, _ = build_feature_matrix(df, config=cfg, since=x.index[-1])
+        assert x_new.index[0] > x.index[-1]
+
+        result = train_incremental(
+            parent["model"], x_new, y_new, names,
+            params=parent["metadata"]["params"],
+            parent_metrics=parent["metrics"],
+            num_boost_round=10,
+        )
+        assert result["model"].booster_.num_trees() > parent_trees
+        assert result["metrics"]["rows_added"] == len(x_new)
+        assert result["metrics"]["test_rows"] == parent["metrics"]["test_rows"] + len(x_new)
+        assert 0.0 <= result["metrics"]["window_accuracy"] <= 1.0
+        # Decay applies to this update only; base params carry forward unchanged
+        base_lr = parent["metadata"]["params"]["learning_rate"]
+        assert result["metadata"]["params"]["learning_rate"] == base_lr
+        assert result["metadata"]["incremental"]["learning_rate"] == pytest.approx(base_lr * 0.5)
+        assert result["model"].predict_proba(x_new).shape == (len(x_new), 2)
+
+    def test_warm_start_from_registry_records_lineage(self, tmp_models_dir):
+        from analysis.services.ml import MLService
+
+        df = _make_ohlcv(1200)
+        history = {"df": df.iloc[:1000]}
+
+        with (
+            patch("common.ml.registry.DEFAULT_MODELS_DIR", tmp_models_dir),
+            patch("analysis.services.ml.ensure_platform_imports"),
+            patch(
+                "common.data_pipeline.pipeline.load_ohlcv",
+                side_effect=lambda *a, **k: history["df"].copy(),
+            ),
+        ):
+            full = MLService.train({"symbol": "BTC/USDT"}, lambda p, m: None)
+            history["df"] = df
+            inc = MLService.train_incremental({"symbol": "BTC/USDT"}, lambda p, m: None)
+            again = MLService.train_incremental({"symbol": "BTC/USDT"}, lambda p, m: None)
+
+        assert inc["mode"] == "incremental"
+        assert inc["parent_model_id"] == full["model_id"]
+        assert inc["rows_added"] > 0
+
+        manifest = ModelRegistry(models_dir=tmp_models_dir).get_model_detail(inc["model_id"])
+        assert manifest["lineage"]["parent_model_id"] == full["model_id"]
+        assert manifest["lineage"]["rows_added"] == inc["rows_added"]
+        assert manifest["metadata"]["data_end"] > history["df"].index[0].isoformat()
+
+        # Nothing appended since the incremental update
+        assert again["mode"] == "unchanged"
+        assert again["model_id"] == inc["model_id"]
+
+    def test_no_parent_falls_back_to_full(self, tmp_models_dir):
+        from analysis.services.ml import MLService
+
+        df = _make_ohlcv(600)
+        with (
+            patch("common.ml.registry.DEFAULT_MODELS_DIR", tmp_models_dir),
+            patch("analysis.services.ml.ensure_platform_imports"),
+            patch("common.data_pipeline.pipeline.load_ohlcv", return_value=df),
+        ):
+            result = MLService.train_incremental({"symbol": "ETH/USDT"}, lambda p, m: None)
+
+        assert result["mode"] == "full"
+        manifest = ModelRegistry(models_dir=tmp_models_dir).get_model_detail(result["model_id"])
+        assert manifest["lineage"]["mode"] == "full"
+
+
 # ══════════════════════════════════════════════════════════════════
 # __init__.py Import Tests
 # ══════════════════════════════════════════════════════════════════
@@ -1090,3 +1090,79 @@ class TestNativeEngineIntegration:
         engine.add_data(bars)
         engine.run()
         engine.dispose()
+
+
+# ── Batch backtests ────────────────────────────────────
+
+
+class TestBatchBacktest:
+    STRATEGIES = ["NautilusTrendFollowing", "NautilusMeanReversion"]
+
+    def _data(self):
+        return {
+            "BTC/USDT": _make_ohlcv(300, seed=1),
+            "ETH/USDT": _make_ohlcv(300, start_price=50.0, seed=2),
+        }
+
+    def _run(self, data, **kwargs):
+        from nautilus import nautilus_runner
+
+        with (
+            patch(
+                "common.data_pipeline.pipeline.load_ohlcv",
+                side_effect=lambda symbol, *a, **k: data.get(symbol, pd.DataFrame()).copy(),
+            ) as load_spy,
+            patch.object(nautilus_runner, "_save_result"),
+        ):
+            entries = nautilus_runner.run_nautilus_backtest_batch(
+                self.STRATEGIES, list(data) + kwargs.pop("extra", []), **kwargs
+            )
+        return entries, load_spy
+
+    def test_batch_matches_single_backtests(self):
+        from nautilus.nautilus_runner import _run_pandas_backtest
+
+        data = self._data()
+        entries, load_spy = self._run(data, max_workers=1, extra=["NODATA/USDT"])
+
+        # One load per symbol, not per strategy x symbol
+        assert load_spy.call_count == 3
+        assert [(e["symbol"], e["strategy"]) for e in entries[:4]] == [
+            (symbol, strategy) for symbol in data for strategy in self.STRATEGIES
+        ]
+        for entry in entries[:4]:
+            with patch("nautilus.nautilus_runner._save_result"):
+                single = _run_pandas_backtest(
+                    entry["strategy"],
+                    data[entry["symbol"]],
+                    entry["symbol"],
+                    "1h",
+                    "kraken",
+                    10000.0,
+                )
+            assert entry["status"] == "completed"
+            assert entry["result"]["metrics"] == single["metrics"]
+
+        assert entries[4]["status"] == "completed"
+        assert "No data" in entries[4]["result"]["error"]
+
+    def test_bars_converted_once_per_symbol(self):
+        from nautilus import nautilus_runner
+
+        with patch.object(
+            nautilus_runner, "_df_to_bar_dicts", wraps=nautilus_runner._df_to_bar_dicts
+        ) as convert_spy:
+            self._run({"BTC/USDT": _make_ohlcv(250)}, max_workers=1)
+
+        assert convert_spy.call_count == 1
+
+    def test_process_pool_matches_serial(self):
+        data = self._data()
+        serial, _ = self._run(data, max_workers=1)
+        pooled, _ = self._run(data, max_workers=2)
+
+        assert [(e["strategy"], e["symbol"]) for e in pooled] == [
+            (e["strategy"], e["symbol"]) for e in serial
+        ]
+        for a, b in zip(serial, pooled, strict=True):
+            assert a["result"]["metrics"] == b["result"]["metrics"]
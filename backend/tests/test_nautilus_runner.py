@@ -800,6 +800,64 @@ class TestOHLCVConversion:
         assert result is None
 
 
+class TestBarCatalog:
+    """Test the Arrow IPC bar catalog."""
+
+    @pytest.fixture
+    def source(self, tmp_path):
+        from common.data_pipeline.pipeline import save_ohlcv
+        from nautilus.nautilus_runner import _catalog_path
+
+        df = _make_ohlcv(50)
+        save_ohlcv(df, "ARROWTEST/USDT", "1h", "testexch", directory=tmp_path)
+        yield df, tmp_path
+        _catalog_path("ARROWTEST/USDT", "1h", "testexch").unlink(missing_ok=True)
+
+    def test_round_trip_fixed_point(self, source):
+        import pyarrow as pa
+        from nautilus.nautilus_runner import (
+            convert_ohlcv_to_nautilus_catalog,
+            load_nautilus_catalog,
+        )
+
+        df, data_dir = source
+        path = convert_ohlcv_to_nautilus_catalog("ARROWTEST/USDT", "1h", "testexch", data_dir)
+        with pa.memory_map(str(path)) as f:
+            schema = pa.ipc.open_file(f).schema
+        assert schema.field("close").type == pa.int64()
+        assert schema.metadata[b"source_rows"] == b"50"
+
+        loaded = load_nautilus_catalog("ARROWTEST/USDT", "1h", "testexch", data_dir)
+        assert len(loaded) == 50
+        assert (loaded.index == df.index).all()
+        np.testing.assert_allclose(loaded["close"], df["close"], atol=1e-8)
+
+    def test_unchanged_source_skips_conversion(self, source):
+        from nautilus.nautilus_runner import convert_ohlcv_to_nautilus_catalog
+
+        _, data_dir = source
+        first = convert_ohlcv_to_nautilus_catalog("ARROWTEST/USDT", "1h", "testexch", data_dir)
+        with patch("nautilus.nautilus_runner.pd.read_parquet") as read:
+            second = convert_ohlcv_to_nautilus_catalog("ARROWTEST/USDT", "1h", "testexch", data_dir)
+        read.assert_not_called()
+        assert second == first
+
+    def test_changed_source_rebuilds(self, source):
+        from common.data_pipeline.pipeline import save_ohlcv
+        from nautilus.nautilus_runner import load_nautilus_catalog
+
+        _, data_dir = source
+        load_nautilus_catalog("ARROWTEST/USDT", "1h", "testexch", data_dir)
+        save_ohlcv(_make_ohlcv(80), "ARROWTEST/USDT", "1h", "testexch", directory=data_dir)
+
+        assert len(load_nautilus_catalog("ARROWTEST/USDT", "1h", "testexch", data_dir)) == 80
+
+    def test_no_data_returns_empty(self, tmp_path):
+        from nautilus.nautilus_runner import load_nautilus_catalog
+
+        assert load_nautilus_catalog("NODATA/PAIR", "1h", "noexchange", tmp_path).empty
+
+
 # ── BacktestResult Persistence Tests ─────────────────
 
 
@@ -1,9 +1,15 @@
 """Tests for order_sync — background order sync loop for live orders."""
 
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from asgiref.sync import async_to_sync
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
 
+from trading.models import Order, OrderFillEvent, OrderStatus, TradingMode
+from trading.services.live_trading import LiveTradingService
 from trading.services.order_sync import start_order_sync, stop_order_sync
 
 
@@ -53,3 +59,131 @@ class TestStopOrderSync:
         # Should not raise
         await stop_order_sync()
         assert mod._sync_task is None
+
+
+def _live_order(exchange_order_id, symbol="BTC/USDT", exchange_id="kraken", **kwargs):
+    defaults = {
+        "exchange_id": exchange_id,
+        "exchange_order_id": exchange_order_id,
+        "symbol": symbol,
+        "side": "buy",
+        "order_type": "limit",
+        "amount": 1.0,
+        "price": 50000.0,
+        "status": OrderStatus.OPEN,
+        "mode": TradingMode.LIVE,
+        "timestamp": timezone.now(),
+    }
+    defaults.update(kwargs)
+    return Order.objects.create(**defaults)
+
+
+def _exchange(open_orders=(), closed_orders=(), orders=None):
+    exchange = MagicMock()
+    exchange.has = {"fetchOpenOrders": True, "fetchClosedOrders": True}
+    exchange.fetch_open_orders = AsyncMock(return_value=list(open_orders))
+    exchange.fetch_closed_orders = AsyncMock(return_value=list(closed_orders))
+    exchange.fetch_order = AsyncMock(side_effect=lambda order_id, symbol: orders[order_id])
+    return exchange
+
+
+def _services(exchanges):
+    def build(exchange_id, shared):
+        service = MagicMock()
+        exchange = exchanges[exchange_id]
+        if isinstance(exchange, Exception):
+            service._get_exchange = AsyncMock(side_effect=exchange)
+        else:
+            service._get_exchange = AsyncMock(return_value=exchange)
+        service.close = AsyncMock()
+        return service
+
+    return patch("trading.services.live_trading.ExchangeService", side_effect=build)
+
+
+@pytest.mark.django_db
+class TestSyncOrdersBatched:
+    def _sync(self, orders):
+        with patch("trading.services.live_trading.get_channel_layer", return_value=None):
+            return async_to_sync(LiveTradingService.sync_orders)(orders)
+
+    def test_one_list_call_per_symbol_and_fetch_order_for_remainder(self):
+        still_open = _live_order("o-1")
+        filled = _live_order("o-2")
+        unlisted = _live_order("o-3")
+        lone = _live_order("e-1", symbol="ETH/USDT", exchange_id="binance")
+
+        kraken = _exchange(
+            open_orders=[{"id": "o-1", "status": "open", "filled": 0}],
+            closed_orders=[{"id": "o-2", "status": "closed", "filled": 1.0, "average": 50100.0}],
+            orders={"o-3": {"id": "o-3", "status": "canceled", "filled": 0}},
+        )
+        binance = _exchange(orders={"e-1": {"id": "e-1", "status": "closed", "filled": 1.0}})
+
+        with _services({"kraken": kraken, "binance": binance}):
+            result = self._sync([still_open, filled, unlisted, lone])
+
+        assert result == {"synced": 4, "updated": 3, "errors": 0}
+        kraken.fetch_open_orders.assert_awaited_once_with("BTC/USDT")
+        since = kraken.fetch_closed_orders.await_args.kwargs["since"]
+        # Only orders still unmatched after the open list bound the window
+        assert since == int(filled.created_at.timestamp() * 1000)
+        kraken.fetch_order.assert_awaited_once_with("o-3", "BTC/USDT")
+        # A lone order is cheaper to fetch directly than via two list calls
+        binance.fetch_open_orders.assert_not_awaited()
+        binance.fetch_order.assert_awaited_once_with("e-1", "ETH/USDT")
+
+        statuses = dict(Order.objects.values_list("exchange_order_id", "status"))
+        assert statuses == {
+            "o-1": OrderStatus.OPEN,
+            "o-2": OrderStatus.FILLED,
+            "o-3": OrderStatus.CANCELLED,
+            "e-1": OrderStatus.FILLED,
+        }
+        fill = OrderFillEvent.objects.get(order=filled)
+        assert fill.fill_amount == 1.0
+        assert fill.fill_price == 50100.0
+        assert OrderFillEvent.objects.count() == 2
+
+    def test_updates_written_with_one_bulk_statement_each(self):
+        orders = [_live_order(f"o-{i}") for i in range(5)]
+        kraken = _exchange(
+            closed_orders=[
+                {"id": f"o-{i}", "status": "closed", "filled": 1.0, "average": 50000.0}
+                for i in range(5)
+            ],
+        )
+
+        with _services({"kraken": kraken}), CaptureQueriesContext(connection) as ctx:
+            result = self._sync(orders)
+
+        assert result["updated"] == 5
+        writes = [
+            q["sql"] for q in ctx.captured_queries if q["sql"].startswith(("UPDATE", "INSERT"))
+        ]
+        order_writes = [sql for sql in writes if "trading_performancerollup" not in sql]
+        assert len(order_writes) == 2
+        # All five fills land in one (symbol, day) performance rollup bucket
+        assert len(writes) - len(order_writes) == 1
+        assert OrderFillEvent.objects.count() == 5
+        kraken.fetch_order.assert_not_awaited()
+
+    def test_exchange_failure_is_isolated(self):
+        ok = _live_order("o-1")
+        down = _live_order("e-1", exchange_id="binance")
+        kraken = _exchange(orders={"o-1": {"id": "o-1", "status": "closed", "filled": 1.0}})
+
+        with _services({"kraken": kraken, "binance": ConnectionError("down")}):
+            result = self._sync([ok, down])
+
+        assert result == {"synced": 1, "updated": 1, "errors": 1}
+        down.refresh_from_db()
+        assert down.status == OrderStatus.OPEN
+
+    def test_orders_without_exchange_id_skipped(self):
+        pending = _live_order("", status=OrderStatus.SUBMITTED)
+
+        with _services({}):
+            result = self._sync([pending])
+
+        assert result == {"synced": 0, "updated": 0, "errors": 0}
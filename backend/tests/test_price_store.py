@@ -0,0 +1,155 @@
+"""Tests for market.services.price_store — shared latest-price snapshot."""
+
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from market.services.price_store import PriceSnapshotStore
+
+
+def _ticker(symbol, price):
+    return {"symbol": symbol, "price": price}
+
+
+@pytest.fixture
+def store():
+    return PriceSnapshotStore(max_age_seconds=30)
+
+
+@pytest.fixture
+def exchange_service():
+    service = MagicMock()
+    service.fetch_tickers = AsyncMock(
+        side_effect=lambda symbols: [_ticker(s, 100.0 + i) for i, s in enumerate(symbols)],
+    )
+    service.fetch_ticker = AsyncMock(side_effect=lambda s: _ticker(s, 1.0))
+    service.close = AsyncMock()
+    with patch("market.services.exchange.ExchangeService", return_value=service) as cls:
+        yield cls, service
+
+
+class TestPriceSnapshotStore:
+    def test_update_skips_invalid_and_older_prices(self, store):
+        now = time.time()
+        assert store.update({"BTC/USDT": 50000.0, "ETH/USDT": 0, "SOL/USDT": None}, "ticker") == 1
+        store.update({"BTC/USDT": 49000.0}, "data_refresh", at=now - 3600)
+
+        quote = store.get_many(["BTC/USDT", "ETH/USDT"])["BTC/USDT"]
+        assert quote.price == 50000.0
+        assert quote.source == "ticker"
+        assert store.get_many(["ETH/USDT"]) == {}
+
+    def test_fresh_reads_do_not_fetch(self, store, exchange_service):
+        cls, service = exchange_service
+        store.update({"BTC/USDT": 50000.0, "ETH/USDT": 3000.0}, "ticker")
+
+        quotes = store.get_prices(["BTC/USDT", "ETH/USDT"])
+
+        assert {s: q.price for s, q in quotes.items()} == {"BTC/USDT": 50000.0, "ETH/USDT": 3000.0}
+        cls.assert_not_called()
+
+    def test_missing_and_stale_fetched_in_one_batch(self, store, exchange_service):
+        cls, service = exchange_service
+        store.update({"BTC/USDT": 50000.0}, "ticker")
+        store.update({"ETH/USDT": 3000.0}, "data_refresh", at=time.time() - 3600)
+
+        quotes = store.get_prices(["BTC/USDT", "ETH/USDT", "SOL/USDT"], exchange_id="kraken")
+
+        cls.assert_called_once_with(exchange_id="kraken", shared=True)
+        service.fetch_tickers.assert_awaited_once_with(["ETH/USDT", "SOL/USDT"])
+        service.fetch_ticker.assert_not_awaited()
+        assert quotes["BTC/USDT"].price == 50000.0
+        assert quotes["ETH/USDT"].price == 100.0
+        assert quotes["ETH/USDT"].source == "kraken"
+        assert not quotes["SOL/USDT"].is_stale(30)
+
+    def test_rejected_batch_falls_back_per_symbol(self, store, exchange_service):
+        _, service = exchange_service
+        service.fetch_tickers.side_effect = Exception("BadSymbol: BTC")
+        service.fetch_ticker.side_effect = lambda s: (
+            _ticker(s, 2.0) if s == "ETH/USDT" else (_ for _ in ()).throw(Exception("BadSymbol"))
+        )
+
+        quotes = store.get_prices(["BTC", "ETH/USDT"])
+
+        assert {s: q.price for s, q in quotes.items()} == {"ETH/USDT": 2.0}
+        assert service.fetch_ticker.await_count == 2
+
+    def test_failed_refresh_returns_stale_quote_with_metadata(self, store, exchange_service):
+        _, service = exchange_service
+        service.fetch_tickers.side_effect = ConnectionError("refused")
+        store.update({"BTC/USDT": 50000.0}, "data_refresh", at=time.time() - 120)
+
+        quote = store.get_prices(["BTC/USDT"])["BTC/USDT"]
+
+        assert quote.price == 50000.0
+        meta = quote.to_dict(max_age=30)
+        assert meta["stale"] is True
+        assert meta["age_seconds"] >= 120
+
+    def test_forex_refresh_uses_router(self, store):
+        with patch(
+            "market.services.data_router.DataServiceRouter.fetch_tickers",
+            new_callable=AsyncMock,
+            return_value=[_ticker("EUR/USD", 1.08)],
+        ) as fetch:
+            quotes = store.get_prices(["EUR/USD"], asset_class="forex")
+
+        fetch.assert_awaited_once_with(["EUR/USD"], "forex")
+        assert quotes["EUR/USD"].source == "yfinance"
+
+    @pytest.mark.asyncio
+    async def test_async_reads(self, store, exchange_service):
+        _, service = exchange_service
+
+        quotes = await store.aget_prices(["BTC/USDT"])
+        again = await store.aget_prices(["BTC/USDT"])
+
+        assert quotes["BTC/USDT"].price == again["BTC/USDT"].price == 100.0
+        service.fetch_tickers.assert_awaited_once()
+
+
+@pytest.mark.django_db
+class TestPriceStoreFeeds:
+    def test_portfolio_analytics_served_from_snapshot(self):
+        from market.services.price_store import get_price_store
+        from portfolio.models import Holding, Portfolio
+        from portfolio.services.analytics import PortfolioAnalyticsService
+
+        p = Portfolio.objects.create(name="P", exchange_id="kraken")
+        Holding.objects.create(portfolio=p, symbol="BTC/USDT", amount=2.0, avg_buy_price=40000)
+        get_price_store().update({"BTC/USDT": 50000.0}, "ticker")
+
+        with patch("market.services.exchange.ExchangeService") as cls:
+            summary = PortfolioAnalyticsService.get_portfolio_summary(p.id)
+
+        cls.assert_not_called()
+        assert summary["total_value"] == 100000.0
+
+    def test_data_refresh_records_last_close(self):
+        from core.services.executors.data import _record_last_closes
+        from market.services.price_store import get_price_store
+
+        candle_time = time.time() - 600
+        _record_last_closes(
+            {
+                "BTC/USDT_1h": {
+                    "status": "ok",
+                    "last_close": 50100.0,
+                    "last_timestamp": candle_time,
+                },
+                "BTC/USDT_1d": {
+                    "status": "ok",
+                    "last_close": 49000.0,
+                    "last_timestamp": candle_time - 82800,
+                },
+                "ETH/USDT_1h": {"status": "error", "error": "down"},
+            }
+        )
+
+        quotes = get_price_store().get_many(["BTC/USDT", "ETH/USDT"])
+        assert list(quotes) == ["BTC/USDT"]
+        assert quotes["BTC/USDT"].price == 50100.0
+        assert quotes["BTC/USDT"].source == "data_refresh"
+        assert quotes["BTC/USDT"].age_seconds >= 600
@@ -261,8 +261,8 @@ class TestCmdNautilus:
 
     def test_convert(self, capsys):
         args = Namespace(nt_command="convert", symbol="BTC/USDT", timeframe="1h", exchange="kraken")
-        with patch("nautilus.nautilus_runner.convert_ohlcv_to_nautilus_csv",
-                    return_value=Path("/tmp/nt.csv")):
+        with patch("nautilus.nautilus_runner.convert_ohlcv_to_nautilus_catalog",
+                    return_value=Path("/tmp/nt.arrow")):
             cmd_nautilus(args)
         out = capsys.readouterr().out
         assert "converted" in out
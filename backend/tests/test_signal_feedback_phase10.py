@@ -517,6 +517,54 @@ class TestSignalFeedbackService(TestCase):
         assert result["overall_win_rate"] == pytest.approx(5 / 8, abs=0.01)
         assert "ml" in result["sources"]
 
+    def test_get_source_accuracy_single_query_cached(self):
+        from analysis.services.signal_feedback import SignalFeedbackService
+
+        for i, (outcome, ml) in enumerate([("win", 80.0), ("win", 70.0), ("loss", 45.0)]):
+            SignalAttribution.objects.create(
+                order_id=f"agg-{i}",
+                symbol="BTC/USDT",
+                asset_class="crypto",
+                strategy="CIV1",
+                composite_score=60.0,
+                ml_contribution=ml,
+                outcome=outcome,
+            )
+
+        with self.assertNumQueries(1):
+            result = SignalFeedbackService.get_source_accuracy()
+        ml = result["sources"]["ml"]
+        assert ml["total_trades"] == 3
+        assert ml["wins"] == 2
+        assert ml["avg_score_win"] == 75.0
+        assert ml["avg_score_loss"] == 45.0
+        assert result["sources"]["regime"]["total_trades"] == 0
+
+        result["sources"]["ml"]["wins"] = 99
+        with self.assertNumQueries(0):
+            again = SignalFeedbackService.get_source_accuracy()
+        assert again["sources"]["ml"]["wins"] == 2
+
+    def test_get_source_accuracy_cache_cleared(self):
+        from analysis.services.signal_feedback import (
+            SignalFeedbackService,
+            clear_source_accuracy_cache,
+        )
+
+        assert SignalFeedbackService.get_source_accuracy()["total_trades"] == 0
+        SignalAttribution.objects.create(
+            order_id="late-win",
+            symbol="BTC/USDT",
+            asset_class="crypto",
+            strategy="CIV1",
+            composite_score=70.0,
+            outcome="win",
+        )
+        assert SignalFeedbackService.get_source_accuracy()["total_trades"] == 0
+
+        clear_source_accuracy_cache()
+        assert SignalFeedbackService.get_source_accuracy()["total_trades"] == 1
+
     def test_get_weight_recommendations(self):
         from analysis.services.signal_feedback import SignalFeedbackService
 
@@ -633,6 +681,15 @@ class TestSignalAttributionViews(TestCase):
         assert self.attr.pnl == 250.0
         assert self.attr.resolved_at is not None
 
+    def test_feedback_invalidates_accuracy(self):
+        assert self.client.get("/api/signals/accuracy/").data["total_trades"] == 0
+        self.client.post(
+            "/api/signals/feedback/",
+            {"order_id": "view-test-order", "outcome": "win", "pnl": 10.0},
+            format="json",
+        )
+        assert self.client.get("/api/signals/accuracy/").data["total_trades"] == 1
+
     def test_feedback_not_found(self):
         resp = self.client.post(
             "/api/signals/feedback/",
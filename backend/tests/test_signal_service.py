@@ -887,6 +887,31 @@ class TestTaskExecutors:
             perf = MLModelPerformance.objects.get(model_id="BTC_1h_kraken_20260310")
             assert perf.retrain_recommended is False
 
+    def test_ml_retrain_executor_mild_drift_warm_starts(self):
+        from core.services.task_registry import _run_ml_retrain
+
+        MLModelPerformance.objects.create(
+            model_id="20260310_060000_BTCUSDT_1h",
+            total_predictions=100,
+            correct_predictions=51,
+            rolling_accuracy=0.51,
+            retrain_recommended=True,
+        )
+
+        with (
+            patch("analysis.services.ml.MLService.train") as mock_full,
+            patch(
+                "analysis.services.ml.MLService.train_incremental",
+                return_value={"mode": "incremental"},
+            ) as mock_inc,
+        ):
+            result = _run_ml_retrain({}, self._progress_cb)
+
+        assert result["retrained"] == 1
+        assert result["modes"] == {"20260310_060000_BTCUSDT_1h": "incremental"}
+        mock_full.assert_not_called()
+        assert mock_inc.call_args[0][0]["parent_model_id"] == "20260310_060000_BTCUSDT_1h"
+
     def test_conviction_audit_executor_no_watchlist(self):
         from core.services.task_registry import _run_conviction_audit
 
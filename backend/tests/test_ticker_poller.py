@@ -13,11 +13,13 @@ def reset_poller():
     import market.services.ticker_poller as mod
 
     mod._poller_task = None
+    mod._hub = mod.TickerHub()
     yield
     # Clean up any running tasks
     if mod._poller_task and not mod._poller_task.done():
         mod._poller_task.cancel()
     mod._poller_task = None
+    mod._hub = mod.TickerHub()
 
 
 @pytest.mark.asyncio
@@ -84,14 +86,15 @@ async def test_stop_poller_cancels_task():
 
 @pytest.mark.asyncio
 async def test_poll_loop_broadcasts_tickers():
-    """_poll_loop should call group_send with ticker data."""
+    """_poll_loop should send each subscribed symbol's ticker to its group."""
     import market.services.ticker_poller as mod
 
+    mod.get_ticker_hub().subscribe("client-1", ["BTC/USDT"])
     mock_layer = MagicMock()
     mock_layer.group_send = AsyncMock()
 
     mock_service = MagicMock()
-    mock_service.fetch_tickers = AsyncMock(return_value={"BTC/USDT": {"price": 50000}})
+    mock_service.fetch_tickers = AsyncMock(return_value=[{"symbol": "BTC/USDT", "price": 50000}])
     mock_service.close = AsyncMock()
 
     with patch.object(mod, "get_channel_layer", return_value=mock_layer), \
@@ -103,10 +106,12 @@ async def test_poll_loop_broadcasts_tickers():
         with contextlib.suppress(asyncio.CancelledError):
             await task
 
-        mock_layer.group_send.assert_called()
+        mock_service.fetch_tickers.assert_called_with(["BTC/USDT"])
+        mock_layer.group_send.assert_called_once()
         call_args = mock_layer.group_send.call_args
-        assert call_args[0][0] == "market_tickers"
-        assert call_args[0][1]["type"] == "ticker_update"
+        assert call_args[0][0] == "ticker.BTC_USDT"
+        assert call_args[0][1]["type"] == "ticker_delta"
+        assert call_args[0][1]["data"] == {"symbol": "BTC/USDT", "price": 50000}
 
 
 @pytest.mark.asyncio
@@ -114,6 +119,8 @@ async def test_poll_loop_handles_fetch_error():
     """_poll_loop should continue after a fetch error."""
     import market.services.ticker_poller as mod
 
+    mod.get_ticker_hub().subscribe("client-1", ["BTC/USDT"])
+
     mock_layer = MagicMock()
     mock_layer.group_send = AsyncMock()
 
@@ -141,3 +148,64 @@ async def test_poll_loop_handles_fetch_error():
         assert call_count >= 2
         # group_send should NOT have been called (no successful fetches)
         mock_layer.group_send.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_poll_loop_idle_without_subscribers():
+    """No subscriptions means no exchange calls."""
+    import market.services.ticker_poller as mod
+
+    mock_service = MagicMock()
+    mock_service.fetch_tickers = AsyncMock(return_value=[])
+
+    with patch.object(mod, "get_channel_layer", return_value=MagicMock()), \
+         patch("market.services.exchange.ExchangeService", return_value=mock_service), \
+         patch.object(mod, "POLL_INTERVAL_SECONDS", 0.01):
+        task = asyncio.create_task(mod._poll_loop())
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+    mock_service.fetch_tickers.assert_not_called()
+
+
+class TestTickerHub:
+    def test_symbols_are_union_of_subscriptions(self):
+        from market.services.ticker_poller import TickerHub
+
+        hub = TickerHub()
+        assert hub.subscribe("a", ["BTC/USDT", "ETH/USDT"]) == ["BTC/USDT", "ETH/USDT"]
+        assert hub.subscribe("b", ["ETH/USDT", "SOL/USDT"]) == ["ETH/USDT", "SOL/USDT"]
+        assert hub.subscribe("a", ["BTC/USDT"]) == []
+        assert hub.symbols == ["BTC/USDT", "ETH/USDT", "SOL/USDT"]
+
+        assert hub.unsubscribe("a") == ["BTC/USDT", "ETH/USDT"]
+        assert hub.symbols == ["ETH/USDT", "SOL/USDT"]
+        assert hub.unsubscribe("b", ["SOL/USDT", "XRP/USDT"]) == ["SOL/USDT"]
+        assert hub.subscriptions("b") == {"ETH/USDT"}
+
+    def test_apply_returns_only_changed_fields(self):
+        from market.services.ticker_poller import TickerHub
+
+        hub = TickerHub()
+        first = {"symbol": "BTC/USDT", "price": 100.0, "volume_24h": 5.0, "timestamp": "t1"}
+        assert hub.apply([first]) == {"BTC/USDT": first}
+
+        # Timestamp-only changes are not worth a message
+        assert hub.apply([{**first, "timestamp": "t2"}]) == {}
+
+        changes = hub.apply([{**first, "price": 101.0, "timestamp": "t3"}])
+        assert changes == {"BTC/USDT": {"symbol": "BTC/USDT", "price": 101.0, "timestamp": "t3"}}
+        latest = {**first, "price": 101.0, "timestamp": "t3"}
+        assert hub.snapshot(["BTC/USDT", "ETH/USDT"]) == [latest]
+
+    def test_unwatched_symbol_forgotten(self):
+        from market.services.ticker_poller import TickerHub
+
+        hub = TickerHub()
+        hub.subscribe("a", ["BTC/USDT"])
+        hub.apply([{"symbol": "BTC/USDT", "price": 1.0}])
+        hub.unsubscribe("a")
+
+        assert hub.snapshot(["BTC/USDT"]) == []
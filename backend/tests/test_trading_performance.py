@@ -1,10 +1,11 @@
 """Trading performance analytics tests."""
 
-from datetime import datetime, timezone
+from datetime import date, datetime, timedelta, timezone
 
 import pytest
+from django.core.management import call_command
 
-from trading.models import Order, OrderStatus
+from trading.models import Order, OrderStatus, PerformanceRollup
 from trading.services.performance import TradingPerformanceService
 
 
@@ -95,6 +96,75 @@ class TestTradingPerformanceService:
         assert symbols == {"BTC/USDT", "ETH/USDT"}
 
 
+@pytest.mark.django_db
+class TestPerformanceRollups:
+    def test_rollup_maintained_on_fill(self):
+        day = datetime(2026, 3, 2, 9, tzinfo=timezone.utc)
+        _create_order(side="buy", amount=2.0, price=100.0, timestamp=day)
+        _create_order(side="sell", amount=1.0, price=130.0, timestamp=day + timedelta(hours=5))
+        _create_order(status=OrderStatus.OPEN, timestamp=day)
+
+        row = PerformanceRollup.objects.get()
+        assert row.day == date(2026, 3, 2)
+        assert row.trade_count == 2
+        assert (row.buy_qty, row.buy_notional) == (2.0, 200.0)
+        assert (row.sell_qty, row.sell_notional) == (1.0, 130.0)
+
+    def test_summary_reads_rollups(self, django_assert_num_queries):
+        _create_order(side="buy", amount=1.0, price=100.0)
+        _create_order(side="sell", amount=1.0, price=150.0)
+        # Rollups are the source of truth for whole days
+        Order.objects.update(status=OrderStatus.CANCELLED)
+
+        with django_assert_num_queries(1):
+            result = TradingPerformanceService.get_summary(portfolio_id=1)
+
+        assert result["total_trades"] == 2
+        assert result["total_pnl"] == 50.0
+
+    def test_partial_days_match_raw_orders(self):
+        start = datetime(2026, 3, 1, 10, tzinfo=timezone.utc)
+        prices = [100.0, 110.0, 90.0, 120.0, 80.0, 130.0]
+        for i, price in enumerate(prices):
+            side = "buy" if i % 2 == 0 else "sell"
+            _create_order(side=side, price=price, timestamp=start + timedelta(hours=12 * i))
+
+        date_from = "2026-03-01T18:00:00Z"
+        date_to = "2026-03-03T12:00:00Z"
+        raw = TradingPerformanceService._compute_metrics(
+            list(TradingPerformanceService._base_qs(1, None, None, date_from, date_to)),
+        )
+        result = TradingPerformanceService.get_summary(
+            portfolio_id=1, date_from=date_from, date_to=date_to,
+        )
+
+        assert result["total_trades"] == raw["total_trades"] == 4
+        assert result["total_pnl"] == raw["total_pnl"]
+        assert result["open_positions"] == raw["open_positions"]
+
+    def test_rebuild_command(self):
+        _create_order(symbol="BTC/USDT", timestamp=datetime(2026, 3, 1, tzinfo=timezone.utc))
+        _create_order(symbol="ETH/USDT", timestamp=datetime(2026, 3, 2, tzinfo=timezone.utc))
+        rows = PerformanceRollup.objects.values_list("symbol", "day", "trade_count")
+        expected = set(rows)
+        PerformanceRollup.objects.all().delete()
+
+        call_command("rebuild_performance_rollups")
+
+        assert set(rows.all()) == expected
+
+    def test_bulk_synced_fill_refreshes_rollup(self):
+        from trading.services.live_trading import _save_synced_orders
+
+        order = _create_order(status=OrderStatus.SUBMITTED, mode="live")
+        assert not PerformanceRollup.objects.exists()
+
+        order.transition_to(OrderStatus.FILLED, commit=False)
+        _save_synced_orders([order], [])
+
+        assert PerformanceRollup.objects.get(mode="live").trade_count == 1
+
+
 @pytest.mark.django_db
 class TestTradingPerformanceAPI:
     def test_summary_endpoint(self, client, django_user_model):
@@ -783,13 +783,15 @@ class TestPaperTradingLogEvent:
 @pytest.mark.django_db
 class TestOrderSyncLoop:
     def test_sync_loop_processes_orders(self):
-        """Lines 36-40: Sync loop iterates orders and calls sync_order."""
+        """Sync loop hands all active orders to one batched sync_orders call."""
         from trading.services.order_sync import _sync_loop
 
         _make_order(mode=TradingMode.LIVE, status=OrderStatus.SUBMITTED)
 
         with patch(
-            "trading.services.live_trading.LiveTradingService.sync_order", new_callable=AsyncMock
+            "trading.services.live_trading.LiveTradingService.sync_orders",
+            new_callable=AsyncMock,
+            return_value={"synced": 1, "updated": 0, "errors": 0},
         ) as mock_sync:
 
             async def _run():
@@ -802,15 +804,16 @@ class TestOrderSyncLoop:
 
             async_to_sync(_run)()
             mock_sync.assert_called_once()
+            assert len(mock_sync.call_args.args[0]) == 1
 
-    def test_sync_loop_per_order_exception(self):
-        """Lines 39-40: Per-order exception is caught and logged."""
+    def test_sync_loop_batch_exception(self):
+        """An exception from the batched sync is caught and logged."""
         from trading.services.order_sync import _sync_loop
 
         _make_order(mode=TradingMode.LIVE, status=OrderStatus.OPEN)
 
         with patch(
-            "trading.services.live_trading.LiveTradingService.sync_order",
+            "trading.services.live_trading.LiveTradingService.sync_orders",
             new_callable=AsyncMock,
             side_effect=RuntimeError("sync error"),
         ):
@@ -917,23 +920,31 @@ class TestLiveTradingPartialFill:
         assert order.status == OrderStatus.SUBMITTED
 
     def test_cancel_all_per_order_exception(self):
-        """Lines 229-230: cancel_all_open_orders logs per-order exception."""
+        """cancel_all_open_orders records a failed exchange cancel as ERROR."""
         from trading.services.live_trading import LiveTradingService
 
-        _make_order(
+        order = _make_order(
             mode=TradingMode.LIVE,
             status=OrderStatus.SUBMITTED,
+            exchange_order_id="EX-1",
             portfolio_id=1,
         )
 
-        with patch.object(
-            LiveTradingService,
-            "cancel_order",
-            new_callable=AsyncMock,
-            side_effect=RuntimeError("cancel failed"),
+        mock_exchange = AsyncMock()
+        mock_exchange.cancel_order = AsyncMock(side_effect=RuntimeError("cancel failed"))
+        mock_service = MagicMock()
+        mock_service._get_exchange = AsyncMock(return_value=mock_exchange)
+        mock_service.close = AsyncMock()
+
+        with (
+            patch("trading.services.live_trading.ExchangeService", return_value=mock_service),
+            patch("trading.services.live_trading.get_channel_layer", return_value=None),
         ):
             count = async_to_sync(LiveTradingService.cancel_all_open_orders)(1)
         assert count == 0  # Exception caught, not counted as cancelled
+        order.refresh_from_db()
+        assert order.status == OrderStatus.ERROR
+        assert "cancel failed" in order.error_message
 
 
 # ══════════════════════════════════════════════════════════════
@@ -1737,23 +1748,30 @@ class TestForexGetPriceSuccess:
         from trading.services.forex_paper_trading import ForexPaperTradingService
 
         with patch(
-            "market.services.data_router.DataServiceRouter.fetch_ticker",
+            "market.services.data_router.DataServiceRouter.fetch_tickers",
             new_callable=AsyncMock,
-            return_value={"last": 1.085},
-        ):
+            return_value=[{"symbol": "EUR/USD", "price": 1.085}],
+        ) as mock_fetch:
             result = ForexPaperTradingService._get_price("EUR/USD")
+            # Second read is served from the price snapshot
+            assert ForexPaperTradingService._get_price("EUR/USD") == 1.085
         assert result == 1.085
+        mock_fetch.assert_awaited_once_with(["EUR/USD"], "forex")
 
-    def test_get_price_close_fallback(self):
+    def test_get_price_stale_snapshot_refetch_fails(self):
+        import time
+
+        from market.services.price_store import get_price_store
         from trading.services.forex_paper_trading import ForexPaperTradingService
 
+        get_price_store().update({"EUR/USD": 1.075}, source="data_refresh", at=time.time() - 3600)
         with patch(
-            "market.services.data_router.DataServiceRouter.fetch_ticker",
+            "market.services.data_router.DataServiceRouter.fetch_tickers",
             new_callable=AsyncMock,
-            return_value={"close": 1.075},
+            side_effect=ConnectionError("down"),
         ):
             result = ForexPaperTradingService._get_price("EUR/USD")
-        assert result == 1.075
+        assert result == 0.0
 
 
 @pytest.mark.django_db
@@ -1398,3 +1398,148 @@ class TestRunValidationGate3Details:
         assert str(RESULTS_DIR) in str(filepath)
         # Clean up
         os.unlink(filepath)
+
+
+# ── Batched / Parallel Sweep ─────────────────────────────────
+
+
+class TestBatchedSweep:
+    PARAMS = {
+        "bb_period": 20,
+        "bb_std": 2.0,
+        "rsi_threshold": 40,
+        "volume_factor": 1.0,
+        "sell_rsi_threshold": 55,
+    }
+
+    def test_batched_sweep_matches_single_backtests(self):
+        from validation_engine import _run_backtest, sweep_parameters
+
+        df = generate_synthetic_ohlcv(n=2000)
+        grid = {**{k: [v] for k, v in self.PARAMS.items()}, "bb_std": [1.5, 2.0, 2.5]}
+        results_df = sweep_parameters(
+            df, bollinger_mr_signals, grid, sl_stop=0.04, max_workers=1, batch_size=2
+        )
+
+        assert len(results_df) == 3
+        for _, row in results_df.iterrows():
+            entries, exits = bollinger_mr_signals(df, row["params"])
+            single = _run_backtest(df["close"], entries, exits, sl_stop=0.04)
+            for key, value in single.items():
+                np.testing.assert_allclose(row[key], value, equal_nan=True)
+
+    def test_cached_indicator_scoped_to_frame(self):
+        from validation_engine import cached_indicator, indicator_cache
+
+        df = generate_synthetic_ohlcv(n=200)
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return df["close"].rolling(10).mean()
+
+        with indicator_cache(df):
+            first = cached_indicator(df, ("sma", 10), compute)
+            second = cached_indicator(df, ("sma", 10), compute)
+            cached_indicator(df.iloc[:100], ("sma", 10), compute)
+        cached_indicator(df, ("sma", 10), compute)
+
+        assert first is second
+        assert len(calls) == 3
+
+    def test_sweep_shares_indicators_across_combos(self):
+        from unittest.mock import patch as _patch
+
+        import validate_bollinger_mean_reversion as bmr
+        from validation_engine import sweep_parameters
+
+        df = generate_synthetic_ohlcv(n=1000)
+        grid = {**{k: [v] for k, v in self.PARAMS.items()}, "rsi_threshold": [30, 35, 40]}
+        with _patch.object(bmr, "adx", wraps=bmr.adx) as adx_spy:
+            sweep_parameters(df, bmr.bollinger_mr_signals, grid, sl_stop=0.04, max_workers=1)
+
+        assert adx_spy.call_count == 1
+
+    def test_early_stop_skips_combos_that_cannot_pass(self):
+        from unittest.mock import patch as _patch
+
+        import validation_engine
+        from validation_engine import sweep_parameters
+
+        df = generate_synthetic_ohlcv(n=2000)
+
+        def sparse_signal(df, params):
+            entries = pd.Series(False, index=df.index)
+            entries.iloc[:: params["step"]] = True
+            return entries, entries.shift(1, fill_value=False)
+
+        # step=1000 → 2 entries in ~83 days (< 30/yr); step=10 → 200 entries
+        with _patch.object(
+            validation_engine,
+            "_backtest_columns",
+            wraps=validation_engine._backtest_columns,
+        ) as bt_spy:
+            results_df = sweep_parameters(
+                df, sparse_signal, {"step": [10, 1000]}, max_workers=1, early_stop=True
+            )
+
+        assert bt_spy.call_count == 1
+        assert bt_spy.call_args.args[1].shape[1] == 1
+        skipped = results_df[results_df["params"] == {"step": 1000}].iloc[0]
+        assert np.isnan(skipped["sharpe_ratio"])
+        assert not skipped["passes_gate2"]
+        assert any("Trades/year" in reason for reason in skipped["failure_reasons"])
+
+    def test_process_pool_sweep_matches_serial(self):
+        from validation_engine import sweep_parameters
+
+        df = generate_synthetic_ohlcv(n=1000)
+        grid = {**{k: [v] for k, v in self.PARAMS.items()}, "bb_std": [1.5, 2.5]}
+        serial = sweep_parameters(df, bollinger_mr_signals, grid, sl_stop=0.04, max_workers=1)
+        pooled = sweep_parameters(
+            df, bollinger_mr_signals, grid, sl_stop=0.04, max_workers=2, batch_size=1
+        )
+
+        cols = ["sharpe_ratio", "total_return", "num_trades", "pvalue"]
+        pd.testing.assert_frame_equal(serial[cols], pooled[cols])
+        assert list(serial["params"]) == list(pooled["params"])
+
+    def test_unpicklable_signal_runs_in_process(self):
+        from validation_engine import _pool_size
+
+        assert _pool_size(4, 10, lambda df, p: None) == 1
+        assert _pool_size(4, 10, bollinger_mr_signals) == 4
+        assert _pool_size(4, 2, bollinger_mr_signals) == 2
+
+
+class TestParallelWalkForward:
+    PARAMS = TestBatchedSweep.PARAMS
+
+    def test_pooled_folds_match_serial_in_order(self):
+        from validation_engine import walk_forward_validate
+
+        df = generate_synthetic_ohlcv(n=2000)
+        serial = walk_forward_validate(
+            df, bollinger_mr_signals, self.PARAMS, n_splits=4, max_workers=1
+        )
+        pooled = walk_forward_validate(
+            df, bollinger_mr_signals, self.PARAMS, n_splits=4, max_workers=2
+        )
+
+        assert [r["fold"] for r in pooled] == [1, 2, 3, 4]
+        pd.testing.assert_frame_equal(pd.DataFrame(serial), pd.DataFrame(pooled))
+
+    def test_unpicklable_signal_runs_folds_in_process(self):
+        from validation_engine import walk_forward_validate
+
+        df = generate_synthetic_ohlcv(n=1000)
+        calls = []
+
+        def local_signal(df, params):
+            calls.append(len(df))
+            return bollinger_mr_signals(df, params)
+
+        results = walk_forward_validate(df, local_signal, self.PARAMS, n_splits=4, max_workers=4)
+
+        assert len(results) == 4
+        assert len(calls) == 8
@@ -5,6 +5,7 @@ NaN data, flat data), asset class handling, per-class fees,
 result format, and empty/invalid watchlists.
 """
 
+import json
 import sys
 from pathlib import Path
 
@@ -556,6 +557,55 @@ class TestScreenFunctionsRegistry:
             assert callable(fn), f"{name} is not callable"
 
 
+class TestVectorizedGrid:
+    """A combo simulated inside a wide grid must match simulating it alone."""
+
+    def test_rsi_grid_matches_single_combo(self):
+        df = _make_volatile_ohlcv(n=500)
+        grid = screen_rsi_mean_reversion(
+            df, rsi_periods=[7, 14], oversold_levels=[25, 30], overbought_levels=[70, 75]
+        )
+        single = screen_rsi_mean_reversion(
+            df, rsi_periods=[14], oversold_levels=[30], overbought_levels=[70]
+        )
+        assert len(grid) == 8
+        row = grid[
+            (grid["rsi_period"] == 14) & (grid["oversold"] == 30) & (grid["overbought"] == 70)
+        ]
+        pd.testing.assert_frame_equal(
+            row.reset_index(drop=True), single.reset_index(drop=True), check_dtype=False
+        )
+
+    def test_volatility_breakout_grid_matches_single_combo(self):
+        df = _make_volatile_ohlcv(n=500)
+        grid = screen_volatility_breakout(
+            df,
+            breakout_periods=[10, 20],
+            volume_factors=[1.2, 2.0],
+            adx_ranges=[(10, 25), (15, 30)],
+        )
+        single = screen_volatility_breakout(
+            df, breakout_periods=[20], volume_factors=[1.2], adx_ranges=[(15, 30)]
+        )
+        row = grid[
+            (grid["breakout_period"] == 20)
+            & (grid["volume_factor"] == 1.2)
+            & (grid["adx_low"] == 15)
+            & (grid["adx_high"] == 30)
+        ]
+        pd.testing.assert_frame_equal(
+            row.reset_index(drop=True), single.reset_index(drop=True), check_dtype=False
+        )
+
+    def test_bollinger_zero_trade_combos_report_zero(self):
+        df = _make_ohlcv(n=500)
+        result = screen_bollinger_breakout(df, bb_periods=[20], bb_stds=[2.0, 50.0])
+        no_trades = result[result["bb_std"] == 50.0].iloc[0]
+        assert no_trades["num_trades"] == 0
+        assert no_trades["win_rate"] == 0
+        assert no_trades["profit_factor"] == 0
+
+
 # ── 13. Walk-Forward Validation ────────────────────────────────
 
 
@@ -1102,3 +1152,126 @@ class TestScreenExceptionBranches:
 
         assert isinstance(result, pd.DataFrame)
         assert len(result) == 0
+
+
+# ── 16. Shared Indicators & Batch Screening ──────────────────
+
+
+class TestBatchScreen:
+    def test_indicators_computed_once_across_screens(self, tmp_path):
+        from unittest.mock import patch
+
+        from research.scripts import vbt_screener
+        from research.scripts.vbt_screener import run_full_screen
+
+        df = _make_ohlcv(n=500)
+        with (
+            patch.object(vbt_screener, "rsi", wraps=vbt_screener.rsi) as rsi_spy,
+            patch.object(vbt_screener, "walk_forward_validate", return_value=pd.DataFrame()),
+            patch.object(vbt_screener, "RESULTS_DIR", tmp_path),
+        ):
+            results = run_full_screen(
+                "BTC/USDT",
+                df=df,
+                strategies=["rsi_mean_reversion", "ema_rsi_combo", "volatility_breakout"],
+            )
+
+        assert set(results) == {"rsi_mean_reversion", "ema_rsi_combo", "volatility_breakout"}
+        periods = [c.args[1] for c in rsi_spy.call_args_list]
+        assert periods.count(14) == 1
+
+    def test_run_full_screen_with_preloaded_df_skips_load(self, tmp_path):
+        from unittest.mock import patch
+
+        from research.scripts.vbt_screener import run_full_screen
+
+        df = _make_ohlcv(n=500)
+        with (
+            patch("research.scripts.vbt_screener.load_ohlcv") as mock_load,
+            patch("research.scripts.vbt_screener.RESULTS_DIR", tmp_path),
+        ):
+            results = run_full_screen("BTC/USDT", df=df, strategies=["bollinger_breakout"])
+
+        mock_load.assert_not_called()
+        assert list(results) == ["bollinger_breakout"]
+
+    def test_batch_inline_preserves_order_and_statuses(self, tmp_path):
+        from unittest.mock import patch
+
+        from research.scripts.vbt_screener import run_batch_screen
+
+        df = _make_ohlcv(n=500)
+
+        def mock_load(symbol, tf, source):
+            if symbol == "BAD/USDT":
+                raise RuntimeError("corrupt parquet")
+            return pd.DataFrame() if symbol == "NONE/USDT" else df
+
+        with (
+            patch("research.scripts.vbt_screener.load_ohlcv", side_effect=mock_load),
+            patch("research.scripts.vbt_screener.RESULTS_DIR", tmp_path),
+        ):
+            results = run_batch_screen(
+                ["ETH/USDT", "NONE/USDT", "BAD/USDT"],
+                strategies=["ema_rsi_combo"],
+                max_workers=1,
+            )
+
+        assert [r["symbol"] for r in results] == ["ETH/USDT", "NONE/USDT", "BAD/USDT"]
+        assert [r["status"] for r in results] == ["completed", "skipped", "error"]
+        summary = results[0]["result"]
+        assert summary["ema_rsi_combo"]["total_combos"] == 9
+        json.dumps(summary, allow_nan=False)
+
+    def test_batch_equity_loads_benchmark_once(self, tmp_path):
+        from unittest.mock import patch
+
+        from research.scripts.vbt_screener import run_batch_screen
+
+        df = _make_ohlcv(n=300)
+        calls = []
+
+        def mock_load(symbol, tf, source):
+            calls.append(symbol)
+            return df
+
+        with (
+            patch("research.scripts.vbt_screener.load_ohlcv", side_effect=mock_load),
+            patch("research.scripts.vbt_screener.RESULTS_DIR", tmp_path),
+        ):
+            results = run_batch_screen(
+                ["AAPL/USD", "MSFT/USD"],
+                timeframe="1d",
+                asset_class="equity",
+                strategies=["relative_strength"],
+                max_workers=1,
+            )
+
+        assert calls.count("SPY/USD") == 1
+        assert all("relative_strength" in r["result"] for r in results)
+
+    def test_batch_process_pool(self):
+        """Worker processes return summaries in input order."""
+        from research.scripts.vbt_screener import run_batch_screen
+
+        symbols = ["NODATA1/XYZ", "NODATA2/XYZ", "NODATA3/XYZ"]
+        results = run_batch_screen(symbols, exchange="no_such_exchange", max_workers=2)
+
+        assert [r["symbol"] for r in results] == symbols
+        assert all(r["status"] == "skipped" for r in results)
+
+
+class TestParallelWalkForward:
+    def test_pooled_splits_match_serial_in_order(self):
+        df = _make_trending_ohlcv(n=1500)
+        serial = walk_forward_validate(df, "bollinger_breakout", n_splits=3, max_workers=1)
+        pooled = walk_forward_validate(df, "bollinger_breakout", n_splits=3, max_workers=3)
+
+        assert list(pooled["split"]) == [1, 2, 3]
+        pd.testing.assert_frame_equal(serial, pooled)
+
+    def test_screen_functions_are_picklable(self):
+        import pickle
+
+        for fn in SCREEN_FUNCTIONS.values():
+            assert pickle.loads(pickle.dumps(fn)) is fn
@@ -1,5 +1,7 @@
 """WebSocket consumer tests."""
 
+from unittest.mock import AsyncMock, patch
+
 import pytest
 from channels.db import database_sync_to_async
 from channels.testing import WebsocketCommunicator
@@ -63,6 +65,88 @@ class TestMarketTickerConsumer:
         await comm.disconnect()
 
 
+@pytest.fixture
+def ticker_hub():
+    import market.services.ticker_poller as tp
+
+    tp._hub = tp.TickerHub()
+    with patch("market.services.ticker_poller.start_poller", new_callable=AsyncMock):
+        yield tp._hub
+    tp._hub = tp.TickerHub()
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.asyncio
+class TestTickerSubscriptions:
+    async def test_subscribe_and_unsubscribe(self, ticker_hub):
+        ticker_hub.apply([{"symbol": "DOGE/USDT", "price": 0.1}])
+        user = await _create_user()
+        comm = _make_communicator(MarketTickerConsumer, "/ws/market/tickers/", user=user)
+        await comm.connect()
+
+        await comm.send_json_to({"action": "subscribe", "symbols": ["doge/usdt"]})
+        # Full ticker for the new symbol, then the acknowledgement
+        assert await comm.receive_json_from() == {
+            "tickers": [{"symbol": "DOGE/USDT", "price": 0.1}],
+        }
+        ack = await comm.receive_json_from()
+        assert "DOGE/USDT" in ack["symbols"]
+        assert "DOGE/USDT" in ticker_hub.symbols
+
+        await comm.send_json_to({"action": "unsubscribe", "symbols": ["DOGE/USDT"]})
+        ack = await comm.receive_json_from()
+        assert "DOGE/USDT" not in ack["symbols"]
+
+        await comm.disconnect()
+        assert ticker_hub.symbols == []
+
+    async def test_invalid_request_rejected(self, ticker_hub):
+        user = await _create_user()
+        comm = _make_communicator(MarketTickerConsumer, "/ws/market/tickers/", user=user)
+        await comm.connect()
+
+        await comm.send_json_to({"action": "subscribe", "symbols": ["BTC/USDT; DROP"]})
+        assert (await comm.receive_json_from())["type"] == "error"
+        await comm.send_json_to({"action": "watch", "symbols": ["BTC/USDT"]})
+        assert (await comm.receive_json_from())["type"] == "error"
+        await comm.disconnect()
+
+    async def test_deltas_coalesced_to_max_rate(self, ticker_hub, settings):
+        from channels.layers import get_channel_layer
+
+        from market.services.ticker_poller import ticker_group
+
+        settings.TICKER_MAX_UPDATES_PER_SECOND = 5
+        user = await _create_user()
+        comm = _make_communicator(MarketTickerConsumer, "/ws/market/tickers/", user=user)
+        await comm.connect()
+
+        layer = get_channel_layer()
+        group = ticker_group("BTC/USDT")
+        for price in (100.0, 101.0, 102.0):
+            await layer.group_send(
+                group,
+                {"type": "ticker_delta", "data": {"symbol": "BTC/USDT", "price": price}},
+            )
+        await layer.group_send(
+            ticker_group("ETH/USDT"),
+            {"type": "ticker_delta", "data": {"symbol": "ETH/USDT", "volume_24h": 7.0}},
+        )
+
+        first = await comm.receive_json_from()
+        assert first == {"tickers": [{"symbol": "BTC/USDT", "price": 100.0}]}
+        # The rest arrive merged in one message after the 200 ms interval
+        second = await comm.receive_json_from(timeout=2)
+        assert second == {
+            "tickers": [
+                {"symbol": "BTC/USDT", "price": 102.0},
+                {"symbol": "ETH/USDT", "volume_24h": 7.0},
+            ],
+        }
+        assert await comm.receive_nothing(timeout=0.3)
+        await comm.disconnect()
+
+
 @pytest.mark.django_db(transaction=True)
 @pytest.mark.asyncio
 class TestSystemEventsConsumer:
@@ -212,6 +296,55 @@ class TestSystemEventsConsumer:
         assert response["data"]["new_regime"] == "strong_trend_up"
         await comm.disconnect()
 
+    async def test_event_batch_sent_as_one_frame(self):
+        user = await _create_user()
+        comm = _make_communicator(SystemEventsConsumer, "/ws/system/", user=user)
+        connected, _ = await comm.connect()
+        assert connected
+
+        from channels.layers import get_channel_layer
+
+        events = [
+            {"type": "news_update", "data": {"asset_class": "crypto", "articles_fetched": 3}},
+            {"type": "regime_change", "data": {"symbol": "BTC/USDT"}},
+        ]
+        await get_channel_layer().group_send(
+            "system_events",
+            {"type": "event_batch", "events": events},
+        )
+
+        response = await comm.receive_json_from(timeout=5)
+        assert response == {"type": "batch", "events": events}
+        assert await comm.receive_nothing()
+        await comm.disconnect()
+
+    async def test_msgpack_subprotocol_sends_binary_frames(self):
+        import msgpack
+
+        user = await _create_user()
+        comm = WebsocketCommunicator(
+            SystemEventsConsumer.as_asgi(), "/ws/system/", subprotocols=["msgpack"],
+        )
+        comm.scope["user"] = user
+        connected, subprotocol = await comm.connect()
+        assert connected
+        assert subprotocol == "msgpack"
+
+        from channels.layers import get_channel_layer
+
+        await get_channel_layer().group_send(
+            "system_events",
+            {"type": "order_update", "data": {"order_id": 7, "status": "filled"}},
+        )
+
+        frame = await comm.receive_from(timeout=5)
+        assert isinstance(frame, bytes)
+        assert msgpack.unpackb(frame) == {
+            "type": "order_update",
+            "data": {"order_id": 7, "status": "filled"},
+        }
+        await comm.disconnect()
+
 
 @pytest.mark.django_db(transaction=True)
 @pytest.mark.asyncio
@@ -1,7 +1,12 @@
 """Tests for WebSocket broadcast utilities (core/services/ws_broadcast.py)."""
 
+import json
+import time
 from unittest.mock import MagicMock, patch
 
+import pytest
+from django.test import override_settings
+
 
 class TestBroadcastHelpers:
     """Test broadcast functions with mocked channel layer."""
@@ -137,3 +142,131 @@ class TestBroadcastHelpers:
         assert event["data"]["symbol"] == "BTC/USDT"
         assert event["data"]["opportunity_type"] == "breakout"
         assert event["data"]["score"] == 82
+
+
+class _RecordingLayer:
+    """Channel layer stand-in that records every group message."""
+
+    def __init__(self):
+        self.messages = []
+
+    async def group_send(self, group, message):
+        self.messages.append((group, message))
+
+
+def _client_frames(messages):
+    """Frames SystemEventsConsumer would send per client for ``messages``."""
+    frames = []
+    for _, message in messages:
+        if message["type"] == "event_batch":
+            frames.append({"type": "batch", "events": message["events"]})
+        else:
+            frames.append(message)
+    return frames
+
+
+def _market_scan_burst(pause: float):
+    """A scan's worth of broadcasts, ``pause`` seconds apart: regime churn,
+    opportunity alerts, news fetches and scheduler events.
+    """
+    from core.services.ws_broadcast import (
+        broadcast_news_update,
+        broadcast_opportunity,
+        broadcast_regime_change,
+        broadcast_scheduler_event,
+    )
+
+    regimes = ["ranging", "weak_trend_up", "strong_trend_up", "high_volatility"]
+    events = [
+        *(
+            (
+                broadcast_regime_change,
+                (f"SYM{i % 10}/USDT", regimes[i % 4], regimes[(i + 1) % 4], 0.7),
+            )
+            for i in range(200)
+        ),
+        *(
+            (broadcast_opportunity, (f"SYM{i % 5}/USDT", "breakout", 70 + i % 20, {}))
+            for i in range(50)
+        ),
+        *((broadcast_news_update, ("crypto", i % 3)) for i in range(40)),
+        *(
+            (broadcast_scheduler_event, ("scan", "Market Scan", "market_scan", status, "j1"))
+            for status in ["submitted", "running", "completed"]
+        ),
+    ]
+    for fn, args in events:
+        fn(*args)
+        time.sleep(pause)
+
+
+class TestBroadcastCoalescing:
+    @pytest.fixture
+    def layer(self):
+        layer = _RecordingLayer()
+        with patch("channels.layers.get_channel_layer", return_value=layer):
+            yield layer
+        from core.services.ws_broadcast import close_broadcast_buffer
+
+        close_broadcast_buffer()
+
+    def _measure(self, layer, window_ms):
+        """Frames/sec and bytes/sec one client receives during the burst."""
+        from core.services.ws_broadcast import close_broadcast_buffer
+
+        with override_settings(WS_BROADCAST_WINDOW_MS=window_ms):
+            started = time.monotonic()
+            _market_scan_burst(pause=0.002)
+            close_broadcast_buffer()
+            elapsed = time.monotonic() - started
+        frames = _client_frames(layer.messages)
+        layer.messages.clear()
+        size = sum(len(json.dumps(f)) for f in frames)
+        return len(frames), len(frames) / elapsed, size / elapsed
+
+    def test_burst_frames_and_bytes_per_client(self, layer):
+        direct_frames, direct_fps, direct_bps = self._measure(layer, window_ms=0)
+        batched_frames, batched_fps, batched_bps = self._measure(layer, window_ms=100)
+
+        assert direct_frames == 293
+        assert batched_frames < 20
+        assert batched_fps < direct_fps / 10
+        # Superseded regime/opportunity/scheduler updates are never sent
+        assert batched_bps < direct_bps / 1.5
+
+    def test_superseded_event_keeps_latest(self, layer):
+        from core.services.ws_broadcast import broadcast_regime_change, close_broadcast_buffer
+
+        with override_settings(WS_BROADCAST_WINDOW_MS=50):
+            broadcast_regime_change("BTC/USDT", "ranging", "weak_trend_up", 0.6)
+            broadcast_regime_change("ETH/USDT", "ranging", "high_volatility", 0.5)
+            broadcast_regime_change("BTC/USDT", "weak_trend_up", "strong_trend_up", 0.9)
+            close_broadcast_buffer()
+
+        ((_, message),) = layer.messages
+        events = [(e["data"]["symbol"], e["data"]["new_regime"]) for e in message["events"]]
+        assert events == [("ETH/USDT", "high_volatility"), ("BTC/USDT", "strong_trend_up")]
+
+    def test_window_flushes_without_close(self, layer):
+        from core.services.ws_broadcast import BroadcastBuffer
+
+        buffer = BroadcastBuffer(window_seconds=0.05)
+        buffer.add("system_events", "news_update", {"articles_fetched": 1})
+
+        deadline = time.monotonic() + 2
+        while not layer.messages and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert layer.messages == [
+            ("system_events", {"type": "news_update", "data": {"articles_fetched": 1}}),
+        ]
+
+    def test_full_batch_flushed_early(self, layer):
+        from core.services.ws_broadcast import BroadcastBuffer
+
+        buffer = BroadcastBuffer(window_seconds=60, max_batch=3)
+        for i in range(3):
+            buffer.add("system_events", "news_update", {"articles_fetched": i})
+
+        ((_, message),) = layer.messages
+        assert message["type"] == "event_batch"
+        assert len(message["events"]) == 3
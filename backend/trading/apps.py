@@ -4,3 +4,8 @@ from django.apps import AppConfig
 class TradingConfig(AppConfig):
     name = "trading"
     default_auto_field = "django.db.models.BigAutoField"
+
+    def ready(self):
+        from trading.services.performance import connect_rollup_maintenance
+
+        connect_rollup_maintenance()
@@ -0,0 +1,20 @@
+"""Rebuild the pre-aggregated trading performance rollups from order history."""
+
+from django.core.management.base import BaseCommand
+
+from trading.services.performance import TradingPerformanceService
+
+
+class Command(BaseCommand):
+    help = "Rebuild PerformanceRollup rows from filled orders (backfills and repairs)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--portfolio-id", type=int, default=None, help="Only rebuild this portfolio",
+        )
+
+    def handle(self, *args, **options):
+        portfolio_id = options["portfolio_id"]
+        rows = TradingPerformanceService.rebuild_rollups(portfolio_id)
+        scope = f"portfolio {portfolio_id}" if portfolio_id is not None else "all portfolios"
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {rows} performance rollup rows for {scope}"))
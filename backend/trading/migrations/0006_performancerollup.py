@@ -0,0 +1,77 @@
+# Generated by Django 5.2.18 on 2026-10-19 13:02
+
+from datetime import timezone
+
+from django.db import migrations, models
+
+TOTAL_FIELDS = ('trade_count', 'buy_qty', 'buy_notional', 'sell_qty', 'sell_notional', 'fees')
+
+
+def backfill_rollups(apps, schema_editor):
+    """Fold existing filled orders into rollups, as TradingPerformanceService does."""
+    Order = apps.get_model('trading', 'Order')
+    PerformanceRollup = apps.get_model('trading', 'PerformanceRollup')
+
+    buckets = {}
+    filled = Order.objects.filter(status='filled').order_by('timestamp')
+    for order in filled.iterator(chunk_size=2000):
+        day = order.timestamp.astimezone(timezone.utc).date()
+        key = (order.portfolio_id, order.mode, order.asset_class, order.symbol, day)
+        totals = buckets.setdefault(key, dict.fromkeys(TOTAL_FIELDS, 0))
+        totals['trade_count'] += 1
+        price = order.avg_fill_price or order.price
+        if not price:
+            continue
+        amount = order.filled or order.amount
+        side = 'buy' if order.side == 'buy' else 'sell'
+        totals[f'{side}_qty'] += amount
+        totals[f'{side}_notional'] += amount * price
+        totals['fees'] += order.fee or 0
+
+    PerformanceRollup.objects.bulk_create(
+        [
+            PerformanceRollup(
+                portfolio_id=portfolio_id,
+                mode=mode,
+                asset_class=asset_class,
+                symbol=symbol,
+                day=day,
+                **totals,
+            )
+            for (portfolio_id, mode, asset_class, symbol, day), totals in buckets.items()
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('trading', '0005_order_idx_order_portfolio_status_ts_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PerformanceRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('portfolio_id', models.IntegerField()),
+                ('mode', models.CharField(choices=[('paper', 'Paper'), ('live', 'Live')], max_length=10)),
+                ('asset_class', models.CharField(choices=[('crypto', 'Crypto'), ('equity', 'Equity'), ('forex', 'Forex')], default='crypto', max_length=10)),
+                ('symbol', models.CharField(max_length=20)),
+                ('day', models.DateField()),
+                ('trade_count', models.IntegerField(default=0)),
+                ('buy_qty', models.FloatField(default=0.0)),
+                ('buy_notional', models.FloatField(default=0.0)),
+                ('sell_qty', models.FloatField(default=0.0)),
+                ('sell_notional', models.FloatField(default=0.0)),
+                ('fees', models.FloatField(default=0.0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['portfolio_id', 'day'], name='idx_perf_rollup_portfolio_day')],
+                'constraints': [models.UniqueConstraint(fields=('portfolio_id', 'mode', 'asset_class', 'symbol', 'day'), name='uniq_perf_rollup_bucket')],
+            },
+        ),
+        migrations.RunPython(backfill_rollups, migrations.RunPython.noop),
+    ]
@@ -137,11 +137,13 @@ class Order(models.Model):
     def __str__(self):
         return f"{self.side} {self.symbol} x{self.amount} [{self.status}]"
 
-    def transition_to(self, new_status: str, **kwargs) -> None:
+    def transition_to(self, new_status: str, *, commit: bool = True, **kwargs) -> None:
         """Validate and apply a state transition.
 
         Raises ValueError if the transition is not allowed.
         Extra kwargs are set as attributes (e.g. error_message, reject_reason).
+        With ``commit=False`` the order is updated in memory only, for
+        callers that persist several orders with ``bulk_update``.
         """
         allowed = VALID_TRANSITIONS.get(self.status, set())
         if new_status not in allowed:
@@ -161,7 +163,10 @@ class Order(models.Model):
             if hasattr(self, key):
                 setattr(self, key, value)
 
-        self.save()
+        if commit:
+            self.save()
+        else:
+            self.updated_at = now
 
 
 class OrderFillEvent(models.Model):
@@ -189,3 +194,44 @@ class OrderFillEvent(models.Model):
 
     def __str__(self):
         return f"Fill {self.fill_amount}@{self.fill_price} for Order#{self.order_id}"
+
+
+class PerformanceRollup(models.Model):
+    """Filled-order totals per (portfolio, mode, asset class, symbol, UTC day).
+
+    Maintained from Order saves (see ``trading.services.performance``) so
+    performance queries sum a few rows instead of replaying order history.
+    Quantities and notionals only include orders with a fill price;
+    ``trade_count`` counts every filled order.
+    """
+
+    portfolio_id = models.IntegerField()
+    mode = models.CharField(max_length=10, choices=TradingMode.choices)
+    asset_class = models.CharField(
+        max_length=10,
+        choices=AssetClass.choices,
+        default=AssetClass.CRYPTO,
+    )
+    symbol = models.CharField(max_length=20)
+    day = models.DateField()
+    trade_count = models.IntegerField(default=0)
+    buy_qty = models.FloatField(default=0.0)
+    buy_notional = models.FloatField(default=0.0)
+    sell_qty = models.FloatField(default=0.0)
+    sell_notional = models.FloatField(default=0.0)
+    fees = models.FloatField(default=0.0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["portfolio_id", "mode", "asset_class", "symbol", "day"],
+                name="uniq_perf_rollup_bucket",
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["portfolio_id", "day"], name="idx_perf_rollup_portfolio_day"),
+        ]
+
+    def __str__(self):
+        return f"{self.symbol} {self.day} [{self.mode}] x{self.trade_count}"
@@ -405,13 +405,16 @@ class ForexPaperTradingService:
 
     @staticmethod
     def _get_price(symbol: str) -> float:
-        """Fetch current price for a forex symbol."""
+        """Current price for a forex symbol, from the price snapshot when fresh."""
         try:
-            from market.services.data_router import DataServiceRouter
-
-            router = DataServiceRouter()
-            ticker = async_to_sync(router.fetch_ticker)(symbol, "forex")
-            return ticker.get("last") or ticker.get("close") or ticker.get("price", 0)
+            from market.services.price_store import get_price_store
+
+            store = get_price_store()
+            quote = store.get_prices([symbol], asset_class="forex").get(symbol)
+            if quote is None or quote.is_stale(store.max_age_seconds):
+                logger.warning("No current price for %s", symbol)
+                return 0.0
+            return quote.price
         except Exception as e:
             logger.warning("Price fetch failed for %s: %s", symbol, e)
             return 0.0
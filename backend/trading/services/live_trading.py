@@ -1,9 +1,13 @@
 """Live trading service — bridges order state machine to ccxt exchange execution."""
 
+import asyncio
 import logging
+import time
+from collections import defaultdict
 
 from asgiref.sync import sync_to_async
 from channels.layers import get_channel_layer
+from django.db import transaction
 
 from market.services.exchange import ExchangeService
 from trading.models import Order, OrderFillEvent, OrderStatus, TradingMode
@@ -20,6 +24,23 @@ CCXT_STATUS_MAP = {
     "rejected": OrderStatus.REJECTED,
 }
 
+# Order fields a status sync can change (see Order.transition_to)
+SYNC_FIELDS = [
+    "status",
+    "filled",
+    "avg_fill_price",
+    "fee",
+    "fee_currency",
+    "filled_at",
+    "cancelled_at",
+    "updated_at",
+]
+
+# Order fields a mass cancel can change
+CANCEL_FIELDS = ["status", "cancelled_at", "error_message", "updated_at"]
+
+LIVE_ACTIVE_STATUSES = [OrderStatus.SUBMITTED, OrderStatus.OPEN, OrderStatus.PARTIAL_FILL]
+
 
 class LiveTradingService:
     """Singleton-style service for live order execution via ccxt."""
@@ -82,7 +103,7 @@ class LiveTradingService:
             return order
 
         # Submit to exchange
-        service = ExchangeService(exchange_id=order.exchange_id)
+        service = ExchangeService(exchange_id=order.exchange_id, shared=True)
         try:
             exchange = await service._get_exchange()
             params = {}
@@ -121,52 +142,15 @@ class LiveTradingService:
         if not order.exchange_order_id:
             return order
 
-        service = ExchangeService(exchange_id=order.exchange_id)
+        service = ExchangeService(exchange_id=order.exchange_id, shared=True)
         try:
             exchange = await service._get_exchange()
             ccxt_order = await exchange.fetch_order(order.exchange_order_id, order.symbol)
 
-            new_status = CCXT_STATUS_MAP.get(ccxt_order.get("status", ""))
-            if not new_status or new_status == order.status:
-                return order
-
-            kwargs = {}
-            filled = ccxt_order.get("filled", 0) or 0
-            if filled > order.filled:
-                kwargs["filled"] = filled
-
-            avg_price = ccxt_order.get("average") or ccxt_order.get("price") or 0
-            if avg_price:
-                kwargs["avg_fill_price"] = avg_price
-
-            fee_info = ccxt_order.get("fee") or {}
-            if fee_info.get("cost"):
-                kwargs["fee"] = fee_info["cost"]
-                kwargs["fee_currency"] = fee_info.get("currency", "")
-
-            # Handle partial fills -> record fill events
-            is_fill = new_status in (OrderStatus.FILLED, OrderStatus.PARTIAL_FILL)
-            if is_fill and filled > order.filled:
-                fill_amount = filled - order.filled
-                await sync_to_async(OrderFillEvent.objects.create)(
-                    order=order,
-                    fill_price=avg_price,
-                    fill_amount=fill_amount,
-                    fee=fee_info.get("cost", 0),
-                    fee_currency=fee_info.get("currency", ""),
-                )
-
-            # If partially filled but ccxt says "open", use partial_fill
-            if ccxt_order.get("status") == "open" and filled > 0 and filled < order.amount:
-                new_status = OrderStatus.PARTIAL_FILL
-
-            try:
-                await sync_to_async(order.transition_to)(new_status, **kwargs)
+            changed, fill = _apply_exchange_state(order, ccxt_order)
+            if changed:
+                await sync_to_async(_save_synced_orders)([order], [fill] if fill else [])
                 await LiveTradingService._broadcast_order_update(order)
-            except ValueError:
-                logger.warning(
-                    f"Invalid transition for order {order.id}: {order.status} -> {new_status}",
-                )
 
         except Exception as e:
             logger.error(f"Order sync failed for {order.id}: {e}")
@@ -175,6 +159,90 @@ class LiveTradingService:
 
         return order
 
+    @staticmethod
+    async def sync_orders(orders: list[Order]) -> dict:
+        """Reconcile many live orders with as few exchange calls as possible.
+
+        Orders are grouped per exchange and symbol. Each group is matched
+        against one ``fetch_open_orders`` and one ``fetch_closed_orders``
+        call; ``fetch_order`` is only used for orders neither list returned.
+        Exchanges are queried concurrently, and all resulting order updates
+        and fill events are written in a single transaction.
+
+        Returns:
+            Counts of orders ``synced`` (exchange state fetched), ``updated``
+            (local state changed) and ``errors`` (state could not be fetched).
+
+        """
+        by_exchange: dict[str, list[Order]] = defaultdict(list)
+        for order in orders:
+            if order.exchange_order_id:
+                by_exchange[order.exchange_id].append(order)
+
+        results = await asyncio.gather(
+            *(
+                LiveTradingService._fetch_order_states(exchange_id, group)
+                for exchange_id, group in by_exchange.items()
+            ),
+        )
+        states = {order_id: state for result in results for order_id, state in result.items()}
+
+        changed: list[Order] = []
+        fills: list[OrderFillEvent] = []
+        for group in by_exchange.values():
+            for order in group:
+                ccxt_order = states.get(order.id)
+                if ccxt_order is None:
+                    continue
+                order_changed, fill = _apply_exchange_state(order, ccxt_order)
+                if order_changed:
+                    changed.append(order)
+                if fill is not None:
+                    fills.append(fill)
+
+        if changed:
+            await sync_to_async(_save_synced_orders)(changed, fills)
+            for order in changed:
+                await LiveTradingService._broadcast_order_update(order)
+
+        synced = len(states)
+        return {
+            "synced": synced,
+            "updated": len(changed),
+            "errors": sum(len(group) for group in by_exchange.values()) - synced,
+        }
+
+    @staticmethod
+    async def _fetch_order_states(exchange_id: str, orders: list[Order]) -> dict[int, dict]:
+        """Fetch the exchange's view of ``orders``, keyed by ``Order.id``."""
+        by_symbol: dict[str, list[Order]] = defaultdict(list)
+        for order in orders:
+            by_symbol[order.symbol].append(order)
+
+        service = ExchangeService(exchange_id=exchange_id, shared=True)
+        try:
+            exchange = await service._get_exchange()
+            results = await asyncio.gather(
+                *(
+                    _fetch_symbol_states(exchange, symbol, group)
+                    for symbol, group in by_symbol.items()
+                ),
+                return_exceptions=True,
+            )
+        except Exception as e:
+            logger.error(f"Order sync failed for exchange {exchange_id}: {e}")
+            return {}
+        finally:
+            await service.close()
+
+        states: dict[int, dict] = {}
+        for symbol, result in zip(by_symbol, results, strict=True):
+            if isinstance(result, Exception):
+                logger.error(f"Order sync failed for {exchange_id} {symbol}: {result}")
+            else:
+                states.update(result)
+        return states
+
     @staticmethod
     async def cancel_order(order: Order) -> Order:
         """Cancel an order on the exchange."""
@@ -187,7 +255,7 @@ class LiveTradingService:
         if order.status in terminal:
             return order
 
-        service = ExchangeService(exchange_id=order.exchange_id)
+        service = ExchangeService(exchange_id=order.exchange_id, shared=True)
         try:
             if order.exchange_order_id:
                 exchange = await service._get_exchange()
@@ -210,25 +278,55 @@ class LiveTradingService:
     async def cancel_all_open_orders(portfolio_id: int) -> int:
         """Cancel all open/submitted/partial live orders for a portfolio.
 
-        Returns the number of orders cancelled.
+        Exchanges are handled concurrently, and so are the cancels within
+        one exchange; the shared client caps in-flight requests and ccxt's
+        rate limiter paces them. Where the exchange supports
+        ``cancelAllOrders`` and no other portfolio has active orders on a
+        symbol, one native call per symbol replaces the per-order cancels.
+        All resulting status changes are saved in one transaction.
+
+        Returns the number of orders confirmed cancelled.
         """
-        live_statuses = [OrderStatus.SUBMITTED, OrderStatus.OPEN, OrderStatus.PARTIAL_FILL]
-        orders = await sync_to_async(list)(
-            Order.objects.filter(
-                portfolio_id=portfolio_id,
-                mode=TradingMode.LIVE,
-                status__in=live_statuses,
+        started = time.monotonic()
+        orders, shared_symbols = await sync_to_async(_load_cancellable_orders)(portfolio_id)
+        if not orders:
+            return 0
+
+        by_exchange: dict[str, list[Order]] = defaultdict(list)
+        for order in orders:
+            by_exchange[order.exchange_id].append(order)
+
+        results = await asyncio.gather(
+            *(
+                _cancel_on_exchange(exchange_id, group, shared_symbols)
+                for exchange_id, group in by_exchange.items()
             ),
         )
+        errors = {order_id: error for result in results for order_id, error in result.items()}
 
         cancelled = 0
         for order in orders:
-            try:
-                await LiveTradingService.cancel_order(order)
+            error = errors.get(order.id)
+            if error is None:
+                order.transition_to(OrderStatus.CANCELLED, commit=False)
                 cancelled += 1
-            except Exception as e:
-                logger.error(f"Failed to cancel order {order.id}: {e}")
+            else:
+                logger.error(f"Order cancel failed for {order.id}: {error}")
+                order.transition_to(
+                    OrderStatus.ERROR,
+                    commit=False,
+                    error_message=f"Cancel failed: {str(error)[:400]}",
+                )
 
+        await sync_to_async(_save_cancelled_orders)(orders)
+        elapsed_ms = (time.monotonic() - started) * 1000
+        logger.info(
+            f"Cancelled {cancelled}/{len(orders)} live orders for portfolio {portfolio_id} "
+            f"in {elapsed_ms:.0f} ms",
+        )
+
+        for order in orders:
+            await LiveTradingService._broadcast_order_update(order)
         return cancelled
 
     @staticmethod
@@ -254,3 +352,178 @@ class LiveTradingService:
                 },
             },
         )
+
+
+def _has(exchange, feature: str) -> bool:
+    """Whether ccxt reports native support for ``feature`` (not emulated)."""
+    has = getattr(exchange, "has", None)
+    return isinstance(has, dict) and has.get(feature) is True
+
+
+def _since_ms(order: Order) -> int:
+    """Earliest time (ms) the exchange can have seen ``order``."""
+    placed = order.submitted_at or order.created_at or order.timestamp
+    return int(placed.timestamp() * 1000)
+
+
+async def _fetch_symbol_states(exchange, symbol: str, orders: list[Order]) -> dict[int, dict]:
+    """Match ``orders`` (one symbol) against the exchange's order lists.
+
+    A lone order is fetched directly, since that is a single call either way.
+    """
+    pending = {order.exchange_order_id: order for order in orders}
+    states: dict[int, dict] = {}
+
+    def _match(ccxt_orders: list[dict]) -> None:
+        for ccxt_order in ccxt_orders or []:
+            order = pending.pop(str(ccxt_order.get("id", "")), None)
+            if order is not None:
+                states[order.id] = ccxt_order
+
+    if len(pending) > 1 and _has(exchange, "fetchOpenOrders"):
+        _match(await exchange.fetch_open_orders(symbol))
+    if len(pending) > 1 and _has(exchange, "fetchClosedOrders"):
+        since = min(_since_ms(order) for order in pending.values())
+        _match(await exchange.fetch_closed_orders(symbol, since=since))
+
+    remaining = list(pending.values())
+    results = await asyncio.gather(
+        *(exchange.fetch_order(order.exchange_order_id, symbol) for order in remaining),
+        return_exceptions=True,
+    )
+    for order, result in zip(remaining, results, strict=True):
+        if isinstance(result, Exception):
+            logger.warning(f"Sync failed for order {order.id}: {result}")
+        else:
+            states[order.id] = result
+    return states
+
+
+def _apply_exchange_state(order: Order, ccxt_order: dict) -> tuple[bool, OrderFillEvent | None]:
+    """Apply a ccxt order snapshot to ``order`` in memory.
+
+    Returns whether the order changed and the fill event to record, if any.
+    Nothing is saved; see :func:`_save_synced_orders`.
+    """
+    new_status = CCXT_STATUS_MAP.get(ccxt_order.get("status", ""))
+    if not new_status or new_status == order.status:
+        return False, None
+
+    kwargs = {}
+    filled = ccxt_order.get("filled", 0) or 0
+    if filled > order.filled:
+        kwargs["filled"] = filled
+
+    avg_price = ccxt_order.get("average") or ccxt_order.get("price") or 0
+    if avg_price:
+        kwargs["avg_fill_price"] = avg_price
+
+    fee_info = ccxt_order.get("fee") or {}
+    if fee_info.get("cost"):
+        kwargs["fee"] = fee_info["cost"]
+        kwargs["fee_currency"] = fee_info.get("currency", "")
+
+    # Handle partial fills -> record fill events
+    fill = None
+    is_fill = new_status in (OrderStatus.FILLED, OrderStatus.PARTIAL_FILL)
+    if is_fill and filled > order.filled:
+        fill = OrderFillEvent(
+            order=order,
+            fill_price=avg_price,
+            fill_amount=filled - order.filled,
+            fee=fee_info.get("cost", 0),
+            fee_currency=fee_info.get("currency", ""),
+        )
+
+    # If partially filled but ccxt says "open", use partial_fill
+    if ccxt_order.get("status") == "open" and filled > 0 and filled < order.amount:
+        new_status = OrderStatus.PARTIAL_FILL
+
+    try:
+        order.transition_to(new_status, commit=False, **kwargs)
+    except ValueError:
+        logger.warning(
+            f"Invalid transition for order {order.id}: {order.status} -> {new_status}",
+        )
+        return False, None
+    return True, fill
+
+
+def _save_synced_orders(orders: list[Order], fills: list[OrderFillEvent]) -> None:
+    """Persist reconciled orders and their fill events in one transaction."""
+    from trading.services.performance import TradingPerformanceService
+
+    with transaction.atomic():
+        Order.objects.bulk_update(orders, SYNC_FIELDS)
+        if fills:
+            OrderFillEvent.objects.bulk_create(fills)
+        # bulk_update sends no post_save, so refresh the rollups explicitly
+        TradingPerformanceService.refresh_rollups(
+            [o for o in orders if o.status == OrderStatus.FILLED],
+        )
+
+
+def _load_cancellable_orders(portfolio_id: int) -> tuple[list[Order], set[tuple[str, str]]]:
+    """Active live orders of a portfolio, plus the (exchange, symbol) pairs
+    where other portfolios also have active live orders.
+    """
+    active = Order.objects.filter(mode=TradingMode.LIVE, status__in=LIVE_ACTIVE_STATUSES)
+    orders = list(active.filter(portfolio_id=portfolio_id))
+    shared_symbols = set(
+        active.exclude(portfolio_id=portfolio_id).values_list("exchange_id", "symbol").distinct(),
+    )
+    return orders, shared_symbols
+
+
+async def _cancel_on_exchange(
+    exchange_id: str,
+    orders: list[Order],
+    shared_symbols: set[tuple[str, str]],
+) -> dict[int, Exception | None]:
+    """Cancel ``orders`` on one exchange; maps ``Order.id`` to its error, if any.
+
+    Orders never acknowledged by the exchange are cancelled locally only.
+    """
+    results: dict[int, Exception | None] = {
+        order.id: None for order in orders if not order.exchange_order_id
+    }
+    remote = [order for order in orders if order.exchange_order_id]
+    if not remote:
+        return results
+
+    by_symbol: dict[str, list[Order]] = defaultdict(list)
+    for order in remote:
+        by_symbol[order.symbol].append(order)
+
+    service = ExchangeService(exchange_id=exchange_id, shared=True)
+    try:
+        exchange = await service._get_exchange()
+        native = _has(exchange, "cancelAllOrders")
+        batches: list[list[Order]] = []
+        calls = []
+        for symbol, group in by_symbol.items():
+            if native and len(group) > 1 and (exchange_id, symbol) not in shared_symbols:
+                batches.append(group)
+                calls.append(exchange.cancel_all_orders(symbol))
+            else:
+                for order in group:
+                    batches.append([order])
+                    calls.append(exchange.cancel_order(order.exchange_order_id, symbol))
+
+        outcomes = await asyncio.gather(*calls, return_exceptions=True)
+        for batch, outcome in zip(batches, outcomes, strict=True):
+            for order in batch:
+                results[order.id] = outcome if isinstance(outcome, Exception) else None
+    except Exception as e:
+        for order in remote:
+            results[order.id] = e
+    finally:
+        await service.close()
+
+    return results
+
+
+def _save_cancelled_orders(orders: list[Order]) -> None:
+    """Persist the outcome of a mass cancel in one transaction."""
+    with transaction.atomic():
+        Order.objects.bulk_update(orders, CANCEL_FIELDS)
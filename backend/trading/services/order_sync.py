@@ -35,11 +35,12 @@ async def _sync_loop() -> None:
                 ),
             )
 
-            for order in orders:
-                try:
-                    await LiveTradingService.sync_order(order)
-                except Exception as e:
-                    logger.warning(f"Sync failed for order {order.id}: {e}")
+            if orders:
+                result = await LiveTradingService.sync_orders(orders)
+                if result["errors"]:
+                    logger.warning(
+                        f"Order sync: {result['errors']} of {len(orders)} orders not synced",
+                    )
 
             consecutive_errors = 0  # Reset on success
 
@@ -1,14 +1,67 @@
-"""Trading performance analytics service."""
+"""Trading performance analytics service.
+
+Metrics come from per-symbol totals (trade count, bought/sold quantity and
+notional, fees). Those totals are additive, so they are kept pre-aggregated
+per (portfolio, mode, asset class, symbol, UTC day) in ``PerformanceRollup``
+rows, refreshed whenever a filled order is saved. Summaries sum the rollup
+rows of whole days and only read raw orders for partial days at the edges
+of a date range.
+"""
 
 import logging
 from collections import defaultdict
+from datetime import date, datetime, time, timedelta
+from datetime import timezone as dt_timezone
 
-from django.db.models import QuerySet
+from django.db import transaction
+from django.db.models import QuerySet, Sum
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
 
-from trading.models import Order, OrderStatus
+from trading.models import Order, OrderStatus, PerformanceRollup
 
 logger = logging.getLogger(__name__)
 
+TOTAL_FIELDS = ("trade_count", "buy_qty", "buy_notional", "sell_qty", "sell_notional", "fees")
+
+
+def _empty_totals(asset_class: str) -> dict:
+    return {"asset_class": asset_class, **dict.fromkeys(TOTAL_FIELDS, 0)}
+
+
+def _as_utc(value) -> datetime | None:
+    """Parse a date/datetime (or ISO string) bound as an aware UTC datetime."""
+    if value is None or value == "":
+        return None
+    if isinstance(value, datetime):
+        dt = value
+    elif isinstance(value, date):
+        dt = datetime.combine(value, time.min)
+    else:
+        dt = parse_datetime(str(value))
+        if dt is None:
+            day = parse_date(str(value))
+            dt = datetime.combine(day, time.min) if day else None
+        if dt is None:
+            raise ValueError(f"Invalid date: {value!r}")
+    if timezone.is_naive(dt):
+        dt = timezone.make_aware(dt)
+    return dt.astimezone(dt_timezone.utc)
+
+
+def _day_start(day: date) -> datetime:
+    return datetime.combine(day, time.min, tzinfo=dt_timezone.utc)
+
+
+def _bucket_key(order: Order) -> tuple:
+    return (
+        order.portfolio_id,
+        order.mode,
+        order.asset_class,
+        order.symbol,
+        _as_utc(order.timestamp).date(),
+    )
+
 
 class TradingPerformanceService:
     @staticmethod
@@ -30,6 +83,35 @@ class TradingPerformanceService:
             qs = qs.filter(timestamp__lte=date_to)
         return qs
 
+    @staticmethod
+    def _fold_orders(orders) -> dict[str, dict]:
+        """Per-symbol totals of filled orders (see ``TOTAL_FIELDS``)."""
+        totals: dict[str, dict] = {}
+        for order in orders:
+            sym = totals.setdefault(
+                order.symbol,
+                _empty_totals(getattr(order, "asset_class", "crypto")),
+            )
+            sym["trade_count"] += 1
+            price = order.avg_fill_price or order.price
+            if not price:
+                logger.warning("Skipping order %s with zero/null price", order.id)
+                continue
+            amount = float(order.filled or order.amount)
+            side = "buy" if order.side == "buy" else "sell"
+            sym[f"{side}_qty"] += amount
+            sym[f"{side}_notional"] += amount * float(price)
+            sym["fees"] += float(getattr(order, "fee", 0) or 0)
+        return totals
+
+    @staticmethod
+    def _merge_totals(into: dict[str, dict], totals: dict[str, dict]) -> dict[str, dict]:
+        for symbol, sym in totals.items():
+            target = into.setdefault(symbol, _empty_totals(sym["asset_class"]))
+            for field in TOTAL_FIELDS:
+                target[field] += sym[field] or 0
+        return into
+
     @staticmethod
     def _compute_metrics(orders: list[Order]) -> dict:
         """Compute realized P&L from matched buy/sell order pairs.
@@ -38,68 +120,42 @@ class TradingPerformanceService:
         contribute to realized P&L — unmatched quantities are tracked as open
         positions so callers can compute mark-to-market separately.
         """
-        buys: dict[str, list] = defaultdict(list)
-        sells: dict[str, list] = defaultdict(list)
-
-        total_fees = 0.0
-        for order in orders:
-            price = order.avg_fill_price or order.price
-            if not price:
-                logger.warning("Skipping order %s with zero/null price", order.id)
-                continue
-            fee = float(getattr(order, "fee", 0) or 0)
-            total_fees += fee
-            entry = {
-                "amount": float(order.filled or order.amount),
-                "price": float(price),
-                "fee": fee,
-                "asset_class": getattr(order, "asset_class", "crypto"),
-            }
-            if order.side == "buy":
-                buys[order.symbol].append(entry)
-            else:
-                sells[order.symbol].append(entry)
+        return TradingPerformanceService._metrics_from_totals(
+            TradingPerformanceService._fold_orders(orders),
+        )
 
+    @staticmethod
+    def _metrics_from_totals(totals: dict[str, dict]) -> dict:
+        """Performance metrics from per-symbol totals (see :meth:`_compute_metrics`)."""
         realized_pnl: dict[str, float] = {}
         open_positions: dict[str, dict] = {}
+        total_fees = 0.0
 
-        for symbol in set(list(buys.keys()) + list(sells.keys())):
-            buy_entries = buys.get(symbol, [])
-            sell_entries = sells.get(symbol, [])
-
-            total_buy_qty = sum(b["amount"] for b in buy_entries)
-            total_sell_qty = sum(s["amount"] for s in sell_entries)
-            total_buy_cost = sum(b["amount"] * b["price"] for b in buy_entries)
-            total_sell_revenue = sum(s["amount"] * s["price"] for s in sell_entries)
+        for symbol, sym in totals.items():
+            total_buy_qty = sym["buy_qty"]
+            total_sell_qty = sym["sell_qty"]
+            total_fees += sym["fees"]
 
-            avg_buy = total_buy_cost / total_buy_qty if total_buy_qty > 0 else 0
-            avg_sell = total_sell_revenue / total_sell_qty if total_sell_qty > 0 else 0
+            avg_buy = sym["buy_notional"] / total_buy_qty if total_buy_qty > 0 else 0
+            avg_sell = sym["sell_notional"] / total_sell_qty if total_sell_qty > 0 else 0
 
             # Realized P&L: only from matched (closed) quantity, net of fees
             matched_qty = min(total_buy_qty, total_sell_qty)
             if matched_qty > 0:
                 gross_pnl = matched_qty * (avg_sell - avg_buy)
-                sym_fees = sum(b.get("fee", 0) for b in buy_entries) + sum(
-                    s.get("fee", 0) for s in sell_entries
-                )
-                realized_pnl[symbol] = gross_pnl - sym_fees
+                realized_pnl[symbol] = gross_pnl - sym["fees"]
 
             # Track unmatched (open) positions
             net_qty = total_buy_qty - total_sell_qty
             if abs(net_qty) > 1e-10:
-                ac = (
-                    buy_entries[0]["asset_class"]
-                    if buy_entries
-                    else sell_entries[0]["asset_class"]
-                )
                 open_positions[symbol] = {
                     "qty": abs(net_qty),
                     "side": "long" if net_qty > 0 else "short",
                     "avg_price": avg_buy if net_qty > 0 else avg_sell,
-                    "asset_class": ac,
+                    "asset_class": sym["asset_class"],
                 }
 
-        total_trades = len(orders)
+        total_trades = sum(sym["trade_count"] for sym in totals.values())
         total_pnl = sum(realized_pnl.values()) if realized_pnl else 0.0
         wins = {s: pnl for s, pnl in realized_pnl.items() if pnl > 0}
         losses = {s: pnl for s, pnl in realized_pnl.items() if pnl < 0}
@@ -140,6 +196,66 @@ class TradingPerformanceService:
             "open_positions": open_positions,
         }
 
+    @staticmethod
+    def _symbol_totals(
+        portfolio_id: int,
+        mode: str | None = None,
+        asset_class: str | None = None,
+        date_from=None,
+        date_to=None,
+    ) -> dict[str, dict]:
+        """Per-symbol totals of filled orders in the window.
+
+        Whole UTC days are read from ``PerformanceRollup``; raw orders are
+        only scanned for the partial days at either end of the range.
+        """
+        svc = TradingPerformanceService
+        try:
+            start = _as_utc(date_from)
+            end = _as_utc(date_to)
+        except ValueError:
+            # Leave unparseable bounds to the ORM, as before rollups existed
+            return svc._fold_orders(
+                svc._base_qs(portfolio_id, mode, asset_class, date_from, date_to),
+            )
+
+        # Rollup days cover [first_day, last_day); the rest of the window is raw
+        first_day = None
+        if start is not None:
+            first_day = start.date() if start == _day_start(start.date()) else (
+                start.date() + timedelta(days=1)
+            )
+        last_day = end.date() if end is not None else None
+        if first_day and last_day and first_day >= last_day:
+            return svc._fold_orders(svc._base_qs(portfolio_id, mode, asset_class, start, end))
+
+        rollups = PerformanceRollup.objects.filter(portfolio_id=portfolio_id)
+        if mode:
+            rollups = rollups.filter(mode=mode)
+        if asset_class:
+            rollups = rollups.filter(asset_class=asset_class)
+        if first_day:
+            rollups = rollups.filter(day__gte=first_day)
+        if last_day:
+            rollups = rollups.filter(day__lt=last_day)
+        totals: dict[str, dict] = {}
+        for row in rollups.values("symbol", "asset_class").annotate(
+            **{field: Sum(field) for field in TOTAL_FIELDS},
+        ):
+            svc._merge_totals(totals, {row["symbol"]: row})
+
+        if start is not None and start < _day_start(first_day):
+            head = svc._base_qs(portfolio_id, mode, asset_class, start).filter(
+                timestamp__lt=_day_start(first_day),
+            )
+            svc._merge_totals(totals, svc._fold_orders(head))
+        if end is not None:
+            tail = svc._base_qs(portfolio_id, mode, asset_class, None, end).filter(
+                timestamp__gte=_day_start(last_day),
+            )
+            svc._merge_totals(totals, svc._fold_orders(tail))
+        return totals
+
     @staticmethod
     def get_summary(
         portfolio_id: int,
@@ -148,11 +264,10 @@ class TradingPerformanceService:
         date_from: str | None = None,
         date_to: str | None = None,
     ) -> dict:
-        qs = TradingPerformanceService._base_qs(
+        totals = TradingPerformanceService._symbol_totals(
             portfolio_id, mode, asset_class, date_from, date_to,
         )
-        orders = list(qs)
-        return TradingPerformanceService._compute_metrics(orders)
+        return TradingPerformanceService._metrics_from_totals(totals)
 
     @staticmethod
     def get_by_symbol(
@@ -162,19 +277,101 @@ class TradingPerformanceService:
         date_from: str | None = None,
         date_to: str | None = None,
     ) -> list[dict]:
-        qs = TradingPerformanceService._base_qs(
+        totals = TradingPerformanceService._symbol_totals(
             portfolio_id, mode, asset_class, date_from, date_to,
         )
-        orders = list(qs)
-
-        # Group orders by symbol
-        by_symbol: dict[str, list] = defaultdict(list)
-        for order in orders:
-            by_symbol[order.symbol].append(order)
 
         results = []
-        for symbol, sym_orders in sorted(by_symbol.items()):
-            metrics = TradingPerformanceService._compute_metrics(sym_orders)
+        for symbol, sym in sorted(totals.items()):
+            metrics = TradingPerformanceService._metrics_from_totals({symbol: sym})
             metrics["symbol"] = symbol
             results.append(metrics)
         return results
+
+    # ── Rollup maintenance ────────────────────────────────
+
+    @staticmethod
+    def refresh_rollups(orders) -> int:
+        """Recompute the rollup rows of the buckets ``orders`` fall into.
+
+        Each bucket is rebuilt from its own filled orders (one symbol, one
+        day), so this is idempotent and also picks up fee or fill updates.
+        Returns the number of buckets refreshed.
+        """
+        keys = {_bucket_key(order) for order in orders}
+        for portfolio_id, mode, asset_class, symbol, day in keys:
+            bucket = Order.objects.filter(
+                portfolio_id=portfolio_id,
+                mode=mode,
+                asset_class=asset_class,
+                symbol=symbol,
+                status=OrderStatus.FILLED,
+                timestamp__gte=_day_start(day),
+                timestamp__lt=_day_start(day + timedelta(days=1)),
+            )
+            sym = TradingPerformanceService._fold_orders(bucket).get(symbol)
+            lookup = {
+                "portfolio_id": portfolio_id,
+                "mode": mode,
+                "asset_class": asset_class,
+                "symbol": symbol,
+                "day": day,
+            }
+            if sym is None:
+                PerformanceRollup.objects.filter(**lookup).delete()
+            else:
+                PerformanceRollup.objects.update_or_create(
+                    **lookup,
+                    defaults={field: sym[field] for field in TOTAL_FIELDS},
+                )
+        return len(keys)
+
+    @staticmethod
+    def rebuild_rollups(portfolio_id: int | None = None) -> int:
+        """Rebuild all rollup rows (optionally of one portfolio) from order history.
+
+        Returns the number of rollup rows written.
+        """
+        orders = Order.objects.filter(status=OrderStatus.FILLED)
+        rollups = PerformanceRollup.objects.all()
+        if portfolio_id is not None:
+            orders = orders.filter(portfolio_id=portfolio_id)
+            rollups = rollups.filter(portfolio_id=portfolio_id)
+
+        by_bucket: dict[tuple, list[Order]] = defaultdict(list)
+        for order in orders.order_by("timestamp").iterator(chunk_size=2000):
+            by_bucket[_bucket_key(order)].append(order)
+
+        rows = []
+        for (pid, mode, asset_class, symbol, day), bucket in by_bucket.items():
+            sym = TradingPerformanceService._fold_orders(bucket)[symbol]
+            rows.append(PerformanceRollup(
+                portfolio_id=pid,
+                mode=mode,
+                asset_class=asset_class,
+                symbol=symbol,
+                day=day,
+                **{field: sym[field] for field in TOTAL_FIELDS},
+            ))
+
+        with transaction.atomic():
+            rollups.delete()
+            PerformanceRollup.objects.bulk_create(rows, batch_size=1000)
+        return len(rows)
+
+
+def _on_order_saved(sender, instance: Order, **kwargs) -> None:
+    if instance.status == OrderStatus.FILLED:
+        TradingPerformanceService.refresh_rollups([instance])
+
+
+def connect_rollup_maintenance() -> None:
+    """Keep rollups current as filled orders are saved or deleted.
+
+    ``bulk_update``/``update()`` send no signals; callers persisting filled
+    orders that way call :meth:`TradingPerformanceService.refresh_rollups`.
+    """
+    from django.db.models.signals import post_delete, post_save
+
+    post_save.connect(_on_order_saved, sender=Order, dispatch_uid="perf_rollup_order_save")
+    post_delete.connect(_on_order_saved, sender=Order, dispatch_uid="perf_rollup_order_delete")
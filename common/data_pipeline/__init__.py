@@ -18,10 +18,14 @@ from common.data_pipeline.pipeline import (
     validate_all_data,
     validate_data,
 )
+from common.data_pipeline.shared_frame import SharedFrame, SharedFrameSpec, attach_frame
 
 __all__ = [
     "DataQualityReport",
+    "SharedFrame",
+    "SharedFrameSpec",
     "add_indicators",
+    "attach_frame",
     "audit_nans",
     "check_ohlc_integrity",
     "detect_gaps",
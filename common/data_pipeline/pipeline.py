@@ -678,6 +678,8 @@ def download_watchlist(
                         "rows": len(df),
                         "path": str(path),
                         "status": "ok",
+                        "last_close": float(df["close"].iloc[-1]),
+                        "last_timestamp": df.index[-1].timestamp(),
                     }
                 else:
                     results[f"{symbol}_{tf}"] = {"status": "empty"}
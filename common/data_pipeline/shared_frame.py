@@ -0,0 +1,120 @@
+"""Shared-Memory OHLCV Frames
+==========================
+Publish a numeric DataFrame once in POSIX shared memory so worker
+processes read the same buffer instead of each unpickling a private
+copy per task.
+
+    with SharedFrame(df) as shared:
+        with ProcessPoolExecutor(initializer=init, initargs=(shared.spec,)) as pool:
+            ...
+
+    # inside the worker
+    df = attach_frame(spec)  # read-only, zero-copy view
+
+Values are stored as one float64 matrix followed by the DatetimeIndex as
+int64 ticks. Any other index type travels in the (pickled) spec.
+"""
+
+import contextlib
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+# Segments attached in this process, kept mapped for the process lifetime
+_attached: dict[str, shared_memory.SharedMemory] = {}
+
+
+@dataclass(frozen=True)
+class SharedFrameSpec:
+    """Picklable description of a :class:`SharedFrame` segment."""
+
+    name: str
+    shape: tuple[int, int]
+    columns: tuple
+    index_name: str | None = None
+    index_unit: str | None = None
+    index_tz: str | None = None
+    index: pd.Index | None = None
+
+
+class SharedFrame:
+    """Owner of a shared-memory copy of a numeric DataFrame.
+
+    The creating process must keep this object alive (or stay inside the
+    ``with`` block) until every reader is done; :meth:`close` unlinks
+    the segment.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        values = np.ascontiguousarray(df.to_numpy(dtype=np.float64))
+        index = df.index
+        is_datetime = isinstance(index, pd.DatetimeIndex)
+        index_bytes = len(index) * 8 if is_datetime else 0
+
+        self._shm = shared_memory.SharedMemory(
+            create=True,
+            size=max(values.nbytes + index_bytes, 1),
+        )
+        np.ndarray(values.shape, dtype=np.float64, buffer=self._shm.buf)[:] = values
+        if is_datetime:
+            np.ndarray(
+                len(index),
+                dtype=np.int64,
+                buffer=self._shm.buf,
+                offset=values.nbytes,
+            )[:] = index.asi8
+
+        self.spec = SharedFrameSpec(
+            name=self._shm.name,
+            shape=values.shape,
+            columns=tuple(df.columns),
+            index_name=index.name,
+            index_unit=index.unit if is_datetime else None,
+            index_tz=str(index.tz) if is_datetime and index.tz is not None else None,
+            index=None if is_datetime else index,
+        )
+
+    def close(self) -> None:
+        """Release and unlink the shared segment."""
+        self._shm.close()
+        with contextlib.suppress(FileNotFoundError):
+            self._shm.unlink()
+
+    def __enter__(self) -> "SharedFrame":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def attach_frame(spec: SharedFrameSpec) -> pd.DataFrame:
+    """Rebuild the DataFrame described by ``spec`` over the shared buffer.
+
+    The returned frame is read-only and shares memory with the segment;
+    call ``.copy()`` before mutating it.
+    """
+    shm = _attached.get(spec.name)
+    if shm is None:
+        shm = shared_memory.SharedMemory(name=spec.name)
+        _attached[spec.name] = shm
+
+    values = np.ndarray(spec.shape, dtype=np.float64, buffer=shm.buf)
+    values.flags.writeable = False
+
+    if spec.index is not None:
+        index = spec.index
+    else:
+        ticks = np.ndarray(
+            spec.shape[0],
+            dtype=np.int64,
+            buffer=shm.buf,
+            offset=values.nbytes,
+        )
+        index = pd.DatetimeIndex(ticks.view(f"datetime64[{spec.index_unit}]"))
+        if spec.index_tz is not None:
+            index = index.tz_localize("UTC").tz_convert(spec.index_tz)
+        index.name = spec.index_name
+
+    return pd.DataFrame(values, index=index, columns=list(spec.columns), copy=False)
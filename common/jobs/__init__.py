@@ -0,0 +1,7 @@
+from common.jobs.manager import Job, JobManager, JobQueueFullError
+
+__all__ = [
+    "Job",
+    "JobManager",
+    "JobQueueFullError",
+]
@@ -0,0 +1,291 @@
+"""Background Job Manager
+======================
+Runs CPU-bound work for the Starlette workers (VectorBT, NautilusTrader)
+in a bounded process pool so the event loop, and with it ``/health``,
+stays responsive while long backtests and screens run.
+
+A job is a list of independent tasks (one per symbol, or per strategy x
+symbol) mapped through a module-level function in the pool. Each task's
+result is recorded as soon as it finishes, so clients can poll progress
+and partial results or stream them as server-sent events:
+
+    manager = JobManager(max_workers=4, max_queue=64)
+    job = manager.submit("screen_batch", screen_symbol_task, tasks)
+    ...
+    job = manager.get(job_id)          # status, progress, results so far
+    async for event, data in manager.events(job): ...
+    StreamingResponse(manager.event_stream(job), media_type="text/event-stream")
+    await manager.wait(job)            # block this request only
+
+Submitting more pending tasks than ``max_queue`` raises
+:class:`JobQueueFullError` so callers can answer 429 instead of queueing
+unbounded work.
+"""
+
+import asyncio
+import json
+import logging
+import multiprocessing
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+QUEUED = "queued"
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "error"
+
+
+class JobQueueFullError(Exception):
+    """Raised when a submission would exceed the manager's queue depth."""
+
+
+def _task_error(task: Any, exc: BaseException) -> dict:
+    return {"status": "error", "error": str(exc) or type(exc).__name__}
+
+
+@dataclass
+class Job:
+    """One submitted job and its (partial) results.
+
+    ``results`` is indexed like the submitted tasks (``None`` until a task
+    finishes); ``stream`` lists task indices in completion order and backs
+    the event stream.
+    """
+
+    id: str
+    kind: str
+    total: int
+    meta: dict = field(default_factory=dict)
+    status: str = QUEUED
+    completed: int = 0
+    results: list = field(default_factory=list)
+    stream: list[int] = field(default_factory=list)
+    error: str | None = None
+    created_at: float = field(default_factory=time.time)
+    started_at: float | None = None
+    finished_at: float | None = None
+    _changed: asyncio.Condition = field(default_factory=asyncio.Condition, repr=False)
+
+    def __post_init__(self) -> None:
+        self.results = [None] * self.total
+
+    @property
+    def done(self) -> bool:
+        return self.status in (COMPLETED, FAILED)
+
+    @property
+    def finished_results(self) -> list:
+        """Results of finished tasks, in submission order."""
+        return [r for r in self.results if r is not None]
+
+    def to_dict(self, include_results: bool = True) -> dict:
+        data = {
+            "job_id": self.id,
+            "kind": self.kind,
+            "status": self.status,
+            "progress": {"completed": self.completed, "total": self.total},
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            **self.meta,
+        }
+        if self.error:
+            data["error"] = self.error
+        if include_results:
+            data["results"] = self.finished_results
+        return data
+
+
+class JobManager:
+    """Bounded process pool plus an in-memory registry of jobs.
+
+    Args:
+        max_workers: Pool size (concurrent tasks); ``None`` = one per CPU.
+        max_queue: Maximum tasks accepted but not yet finished, across jobs.
+        max_tasks_per_child: Recycle pool processes after this many tasks.
+        history: Finished jobs kept for status queries.
+
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        max_queue: int = 64,
+        max_tasks_per_child: int | None = None,
+        history: int = 100,
+    ):
+        self.max_workers = max_workers or multiprocessing.cpu_count()
+        self.max_queue = max_queue
+        self.max_tasks_per_child = max_tasks_per_child
+        self.history = history
+        self._jobs: OrderedDict[str, Job] = OrderedDict()
+        self._runners: set[asyncio.Task] = set()
+        self._executor: ProcessPoolExecutor | None = None
+        self._pending = 0
+
+    @property
+    def pending(self) -> int:
+        """Tasks accepted but not yet finished."""
+        return self._pending
+
+    def stats(self) -> dict:
+        """Load summary for health endpoints."""
+        return {
+            "max_workers": self.max_workers,
+            "max_queue": self.max_queue,
+            "pending_tasks": self._pending,
+            "active_jobs": sum(1 for job in self._jobs.values() if not job.done),
+        }
+
+    def _pool(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                max_tasks_per_child=self.max_tasks_per_child,
+            )
+        return self._executor
+
+    def submit(
+        self,
+        kind: str,
+        fn: Callable[[Any], Any],
+        tasks: list,
+        meta: dict | None = None,
+        on_error: Callable[[Any, BaseException], Any] = _task_error,
+        on_done: Callable[[Job], None] | None = None,
+    ) -> Job:
+        """Queue ``fn(task)`` for every task and return the job immediately.
+
+        Must be called from the event loop. ``fn`` and the tasks must be
+        picklable. ``on_error`` builds the result recorded for a task whose
+        worker raised or crashed; ``on_done`` runs once the job finishes
+        (e.g. to release shared memory the tasks read).
+
+        Raises:
+            JobQueueFullError: If accepting the tasks would exceed ``max_queue``.
+
+        """
+        if self._pending + len(tasks) > self.max_queue:
+            raise JobQueueFullError(
+                f"Job queue full ({self._pending} pending tasks, limit {self.max_queue})",
+            )
+
+        job = Job(id=uuid.uuid4().hex, kind=kind, total=len(tasks), meta=meta or {})
+        self._jobs[job.id] = job
+        self._pending += len(tasks)
+        self._prune()
+
+        runner = asyncio.get_running_loop().create_task(
+            self._run(job, fn, tasks, on_error, on_done),
+        )
+        self._runners.add(runner)
+        runner.add_done_callback(self._runners.discard)
+        return job
+
+    def get(self, job_id: str) -> Job | None:
+        return self._jobs.get(job_id)
+
+    async def wait(self, job: Job) -> Job:
+        """Wait for ``job`` to finish without blocking the event loop."""
+        async with job._changed:
+            await job._changed.wait_for(lambda: job.done)
+        return job
+
+    async def events(self, job: Job) -> AsyncIterator[tuple[str, dict]]:
+        """Yield ``("result", ...)`` per finished task, then ``("done", ...)``.
+
+        Tasks that finished before the stream was opened are replayed first.
+        """
+        sent = 0
+        while True:
+            async with job._changed:
+                await job._changed.wait_for(
+                    lambda sent=sent: len(job.stream) > sent or job.done,
+                )
+                fresh = job.stream[sent:]
+                finished = job.done
+            for index in fresh:
+                sent += 1
+                yield (
+                    "result",
+                    {
+                        "index": index,
+                        "completed": sent,
+                        "total": job.total,
+                        "result": job.results[index],
+                    },
+                )
+            if finished:
+                yield "done", job.to_dict(include_results=False)
+                return
+
+    async def event_stream(self, job: Job) -> AsyncIterator[str]:
+        """:meth:`events` encoded as a ``text/event-stream`` body."""
+        async for event, data in self.events(job):
+            yield f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+    async def _run(self, job: Job, fn, tasks: list, on_error, on_done) -> None:
+        loop = asyncio.get_running_loop()
+
+        async def run_one(index: int, task: Any) -> tuple[int, Any]:
+            try:
+                return index, await loop.run_in_executor(self._pool(), fn, task)
+            except BrokenProcessPool as e:
+                # A worker died (e.g. OOM); start a fresh pool for later tasks
+                logger.error("Job %s: worker process crashed: %s", job.id, e)
+                self._executor = None
+                return index, on_error(task, e)
+            except Exception as e:
+                logger.warning("Job %s task %d failed: %s", job.id, index, e)
+                return index, on_error(task, e)
+
+        job.status = RUNNING
+        job.started_at = time.time()
+        try:
+            for next_done in asyncio.as_completed(
+                [run_one(i, task) for i, task in enumerate(tasks)],
+            ):
+                index, result = await next_done
+                self._pending -= 1
+                async with job._changed:
+                    job.results[index] = result
+                    job.stream.append(index)
+                    job.completed += 1
+                    job._changed.notify_all()
+            job.status = COMPLETED
+        except Exception as e:
+            logger.error("Job %s failed: %s", job.id, e)
+            job.status = FAILED
+            job.error = str(e)
+            self._pending -= job.total - job.completed
+        finally:
+            job.finished_at = time.time()
+            if on_done is not None:
+                try:
+                    on_done(job)
+                except Exception as e:
+                    logger.warning("Job %s cleanup failed: %s", job.id, e)
+            async with job._changed:
+                job._changed.notify_all()
+
+    def _prune(self) -> None:
+        finished = [job_id for job_id, job in self._jobs.items() if job.done]
+        for job_id in finished[: max(0, len(finished) - self.history)]:
+            del self._jobs[job_id]
+
+    def shutdown(self) -> None:
+        """Stop the pool; running tasks are abandoned."""
+        for runner in self._runners:
+            runner.cancel()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
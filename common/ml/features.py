@@ -5,6 +5,9 @@ Uses shared indicators from common.indicators.technical.
 """
 
 import logging
+import math
+import threading
+import warnings
 
 import numpy as np
 import pandas as pd
@@ -36,6 +39,63 @@ DEFAULT_FEATURE_CONFIG = {
     "drop_na": True,
 }
 
+# Bump when feature definitions change so cached feature selections are not reused
+FEATURE_SET_VERSION = 1
+
+# Selected feature lists keyed by (symbol, FEATURE_SET_VERSION, candidate columns,
+# max_features, corr_threshold) — lets repeated trainings skip correlation pruning
+_SELECTION_CACHE: dict[tuple, list[str]] = {}
+_SELECTION_CACHE_LOCK = threading.Lock()
+
+# Longest finite rolling window used by each feature block (bars)
+_INDICATOR_WINDOW = 50  # sma_50
+_VOLATILITY_REGIME_WINDOW = 20 + 100  # bb_width / atr percentile over 100 bars
+_CROSS_ASSET_WINDOW = 20 + 2  # rolling corr/strength + lead2 return
+_FUNDING_RATE_WINDOW = 8
+
+# Slowest recursive smoother (ema_50, span=50). EWM state never fully forgets
+# its seed, so "latest" mode adds enough warmup for the seed's residual weight
+# to fall below this tolerance.
+_SLOWEST_EWM_SPAN = 50
+_EWM_TOLERANCE = 1e-10
+
+
+def feature_lookback(
+    config: dict | None = None,
+    include_volatility_regime: bool = False,
+    include_cross_asset: bool = False,
+) -> int:
+    """Number of trailing bars needed to compute the final feature row exactly.
+
+    Combines the longest rolling window, the longest lag/return period and the
+    warmup required for the slowest EWM-based indicator to converge.
+
+    Args:
+        config: Optional override for DEFAULT_FEATURE_CONFIG.
+        include_volatility_regime: Whether volatility regime features are built.
+        include_cross_asset: Whether cross-asset features are built.
+
+    Returns:
+        Lookback in bars.
+
+    """
+    cfg = {**DEFAULT_FEATURE_CONFIG, **(config or {})}
+
+    window = _INDICATOR_WINDOW
+    if include_volatility_regime:
+        window = max(window, _VOLATILITY_REGIME_WINDOW)
+    if include_cross_asset:
+        window = max(window, _CROSS_ASSET_WINDOW)
+    if cfg.get("include_funding_rate", False):
+        window = max(window, _FUNDING_RATE_WINDOW)
+
+    alpha = 2 / (_SLOWEST_EWM_SPAN + 1)
+    ewm_warmup = math.ceil(math.log(_EWM_TOLERANCE) / math.log(1 - alpha))
+
+    max_lag = max(cfg["lag_periods"], default=0)
+    max_return = max(cfg["return_periods"], default=0)
+    return max(window, ewm_warmup) + max(max_lag, max_return) + 1
+
 
 def compute_indicator_features(df: pd.DataFrame) -> pd.DataFrame:
     """Compute indicator-based features from an OHLCV DataFrame.
@@ -378,9 +438,20 @@ def build_feature_matrix(
     include_cross_asset: bool = False,
     reference_df: pd.DataFrame | None = None,
     asset_class: str = "crypto",
+    mode: str = "full",
+    since: pd.Timestamp | None = None,
 ) -> tuple[pd.DataFrame, pd.Series, list[str]]:
     """Full pipeline: OHLCV → feature matrix + target.
 
+    ``mode="latest"`` is the online-inference path: only the trailing
+    :func:`feature_lookback` bars are used, and a single row for the final bar
+    is returned. The target is not computed (y is NaN) and feature reduction
+    is skipped, so callers align columns to the model's ``feature_names``.
+
+    ``since`` (full mode) restricts the result to rows after that timestamp,
+    computing them from the same trailing lookback — used for warm-start
+    retraining on newly appended bars.
+
     Args:
         df: OHLCV DataFrame with columns [open, high, low, close, volume].
         config: Optional override for DEFAULT_FEATURE_CONFIG.
@@ -394,16 +465,36 @@ def build_feature_matrix(
         include_volatility_regime: Whether to include volatility regime features.
         include_regime: Whether to include regime features.
         include_sentiment: Whether to include sentiment features.
+        mode: "full" for the training matrix, "latest" for the final row only.
+        since: Only return rows strictly after this timestamp (full mode).
 
     Returns:
         Tuple of (X features, y target, feature_names).
         Rows with any NaN are dropped.
 
     """
+    if mode not in ("full", "latest"):
+        raise ValueError(f"Unknown feature mode: {mode}")
+
     cfg = {**DEFAULT_FEATURE_CONFIG, **(config or {})}
 
+    obv_offset = 0.0
+    if mode == "latest" or since is not None:
+        lookback = feature_lookback(cfg, include_volatility_regime, include_cross_asset)
+        if mode == "latest":
+            first = len(df) - lookback
+        else:
+            first = int(df.index.searchsorted(since, side="right")) - lookback
+        if first > 0:
+            # OBV is a cumulative sum over all history — carry the prefix total
+            # so the windowed value matches the full-history one.
+            obv_offset = float(obv(df.iloc[: first + 1]).iloc[-1])
+            df = df.iloc[first:]
+
     # Compute all features
     indicators = compute_indicator_features(df)
+    if obv_offset:
+        indicators["obv"] += obv_offset
     returns = add_return_features(df, cfg["return_periods"])
     parts = [indicators, returns]
 
@@ -454,6 +545,13 @@ def build_feature_matrix(
     features = pd.concat(parts, axis=1)
     features = add_lag_features(features, cfg["lag_periods"])
 
+    if mode == "latest":
+        if cfg["drop_na"]:
+            features = features.dropna()
+        x_latest = features.tail(1)
+        y_latest = pd.Series(np.nan, index=x_latest.index, dtype=float)
+        return x_latest, y_latest, list(x_latest.columns)
+
     # Target
     target = compute_target(df, cfg["target_horizon"], cfg.get("target_dead_zone", 0.0))
 
@@ -464,13 +562,18 @@ def build_feature_matrix(
     if cfg["drop_na"]:
         combined = combined.dropna()
 
+    if since is not None:
+        combined = combined[combined.index > since]
+
     y = combined.pop("__target__")
     x_feat = combined
 
     # Feature reduction: drop highly correlated features (>0.95)
     max_features = cfg.get("max_features", 0)
     if max_features > 0 and len(x_feat.columns) > max_features:
-        x_feat = _reduce_features(x_feat, max_features)
+        symbol = cfg.get("symbol", "")
+        cache_key = (symbol, FEATURE_SET_VERSION) if symbol else None
+        x_feat = _reduce_features(x_feat, max_features, cache_key=cache_key)
 
     feature_names = list(x_feat.columns)
 
@@ -478,32 +581,81 @@ def build_feature_matrix(
     return x_feat, y, feature_names
 
 
+def clear_feature_selection_cache() -> None:
+    """Drop all cached feature selections (e.g. after changing feature config)."""
+    with _SELECTION_CACHE_LOCK:
+        _SELECTION_CACHE.clear()
+
+
 def _reduce_features(
     x_feat: pd.DataFrame,
     max_features: int = 35,
     corr_threshold: float = 0.95,
+    cache_key: tuple | None = None,
 ) -> pd.DataFrame:
     """Reduce features by removing highly correlated columns.
 
-    1. Drop columns with >corr_threshold Pearson correlation (keep first).
+    1. Greedy correlation filter: walk columns in order and drop any column
+       with >corr_threshold absolute Pearson correlation to a column already kept.
     2. If still over max_features, drop lowest-variance columns.
+
+    The selection is memoized under ``cache_key`` (symbol, feature-set version)
+    plus the candidate columns and limits.
     """
+    key = None
+    if cache_key is not None:
+        key = (*cache_key, tuple(x_feat.columns), max_features, corr_threshold)
+        with _SELECTION_CACHE_LOCK:
+            cached = _SELECTION_CACHE.get(key)
+        if cached is not None:
+            return x_feat[cached]
+
     # Step 1: Correlation filter
-    corr = x_feat.corr().abs()
-    upper = corr.where(np.triu(np.ones(corr.shape), k=1).astype(bool))
-    to_drop = [col for col in upper.columns if any(upper[col] > corr_threshold)]
+    corr = _abs_corr_matrix(x_feat)
+    too_close = corr > corr_threshold
+    n_cols = len(x_feat.columns)
+    keep = np.ones(n_cols, dtype=bool)
+    for j in range(n_cols):
+        if keep[j]:
+            # Column j survives — every later column too close to it is dropped
+            keep[j + 1:] &= ~too_close[j, j + 1:]
+    to_drop = [col for col, k in zip(x_feat.columns, keep, strict=True) if not k]
     if to_drop:
         logger.info(
             "Dropping %d correlated features (>%.2f): %s", len(to_drop), corr_threshold, to_drop[:5]
         )
-        x_feat = x_feat.drop(columns=to_drop)
+        x_feat = x_feat.loc[:, keep]
 
     # Step 2: Variance filter if still over budget
     if len(x_feat.columns) > max_features:
         variances = x_feat.var().sort_values(ascending=False)
-        keep = variances.index[:max_features].tolist()
+        keep_cols = variances.index[:max_features].tolist()
         dropped = len(x_feat.columns) - max_features
         logger.info("Dropping %d low-variance features to reach %d", dropped, max_features)
-        x_feat = x_feat[keep]
+        x_feat = x_feat[keep_cols]
+
+    if key is not None:
+        with _SELECTION_CACHE_LOCK:
+            _SELECTION_CACHE[key] = list(x_feat.columns)
 
     return x_feat
+
+
+def _abs_corr_matrix(x_feat: pd.DataFrame) -> np.ndarray:
+    """Absolute Pearson correlation matrix in float32 via one matrix product.
+
+    Columns are standardized (NaNs become 0 after centering) and the Gram
+    matrix of the standardized data gives the correlations. Constant columns
+    correlate with nothing.
+    """
+    arr = x_feat.to_numpy(dtype=np.float64, na_value=np.nan)
+    if len(arr) == 0:
+        return np.zeros((arr.shape[1], arr.shape[1]), dtype=np.float32)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)  # all-NaN columns
+        mean = np.nanmean(arr, axis=0)
+        std = np.nanstd(arr, axis=0)
+    # Constant (up to float noise) or all-NaN columns → zero after scaling
+    std[~(std > 1e-12 * np.maximum(np.abs(mean), 1.0))] = np.inf
+    z = np.nan_to_num((arr - mean) / std).astype(np.float32)
+    return np.abs(z.T @ z) / np.float32(len(arr))
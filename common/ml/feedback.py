@@ -1,12 +1,16 @@
 """ML Feedback Tracker
 ===================
 Tracks prediction outcomes, computes model accuracy, and triggers retraining.
-Storage: JSONL files in models/_feedback/ for lightweight local persistence.
+Storage: SQLite database in models/_feedback/ with indexes on model_id, symbol
+and date, so outcome backfills update rows in place and accuracy queries are
+aggregated in SQL. Legacy per-day JSONL files are imported once on startup.
 """
 
 import json
 import logging
-from datetime import datetime, timezone
+import sqlite3
+from contextlib import closing
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any
 
@@ -14,20 +18,85 @@ from common.ml.registry import DEFAULT_MODELS_DIR
 
 logger = logging.getLogger(__name__)
 
+# Degradation beyond these limits needs a full retrain; milder drift is
+# handled by warm-start incremental updates.
+FULL_RETRAIN_ACCURACY_FLOOR = 0.48
+FULL_RETRAIN_REGIME_SPREAD = 0.25
+
+
+def select_retrain_mode(
+    stats: dict[str, Any],
+    min_predictions: int = 50,
+    accuracy_floor: float = FULL_RETRAIN_ACCURACY_FLOOR,
+    regime_spread_limit: float = FULL_RETRAIN_REGIME_SPREAD,
+) -> str:
+    """Choose "full" or "incremental" retraining from accuracy stats.
+
+    Args:
+        stats: Dict shaped like FeedbackTracker.get_model_accuracy() output
+            (total_predictions, accuracy, accuracy_by_regime).
+        min_predictions: Minimum predictions before judging accuracy.
+        accuracy_floor: Accuracy below which the model is rebuilt from scratch.
+        regime_spread_limit: Max-min regime accuracy spread that forces a rebuild.
+
+    Returns:
+        "full" or "incremental".
+
+    """
+    total = stats.get("total_predictions", 0)
+    if total >= min_predictions and stats.get("accuracy", 0.0) < accuracy_floor:
+        return "full"
+
+    regime_accs = list((stats.get("accuracy_by_regime") or {}).values())
+    if len(regime_accs) >= 2 and max(regime_accs) - min(regime_accs) > regime_spread_limit:
+        return "full"
+
+    return "incremental"
+
 
 class FeedbackTracker:
     """Tracks ML prediction outcomes and determines retraining needs.
 
-    Records are stored as JSONL (one JSON object per line) in:
-        models/_feedback/YYYY-MM-DD.jsonl
+    Records are stored in one SQLite table:
+        models/_feedback/feedback.sqlite3
 
     Each record contains: model_id, symbol, asset_class, probability,
     direction, regime, actual_direction (filled later), correct (filled later).
     """
 
+    DB_FILENAME = "feedback.sqlite3"
+
+    _SCHEMA = (
+        """
+        CREATE TABLE IF NOT EXISTS predictions (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            model_id TEXT NOT NULL,
+            symbol TEXT NOT NULL,
+            asset_class TEXT NOT NULL DEFAULT '',
+            probability REAL NOT NULL,
+            direction TEXT NOT NULL,
+            regime TEXT NOT NULL DEFAULT '',
+            timestamp TEXT NOT NULL,
+            date TEXT NOT NULL,
+            actual_direction TEXT,
+            correct INTEGER,
+            actual_return REAL
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS ix_pred_model_date ON predictions (model_id, date)",
+        "CREATE INDEX IF NOT EXISTS ix_pred_symbol_date ON predictions (symbol, date)",
+        "CREATE INDEX IF NOT EXISTS ix_pred_timestamp ON predictions (timestamp)",
+    )
+
     def __init__(self, feedback_dir: Path | None = None):
         self._feedback_dir = feedback_dir or (DEFAULT_MODELS_DIR / "_feedback")
         self._feedback_dir.mkdir(parents=True, exist_ok=True)
+        self._db_path = self._feedback_dir / self.DB_FILENAME
+        with closing(self._connect()) as conn, conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            for stmt in self._SCHEMA:
+                conn.execute(stmt)
+        self.migrate_jsonl()
 
     def record_prediction(
         self,
@@ -67,10 +136,8 @@ class FeedbackTracker:
             "correct": None,
         }
 
-        date_str = ts[:10]  # YYYY-MM-DD
-        filepath = self._feedback_dir / f"{date_str}.jsonl"
-        with open(filepath, "a") as f:
-            f.write(json.dumps(record) + "\n")
+        with closing(self._connect()) as conn, conn:
+            self._insert_records(conn, [record])
 
         return record
 
@@ -90,30 +157,23 @@ class FeedbackTracker:
 
         """
         date_str = date or datetime.now(timezone.utc).strftime("%Y-%m-%d")
-        filepath = self._feedback_dir / f"{date_str}.jsonl"
-        if not filepath.exists():
-            return 0
-
-        records = self._load_records(filepath)
-        updated_count = 0
-
-        for record in records:
-            if record.get("actual_direction") is not None:
-                continue
 
-            symbol = record.get("symbol", "")
-            if symbol not in actual_returns:
-                continue
-
-            actual_return = actual_returns[symbol]
+        params = []
+        for symbol, actual_return in actual_returns.items():
             actual_dir = "up" if actual_return > 0 else "down"
-            record["actual_direction"] = actual_dir
-            record["correct"] = record["direction"] == actual_dir
-            record["actual_return"] = round(actual_return, 6)
-            updated_count += 1
-
-        if updated_count > 0:
-            self._save_records(filepath, records)
+            params.append((actual_dir, actual_dir, round(actual_return, 6), symbol, date_str))
+
+        with closing(self._connect()) as conn, conn:
+            before = conn.total_changes
+            conn.executemany(
+                """
+                UPDATE predictions
+                SET actual_direction = ?, correct = (direction = ?), actual_return = ?
+                WHERE symbol = ? AND date = ? AND actual_direction IS NULL
+                """,
+                params,
+            )
+            updated_count = conn.total_changes - before
 
         logger.info("Backfilled %d outcomes for %s", updated_count, date_str)
         return updated_count
@@ -134,51 +194,17 @@ class FeedbackTracker:
             accuracy_by_regime, accuracy_by_asset_class.
 
         """
-        records = self._load_recent_records(lookback_days)
-
-        model_records = [
-            r for r in records if r.get("model_id") == model_id and r.get("correct") is not None
-        ]
-
-        if not model_records:
-            return {
-                "model_id": model_id,
-                "total_predictions": 0,
-                "correct_predictions": 0,
-                "accuracy": 0.0,
-                "accuracy_by_regime": {},
-                "accuracy_by_asset_class": {},
-            }
-
-        total = len(model_records)
-        correct = sum(1 for r in model_records if r["correct"])
-
-        # Accuracy by regime
-        by_regime: dict[str, list[bool]] = {}
-        for r in model_records:
-            regime = r.get("regime", "unknown")
-            by_regime.setdefault(regime, []).append(r["correct"])
-
-        accuracy_by_regime = {
-            k: round(sum(v) / len(v), 4) if v else 0.0 for k, v in by_regime.items()
-        }
-
-        # Accuracy by asset class
-        by_ac: dict[str, list[bool]] = {}
-        for r in model_records:
-            ac = r.get("asset_class", "unknown")
-            by_ac.setdefault(ac, []).append(r["correct"])
-
-        accuracy_by_ac = {k: round(sum(v) / len(v), 4) if v else 0.0 for k, v in by_ac.items()}
-
-        return {
-            "model_id": model_id,
-            "total_predictions": total,
-            "correct_predictions": correct,
-            "accuracy": round(correct / total, 4),
-            "accuracy_by_regime": accuracy_by_regime,
-            "accuracy_by_asset_class": accuracy_by_ac,
-        }
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                """
+                SELECT regime, asset_class, COUNT(correct), COALESCE(SUM(correct), 0)
+                FROM predictions
+                WHERE model_id = ? AND date >= ? AND correct IS NOT NULL
+                GROUP BY regime, asset_class
+                """,
+                (model_id, self._cutoff_date(lookback_days)),
+            ).fetchall()
+        return self._accuracy_from_groups(model_id, rows)
 
     def should_retrain(
         self,
@@ -211,9 +237,12 @@ class FeedbackTracker:
             return True
 
         # Check staleness: look at last few days only
-        recent = self._load_recent_records(stale_days)
-        recent_for_model = [r for r in recent if r.get("model_id") == model_id]
-        if not recent_for_model:
+        with closing(self._connect()) as conn:
+            recent = conn.execute(
+                "SELECT 1 FROM predictions WHERE model_id = ? AND date >= ? LIMIT 1",
+                (model_id, self._cutoff_date(stale_days)),
+            ).fetchone()
+        if recent is None:
             return True
 
         # Accuracy check (only with enough samples)
@@ -243,6 +272,26 @@ class FeedbackTracker:
 
         return False
 
+    def retrain_mode(
+        self,
+        model_id: str,
+        min_predictions: int = 50,
+        accuracy_floor: float = FULL_RETRAIN_ACCURACY_FLOOR,
+        regime_spread_limit: float = FULL_RETRAIN_REGIME_SPREAD,
+    ) -> str:
+        """Decide how a model should be retrained.
+
+        Models that should_retrain() flags only mildly are warm-started on new
+        data; accuracy below ``accuracy_floor`` or a regime spread above
+        ``regime_spread_limit`` falls back to a full retrain.
+
+        Returns:
+            "full" or "incremental".
+
+        """
+        stats = self.get_model_accuracy(model_id, lookback_days=30)
+        return select_retrain_mode(stats, min_predictions, accuracy_floor, regime_spread_limit)
+
     def get_all_model_stats(self, lookback_days: int = 30) -> list[dict]:
         """Get accuracy stats for all models with feedback data.
 
@@ -250,13 +299,128 @@ class FeedbackTracker:
             List of accuracy dicts, one per model.
 
         """
-        records = self._load_recent_records(lookback_days)
-        model_ids = set(r.get("model_id", "") for r in records if r.get("model_id"))
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                """
+                SELECT model_id, regime, asset_class, COUNT(correct), COALESCE(SUM(correct), 0)
+                FROM predictions
+                WHERE date >= ? AND model_id != ''
+                GROUP BY model_id, regime, asset_class
+                ORDER BY model_id
+                """,
+                (self._cutoff_date(lookback_days),),
+            ).fetchall()
+
+        by_model: dict[str, list[tuple]] = {}
+        for model_id, *group in rows:
+            by_model.setdefault(model_id, []).append(tuple(group))
+
+        return [self._accuracy_from_groups(mid, groups) for mid, groups in by_model.items()]
+
+    def migrate_jsonl(self, remove: bool = False) -> int:
+        """Import legacy ``YYYY-MM-DD.jsonl`` files into the database (one-shot).
+
+        Each imported file is renamed to ``*.jsonl.migrated`` (or deleted when
+        ``remove`` is True) inside the write transaction, so concurrent
+        trackers never import the same file twice.
+
+        Returns:
+            Number of records imported.
+
+        """
+        if not any(self._feedback_dir.glob("*.jsonl")):
+            return 0
 
-        return [self.get_model_accuracy(mid, lookback_days) for mid in sorted(model_ids)]
+        imported = 0
+        with closing(self._connect()) as conn, conn:
+            conn.execute("BEGIN IMMEDIATE")
+            for filepath in sorted(self._feedback_dir.glob("*.jsonl")):
+                records = self._load_records(filepath)
+                self._insert_records(conn, records)
+                imported += len(records)
+                if remove:
+                    filepath.unlink()
+                else:
+                    filepath.rename(filepath.with_suffix(".jsonl.migrated"))
+
+        logger.info("Migrated %d feedback records from JSONL", imported)
+        return imported
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self._db_path, timeout=30)
+
+    @staticmethod
+    def _insert_records(conn: sqlite3.Connection, records: list[dict]) -> None:
+        conn.executemany(
+            """
+            INSERT INTO predictions (
+                model_id, symbol, asset_class, probability, direction, regime,
+                timestamp, date, actual_direction, correct, actual_return
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            [
+                (
+                    r.get("model_id", ""),
+                    r.get("symbol", ""),
+                    r.get("asset_class", ""),
+                    r.get("probability", 0.0),
+                    r.get("direction", ""),
+                    r.get("regime", ""),
+                    r.get("timestamp", ""),
+                    r.get("timestamp", "")[:10],  # YYYY-MM-DD
+                    r.get("actual_direction"),
+                    None if r.get("correct") is None else int(bool(r["correct"])),
+                    r.get("actual_return"),
+                )
+                for r in records
+            ],
+        )
+
+    @staticmethod
+    def _cutoff_date(lookback_days: int) -> str:
+        """Earliest date (inclusive) covered by a lookback of N days."""
+        today = datetime.now(timezone.utc).date()
+        return (today - timedelta(days=max(lookback_days, 1) - 1)).isoformat()
+
+    @staticmethod
+    def _accuracy_from_groups(model_id: str, groups: list[tuple]) -> dict[str, Any]:
+        """Build an accuracy dict from (regime, asset_class, total, correct) rows."""
+        total = sum(g[2] for g in groups)
+        if total == 0:
+            return {
+                "model_id": model_id,
+                "total_predictions": 0,
+                "correct_predictions": 0,
+                "accuracy": 0.0,
+                "accuracy_by_regime": {},
+                "accuracy_by_asset_class": {},
+            }
+
+        correct = sum(g[3] for g in groups)
+
+        by_regime: dict[str, list[int]] = {}
+        by_ac: dict[str, list[int]] = {}
+        for regime, asset_class, n, n_correct in groups:
+            if n == 0:
+                continue
+            r = by_regime.setdefault(regime, [0, 0])
+            r[0] += n
+            r[1] += n_correct
+            a = by_ac.setdefault(asset_class, [0, 0])
+            a[0] += n
+            a[1] += n_correct
+
+        return {
+            "model_id": model_id,
+            "total_predictions": total,
+            "correct_predictions": correct,
+            "accuracy": round(correct / total, 4),
+            "accuracy_by_regime": {k: round(c / n, 4) for k, (n, c) in by_regime.items()},
+            "accuracy_by_asset_class": {k: round(c / n, 4) for k, (n, c) in by_ac.items()},
+        }
 
     def _load_records(self, filepath: Path) -> list[dict]:
-        """Load all records from a JSONL file."""
+        """Load all records from a legacy JSONL file."""
         records = []
         if not filepath.exists():
             return records
@@ -269,22 +433,3 @@ class FeedbackTracker:
                     except json.JSONDecodeError:
                         logger.warning("Skipping corrupt record in %s", filepath)
         return records
-
-    def _save_records(self, filepath: Path, records: list[dict]) -> None:
-        """Rewrite a JSONL file with updated records."""
-        with open(filepath, "w") as f:
-            f.writelines(json.dumps(record) + "\n" for record in records)
-
-    def _load_recent_records(self, lookback_days: int) -> list[dict]:
-        """Load records from the last N days."""
-        from datetime import timedelta
-
-        all_records: list[dict] = []
-        today = datetime.now(timezone.utc).date()
-
-        for i in range(lookback_days):
-            date = today - timedelta(days=i)
-            filepath = self._feedback_dir / f"{date.isoformat()}.jsonl"
-            all_records.extend(self._load_records(filepath))
-
-        return all_records
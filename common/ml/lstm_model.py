@@ -139,6 +139,12 @@ def prepare_sequences(
 ) -> tuple["torch.Tensor", "torch.Tensor"]:
     """Convert feature matrix + target into LSTM-ready sequences.
 
+    Sequences are a zero-copy sliding-window view over the feature matrix
+    (``numpy.lib.stride_tricks.sliding_window_view``), so memory stays at
+    O(n_rows * n_features) regardless of ``seq_len``. Windows are only
+    materialized per mini-batch when indexed (e.g. by a DataLoader). Treat
+    the returned X as read-only.
+
     Args:
         features: DataFrame or numpy array of shape (n_rows, n_features).
         target: Series or numpy array of shape (n_rows,).
@@ -154,8 +160,8 @@ def prepare_sequences(
 
     import numpy as np
 
-    # Convert to numpy if needed
-    feat_arr = np.asarray(features, dtype=np.float32)
+    # Own a contiguous copy of the base matrix — every window is a view into it
+    feat_arr = np.array(features, dtype=np.float32)
     tgt_arr = np.asarray(target, dtype=np.float32)
 
     n_rows = len(feat_arr)
@@ -164,13 +170,16 @@ def prepare_sequences(
             f"Need more than {seq_len} rows for sequences, got {n_rows}"
         )
 
-    x_sequences = []
-    y_targets = []
-    for i in range(seq_len, n_rows):
-        x_sequences.append(feat_arr[i - seq_len:i])
-        y_targets.append(tgt_arr[i])
-
-    x_tensor = torch.tensor(np.array(x_sequences), dtype=torch.float32)
-    y_tensor = torch.tensor(np.array(y_targets), dtype=torch.float32).unsqueeze(1)
+    # Window i covers rows [i, i + seq_len) and predicts target[i + seq_len].
+    # sliding_window_view yields (n_windows, n_features, seq_len); swap to
+    # (n_windows, seq_len, n_features) and drop the final window (no target).
+    # writeable=True only so torch.from_numpy does not warn; windows overlap,
+    # so the tensor must never be modified in place.
+    windows = np.lib.stride_tricks.sliding_window_view(
+        feat_arr, seq_len, axis=0, writeable=True,
+    )
+    windows = windows.swapaxes(1, 2)[:-1]
+    x_tensor = torch.from_numpy(windows)
+    y_tensor = torch.from_numpy(np.ascontiguousarray(tgt_arr[seq_len:])).unsqueeze(1)
 
     return x_tensor, y_tensor
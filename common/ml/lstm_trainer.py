@@ -56,6 +56,16 @@ class TrainResult:
     elapsed_seconds: float
 
 
+def _predict_batched(
+    model: LSTMPredictor, x: torch.Tensor, batch_size: int,
+) -> torch.Tensor:
+    """Run inference over strided sequence views one mini-batch at a time.
+
+    Avoids materializing every overlapping window at once (see prepare_sequences).
+    """
+    return torch.cat([model(x[i:i + batch_size]) for i in range(0, len(x), batch_size)])
+
+
 def train_lstm(
     features: object,
     target: object,
@@ -114,7 +124,7 @@ def train_lstm(
         len(x_train), len(x_test), n_features, seq_len,
     )
 
-    # DataLoader
+    # DataLoader — batches are copied out of the zero-copy window view lazily
     train_dataset = TensorDataset(x_train, y_train)
     train_loader = DataLoader(
         train_dataset, batch_size=batch_size, shuffle=False,  # keep temporal order
@@ -153,7 +163,7 @@ def train_lstm(
         # Validation
         model.eval()
         with torch.no_grad():
-            val_output = model(x_test)
+            val_output = _predict_batched(model, x_test, batch_size)
             val_loss = criterion(val_output, y_test).item()
 
         scheduler.step(val_loss)
@@ -183,7 +193,7 @@ def train_lstm(
 
     # Compute test metrics
     with torch.no_grad():
-        test_probs = model(x_test)
+        test_probs = _predict_batched(model, x_test, batch_size)
         test_preds = (test_probs >= 0.5).float()
         accuracy = float((test_preds == y_test).float().mean())
         test_loss = criterion(test_probs, y_test).item()
@@ -99,6 +99,17 @@ class PredictionService:
             logger.warning("Failed to load model %s: %s", model_id, e)
             return None
 
+        # Align feature columns to match training feature names
+        expected_features = manifest.get("metadata", {}).get("feature_names")
+        if expected_features and isinstance(features, pd.DataFrame):
+            missing = set(expected_features) - set(features.columns)
+            if missing:
+                logger.warning(
+                    "Model %s missing %d features: %s", model_id, len(missing), list(missing)[:5]
+                )
+                return None
+            features = features[expected_features]
+
         # Run inference
         try:
             if HAS_LIGHTGBM and isinstance(model, lgb.Booster):
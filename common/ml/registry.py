@@ -54,6 +54,7 @@ class ModelRegistry:
         symbol: str = "",
         timeframe: str = "",
         label: str = "",
+        lineage: dict | None = None,
     ) -> str:
         """Save a trained model and its metadata.
 
@@ -65,6 +66,7 @@ class ModelRegistry:
             symbol: Trading symbol used for training.
             timeframe: Timeframe of training data.
             label: Optional human label.
+            lineage: Optional provenance (parent_model_id, rows_added, mode).
 
         Returns:
             model_id string.
@@ -72,6 +74,11 @@ class ModelRegistry:
         """
         ts = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
         model_id = f"{ts}_{symbol.replace('/', '')}_{timeframe}" if symbol else ts
+        # Warm-start updates can land within the same second as their parent
+        base_id, suffix = model_id, 1
+        while (self.models_dir / model_id).exists():
+            model_id = f"{base_id}_{suffix}"
+            suffix += 1
 
         model_dir = self.models_dir / model_id
         model_dir.mkdir(parents=True, exist_ok=True)
@@ -116,6 +123,8 @@ class ModelRegistry:
             "metadata": metadata,
             "feature_importance": feature_importance,
         }
+        if lineage:
+            manifest["lineage"] = lineage
         manifest_path = model_dir / "manifest.json"
         manifest_path.write_text(json.dumps(manifest, indent=2, default=str))
 
@@ -219,6 +228,7 @@ class ModelRegistry:
                         "symbol": manifest.get("symbol", ""),
                         "timeframe": manifest.get("timeframe", ""),
                         "label": manifest.get("label", ""),
+                        "model_format": manifest.get("model_format", "lightgbm"),
                         "metrics": manifest.get("metrics", {}),
                     }
                 )
@@ -63,6 +63,10 @@ DEFAULT_TRAIN_PARAMS = {
     "n_jobs": 4,  # Adjust based on available CPU cores
 }
 
+# Warm-start (incremental) retraining defaults
+DEFAULT_INCREMENTAL_ROUNDS = 25  # extra boosting rounds per update
+DEFAULT_INCREMENTAL_LR_DECAY = 0.5  # learning_rate multiplier vs. the parent model
+
 
 def cross_validate(
     x_data: pd.DataFrame,
@@ -434,6 +438,123 @@ def train_model(
     }
 
 
+def train_incremental(
+    model: object,
+    x_new: pd.DataFrame,
+    y_new: pd.Series,
+    feature_names: list[str],
+    params: dict | None = None,
+    parent_metrics: dict | None = None,
+    num_boost_round: int = DEFAULT_INCREMENTAL_ROUNDS,
+    lr_decay: float = DEFAULT_INCREMENTAL_LR_DECAY,
+) -> dict:
+    """Continue boosting an existing LightGBM model on newly appended rows.
+
+    The parent booster is passed as ``init_model`` and ``num_boost_round``
+    extra trees are fitted on the new window only, with the parent's learning
+    rate scaled by ``lr_decay``. The new rows are out-of-sample for the parent,
+    so its accuracy on them is folded into the running test accuracy.
+
+    Args:
+        model: Trained LGBMClassifier (or raw Booster) to continue from.
+        x_new: Feature rows appended since the parent was trained.
+        y_new: Binary target for x_new.
+        feature_names: Parent's training feature names (column order).
+        params: Parent's LightGBM parameters (overrides defaults).
+        parent_metrics: Parent's metrics dict, used for the running accuracy.
+        num_boost_round: Number of trees to add.
+        lr_decay: Learning rate multiplier relative to the parent.
+
+    Returns:
+        dict with keys: model, metrics, metadata, feature_importance.
+
+    Raises:
+        ImportError: If lightgbm is not installed.
+
+    """
+    if not HAS_LIGHTGBM:
+        raise ImportError(
+            "lightgbm is required for ML training. Install with: pip install lightgbm",
+        )
+
+    booster = getattr(model, "booster_", model)
+    x_new = x_new[feature_names]
+    parent_metrics = parent_metrics or {}
+
+    # Parent's out-of-sample performance on the new window
+    window_pred = (np.asarray(booster.predict(x_new)) >= 0.5).astype(int)
+    window_accuracy = float(np.mean(window_pred == y_new.values))
+
+    # Base params are carried forward unchanged so the decay never compounds
+    # across generations of incremental updates.
+    base_params = {**DEFAULT_TRAIN_PARAMS, **(params or {})}
+    model_params = {
+        **base_params,
+        "n_estimators": num_boost_round,
+        "learning_rate": base_params["learning_rate"] * lr_decay,
+        # A short window cannot satisfy the full-history leaf size
+        "min_child_samples": min(
+            base_params.get("min_child_samples", 20), max(2, len(x_new) // 5),
+        ),
+    }
+
+    logger.info(
+        "Incremental training: %d new rows, +%d rounds at lr=%.4f",
+        len(x_new),
+        num_boost_round,
+        model_params["learning_rate"],
+    )
+
+    updated = lgb.LGBMClassifier(**model_params)
+    updated.fit(x_new, y_new, init_model=booster)
+
+    parent_rows = int(parent_metrics.get("test_rows", 0))
+    parent_acc = float(parent_metrics.get("accuracy", window_accuracy))
+    running_acc = (parent_acc * parent_rows + window_accuracy * len(x_new)) / (
+        parent_rows + len(x_new)
+    )
+
+    importance = dict(
+        zip(feature_names, map(float, updated.feature_importances_), strict=False),
+    )
+
+    metrics = {
+        **parent_metrics,
+        "accuracy": round(running_acc, 4),
+        "window_accuracy": round(window_accuracy, 4),
+        "test_rows": parent_rows + len(x_new),
+        "train_rows": int(parent_metrics.get("train_rows", 0)) + len(x_new),
+        "rows_added": len(x_new),
+        "n_features": len(feature_names),
+    }
+
+    metadata = {
+        "trained_at": datetime.now(timezone.utc).isoformat(),
+        "model_type": "LightGBMClassifier",
+        "params": base_params,
+        "feature_names": feature_names,
+        "incremental": {
+            "num_boost_round": num_boost_round,
+            "lr_decay": lr_decay,
+            "learning_rate": model_params["learning_rate"],
+            "total_trees": updated.booster_.num_trees(),
+        },
+    }
+
+    logger.info(
+        "Incremental training complete: window_accuracy=%.4f, running accuracy=%.4f",
+        window_accuracy,
+        running_acc,
+    )
+
+    return {
+        "model": updated,
+        "metrics": metrics,
+        "metadata": metadata,
+        "feature_importance": importance,
+    }
+
+
 def predict(model: object, X: pd.DataFrame) -> dict:  # noqa: N803
     """Generate predictions from a trained model.
 
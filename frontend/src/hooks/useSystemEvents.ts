@@ -4,6 +4,7 @@ import { useWebSocket } from "./useWebSocket";
 import { useToast } from "./useToast";
 import type {
   SystemEvent,
+  SystemEventBatch,
   OrderUpdateEvent,
   RiskAlertEvent,
   RegimeChangeEvent,
@@ -19,7 +20,7 @@ export function useSystemEvents() {
   const queryClient = useQueryClient();
   const { toast } = useToast();
   const { isConnected, isReconnecting, reconnectAttempt, lastMessage, reconnect } =
-    useWebSocket<SystemEvent>("/ws/system/");
+    useWebSocket<SystemEvent | SystemEventBatch>("/ws/system/");
 
   const [isHalted, setIsHalted] = useState<boolean | null>(null);
   const [haltReason, setHaltReason] = useState("");
@@ -35,60 +36,68 @@ export function useSystemEvents() {
   useEffect(() => {
     if (!lastMessage) return;
 
-    switch (lastMessage.type) {
-      case "halt_status":
-        // eslint-disable-next-line react-hooks/set-state-in-effect -- syncing external WS state
-        setIsHalted(lastMessage.data.is_halted);
-        setHaltReason(lastMessage.data.halt_reason ?? "");
-        queryClient.invalidateQueries({ queryKey: ["risk-status"] });
-        break;
-      case "order_update":
-        setLastOrderUpdate(lastMessage.data);
-        queryClient.invalidateQueries({ queryKey: ["orders"] });
-        break;
-      case "risk_alert":
-        setLastRiskAlert(lastMessage.data);
-        queryClient.invalidateQueries({ queryKey: ["risk-alerts"] });
-        break;
-      case "news_update":
-        queryClient.invalidateQueries({ queryKey: ["news-articles"] });
-        if (lastMessage.data.articles_fetched > 0) {
+    const handle = (event: SystemEvent) => {
+      switch (event.type) {
+        case "halt_status":
+          // eslint-disable-next-line react-hooks/set-state-in-effect -- syncing external WS state
+          setIsHalted(event.data.is_halted);
+          setHaltReason(event.data.halt_reason ?? "");
+          queryClient.invalidateQueries({ queryKey: ["risk-status"] });
+          break;
+        case "order_update":
+          setLastOrderUpdate(event.data);
+          queryClient.invalidateQueries({ queryKey: ["orders"] });
+          break;
+        case "risk_alert":
+          setLastRiskAlert(event.data);
+          queryClient.invalidateQueries({ queryKey: ["risk-alerts"] });
+          break;
+        case "news_update":
+          queryClient.invalidateQueries({ queryKey: ["news-articles"] });
+          if (event.data.articles_fetched > 0) {
+            toast(
+              `${event.data.articles_fetched} new ${event.data.asset_class} articles`,
+              "info",
+            );
+          }
+          break;
+        case "sentiment_update":
+          queryClient.invalidateQueries({ queryKey: ["news-sentiment"] });
+          queryClient.invalidateQueries({ queryKey: ["sentiment-signal"] });
+          break;
+        case "scheduler_event":
+          setLastSchedulerEvent(event.data);
+          queryClient.invalidateQueries({ queryKey: ["recent-jobs"] });
+          queryClient.invalidateQueries({ queryKey: ["scheduler-tasks"] });
+          if (event.data.status === "completed") {
+            toast(`Task completed: ${event.data.task_name}`, "success");
+          } else if (event.data.status === "failed") {
+            toast(`Task failed: ${event.data.task_name}`, "error");
+          }
+          break;
+        case "regime_change":
+          setLastRegimeChange(event.data);
+          queryClient.invalidateQueries({ queryKey: ["regime-overview"] });
           toast(
-            `${lastMessage.data.articles_fetched} new ${lastMessage.data.asset_class} articles`,
+            `Regime change: ${event.data.symbol} ${event.data.previous_regime} → ${event.data.new_regime}`,
+            "warning",
+          );
+          break;
+        case "opportunity_alert":
+          queryClient.invalidateQueries({ queryKey: ["opportunities"] });
+          queryClient.invalidateQueries({ queryKey: ["opportunity-summary"] });
+          toast(
+            `Opportunity: ${event.data.symbol} ${event.data.opportunity_type.replace(/_/g, " ")} (score ${event.data.score})`,
             "info",
           );
-        }
-        break;
-      case "sentiment_update":
-        queryClient.invalidateQueries({ queryKey: ["news-sentiment"] });
-        queryClient.invalidateQueries({ queryKey: ["sentiment-signal"] });
-        break;
-      case "scheduler_event":
-        setLastSchedulerEvent(lastMessage.data);
-        queryClient.invalidateQueries({ queryKey: ["recent-jobs"] });
-        queryClient.invalidateQueries({ queryKey: ["scheduler-tasks"] });
-        if (lastMessage.data.status === "completed") {
-          toast(`Task completed: ${lastMessage.data.task_name}`, "success");
-        } else if (lastMessage.data.status === "failed") {
-          toast(`Task failed: ${lastMessage.data.task_name}`, "error");
-        }
-        break;
-      case "regime_change":
-        setLastRegimeChange(lastMessage.data);
-        queryClient.invalidateQueries({ queryKey: ["regime-overview"] });
-        toast(
-          `Regime change: ${lastMessage.data.symbol} ${lastMessage.data.previous_regime} → ${lastMessage.data.new_regime}`,
-          "warning",
-        );
-        break;
-      case "opportunity_alert":
-        queryClient.invalidateQueries({ queryKey: ["opportunities"] });
-        queryClient.invalidateQueries({ queryKey: ["opportunity-summary"] });
-        toast(
-          `Opportunity: ${lastMessage.data.symbol} ${lastMessage.data.opportunity_type.replace(/_/g, " ")} (score ${lastMessage.data.score})`,
-          "info",
-        );
-        break;
+          break;
+      }
+    };
+
+    if (lastMessage.type === "batch") {
+      lastMessage.events.forEach(handle);
+    } else {
+      handle(lastMessage);
     }
   }, [lastMessage, queryClient, toast]);
 
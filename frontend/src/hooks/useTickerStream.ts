@@ -3,26 +3,38 @@ import type { TickerData } from "../types";
 import { useWebSocket } from "./useWebSocket";
 
 interface TickerMessage {
-  tickers: TickerData[];
+  tickers: Partial<TickerData>[];
 }
 
 /**
  * Streams live ticker data via WebSocket.
  * Returns a map of symbol -> latest ticker data.
+ *
+ * The server sends a full ticker when a symbol is first subscribed and then
+ * only the fields that changed, so updates are merged into the last value.
+ * Passing `symbols` subscribes to them in addition to the server defaults.
  */
-export function useTickerStream() {
-  const { isConnected, lastMessage } = useWebSocket<TickerMessage>(
+export function useTickerStream(symbols: string[] = []) {
+  const { isConnected, lastMessage, send } = useWebSocket<TickerMessage>(
     "/ws/market/tickers/",
   );
 
   const [tickers, setTickers] = useState<Record<string, TickerData>>({});
   const tickersRef = useRef(tickers);
+  const symbolKey = symbols.join(",");
+
+  useEffect(() => {
+    if (isConnected && symbolKey) {
+      send({ action: "subscribe", symbols: symbolKey.split(",") });
+    }
+  }, [isConnected, symbolKey, send]);
 
   useEffect(() => {
     if (lastMessage?.tickers) {
       const updated = { ...tickersRef.current };
       for (const t of lastMessage.tickers) {
-        updated[t.symbol] = t;
+        if (!t.symbol) continue;
+        updated[t.symbol] = { ...updated[t.symbol], ...t } as TickerData;
       }
       tickersRef.current = updated;
       setTickers(updated);
@@ -100,7 +100,7 @@ export function PortfolioPage() {
   });
 
   // Real-time ticker data via WebSocket (overrides HTTP polling)
-  const { tickers: wsTickers } = useTickerStream();
+  const { tickers: wsTickers } = useTickerStream(allSymbols);
 
   // Build a price lookup map: WS tickers override HTTP tickers
   const priceMap: Record<string, number> = {};
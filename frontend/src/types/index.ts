@@ -346,6 +346,8 @@ export interface HaltStatusEvent {
   data: {
     is_halted: boolean;
     halt_reason: string;
+    cancelled_orders?: number;
+    cancel_elapsed_ms?: number;
   };
 }
 
@@ -438,6 +440,12 @@ export type SystemEvent =
   | RegimeChangeEvent
   | OpportunityAlertEvent;
 
+/** Events coalesced by the backend broadcast buffer into one frame. */
+export interface SystemEventBatch {
+  type: "batch";
+  events: SystemEvent[];
+}
+
 // News types
 export interface NewsArticle {
   article_id: string;
@@ -876,6 +884,7 @@ export interface PaperTradingInstanceKPI {
   pnl: number;
   open_trades: number;
   closed_trades: number;
+  data_age_seconds?: number | null;
 }
 
 export interface PaperTradingKPIs {
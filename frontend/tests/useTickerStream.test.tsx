@@ -111,6 +111,42 @@ describe("useTickerStream", () => {
     expect(result.current.tickers["ETH/USDT"]).toBeDefined();
   });
 
+  it("merges change-only updates into the last ticker", () => {
+    lastWebSocketResult.lastMessage = {
+      tickers: [
+        { symbol: "BTC/USDT", price: 50000, volume_24h: 1000, change_24h: 2.5 },
+      ],
+    };
+
+    const { result, rerender } = renderHook(() => useTickerStream());
+
+    act(() => {
+      lastWebSocketResult.lastMessage = {
+        tickers: [{ symbol: "BTC/USDT", price: 50500 }],
+      };
+    });
+
+    rerender();
+
+    expect(result.current.tickers["BTC/USDT"]).toEqual({
+      symbol: "BTC/USDT",
+      price: 50500,
+      volume_24h: 1000,
+      change_24h: 2.5,
+    });
+  });
+
+  it("subscribes to requested symbols once connected", () => {
+    lastWebSocketResult.isConnected = true;
+
+    renderHook(() => useTickerStream(["DOGE/USDT", "BTC/USDT"]));
+
+    expect(lastWebSocketResult.send).toHaveBeenCalledWith({
+      action: "subscribe",
+      symbols: ["DOGE/USDT", "BTC/USDT"],
+    });
+  });
+
   it("ignores messages without tickers field", () => {
     lastWebSocketResult.lastMessage = { type: "heartbeat" };
 
@@ -10,6 +10,7 @@ Handles:
 
 import json
 import logging
+import os
 import sys
 from pathlib import Path
 
@@ -29,6 +30,9 @@ TICKS_DIR = PROJECT_ROOT / "data" / "ticks"
 TICKS_DIR.mkdir(parents=True, exist_ok=True)
 CONFIG_PATH = PROJECT_ROOT / "configs" / "platform_config.yaml"
 
+# Bump when the generated ticks change so cached .npy files are rebuilt
+TICK_CONVERSION_VERSION = 1
+
 
 def _load_platform_config() -> dict:
     """Load platform_config.yaml. Returns empty dict on failure."""
@@ -48,6 +52,35 @@ def _load_platform_config() -> dict:
         return {}
 
 
+def _tick_path(symbol: str, timeframe: str, exchange: str) -> Path:
+    return TICKS_DIR / f"{exchange}_{symbol.replace('/', '')}_{timeframe}_ticks.npy"
+
+
+def _source_path(symbol: str, timeframe: str, exchange: str) -> Path:
+    from common.data_pipeline.pipeline import PROCESSED_DIR, _parquet_path
+
+    return _parquet_path(symbol, timeframe, exchange, PROCESSED_DIR)
+
+
+def _source_stamp(source: Path) -> dict:
+    """Identify a Parquet source by mtime, row count and conversion version."""
+    import pyarrow.parquet as pq
+
+    return {
+        "source_mtime_ns": source.stat().st_mtime_ns,
+        "source_rows": pq.ParquetFile(source).metadata.num_rows,
+        "version": TICK_CONVERSION_VERSION,
+    }
+
+
+def _read_stamp(tick_path: Path) -> dict | None:
+    try:
+        with open(tick_path.with_suffix(".json")) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
 def convert_ohlcv_to_hft_ticks(
     symbol: str = "BTC/USDT",
     timeframe: str = "1h",
@@ -57,12 +90,23 @@ def convert_ohlcv_to_hft_ticks(
 
     Generates 4 ticks per bar (O/H/L/C) with interpolated timestamps.
     This is a development approximation — real HFT requires actual tick data.
+    The source's mtime, row count and ``TICK_CONVERSION_VERSION`` are saved
+    next to the ticks so :func:`load_hft_ticks` can tell when they are stale.
 
     Returns path to saved .npy file.
     """
-    from common.data_pipeline.pipeline import load_ohlcv, to_hftbacktest_ticks
+    import pandas as pd
+
+    from common.data_pipeline.pipeline import to_hftbacktest_ticks
+
+    source = _source_path(symbol, timeframe, exchange)
+    if not source.exists():
+        logger.error(f"No data for {symbol} {timeframe}")
+        return None
 
-    df = load_ohlcv(symbol, timeframe, exchange)
+    # Stamp before reading: a write in between leaves the cache stale, not wrong
+    stamp = _source_stamp(source)
+    df = pd.read_parquet(source)
     if df.empty:
         logger.error(f"No data for {symbol} {timeframe}")
         return None
@@ -70,13 +114,49 @@ def convert_ohlcv_to_hft_ticks(
     logger.info(f"Converting {len(df)} bars to synthetic ticks...")
     tick_array = to_hftbacktest_ticks(df, timeframe)
 
-    safe_symbol = symbol.replace("/", "")
-    output_path = TICKS_DIR / f"{exchange}_{safe_symbol}_{timeframe}_ticks.npy"
-    np.save(output_path, tick_array)
+    # Replace atomically so backtests mapping the old file keep a valid view
+    output_path = _tick_path(symbol, timeframe, exchange)
+    tmp_path = output_path.with_suffix(f".{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as f:
+        np.save(f, tick_array)
+    os.replace(tmp_path, output_path)
+    stamp_tmp = tmp_path.with_suffix(".json.tmp")
+    with open(stamp_tmp, "w") as f:
+        json.dump(stamp, f)
+    os.replace(stamp_tmp, output_path.with_suffix(".json"))
+
     logger.info(f"Saved {len(tick_array)} ticks to {output_path}")
     return output_path
 
 
+def load_hft_ticks(
+    symbol: str = "BTC/USDT",
+    timeframe: str = "1h",
+    exchange: str = "kraken",
+) -> np.ndarray | None:
+    """Return the tick array for a symbol, regenerating it only when stale.
+
+    Ticks are memory-mapped read-only, so concurrent backtests share the
+    same pages. A tick file without a Parquet source (e.g. real tick data
+    dropped into ``TICKS_DIR``) is used as is.
+
+    Returns None when there is neither a tick file nor OHLCV data.
+    """
+    tick_path = _tick_path(symbol, timeframe, exchange)
+    source = _source_path(symbol, timeframe, exchange)
+
+    if tick_path.exists() and (
+        not source.exists() or _read_stamp(tick_path) == _source_stamp(source)
+    ):
+        return np.load(tick_path, mmap_mode="r")
+
+    logger.info("Tick data missing or stale, generating from OHLCV...")
+    tick_path = convert_ohlcv_to_hft_ticks(symbol, timeframe, exchange)
+    if tick_path is None:
+        return None
+    return np.load(tick_path, mmap_mode="r")
+
+
 def list_hft_strategies() -> list[str]:
     """Return names of all registered HFT strategies."""
     from hftbacktest.strategies import STRATEGY_REGISTRY
@@ -107,17 +187,10 @@ def run_hft_backtest(
         available = ", ".join(STRATEGY_REGISTRY.keys())
         return {"error": f"Unknown strategy '{strategy_name}'. Available: {available}"}
 
-    # Load or generate tick data
-    safe_symbol = symbol.replace("/", "")
-    tick_path = TICKS_DIR / f"{exchange}_{safe_symbol}_{timeframe}_ticks.npy"
-
-    if not tick_path.exists():
-        logger.info("Tick data not found, generating from OHLCV...")
-        tick_path = convert_ohlcv_to_hft_ticks(symbol, timeframe, exchange)
-        if tick_path is None:
-            return {"error": f"No data for {symbol} {timeframe} on {exchange}"}
-
-    tick_array = np.load(tick_path)
+    # Load or (re)generate tick data
+    tick_array = load_hft_ticks(symbol, timeframe, exchange)
+    if tick_array is None:
+        return {"error": f"No data for {symbol} {timeframe} on {exchange}"}
     logger.info(f"Running HFT backtest: {strategy_name} on {len(tick_array)} ticks")
 
     # Build config: platform_config.yaml defaults → function args
@@ -161,6 +234,7 @@ def run_hft_backtest(
     }
 
     # Save results
+    safe_symbol = symbol.replace("/", "")
     result_path = RESULTS_DIR / f"{strategy_name}_{safe_symbol}_{timeframe}.json"
     with open(result_path, "w") as f:
         json.dump(result, f, indent=2, default=str)
@@ -5,26 +5,204 @@ Shared functionality for all hftbacktest strategies:
 - Order management (submit/cancel helpers)
 - PnL + drawdown tracking
 - Tick-by-tick processing loop
+
+The loop hands strategies typed scalars (``on_tick_values``) and records
+fills in a preallocated NumPy structured array (``FILL_DTYPE``); the
+position/PnL/fee accounting runs as a numba kernel when numba is
+installed. The dict-based ``on_tick``/``submit_order`` API is kept as a
+compatibility shim on top.
 """
 
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING
 
+import numpy as np
 import pandas as pd
 
-if TYPE_CHECKING:
-    import numpy as np
+try:
+    from numba import njit
+
+    HAS_NUMBA = True
+except ImportError:  # pragma: no cover
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):  # type: ignore[no-redef]
+        return lambda fn: fn
+
 
 logger = logging.getLogger(__name__)
 
+# Tick / fill side codes (tick array column 3 uses the same sign convention)
+BUY = 1
+SELL = -1
+
+FILL_DTYPE = np.dtype(
+    [
+        ("timestamp", np.int64),
+        ("side", np.int8),
+        ("price", np.float64),
+        ("size", np.float64),
+        ("fee", np.float64),
+        ("position_after", np.float64),
+        ("pnl", np.float64),
+    ]
+)
+
+# Initial fill buffer capacity; the buffer doubles when full
+FILL_CAPACITY = 1024
+
+# Tick rows unpacked to Python scalars at a time by run()
+TICK_CHUNK = 65_536
+
+
+@njit(cache=True)
+def _apply_fill(
+    position: float,
+    avg_cost: float,
+    gross_pnl: float,
+    total_fees: float,
+    balance: float,
+    peak_balance: float,
+    side: int,
+    price: float,
+    size: float,
+    fee_rate: float,
+) -> tuple:
+    """Book one fill against the inventory.
+
+    Returns the updated ``(position, avg_cost, gross_pnl, total_fees,
+    balance, peak_balance)`` followed by the fill's ``fee`` and realized
+    ``pnl``.
+    """
+    new_position = position + side * size
+
+    # Deduct fee from balance and accumulate
+    fee = price * size * fee_rate
+    balance -= fee
+    total_fees += fee
+
+    pnl = 0.0
+    if side > 0:
+        if position < 0:
+            # Closing short
+            pnl = min(size, -position) * (avg_cost - price)
+            gross_pnl += pnl
+            balance += pnl
+        if new_position > 0:
+            if position > 0:
+                avg_cost = (avg_cost * position + price * size) / new_position
+            else:
+                avg_cost = price
+    else:
+        if position > 0:
+            # Closing long
+            pnl = min(size, position) * (price - avg_cost)
+            gross_pnl += pnl
+            balance += pnl
+        if new_position < 0:
+            if position < 0:
+                avg_cost = (avg_cost * -position + price * size) / -new_position
+            else:
+                avg_cost = price
+
+    # Track peak balance for drawdown
+    peak_balance = max(peak_balance, balance)
+    return new_position, avg_cost, gross_pnl, total_fees, balance, peak_balance, fee, pnl
+
+
+@njit(cache=True)
+def _pair_fifo(
+    sides: np.ndarray,
+    prices: np.ndarray,
+    sizes: np.ndarray,
+    fee_rate: float,
+) -> tuple:
+    """Pair fills into round trips, closing the oldest open entries first.
+
+    Open entries always share one side, so the FIFO is a slice of fill
+    indices with a moving head: each fill is queued at most once and
+    closed at most once, making the pass linear in the number of fills.
+
+    Returns arrays ``(entry_idx, exit_idx, size, pnl, pnl_pct, fee)``,
+    one element per trade, with fees netted out of ``pnl``/``pnl_pct``.
+    """
+    n = len(sides)
+    queue = np.empty(n, dtype=np.int64)  # fill index of each open entry
+    left = np.empty(n, dtype=np.float64)  # its unclosed size
+    head = 0
+    tail = 0
+
+    # Each fill closes any number of entries but leaves at most one partial,
+    # so there are fewer than 2n trades
+    entry_idx = np.empty(2 * n, dtype=np.int64)
+    exit_idx = np.empty(2 * n, dtype=np.int64)
+    trade_size = np.empty(2 * n, dtype=np.float64)
+    trade_pnl = np.empty(2 * n, dtype=np.float64)
+    trade_pnl_pct = np.empty(2 * n, dtype=np.float64)
+    trade_fee = np.empty(2 * n, dtype=np.float64)
+    k = 0
+
+    for i in range(n):
+        price = prices[i]
+        remaining = sizes[i]
+
+        # Opposite side — close FIFO entries
+        if head < tail and sides[queue[head]] != sides[i]:
+            while remaining > 0 and head < tail:
+                entry = queue[head]
+                entry_price = prices[entry]
+                close_size = min(remaining, left[head])
+
+                if sides[entry] > 0:
+                    pnl = (price - entry_price) * close_size
+                    pnl_pct = (price / entry_price) - 1
+                else:
+                    pnl = (entry_price - price) * close_size
+                    pnl_pct = (entry_price / price) - 1
+
+                entry_fee = entry_price * close_size * fee_rate
+                exit_fee = price * close_size * fee_rate
+                total_fee = entry_fee + exit_fee
+
+                entry_idx[k] = entry
+                exit_idx[k] = i
+                trade_size[k] = close_size
+                trade_pnl[k] = pnl - total_fee
+                trade_pnl_pct[k] = pnl_pct - (2 * fee_rate)
+                trade_fee[k] = total_fee
+                k += 1
+
+                left[head] -= close_size
+                remaining -= close_size
+                if left[head] <= 1e-12:
+                    head += 1
+
+        # Any remaining size becomes a new open entry
+        if remaining > 1e-12:
+            queue[tail] = i
+            left[tail] = remaining
+            tail += 1
+
+    return (
+        entry_idx[:k],
+        exit_idx[:k],
+        trade_size[:k],
+        trade_pnl[:k],
+        trade_pnl_pct[:k],
+        trade_fee[:k],
+    )
+
 
 class HFTBaseStrategy:
     """Base class for HFT strategies.
 
-    Strategies override ``on_tick()`` which receives each tick as a dict:
-    ``{timestamp, price, volume, side}`` where side is 'buy' or 'sell'.
+    Strategies override ``on_tick_values(timestamp, price, volume, side)``,
+    which receives each tick as scalars with side ``BUY`` (+1) or ``SELL``
+    (-1), and place orders with ``submit_order_values()``. Overriding the
+    older ``on_tick()``, which receives a dict
+    ``{timestamp, price, volume, side}`` with side 'buy' or 'sell', still
+    works but allocates per tick.
 
     The base class manages inventory, fills, and PnL.
     """
@@ -35,9 +213,9 @@ class HFTBaseStrategy:
 
     def __init__(self, config: dict | None = None):
         self.config = config or {}
-        self.initial_balance = self.config.get("initial_balance", 10000.0)
+        self.initial_balance = float(self.config.get("initial_balance", 10000.0))
         self.max_position = self.config.get("max_position", self.max_position)
-        self.fee_rate: float = self.config.get("fee_rate", 0.0002)  # 0.02% maker fee
+        self.fee_rate = float(self.config.get("fee_rate", 0.0002))  # 0.02% maker fee
 
         # State
         self.position: float = 0.0  # Signed position (+ long, - short)
@@ -46,100 +224,144 @@ class HFTBaseStrategy:
         self.total_fees: float = 0.0
         self.balance: float = self.initial_balance
         self.peak_balance: float = self.initial_balance
-        self.fills: list[dict] = []
         self.halted: bool = False
 
+        # Fills: structured buffer plus lazily built dict view
+        self._fill_buf = np.empty(FILL_CAPACITY, dtype=FILL_DTYPE)
+        self._n_fills = 0
+        self._fill_dicts: list[dict] = []
+
         # Latency simulation
         self.latency_ns: int = self.config.get("latency_ns", 1_000_000)  # 1ms default
 
+    @property
+    def fill_array(self) -> np.ndarray:
+        """Fills so far as a ``FILL_DTYPE`` structured array (a view)."""
+        return self._fill_buf[: self._n_fills]
+
+    @property
+    def fills(self) -> list[dict]:
+        """Fills so far as dicts (compatibility view of :attr:`fill_array`)."""
+        done = len(self._fill_dicts)
+        if done < self._n_fills:
+            self._fill_dicts.extend(
+                self._fill_dict(row) for row in self._fill_buf[done : self._n_fills].tolist()
+            )
+        return self._fill_dicts
+
+    @staticmethod
+    def _fill_dict(row: tuple) -> dict:
+        timestamp, side, price, size, fee, position_after, pnl = row
+        return {
+            "timestamp": timestamp,
+            "side": "buy" if side > 0 else "sell",
+            "price": price,
+            "size": size,
+            "fee": fee,
+            "position_after": position_after,
+            "pnl": pnl,
+        }
+
+    def reserve_fills(self, capacity: int) -> None:
+        """Grow the fill buffer to hold at least ``capacity`` fills."""
+        if capacity > len(self._fill_buf):
+            buf = np.empty(capacity, dtype=FILL_DTYPE)
+            buf[: self._n_fills] = self._fill_buf[: self._n_fills]
+            self._fill_buf = buf
+
     def run(self, ticks: np.ndarray) -> list[dict]:
-        """Process all ticks through the strategy. Returns list of fills."""
-        for i in range(len(ticks)):
-            if self.halted:
-                break
-            tick = {
-                "timestamp": ticks[i, 0],
-                "price": ticks[i, 1],
-                "volume": ticks[i, 2],
-                "side": "buy" if ticks[i, 3] > 0 else "sell",
-            }
-            self.on_tick(tick)
+        """Process all ticks through the strategy. Returns list of fills.
+
+        ``ticks`` may be a read-only memory map; it is unpacked in chunks of
+        ``TICK_CHUNK`` rows so the Python copy stays small.
+        """
+        on_tick = self.on_tick_values
+        for start in range(0, len(ticks), TICK_CHUNK):
+            for timestamp, price, volume, side in ticks[start : start + TICK_CHUNK, :4].tolist():
+                if self.halted:
+                    return self.fills
+                on_tick(int(timestamp), price, volume, BUY if side > 0 else SELL)
         return self.fills
 
+    def on_tick_values(self, timestamp: int, price: float, volume: float, side: int) -> None:
+        """Override in subclass: process a single tick given as scalars.
+
+        The default implementation builds the legacy tick dict and calls
+        :meth:`on_tick`.
+        """
+        self.on_tick(
+            {
+                "timestamp": timestamp,
+                "price": price,
+                "volume": volume,
+                "side": "buy" if side > 0 else "sell",
+            }
+        )
+
     def on_tick(self, tick: dict) -> None:
-        """Override in subclass: process a single tick."""
-        raise NotImplementedError
+        """Process a single tick given as a dict.
 
-    def submit_order(self, side: str, price: float, size: float, tick: dict) -> dict | None:
-        """Submit a simulated order. Returns fill dict or None if rejected."""
+        Subclasses either override this or :meth:`on_tick_values`; for the
+        latter this forwards the dict's fields.
+        """
+        if type(self).on_tick_values is HFTBaseStrategy.on_tick_values:
+            raise NotImplementedError
+        self.on_tick_values(
+            tick["timestamp"],
+            tick["price"],
+            tick["volume"],
+            BUY if tick["side"] == "buy" else SELL,
+        )
+
+    def submit_order_values(self, side: int, price: float, size: float, timestamp: int) -> int:
+        """Submit a simulated order. Returns the fill's index or -1 if rejected."""
         if self.halted:
-            return None
+            return -1
 
         # Position limit check
-        new_position = self.position + (size if side == "buy" else -size)
-        if abs(new_position) > self.max_position:
-            return None
+        if abs(self.position + side * size) > self.max_position:
+            return -1
 
         # Simulate fill at the given price
-        fee = price * size * self.fee_rate
-        fill = {
-            "timestamp": tick["timestamp"],
-            "side": side,
-            "price": price,
-            "size": size,
-            "fee": fee,
-            "position_after": new_position,
-        }
-
-        # Deduct fee from balance and accumulate
-        self.balance -= fee
-        self.total_fees += fee
-
-        # Update position and PnL
-        if side == "buy":
-            if self.position < 0:
-                # Closing short
-                close_size = min(size, abs(self.position))
-                pnl = close_size * (self.avg_cost - price)
-                self.gross_pnl += pnl
-                self.balance += pnl
-                fill["pnl"] = pnl
-            else:
-                fill["pnl"] = 0.0
-
-            # Update average cost
-            if new_position > 0:
-                if self.position > 0:
-                    total_cost = self.avg_cost * self.position + price * size
-                    self.avg_cost = total_cost / new_position
-                else:
-                    self.avg_cost = price
-        else:  # sell
-            if self.position > 0:
-                # Closing long
-                close_size = min(size, self.position)
-                pnl = close_size * (price - self.avg_cost)
-                self.gross_pnl += pnl
-                self.balance += pnl
-                fill["pnl"] = pnl
-            else:
-                fill["pnl"] = 0.0
-
-            # Update average cost
-            if new_position < 0:
-                if self.position < 0:
-                    total_cost = self.avg_cost * abs(self.position) + price * size
-                    self.avg_cost = total_cost / abs(new_position)
-                else:
-                    self.avg_cost = price
-
-        self.position = new_position
+        price = float(price)
+        size = float(size)
+        (
+            self.position,
+            self.avg_cost,
+            self.gross_pnl,
+            self.total_fees,
+            self.balance,
+            self.peak_balance,
+            fee,
+            pnl,
+        ) = _apply_fill(
+            self.position,
+            self.avg_cost,
+            self.gross_pnl,
+            self.total_fees,
+            self.balance,
+            self.peak_balance,
+            side,
+            price,
+            size,
+            self.fee_rate,
+        )
+
+        index = self._n_fills
+        if index == len(self._fill_buf):
+            self.reserve_fills(2 * index)
+        self._fill_buf[index] = (timestamp, side, price, size, fee, self.position, pnl)
+        self._n_fills = index + 1
+        return index
 
-        # Track peak balance for drawdown
-        self.peak_balance = max(self.peak_balance, self.balance)
-
-        self.fills.append(fill)
-        return fill
+    def submit_order(self, side: str, price: float, size: float, tick: dict) -> dict | None:
+        """Submit a simulated order. Returns fill dict or None if rejected."""
+        index = self.submit_order_values(
+            BUY if side == "buy" else SELL, price, size, tick["timestamp"]
+        )
+        if index < 0:
+            return None
+        return self.fills[index]
 
     def check_drawdown_halt(self, max_drawdown_pct: float = 0.05) -> bool:
         """Halt trading if drawdown exceeds threshold."""
@@ -155,60 +377,30 @@ class HFTBaseStrategy:
         """Convert fills to round-trip trades using FIFO position tracking.
 
         Handles consecutive same-side fills (accumulation) and partial closes
-        correctly for market-maker workloads.
+        correctly for market-maker workloads. Pairing runs in linear time
+        over :attr:`fill_array` (see ``_pair_fifo``).
         """
-        if not self.fills:
+        fills = self.fill_array
+        if not len(fills):
             return pd.DataFrame()
 
-        trades = []
-        # FIFO queue of open entries: [(timestamp, price, remaining_size, side)]
-        open_entries: list[list] = []
-
-        for fill in self.fills:
-            fill_side = fill["side"]
-            remaining = fill["size"]
-
-            # Determine if this fill closes existing entries
-            if open_entries and open_entries[0][3] != fill_side:
-                # Opposite side — close FIFO entries
-                while remaining > 0 and open_entries:
-                    entry = open_entries[0]
-                    close_size = min(remaining, entry[2])
-
-                    if entry[3] == "buy":
-                        pnl = (fill["price"] - entry[1]) * close_size
-                        pnl_pct = (fill["price"] / entry[1]) - 1
-                    else:
-                        pnl = (entry[1] - fill["price"]) * close_size
-                        pnl_pct = (entry[1] / fill["price"]) - 1
-
-                    entry_fee = entry[1] * close_size * self.fee_rate
-                    exit_fee = fill["price"] * close_size * self.fee_rate
-                    total_fee = entry_fee + exit_fee
-
-                    trades.append(
-                        {
-                            "entry_time": pd.Timestamp(entry[0], unit="ns", tz="UTC"),
-                            "exit_time": pd.Timestamp(fill["timestamp"], unit="ns", tz="UTC"),
-                            "side": entry[3],
-                            "entry_price": entry[1],
-                            "exit_price": fill["price"],
-                            "size": close_size,
-                            "pnl": pnl - total_fee,
-                            "pnl_pct": pnl_pct - (2 * self.fee_rate),
-                            "fee": total_fee,
-                        }
-                    )
-
-                    entry[2] -= close_size
-                    remaining -= close_size
-                    if entry[2] <= 1e-12:
-                        open_entries.pop(0)
-
-            # Any remaining size becomes a new open entry
-            if remaining > 1e-12:
-                open_entries.append([fill["timestamp"], fill["price"], remaining, fill_side])
-
-        if not trades:
+        entry_idx, exit_idx, size, pnl, pnl_pct, fee = _pair_fifo(
+            fills["side"], fills["price"], fills["size"], self.fee_rate
+        )
+        if not len(entry_idx):
             return pd.DataFrame()
-        return pd.DataFrame(trades)
+
+        timestamps = fills["timestamp"]
+        return pd.DataFrame(
+            {
+                "entry_time": pd.to_datetime(timestamps[entry_idx], unit="ns", utc=True),
+                "exit_time": pd.to_datetime(timestamps[exit_idx], unit="ns", utc=True),
+                "side": np.where(fills["side"][entry_idx] > 0, "buy", "sell"),
+                "entry_price": fills["price"][entry_idx],
+                "exit_price": fills["price"][exit_idx],
+                "size": size,
+                "pnl": pnl,
+                "pnl_pct": pnl_pct,
+                "fee": fee,
+            }
+        )
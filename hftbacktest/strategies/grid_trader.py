@@ -18,7 +18,7 @@ Parameters
 
 """
 
-from hftbacktest.strategies.base import HFTBaseStrategy
+from hftbacktest.strategies.base import BUY, SELL, HFTBaseStrategy
 
 
 class HFTGridTrader(HFTBaseStrategy):
@@ -49,12 +49,10 @@ class HFTGridTrader(HFTBaseStrategy):
             return self._reference_price * (1 - level * self.grid_spacing)
         return self._reference_price * (1 + level * self.grid_spacing)
 
-    def on_tick(self, tick: dict) -> None:
+    def on_tick_values(self, timestamp: int, price: float, volume: float, side: int) -> None:
         if self.check_drawdown_halt(self.drawdown_halt_pct):
             return
 
-        price = tick["price"]
-
         # Initialize grid on first tick
         if self._reference_price is None:
             self._reset_grid(price)
@@ -80,8 +78,8 @@ class HFTGridTrader(HFTBaseStrategy):
             if k not in self._buy_levels_filled:
                 level_price = self._grid_level_price(k, "buy")
                 if price <= level_price:
-                    fill = self.submit_order("buy", price, self.order_size, tick)
-                    if fill is not None:
+                    fill = self.submit_order_values(BUY, price, self.order_size, timestamp)
+                    if fill >= 0:
                         self._buy_levels_filled.add(k)
 
         # Check sell levels (price touching or crossing above a grid sell level)
@@ -89,6 +87,6 @@ class HFTGridTrader(HFTBaseStrategy):
             if k not in self._sell_levels_filled:
                 level_price = self._grid_level_price(k, "sell")
                 if price >= level_price:
-                    fill = self.submit_order("sell", price, self.order_size, tick)
-                    if fill is not None:
+                    fill = self.submit_order_values(SELL, price, self.order_size, timestamp)
+                    if fill >= 0:
                         self._sell_levels_filled.add(k)
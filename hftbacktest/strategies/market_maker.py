@@ -18,12 +18,10 @@ Parameters
 
 """
 
-
-from hftbacktest.strategies.base import HFTBaseStrategy
+from hftbacktest.strategies.base import BUY, SELL, HFTBaseStrategy
 
 
 class HFTMarketMaker(HFTBaseStrategy):
-
     name = "MarketMaker"
 
     def __init__(self, config: dict | None = None):
@@ -35,7 +33,7 @@ class HFTMarketMaker(HFTBaseStrategy):
         self._tick_count: int = 0
         self._quote_interval: int = self.config.get("quote_interval", 4)
 
-    def on_tick(self, tick: dict) -> None:
+    def on_tick_values(self, timestamp: int, price: float, volume: float, side: int) -> None:
         self._tick_count += 1
 
         # Check drawdown before quoting
@@ -46,7 +44,7 @@ class HFTMarketMaker(HFTBaseStrategy):
         if self._tick_count % self._quote_interval != 0:
             return
 
-        mid_price = tick["price"]
+        mid_price = price
 
         # Inventory skew: shift quotes away from the side we're overweight
         inventory_skew = self.position * self.skew_factor
@@ -56,17 +54,9 @@ class HFTMarketMaker(HFTBaseStrategy):
 
         # Submit passive quotes if within position limits
         # Buy side (bid)
-        if (
-            self.position < self.max_position
-            and tick["price"] <= bid_price
-            and tick["side"] == "sell"
-        ):
-            self.submit_order("buy", bid_price, self.order_size, tick)
+        if self.position < self.max_position and price <= bid_price and side == SELL:
+            self.submit_order_values(BUY, bid_price, self.order_size, timestamp)
 
         # Sell side (ask)
-        if (
-            self.position > -self.max_position
-            and tick["price"] >= ask_price
-            and tick["side"] == "buy"
-        ):
-            self.submit_order("sell", ask_price, self.order_size, tick)
+        if self.position > -self.max_position and price >= ask_price and side == BUY:
+            self.submit_order_values(SELL, ask_price, self.order_size, timestamp)
@@ -21,7 +21,7 @@ Parameters
 
 from collections import deque
 
-from hftbacktest.strategies.base import HFTBaseStrategy
+from hftbacktest.strategies.base import BUY, SELL, HFTBaseStrategy
 
 
 class HFTMeanReversionScalper(HFTBaseStrategy):
@@ -47,13 +47,10 @@ class HFTMeanReversionScalper(HFTBaseStrategy):
         total_v = sum(v for _, v in self._price_volume_window)
         self._vwap = total_pv / total_v if total_v > 0 else price
 
-    def on_tick(self, tick: dict) -> None:
+    def on_tick_values(self, timestamp: int, price: float, volume: float, side: int) -> None:
         if self.check_drawdown_halt(self.drawdown_halt_pct):
             return
 
-        price = tick["price"]
-        volume = tick["volume"]
-
         self._update_vwap(price, volume)
 
         # Need enough data before trading
@@ -66,20 +63,20 @@ class HFTMeanReversionScalper(HFTBaseStrategy):
 
         # Forced exit on max hold
         if self.position != 0 and self._hold_counter >= self.max_hold_ticks:
-            side = "sell" if self.position > 0 else "buy"
-            self.submit_order(side, price, abs(self.position), tick)
+            exit_side = SELL if self.position > 0 else BUY
+            self.submit_order_values(exit_side, price, abs(self.position), timestamp)
             self._hold_counter = 0
             return
 
         # VWAP crossover exit
         if self.position > 0 and price >= self._vwap:
             # Long position — price reverted to VWAP, exit
-            self.submit_order("sell", price, self.position, tick)
+            self.submit_order_values(SELL, price, self.position, timestamp)
             self._hold_counter = 0
             return
         if self.position < 0 and price <= self._vwap:
             # Short position — price reverted to VWAP, exit
-            self.submit_order("buy", price, abs(self.position), tick)
+            self.submit_order_values(BUY, price, abs(self.position), timestamp)
             self._hold_counter = 0
             return
 
@@ -88,8 +85,8 @@ class HFTMeanReversionScalper(HFTBaseStrategy):
             lower_band = self._vwap * (1 - self.deviation_threshold)
             upper_band = self._vwap * (1 + self.deviation_threshold)
             if price < lower_band:
-                self.submit_order("buy", price, self.order_size, tick)
+                self.submit_order_values(BUY, price, self.order_size, timestamp)
                 self._hold_counter = 0
             elif price > upper_band:
-                self.submit_order("sell", price, self.order_size, tick)
+                self.submit_order_values(SELL, price, self.order_size, timestamp)
                 self._hold_counter = 0
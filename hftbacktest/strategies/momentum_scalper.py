@@ -21,7 +21,7 @@ Parameters
 
 """
 
-from hftbacktest.strategies.base import HFTBaseStrategy
+from hftbacktest.strategies.base import BUY, SELL, HFTBaseStrategy
 
 
 class HFTMomentumScalper(HFTBaseStrategy):
@@ -43,11 +43,10 @@ class HFTMomentumScalper(HFTBaseStrategy):
         self._hold_counter: int = 0
         self._tick_count: int = 0
 
-    def on_tick(self, tick: dict) -> None:
+    def on_tick_values(self, timestamp: int, price: float, volume: float, side: int) -> None:
         if self.check_drawdown_halt(self.drawdown_halt_pct):
             return
 
-        price = tick["price"]
         self._tick_count += 1
 
         # Need at least one previous price to compute delta
@@ -66,8 +65,8 @@ class HFTMomentumScalper(HFTBaseStrategy):
 
         # Forced exit on max hold
         if self.position != 0 and self._hold_counter >= self.max_hold_ticks:
-            side = "sell" if self.position > 0 else "buy"
-            self.submit_order(side, price, abs(self.position), tick)
+            exit_side = SELL if self.position > 0 else BUY
+            self.submit_order_values(exit_side, price, abs(self.position), timestamp)
             self._hold_counter = 0
             return
 
@@ -75,17 +74,17 @@ class HFTMomentumScalper(HFTBaseStrategy):
         if self.position == 0:
             # No position — look for entry
             if self._ema_momentum > self.entry_threshold:
-                self.submit_order("buy", price, self.order_size, tick)
+                self.submit_order_values(BUY, price, self.order_size, timestamp)
                 self._hold_counter = 0
             elif self._ema_momentum < -self.entry_threshold:
-                self.submit_order("sell", price, self.order_size, tick)
+                self.submit_order_values(SELL, price, self.order_size, timestamp)
                 self._hold_counter = 0
         elif self.position > 0:
             # Long — exit on negative momentum
             if self._ema_momentum < -self.exit_threshold:
-                self.submit_order("sell", price, self.position, tick)
+                self.submit_order_values(SELL, price, self.position, timestamp)
                 self._hold_counter = 0
         # Short — exit on positive momentum
         elif self._ema_momentum > self.exit_threshold:
-            self.submit_order("buy", price, abs(self.position), tick)
+            self.submit_order_values(BUY, price, abs(self.position), timestamp)
             self._hold_counter = 0
@@ -13,6 +13,7 @@ Usage:
 import logging
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
 logger = logging.getLogger(__name__)
@@ -37,6 +38,11 @@ try:
 except ImportError:  # pragma: no cover
     HAS_NAUTILUS_TRADER = False
 
+try:
+    from nautilus_trader.model.objects import FIXED_PRECISION
+except ImportError:  # pragma: no cover
+    FIXED_PRECISION = 9
+
 
 CONFIG_PATH = Path(__file__).resolve().parent.parent / "configs" / "platform_config.yaml"
 
@@ -300,32 +306,49 @@ def build_bar_type(
     )
 
 
+def _fixed_point_raw(values: pd.Series, precision: int) -> list[int]:
+    """Scale values to Nautilus raw fixed-point integers at ``precision`` decimals."""
+    units = np.round(values.to_numpy(dtype=np.float64) * 10.0**precision).astype(np.int64)
+    scale = 10 ** (FIXED_PRECISION - precision)
+    return [int(unit) * scale for unit in units]
+
+
 def convert_df_to_bars(
     df: pd.DataFrame,
     bar_type: "BarType",
     price_precision: int = 2,
     size_precision: int = 6,
 ) -> list["Bar"]:
-    """Convert a pandas OHLCV DataFrame to a list of NautilusTrader Bar objects."""
+    """Convert a pandas OHLCV DataFrame to a list of NautilusTrader Bar objects.
+
+    Prices and sizes are rounded to the instrument precision in bulk and
+    passed as raw fixed-point values, so no per-value string formatting or
+    parsing is involved.
+    """
     if not HAS_NAUTILUS_TRADER:
         raise ImportError("nautilus_trader is not installed")
 
-    pfmt = f".{price_precision}f"
-    sfmt = f".{size_precision}f"
-    bars = []
-    for ts, row in df.iterrows():
-        ts_ns = int(ts.value)  # nanoseconds since epoch
-        bar = Bar(
+    opens, highs, lows, closes = (
+        _fixed_point_raw(df[col], price_precision) for col in ("open", "high", "low", "close")
+    )
+    volumes = _fixed_point_raw(df["volume"], size_precision)
+    timestamps = df.index.as_unit("ns").asi8.tolist()  # nanoseconds since epoch
+
+    bars = [
+        Bar(
             bar_type=bar_type,
-            open=Price.from_str(f"{row['open']:{pfmt}}"),
-            high=Price.from_str(f"{row['high']:{pfmt}}"),
-            low=Price.from_str(f"{row['low']:{pfmt}}"),
-            close=Price.from_str(f"{row['close']:{pfmt}}"),
-            volume=Quantity.from_str(f"{row['volume']:{sfmt}}"),
+            open=Price.from_raw(o, price_precision),
+            high=Price.from_raw(h, price_precision),
+            low=Price.from_raw(lo, price_precision),
+            close=Price.from_raw(c, price_precision),
+            volume=Quantity.from_raw(v, size_precision),
             ts_event=ts_ns,
             ts_init=ts_ns,
         )
-        bars.append(bar)
+        for ts_ns, o, h, lo, c, v in zip(
+            timestamps, opens, highs, lows, closes, volumes, strict=True
+        )
+    ]
 
     logger.info(f"Converted {len(bars)} bars for {bar_type}")
     return bars
@@ -20,7 +20,11 @@ Handles:
 
 import json
 import logging
+import multiprocessing
+import os
 import sys
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import numpy as np
@@ -75,6 +79,8 @@ def convert_ohlcv_to_nautilus_csv(
 ) -> Path:
     """Convert shared Parquet OHLCV data into Nautilus-compatible CSV bars.
     NautilusTrader can ingest CSV data via its data catalog or wranglers.
+    Prefer :func:`convert_ohlcv_to_nautilus_catalog`, which stores typed
+    fixed-point columns and skips unchanged sources.
     """
     from common.data_pipeline.pipeline import load_ohlcv
 
@@ -105,6 +111,114 @@ def convert_ohlcv_to_nautilus_csv(
     return output_path
 
 
+OHLCV_COLUMNS = ["open", "high", "low", "close", "volume"]
+
+# Decimal places of the catalog's fixed-point price and volume columns
+CATALOG_PRECISION = 8
+
+
+def _catalog_path(symbol: str, timeframe: str, exchange: str) -> Path:
+    return CATALOG_DIR / f"{symbol.replace('/', '')}_{exchange.upper()}_{timeframe}_bars.arrow"
+
+
+def convert_ohlcv_to_nautilus_catalog(
+    symbol: str = "BTC/USDT",
+    timeframe: str = "1h",
+    exchange: str = "kraken",
+    directory: Path | None = None,
+) -> Path | None:
+    """Export shared Parquet OHLCV as a typed Arrow IPC bar catalog.
+
+    Prices and volumes are stored as int64 fixed-point values with
+    ``CATALOG_PRECISION`` decimals next to int64 ``ts_event``/``ts_init``
+    nanoseconds, so loading needs no text parsing. The file records the
+    source Parquet's modification time and row count; when both still
+    match, the existing catalog is returned without converting again.
+
+    Returns:
+        Path to the catalog, or None when there is no source data.
+
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    from common.data_pipeline.pipeline import PROCESSED_DIR, _parquet_path
+
+    source = _parquet_path(symbol, timeframe, exchange, directory or PROCESSED_DIR)
+    if not source.exists():
+        logger.error(f"No data for {symbol} {timeframe}")
+        return None
+
+    stamp = {
+        "source_mtime_ns": str(source.stat().st_mtime_ns),
+        "source_rows": str(pq.ParquetFile(source).metadata.num_rows),
+        "precision": str(CATALOG_PRECISION),
+    }
+    output_path = _catalog_path(symbol, timeframe, exchange)
+    if output_path.exists():
+        with pa.memory_map(str(output_path)) as f:
+            metadata = pa.ipc.open_file(f).schema.metadata or {}
+        if all(metadata.get(k.encode()) == v.encode() for k, v in stamp.items()):
+            logger.debug(f"Bar catalog up to date: {output_path}")
+            return output_path
+
+    df = pd.read_parquet(source)
+    if df.empty:
+        logger.error(f"No data for {symbol} {timeframe}")
+        return None
+
+    scale = 10.0**CATALOG_PRECISION
+    ts_ns = df.index.as_unit("ns").asi8
+    columns = {"ts_event": ts_ns, "ts_init": ts_ns}
+    for col in OHLCV_COLUMNS:
+        columns[col] = np.round(df[col].to_numpy(dtype=np.float64) * scale).astype(np.int64)
+
+    bar_type = (
+        f"{symbol.replace('/', '')}.{exchange.upper()}-{_tf_to_nautilus(timeframe)}-LAST-EXTERNAL"
+    )
+    table = pa.table(columns).replace_schema_metadata({**stamp, "bar_type": bar_type})
+
+    # Write then rename so concurrent readers never see a partial file
+    tmp_path = output_path.with_suffix(f".{os.getpid()}.tmp")
+    with pa.OSFile(str(tmp_path), "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+    os.replace(tmp_path, output_path)
+    logger.info(f"Wrote {len(df)} bars to catalog {output_path}")
+    return output_path
+
+
+def load_nautilus_catalog(
+    symbol: str = "BTC/USDT",
+    timeframe: str = "1h",
+    exchange: str = "kraken",
+    directory: Path | None = None,
+) -> pd.DataFrame:
+    """Load OHLCV bars from the binary catalog, (re)building it if stale.
+
+    The catalog is memory-mapped and its fixed-point columns are scaled
+    back to floats with vectorized arithmetic.
+
+    Returns:
+        OHLCV DataFrame indexed by UTC timestamp; empty when no data.
+
+    """
+    import pyarrow as pa
+
+    path = convert_ohlcv_to_nautilus_catalog(symbol, timeframe, exchange, directory)
+    if path is None:
+        return pd.DataFrame()
+
+    with pa.memory_map(str(path)) as f:
+        table = pa.ipc.open_file(f).read_all()
+    precision = int(table.schema.metadata[b"precision"])
+    scale = 10.0**-precision
+    index = pd.to_datetime(table.column("ts_event").to_numpy(), unit="ns", utc=True)
+    return pd.DataFrame(
+        {col: table.column(col).to_numpy() * scale for col in OHLCV_COLUMNS},
+        index=pd.DatetimeIndex(index, name="timestamp"),
+    )
+
+
 def _tf_to_nautilus(timeframe: str) -> str:
     """Convert common timeframe strings to Nautilus bar aggregation format."""
     mapping = {
@@ -132,6 +246,8 @@ def run_nautilus_backtest(
     exchange: str = "kraken",
     initial_balance: float = 10000.0,
     asset_class: str = "crypto",
+    df: pd.DataFrame | None = None,
+    bar_cache: dict | None = None,
 ) -> dict:
     """Run a backtest using one of the registered Nautilus strategies.
 
@@ -140,6 +256,10 @@ def run_nautilus_backtest(
 
     Both modes use identical entry/exit signal logic from the strategy
     registry. The native mode provides more accurate fill simulation.
+
+    ``df`` skips loading when the caller already holds the symbol's OHLCV,
+    and ``bar_cache`` (one dict per symbol) lets several strategies on the
+    same symbol reuse one bar conversion.
     """
     from common.data_pipeline.pipeline import load_ohlcv
     from nautilus.strategies import STRATEGY_REGISTRY
@@ -150,7 +270,8 @@ def run_nautilus_backtest(
 
     # Load data — route to correct source by asset class
     source = "yfinance" if asset_class in ("equity", "forex") else exchange
-    df = load_ohlcv(symbol, timeframe, source)
+    if df is None:
+        df = load_ohlcv(symbol, timeframe, source)
     if df.empty:
         return {"error": f"No data for {symbol} {timeframe} on {source}"}
 
@@ -164,6 +285,7 @@ def run_nautilus_backtest(
             timeframe,
             exchange,
             initial_balance,
+            bar_cache=bar_cache,
         )
         if result is not None:
             return result
@@ -177,7 +299,158 @@ def run_nautilus_backtest(
         timeframe,
         exchange,
         initial_balance,
+        bar_cache=bar_cache,
+    )
+
+
+# ──────────────────────────────────────────────
+# Batch Backtests
+# ──────────────────────────────────────────────
+
+# Symbols whose converted bars a batch worker process keeps for reuse
+BATCH_BAR_CACHE_SIZE = 4
+
+# Per-process batch state: shared frame name -> (OHLCV view, bar cache)
+_batch_symbols: OrderedDict[str, tuple[pd.DataFrame, dict]] = OrderedDict()
+
+
+def prepare_backtest_batch(
+    strategies: list[str],
+    symbols: list[str],
+    timeframe: str = "1h",
+    exchange: str = "kraken",
+    initial_balance: float = 10000.0,
+    asset_class: str = "crypto",
+) -> tuple[list[dict], list]:
+    """Load every symbol once and build one task per symbol x strategy.
+
+    Each symbol's OHLCV is read from Parquet once and published in shared
+    memory; the tasks only carry the segment's spec, so workers attach to
+    it instead of reloading or unpickling the data per strategy.
+
+    Returns:
+        ``(tasks, frames)``. The caller must ``close()`` every frame once
+        the tasks have finished.
+
+    """
+    from common.data_pipeline.pipeline import load_ohlcv
+    from common.data_pipeline.shared_frame import SharedFrame
+
+    source = "yfinance" if asset_class in ("equity", "forex") else exchange
+    tasks, frames = [], []
+    for symbol in symbols:
+        df = load_ohlcv(symbol, timeframe, source)
+        spec = None
+        if not df.empty:
+            frame = SharedFrame(df[OHLCV_COLUMNS])
+            frames.append(frame)
+            spec = frame.spec
+        for strategy in strategies:
+            tasks.append(
+                {
+                    "strategy_name": strategy,
+                    "symbol": symbol,
+                    "timeframe": timeframe,
+                    "exchange": exchange,
+                    "initial_balance": initial_balance,
+                    "asset_class": asset_class,
+                    "frame": spec,
+                }
+            )
+    return tasks, frames
+
+
+def _batch_symbol(spec) -> tuple[pd.DataFrame, dict]:
+    """Attach a batch symbol's shared frame, keeping recent bar caches."""
+    from common.data_pipeline.shared_frame import attach_frame
+
+    entry = _batch_symbols.get(spec.name)
+    if entry is None:
+        entry = _batch_symbols[spec.name] = (attach_frame(spec), {})
+        while len(_batch_symbols) > BATCH_BAR_CACHE_SIZE:
+            _batch_symbols.popitem(last=False)
+    else:
+        _batch_symbols.move_to_end(spec.name)
+    return entry
+
+
+def backtest_task(task: dict) -> dict:
+    """Worker pool entry point: run one strategy x symbol backtest.
+
+    ``task`` holds the :func:`run_nautilus_backtest` arguments, plus the
+    symbol's shared ``frame`` spec when built by
+    :func:`prepare_backtest_batch` (``None`` when the symbol had no data).
+    Returns a batch entry with ``strategy``, ``symbol``, ``status`` and
+    ``result`` or ``error``; exceptions are caught and reported in the entry.
+    """
+    task = dict(task)
+    strategy, symbol = task["strategy_name"], task["symbol"]
+    try:
+        if "frame" in task:
+            spec = task.pop("frame")
+            if spec is None:
+                task["df"] = pd.DataFrame()
+            else:
+                task["df"], task["bar_cache"] = _batch_symbol(spec)
+        result = run_nautilus_backtest(**task)
+        return {"strategy": strategy, "symbol": symbol, "status": "completed", "result": result}
+    except Exception as e:
+        logger.warning(f"Backtest failed {strategy}/{symbol}: {e}")
+        return {"strategy": strategy, "symbol": symbol, "status": "error", "error": str(e)}
+
+
+def run_nautilus_backtest_batch(
+    strategies: list[str],
+    symbols: list[str],
+    timeframe: str = "1h",
+    exchange: str = "kraken",
+    initial_balance: float = 10000.0,
+    asset_class: str = "crypto",
+    max_workers: int | None = None,
+) -> list[dict]:
+    """Backtest every strategy on every symbol in parallel worker processes.
+
+    Args:
+        strategies: Registered strategy names.
+        symbols: Symbols to backtest.
+        timeframe: Candle timeframe.
+        exchange: Exchange to load data from (ignored for equity/forex).
+        initial_balance: Starting balance for each backtest.
+        asset_class: "crypto", "equity", or "forex".
+        max_workers: Worker processes; defaults to one per CPU. ``1`` runs
+            in-process.
+
+    Returns:
+        One :func:`backtest_task` entry per symbol x strategy, grouped by
+        symbol in input order.
+
+    """
+    tasks, frames = prepare_backtest_batch(
+        strategies,
+        symbols,
+        timeframe,
+        exchange,
+        initial_balance,
+        asset_class,
     )
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = max(1, min(max_workers, len(tasks)))
+    logger.info(
+        f"Batch backtest: {len(strategies)} strategies x {len(symbols)} symbols "
+        f"on {max_workers} worker(s)",
+    )
+    try:
+        if max_workers == 1:
+            return [backtest_task(task) for task in tasks]
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as pool:
+            return list(pool.map(backtest_task, tasks))
+    finally:
+        for frame in frames:
+            frame.close()
 
 
 def _run_native_backtest(
@@ -187,6 +460,7 @@ def _run_native_backtest(
     timeframe: str,
     exchange: str,
     initial_balance: float,
+    bar_cache: dict | None = None,
 ) -> dict | None:
     """Run backtest using real NautilusTrader BacktestEngine.
 
@@ -229,13 +503,18 @@ def _run_native_backtest(
         instrument_id = instrument.id
         bar_type = build_bar_type(instrument_id, timeframe)
 
-        # Convert data and add to engine
-        bars = convert_df_to_bars(
-            df,
-            bar_type,
-            price_precision=instrument.price_precision,
-            size_precision=instrument.size_precision,
-        )
+        # Convert data (once per symbol when batching) and add to engine
+        cache_key = (str(bar_type), instrument.price_precision, instrument.size_precision)
+        bars = (bar_cache or {}).get(cache_key)
+        if bars is None:
+            bars = convert_df_to_bars(
+                df,
+                bar_type,
+                price_precision=instrument.price_precision,
+                size_precision=instrument.size_precision,
+            )
+            if bar_cache is not None:
+                bar_cache[cache_key] = bars
         engine.add_data(bars)
 
         # Create and add native strategy
@@ -287,6 +566,7 @@ def _run_pandas_backtest(
     timeframe: str,
     exchange: str,
     initial_balance: float,
+    bar_cache: dict | None = None,
 ) -> dict:
     """Run backtest using pandas-based simulation (fallback mode)."""
     from nautilus.strategies import STRATEGY_REGISTRY
@@ -313,16 +593,13 @@ def _run_pandas_backtest(
     strategy_cls = STRATEGY_REGISTRY[strategy_name]
     strategy = strategy_cls(config=config)
 
-    # Feed bars
-    for ts, row in df.iterrows():
-        bar = {
-            "timestamp": ts,
-            "open": float(row["open"]),
-            "high": float(row["high"]),
-            "low": float(row["low"]),
-            "close": float(row["close"]),
-            "volume": float(row["volume"]),
-        }
+    # Feed bars (converted once per symbol when batching)
+    bars = (bar_cache or {}).get("bar_dicts")
+    if bars is None:
+        bars = _df_to_bar_dicts(df)
+        if bar_cache is not None:
+            bar_cache["bar_dicts"] = bars
+    for bar in bars:
         strategy.on_bar(bar)
 
     # Flatten any remaining position
@@ -349,6 +626,15 @@ def _run_pandas_backtest(
     return result
 
 
+def _df_to_bar_dicts(df: pd.DataFrame) -> list[dict]:
+    """Convert OHLCV rows to the bar dicts the pandas strategies consume."""
+    columns = [df[col].to_numpy(dtype=np.float64).tolist() for col in OHLCV_COLUMNS]
+    return [
+        {"timestamp": ts, "open": o, "high": h, "low": lo, "close": c, "volume": v}
+        for ts, o, h, lo, c, v in zip(df.index, *columns, strict=True)
+    ]
+
+
 def _save_result(result: dict, strategy_name: str, symbol: str, timeframe: str) -> None:
     """Save backtest result to JSON in the results directory."""
     safe_symbol = symbol.replace("/", "")
@@ -389,7 +675,7 @@ if __name__ == "__main__":  # pragma: no cover
     sub = parser.add_subparsers(dest="command")
 
     # Convert data
-    conv = sub.add_parser("convert", help="Convert Parquet data to Nautilus CSV")
+    conv = sub.add_parser("convert", help="Convert Parquet data to the Nautilus bar catalog")
     conv.add_argument("--symbol", default="BTC/USDT")
     conv.add_argument("--timeframe", default="1h")
     conv.add_argument("--exchange", default="kraken")
@@ -411,13 +697,23 @@ if __name__ == "__main__":  # pragma: no cover
         help="Asset class (determines data source and strategy subset)",
     )
 
+    # Batch backtest
+    batch = sub.add_parser("batch", help="Backtest strategies x symbols in parallel")
+    batch.add_argument("--strategies", nargs="+", required=True)
+    batch.add_argument("--symbols", nargs="+", required=True)
+    batch.add_argument("--timeframe", default="1h")
+    batch.add_argument("--exchange", default="kraken")
+    batch.add_argument("--balance", type=float, default=10000.0)
+    batch.add_argument("--asset-class", choices=["crypto", "equity", "forex"], default="crypto")
+    batch.add_argument("--workers", type=int, default=None, help="Worker processes")
+
     # List strategies
     sub.add_parser("list-strategies", help="List registered strategies")
 
     args = parser.parse_args()
 
     if args.command == "convert":
-        convert_ohlcv_to_nautilus_csv(args.symbol, args.timeframe, args.exchange)
+        convert_ohlcv_to_nautilus_catalog(args.symbol, args.timeframe, args.exchange)
     elif args.command == "test":
         success = run_nautilus_engine_test()
         if success:
@@ -434,6 +730,18 @@ if __name__ == "__main__":  # pragma: no cover
             asset_class=args.asset_class,
         )
         print(json.dumps(result, indent=2, default=str))
+    elif args.command == "batch":
+        entries = run_nautilus_backtest_batch(
+            args.strategies,
+            args.symbols,
+            args.timeframe,
+            args.exchange,
+            args.balance,
+            asset_class=args.asset_class,
+            max_workers=args.workers,
+        )
+        for entry in entries:
+            print(f"{entry['strategy']} {entry['symbol']}: {entry['status']}")
     elif args.command == "list-strategies":
         for name in list_nautilus_strategies():
             engine_tag = " [native+pandas]" if HAS_NAUTILUS_TRADER else " [pandas]"
@@ -4,23 +4,34 @@ Runs inside the NautilusTrader Docker container. The Django backend calls
 this service to run backtests without needing nautilus_trader installed
 in the main backend image.
 
+Backtests run as background jobs in a bounded process pool, so a long
+batch never blocks ``/health`` or other requests. POST endpoints return
+202 with a job id; poll ``/jobs/{id}`` or stream ``/jobs/{id}/events``
+(server-sent events, one ``result`` event per strategy x symbol). Send
+``"wait": true`` to get the finished result in the response instead.
+
 Endpoints:
     GET  /health              — Liveness/readiness probe
     GET  /strategies          — List registered strategies
     POST /backtest            — Run a single backtest
     POST /backtest/batch      — Run backtests across strategies x symbols
+    GET  /jobs/{id}           — Job status, progress and results so far
+    GET  /jobs/{id}/events    — Job progress as server-sent events
 """
 
-import json
+import asyncio
 import logging
-import traceback
+import os
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 
 from starlette.applications import Starlette
 from starlette.requests import Request
-from starlette.responses import JSONResponse
+from starlette.responses import JSONResponse, StreamingResponse
 from starlette.routing import Route
 
+from common.jobs import Job, JobManager, JobQueueFullError
+
 logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s %(message)s")
 logger = logging.getLogger("nautilus.worker")
 
@@ -34,6 +45,19 @@ except ImportError:
     HAS_NATIVE = False
     NT_VERSION = "not installed"
 
+# Process pool size for backtest jobs (0 = one worker per CPU)
+BACKTEST_MAX_WORKERS = int(os.environ.get("BACKTEST_MAX_WORKERS", "0")) or None
+# Backtests queued or running across all jobs before new jobs get a 429
+BACKTEST_MAX_QUEUE = int(os.environ.get("BACKTEST_MAX_QUEUE", "512"))
+# Backtests a pool process runs before it is replaced (releases attached bar data)
+BACKTEST_TASKS_PER_CHILD = int(os.environ.get("BACKTEST_TASKS_PER_CHILD", "32"))
+
+jobs = JobManager(
+    max_workers=BACKTEST_MAX_WORKERS,
+    max_queue=BACKTEST_MAX_QUEUE,
+    max_tasks_per_child=BACKTEST_TASKS_PER_CHILD,
+)
+
 
 async def health(request: Request) -> JSONResponse:
     """Liveness probe."""
@@ -42,6 +66,7 @@ async def health(request: Request) -> JSONResponse:
         "service": "nautilus-worker",
         "native_engine": HAS_NATIVE,
         "nautilus_version": NT_VERSION,
+        "jobs": jobs.stats(),
         "timestamp": datetime.now(timezone.utc).isoformat(),
     })
 
@@ -54,6 +79,39 @@ async def list_strategies(request: Request) -> JSONResponse:
     return JSONResponse({"strategies": strategies, "count": len(strategies)})
 
 
+def _backtest_task_error(task: dict, exc: BaseException) -> dict:
+    return {
+        "strategy": task["strategy_name"], "symbol": task["symbol"],
+        "status": "error", "error": str(exc),
+    }
+
+
+def _submit(kind: str, tasks: list[dict], meta: dict, frames: list = ()) -> Job | JSONResponse:
+    from nautilus.nautilus_runner import backtest_task
+
+    def release_frames(job: Job | None) -> None:
+        for frame in frames:
+            frame.close()
+
+    try:
+        return jobs.submit(
+            kind, backtest_task, tasks, meta,
+            on_error=_backtest_task_error, on_done=release_frames,
+        )
+    except JobQueueFullError as e:
+        release_frames(None)
+        return JSONResponse({"status": "error", "error": str(e)}, status_code=429)
+
+
+def _accepted(job: Job) -> JSONResponse:
+    return JSONResponse({
+        "job_id": job.id,
+        "status": job.status,
+        "status_url": f"/jobs/{job.id}",
+        "events_url": f"/jobs/{job.id}/events",
+    }, status_code=202)
+
+
 async def run_backtest(request: Request) -> JSONResponse:
     """Run a single NautilusTrader backtest.
 
@@ -64,6 +122,7 @@ async def run_backtest(request: Request) -> JSONResponse:
         exchange: str           — Exchange (default: "kraken")
         initial_balance: float  — Starting balance (default: 10000.0)
         asset_class: str        — "crypto", "equity", or "forex"
+        wait: bool              — Return the finished result instead of a job id
     """
     try:
         body = await request.json()
@@ -74,24 +133,36 @@ async def run_backtest(request: Request) -> JSONResponse:
     if not strategy:
         return JSONResponse({"error": "strategy is required"}, status_code=400)
 
-    try:
-        from nautilus.nautilus_runner import run_nautilus_backtest
-
-        result = run_nautilus_backtest(
-            strategy_name=strategy,
-            symbol=body.get("symbol", "BTC/USDT"),
-            timeframe=body.get("timeframe", "1h"),
-            exchange=body.get("exchange", "kraken"),
-            initial_balance=body.get("initial_balance", 10000.0),
-            asset_class=body.get("asset_class", "crypto"),
-        )
-        return JSONResponse({"status": "completed", "result": result})
-    except Exception as e:
-        logger.error("Backtest failed: %s\n%s", e, traceback.format_exc())
+    task = {
+        "strategy_name": strategy,
+        "symbol": body.get("symbol", "BTC/USDT"),
+        "timeframe": body.get("timeframe", "1h"),
+        "exchange": body.get("exchange", "kraken"),
+        "initial_balance": body.get("initial_balance", 10000.0),
+        "asset_class": body.get("asset_class", "crypto"),
+    }
+    job = _submit("backtest", [task], {"strategy": strategy, "symbol": task["symbol"]})
+    if isinstance(job, JSONResponse):
+        return job
+    if not body.get("wait"):
+        return _accepted(job)
+
+    await jobs.wait(job)
+    [entry] = job.finished_results
+    if entry["status"] == "error":
+        logger.error("Backtest failed: %s", entry["error"])
         return JSONResponse(
-            {"status": "error", "error": str(e)},
+            {"status": "error", "error": entry["error"]},
             status_code=500,
         )
+    return JSONResponse({"status": "completed", "result": entry["result"]})
+
+
+def _batch_summary(results: list[dict]) -> dict:
+    return {
+        "total_backtests": len(results),
+        "completed": sum(1 for r in results if r["status"] == "completed"),
+    }
 
 
 async def run_backtest_batch(request: Request) -> JSONResponse:
@@ -104,6 +175,7 @@ async def run_backtest_batch(request: Request) -> JSONResponse:
         timeframe: str          — Timeframe (default: "1h")
         exchange: str           — Exchange (default: "kraken")
         initial_balance: float  — Starting balance (default: 10000.0)
+        wait: bool              — Return the finished results instead of a job id
     """
     try:
         body = await request.json()
@@ -132,54 +204,80 @@ async def run_backtest_batch(request: Request) -> JSONResponse:
             with open("/project/configs/platform_config.yaml") as f:
                 config = yaml.safe_load(f)
             watchlist_key = {"crypto": "watchlist", "equity": "equity_watchlist", "forex": "forex_watchlist"}
-            symbols = config.get("data", {}).get(watchlist_key.get(asset_class, "watchlist"), [])[:5]
+            symbols = config.get("data", {}).get(watchlist_key.get(asset_class, "watchlist"), [])
         except Exception:
             symbols = ["BTC/USDT"] if asset_class == "crypto" else ["AAPL/USD"]
 
-    from nautilus.nautilus_runner import list_nautilus_strategies, run_nautilus_backtest
+    from nautilus.nautilus_runner import list_nautilus_strategies, prepare_backtest_batch
 
     available = list_nautilus_strategies()
     strategies = [s for s in strategies if s in available]
 
-    results = []
-    for strategy in strategies:
-        for symbol in symbols:
-            try:
-                result = run_nautilus_backtest(
-                    strategy, symbol, timeframe, exchange, initial_balance,
-                    asset_class=asset_class,
-                )
-                results.append({
-                    "strategy": strategy, "symbol": symbol,
-                    "status": "completed", "result": result,
-                })
-            except Exception as e:
-                logger.warning("Backtest failed %s/%s: %s", strategy, symbol, e)
-                results.append({
-                    "strategy": strategy, "symbol": symbol,
-                    "status": "error", "error": str(e),
-                })
-
-    completed = sum(1 for r in results if r["status"] == "completed")
-    return JSONResponse({
-        "status": "completed",
+    # Each symbol is loaded once into shared memory for all its strategies
+    tasks, frames = await asyncio.to_thread(
+        prepare_backtest_batch,
+        strategies, symbols, timeframe, exchange, initial_balance, asset_class,
+    )
+    meta = {
         "framework": "nautilus",
         "asset_class": asset_class,
         "native_engine": HAS_NATIVE,
         "strategies_run": len(strategies),
         "symbols_tested": len(symbols),
-        "total_backtests": len(results),
-        "completed": completed,
+    }
+    job = _submit("backtest_batch", tasks, meta, frames)
+    if isinstance(job, JSONResponse):
+        return job
+    if not body.get("wait"):
+        return _accepted(job)
+
+    await jobs.wait(job)
+    results = job.finished_results
+    return JSONResponse({
+        "status": "completed",
+        **meta,
+        **_batch_summary(results),
         "results": results,
     })
 
 
+async def get_job(request: Request) -> JSONResponse:
+    """Job status, progress and the results of finished backtests."""
+    job = jobs.get(request.path_params["job_id"])
+    if job is None:
+        return JSONResponse({"error": "job not found"}, status_code=404)
+    data = job.to_dict()
+    if job.kind == "backtest_batch":
+        data.update(_batch_summary(data["results"]))
+    return JSONResponse(data)
+
+
+async def job_events(request: Request) -> StreamingResponse | JSONResponse:
+    """Stream a job's per-backtest results as server-sent events."""
+    job = jobs.get(request.path_params["job_id"])
+    if job is None:
+        return JSONResponse({"error": "job not found"}, status_code=404)
+    return StreamingResponse(
+        jobs.event_stream(job),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
+    )
+
+
+@asynccontextmanager
+async def lifespan(app: Starlette):
+    yield
+    jobs.shutdown()
+
+
 routes = [
     Route("/health", health),
     Route("/strategies", list_strategies),
     Route("/backtest", run_backtest, methods=["POST"]),
     Route("/backtest/batch", run_backtest_batch, methods=["POST"]),
+    Route("/jobs/{job_id}", get_job),
+    Route("/jobs/{job_id}/events", job_events),
 ]
 
-app = Starlette(routes=routes)
+app = Starlette(routes=routes, lifespan=lifespan)
 """ASGI app — run with: uvicorn nautilus.worker:app --host 0.0.0.0 --port 4090"""
@@ -1,3 +1,3 @@
-from research.scripts.vbt_screener import run_full_screen
+from research.scripts.vbt_screener import run_batch_screen, run_full_screen
 
-__all__ = ["run_full_screen"]
+__all__ = ["run_batch_screen", "run_full_screen"]
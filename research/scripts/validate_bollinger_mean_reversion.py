@@ -39,6 +39,7 @@ if str(SCRIPTS_DIR) not in sys.path:  # pragma: no cover
 
 from validation_engine import (  # noqa: E402
     DEFAULT_FEES,
+    cached_indicator,
     generate_synthetic_ohlcv,
     run_validation,
     save_report,
@@ -78,10 +79,13 @@ def bollinger_mr_signals(
     close = df["close"]
     volume = df["volume"]
 
-    bb = bollinger_bands(close, int(params["bb_period"]), float(params["bb_std"]))
-    rsi_14 = rsi(close, 14)
-    adx_14 = adx(df, 14)
-    volume_sma = sma(volume, 20)
+    bb_period, bb_std = int(params["bb_period"]), float(params["bb_std"])
+    bb = cached_indicator(
+        df, ("bb", bb_period, bb_std), lambda: bollinger_bands(close, bb_period, bb_std)
+    )
+    rsi_14 = cached_indicator(df, ("rsi", 14), lambda: rsi(close, 14))
+    adx_14 = cached_indicator(df, ("adx", 14), lambda: adx(df, 14))
+    volume_sma = cached_indicator(df, ("volume_sma", 20), lambda: sma(volume, 20))
     volume_ratio = volume / volume_sma
 
     # Entry: all conditions must be true
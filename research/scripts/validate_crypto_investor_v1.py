@@ -39,6 +39,7 @@ if str(SCRIPTS_DIR) not in sys.path:  # pragma: no cover
 
 from validation_engine import (  # noqa: E402
     DEFAULT_FEES,
+    cached_indicator,
     generate_synthetic_ohlcv,
     run_validation,
     save_report,
@@ -82,13 +83,14 @@ def crypto_investor_v1_signals(
     close = df["close"]
     volume = df["volume"]
 
-    ema_fast_val = ema(close, int(params["ema_fast"]))
-    ema_slow_val = ema(close, int(params["ema_slow"]))
-    rsi_14 = rsi(close, 14)
-    macd_data = macd(close)
+    ema_fast, ema_slow = int(params["ema_fast"]), int(params["ema_slow"])
+    ema_fast_val = cached_indicator(df, ("ema", ema_fast), lambda: ema(close, ema_fast))
+    ema_slow_val = cached_indicator(df, ("ema", ema_slow), lambda: ema(close, ema_slow))
+    rsi_14 = cached_indicator(df, ("rsi", 14), lambda: rsi(close, 14))
+    macd_data = cached_indicator(df, ("macd",), lambda: macd(close))
     macd_hist = macd_data["macd_hist"]
-    bb = bollinger_bands(close, 20, 2.0)
-    volume_sma = sma(volume, 20)
+    bb = cached_indicator(df, ("bb", 20, 2.0), lambda: bollinger_bands(close, 20, 2.0))
+    volume_sma = cached_indicator(df, ("volume_sma", 20), lambda: sma(volume, 20))
     volume_ratio = volume / volume_sma
 
     # Entry: all conditions must be true
@@ -39,6 +39,7 @@ if str(SCRIPTS_DIR) not in sys.path:  # pragma: no cover
 
 from validation_engine import (  # noqa: E402
     DEFAULT_FEES,
+    cached_indicator,
     generate_synthetic_ohlcv,
     run_validation,
     save_report,
@@ -90,13 +91,18 @@ def volatility_breakout_signals(
     volume = df["volume"]
 
     # Indicators
-    n_high = high.rolling(window=int(params["breakout_period"])).max().shift(1)
-    rsi_14 = rsi(close, 14)
-    adx_14 = adx(df, 14)
-    ema_20 = ema(close, 20)
-    volume_sma = sma(volume, 20)
+    breakout_period = int(params["breakout_period"])
+    n_high = cached_indicator(
+        df,
+        ("n_high", breakout_period),
+        lambda: high.rolling(window=breakout_period).max().shift(1),
+    )
+    rsi_14 = cached_indicator(df, ("rsi", 14), lambda: rsi(close, 14))
+    adx_14 = cached_indicator(df, ("adx", 14), lambda: adx(df, 14))
+    ema_20 = cached_indicator(df, ("ema", 20), lambda: ema(close, 20))
+    volume_sma = cached_indicator(df, ("volume_sma", 20), lambda: sma(volume, 20))
     volume_ratio = volume / volume_sma
-    bb = bollinger_bands(close, 20, 2.0)
+    bb = cached_indicator(df, ("bb", 20, 2.0), lambda: bollinger_bands(close, 20, 2.0))
     bb_width = bb["bb_width"]
     bb_width_expanding = bb_width > bb_width.shift(1)
 
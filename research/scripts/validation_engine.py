@@ -17,10 +17,17 @@ Gate 3 (Backtest Validation):
 import itertools
 import json
 import logging
+import multiprocessing
+import os
+import pickle
 import sys
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime
 from pathlib import Path
+from typing import Any
 
 import numpy as np
 import pandas as pd
@@ -48,9 +55,56 @@ GATE3_WF_SPLITS = 5
 # Realistic costs: 0.1% exchange fee + 0.05% slippage
 DEFAULT_FEES = 0.0015
 
+# Combos simulated together in one multi-column portfolio (and one pool task)
+SWEEP_BATCH_SIZE = 64
+
 # Type alias for signal generators
 SignalFn = Callable[[pd.DataFrame, dict], tuple[pd.Series, pd.Series]]
 
+_indicator_scope: ContextVar[tuple[pd.DataFrame, dict] | None] = ContextVar(
+    "indicator_scope",
+    default=None,
+)
+
+
+@contextmanager
+def indicator_cache(df: pd.DataFrame) -> Iterator[None]:
+    """Share indicators computed on ``df`` via :func:`cached_indicator`.
+
+    Sweeps and perturbation tests open one scope per frame so combos that
+    share an indicator sub-parameter (e.g. the same Bollinger period) reuse
+    the series instead of recomputing it.
+    """
+    token = _indicator_scope.set((df, {}))
+    try:
+        yield
+    finally:
+        _indicator_scope.reset(token)
+
+
+def cached_indicator(df: pd.DataFrame, key: tuple, compute: Callable[[], Any]) -> Any:
+    """Return an indicator of ``df``, computed at most once per cache scope.
+
+    Args:
+        df: Frame the indicator is computed from.
+        key: Indicator name plus the sub-parameters it depends on,
+            e.g. ``("ema", 50)``.
+        compute: Zero-argument callable producing the indicator.
+
+    Returns:
+        The cached value when ``df`` is the frame of the active
+        :func:`indicator_cache` scope, otherwise a freshly computed one
+        (walk-forward slices, direct calls).
+
+    """
+    scope = _indicator_scope.get()
+    if scope is None or scope[0] is not df:
+        return compute()
+    memo = scope[1]
+    if key not in memo:
+        memo[key] = compute()
+    return memo[key]
+
 
 def generate_synthetic_ohlcv(
     n: int = 5000,
@@ -81,6 +135,87 @@ def generate_synthetic_ohlcv(
     )
 
 
+def _years(index: pd.Index) -> float:
+    days = (index[-1] - index[0]).total_seconds() / 86400
+    return max(days / 365.25, 0.01)
+
+
+def _trade_pvalue(trade_pnls: np.ndarray) -> float:
+    """One-sided t-test p-value that mean trade PnL is positive."""
+    try:
+        trade_pnls = np.asarray(trade_pnls, dtype=float)
+        trade_pnls = trade_pnls[~np.isnan(trade_pnls)]
+        if len(trade_pnls) >= 2:
+            t_stat, p_two = scipy_stats.ttest_1samp(trade_pnls, 0)
+            return float(p_two / 2) if t_stat > 0 else 1.0
+    except Exception:
+        pass
+    return 1.0
+
+
+def _backtest_columns(
+    close: pd.Series,
+    entries: pd.DataFrame,
+    exits: pd.DataFrame,
+    fees: float = DEFAULT_FEES,
+    sl_stop: float = 0.05,
+    freq: str = "1h",
+) -> list[dict]:
+    """Simulate every signal column in one VectorBT portfolio.
+
+    Columns are independent (no cash sharing), so each column's metrics
+    equal those of a single-column backtest of the same signals.
+
+    Returns:
+        One metrics dict per column, in column order.
+
+    """
+    import vectorbt as vbt
+
+    pf = vbt.Portfolio.from_signals(
+        close,
+        entries=entries,
+        exits=exits,
+        fees=fees,
+        sl_stop=sl_stop,
+        freq=freq,
+        init_cash=10000,
+    )
+
+    def per_column(values) -> np.ndarray:
+        return np.atleast_1d(np.asarray(values, dtype=float))
+
+    trades = pf.trades
+    num_trades = per_column(trades.count()).astype(int)
+    total_return = per_column(pf.total_return())
+    sharpe = per_column(pf.sharpe_ratio())
+    drawdown = per_column(pf.max_drawdown())
+    win_rate = per_column(trades.win_rate())
+    profit_factor = per_column(trades.profit_factor())
+    trade_cols = trades.records_arr["col"]
+    trade_pnls = trades.records_arr["pnl"]
+    years = _years(close.index)
+
+    results = []
+    for col in range(entries.shape[1]):
+        n = int(num_trades[col])
+        # T-test on trade PnLs for statistical significance
+        pvalue = _trade_pvalue(trade_pnls[trade_cols == col]) if n >= 2 else 1.0
+        results.append(
+            {
+                "total_return": float(total_return[col]),
+                "sharpe_ratio": float(sharpe[col]),
+                "max_drawdown": float(drawdown[col]),
+                "num_trades": n,
+                "annualized_trades": round(n / years, 1),
+                "win_rate": float(win_rate[col]) if n > 0 else 0.0,
+                "profit_factor": float(profit_factor[col]) if n > 0 else 0.0,
+                "pvalue": pvalue,
+            },
+        )
+    return results
+
+
 def _run_backtest(
     close: pd.Series,
     entries: pd.Series,
@@ -90,53 +225,135 @@ def _run_backtest(
     freq: str = "1h",
 ) -> dict:
     """Run a single VectorBT backtest and extract metrics."""
-    import vectorbt as vbt
-
     entries = entries.fillna(False).astype(bool)
     exits = exits.fillna(False).astype(bool)
-
-    pf = vbt.Portfolio.from_signals(
+    return _backtest_columns(
         close,
-        entries=entries,
-        exits=exits,
+        pd.DataFrame({0: entries}),
+        pd.DataFrame({0: exits}),
+        fees,
+        sl_stop,
+        freq,
+    )[0]
+
+
+def _evaluate_combos(
+    df: pd.DataFrame,
+    signal_fn: SignalFn,
+    combos: list[dict],
+    fees: float = DEFAULT_FEES,
+    sl_stop: float = 0.05,
+    freq: str = "1h",
+    early_stop: bool = False,
+) -> list[dict | None]:
+    """Generate signals for each combo and backtest them as one portfolio.
+
+    With ``early_stop``, combos whose entry signals cannot reach
+    ``GATE2_MIN_TRADES_PER_YEAR`` (every trade needs an entry bar) cannot
+    pass Gate 2 and are not simulated. They are reported with NaN
+    performance metrics and the entry-count bound as ``annualized_trades``.
+
+    Returns:
+        Metrics per combo, in order; ``None`` where signal generation or
+        the simulation failed.
+
+    """
+    close = df["close"]
+    years = _years(close.index)
+    results: list[dict | None] = [None] * len(combos)
+    entry_cols, exit_cols, slots = {}, {}, []
+
+    for i, params in enumerate(combos):
+        try:
+            entries, exits = signal_fn(df, params)
+        except Exception as e:
+            logger.debug(f"Combo {params} failed: {e}")
+            continue
+        entries = entries.fillna(False).astype(bool)
+        exits = exits.fillna(False).astype(bool)
+
+        max_trades_per_year = int(entries.sum()) / years
+        if early_stop and max_trades_per_year < GATE2_MIN_TRADES_PER_YEAR:
+            results[i] = {
+                "total_return": float("nan"),
+                "sharpe_ratio": float("nan"),
+                "max_drawdown": float("nan"),
+                "num_trades": float("nan"),
+                "annualized_trades": round(max_trades_per_year, 1),
+                "win_rate": float("nan"),
+                "profit_factor": float("nan"),
+                "pvalue": 1.0,
+            }
+            continue
+
+        entry_cols[len(slots)] = entries
+        exit_cols[len(slots)] = exits
+        slots.append(i)
+
+    if slots:
+        try:
+            metrics = _backtest_columns(
+                close,
+                pd.DataFrame(entry_cols),
+                pd.DataFrame(exit_cols),
+                fees,
+                sl_stop,
+                freq,
+            )
+        except Exception as e:
+            logger.debug(f"Batch of {len(slots)} combos failed: {e}")
+        else:
+            for i, combo_metrics in zip(slots, metrics, strict=True):
+                results[i] = combo_metrics
+
+    return results
+
+
+# Per-process sweep state for pool workers (set by _init_sweep_worker)
+_worker_sweep: dict = {}
+
+
+def _init_sweep_worker(df, signal_fn, fees, sl_stop, freq, early_stop) -> None:
+    _worker_sweep.update(
+        df=df,
+        signal_fn=signal_fn,
         fees=fees,
         sl_stop=sl_stop,
         freq=freq,
-        init_cash=10000,
+        early_stop=early_stop,
     )
 
-    num_trades = int(pf.trades.count())
 
-    # Annualized trade count
-    days = (close.index[-1] - close.index[0]).total_seconds() / 86400
-    years = max(days / 365.25, 0.01)
-    annualized_trades = num_trades / years
+def _evaluate_batch_in_worker(combos: list[dict]) -> list[dict | None]:
+    df = _worker_sweep["df"]
+    with indicator_cache(df):
+        return _evaluate_combos(
+            df,
+            _worker_sweep["signal_fn"],
+            combos,
+            _worker_sweep["fees"],
+            _worker_sweep["sl_stop"],
+            _worker_sweep["freq"],
+            _worker_sweep["early_stop"],
+        )
+
+
+def _pool_size(max_workers: int | None, n_tasks: int, payload: Any) -> int:
+    """Worker processes to use, or 1 to run in-process.
 
-    # T-test on trade PnLs for statistical significance
-    pvalue = 1.0
-    if num_trades >= 2:
+    Falls back to in-process execution when ``payload`` (the signal
+    function) cannot be pickled, e.g. closures defined inside a function.
+    """
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    workers = max(1, min(max_workers, n_tasks))
+    if workers > 1:
         try:
-            trade_pnls = pf.trades.pnl.values
-            if hasattr(trade_pnls, "to_numpy"):  # pragma: no cover — VBT version-dependent
-                trade_pnls = trade_pnls.to_numpy()
-            trade_pnls = np.asarray(trade_pnls, dtype=float)
-            trade_pnls = trade_pnls[~np.isnan(trade_pnls)]
-            if len(trade_pnls) >= 2:
-                t_stat, p_two = scipy_stats.ttest_1samp(trade_pnls, 0)
-                pvalue = float(p_two / 2) if t_stat > 0 else 1.0
+            pickle.dumps(payload)
         except Exception:
-            pvalue = 1.0
-
-    return {
-        "total_return": float(pf.total_return()),
-        "sharpe_ratio": float(pf.sharpe_ratio()),
-        "max_drawdown": float(pf.max_drawdown()),
-        "num_trades": num_trades,
-        "annualized_trades": round(annualized_trades, 1),
-        "win_rate": float(pf.trades.win_rate()) if num_trades > 0 else 0.0,
-        "profit_factor": float(pf.trades.profit_factor()) if num_trades > 0 else 0.0,
-        "pvalue": pvalue,
-    }
+            logger.debug("Signal function is not picklable; running in-process")
+            return 1
+    return workers
 
 
 def check_gate2(result: dict) -> tuple[bool, list[str]]:
@@ -170,38 +387,67 @@ def sweep_parameters(
     fees: float = DEFAULT_FEES,
     sl_stop: float = 0.05,
     freq: str = "1h",
+    max_workers: int | None = None,
+    batch_size: int = SWEEP_BATCH_SIZE,
+    early_stop: bool = False,
 ) -> pd.DataFrame:
     """Run Gate 2 parameter sweep across all combinations.
 
-    Returns DataFrame sorted by Sharpe ratio, with passes_gate2 column.
+    Combos are split into consecutive batches of ``batch_size``; each batch
+    is simulated as one multi-column portfolio, and batches are spread over
+    a process pool. Indicators wrapped in :func:`cached_indicator` are shared
+    by every combo in a batch.
+
+    Args:
+        df: OHLCV DataFrame.
+        signal_fn: ``(df, params) -> (entries, exits)``.
+        param_grid: Parameter name to candidate values.
+        fees: Trading fees.
+        sl_stop: Stop-loss fraction.
+        freq: Bar frequency.
+        max_workers: Pool size; defaults to one per CPU. ``1`` (or an
+            unpicklable ``signal_fn``) sweeps in-process.
+        batch_size: Combos per portfolio simulation.
+        early_stop: Skip simulating combos that cannot reach the Gate 2
+            trade-frequency floor (see :func:`_evaluate_combos`).
+
+    Returns:
+        DataFrame sorted by Sharpe ratio, with passes_gate2 column.
+
     """
     param_names = list(param_grid.keys())
     param_values = list(param_grid.values())
-    combos = list(itertools.product(*param_values))
+    combos = [
+        dict(zip(param_names, combo, strict=False)) for combo in itertools.product(*param_values)
+    ]
+    batches = [combos[i : i + batch_size] for i in range(0, len(combos), max(1, batch_size))]
+    workers = _pool_size(max_workers, len(batches), signal_fn)
 
     logger.info(
         f"Gate 2: Sweeping {len(combos)} parameter combinations "
-        f"({' x '.join(f'{k}[{len(v)}]' for k, v in param_grid.items())})",
+        f"({' x '.join(f'{k}[{len(v)}]' for k, v in param_grid.items())}) "
+        f"in {len(batches)} batch(es) on {workers} worker(s)",
     )
 
-    close = df["close"]
     results = []
-
-    for i, combo in enumerate(combos):
-        params = dict(zip(param_names, combo, strict=False))
-        try:
-            entries, exits = signal_fn(df, params)
-            metrics = _run_backtest(close, entries, exits, fees, sl_stop, freq)
+    tested = 0
+    for batch, batch_metrics in zip(
+        batches,
+        _map_sweep_batches(df, signal_fn, batches, fees, sl_stop, freq, early_stop, workers),
+        strict=True,
+    ):
+        for params, metrics in zip(batch, batch_metrics, strict=True):
+            if metrics is None:
+                continue
             passed, failures = check_gate2(metrics)
             metrics["params"] = params
             metrics["passes_gate2"] = passed
             metrics["failure_reasons"] = failures
             results.append(metrics)
-        except Exception as e:
-            logger.debug(f"Combo {i} failed ({params}): {e}")
 
-        if (i + 1) % 100 == 0:
-            logger.info(f"  ... {i + 1}/{len(combos)} combos tested")
+        if (tested + len(batch)) // 100 > tested // 100:
+            logger.info(f"  ... {tested + len(batch)}/{len(combos)} combos tested")
+        tested += len(batch)
 
     results_df = pd.DataFrame(results)
     if not results_df.empty:
@@ -217,6 +463,32 @@ def sweep_parameters(
     return results_df
 
 
+def _map_sweep_batches(
+    df: pd.DataFrame,
+    signal_fn: SignalFn,
+    batches: list[list[dict]],
+    fees: float,
+    sl_stop: float,
+    freq: str,
+    early_stop: bool,
+    workers: int,
+) -> Iterator[list[dict | None]]:
+    """Evaluate sweep batches in order, in-process or on a process pool."""
+    if workers <= 1:
+        with indicator_cache(df):
+            for batch in batches:
+                yield _evaluate_combos(df, signal_fn, batch, fees, sl_stop, freq, early_stop)
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_sweep_worker,
+        initargs=(df, signal_fn, fees, sl_stop, freq, early_stop),
+    ) as pool:
+        yield from pool.map(_evaluate_batch_in_worker, batches)
+
+
 # ── Gate 3a: Walk-Forward Validation ─────────────────────────
 
 
@@ -228,12 +500,22 @@ def walk_forward_validate(
     sl_stop: float = 0.05,
     freq: str = "1h",
     n_splits: int = GATE3_WF_SPLITS,
+    max_workers: int | None = None,
 ) -> list[dict]:
     """Expanding-window walk-forward out-of-sample validation.
 
     Splits data into n_splits+1 segments. For fold k (1..n_splits):
       - Train on segments 0..k-1 (expanding window)
       - Test on segment k (fixed window)
+
+    Folds are independent and run concurrently in worker processes that
+    read the price data from one shared-memory segment. Results are
+    returned in fold order regardless of completion order.
+
+    Args:
+        max_workers: Pool size; defaults to one per CPU. ``1`` (or an
+            unpicklable ``signal_fn``) runs the folds in-process.
+
     """
     n = len(df)
     segment_size = n // (n_splits + 1)
@@ -243,71 +525,129 @@ def walk_forward_validate(
             f"Segment size {segment_size} is small — results may be unreliable",
         )
 
-    results = []
-
+    folds = []
     for fold in range(1, n_splits + 1):
         train_end = segment_size * fold
         test_end = min(segment_size * (fold + 1), n)
-
-        train_df = df.iloc[:train_end]
-        test_df = df.iloc[train_end:test_end]
-
-        if len(test_df) < 50:
+        if test_end - train_end < 50:
             logger.warning(
-                f"Fold {fold}: test set too small ({len(test_df)} rows), skipping",
+                f"Fold {fold}: test set too small ({test_end - train_end} rows), skipping",
             )
             continue
+        folds.append((fold, train_end, test_end))
 
-        try:
-            is_entries, is_exits = signal_fn(train_df, best_params)
-            is_metrics = _run_backtest(
-                train_df["close"],
-                is_entries,
-                is_exits,
-                fees,
-                sl_stop,
-                freq,
-            )
-        except Exception as e:
-            logger.warning(f"Fold {fold} IS failed: {e}")
-            continue
+    workers = _pool_size(max_workers, len(folds), signal_fn)
+    if workers <= 1:
+        outcomes = [
+            _run_fold(df, signal_fn, best_params, fees, sl_stop, freq, *bounds) for bounds in folds
+        ]
+    else:
+        from common.data_pipeline.shared_frame import SharedFrame
+
+        with (
+            SharedFrame(df) as shared,
+            ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_fold_worker,
+                initargs=(shared.spec, signal_fn, best_params, fees, sl_stop, freq),
+            ) as pool,
+        ):
+            outcomes = list(pool.map(_run_fold_in_worker, folds))
 
-        try:
-            oos_entries, oos_exits = signal_fn(test_df, best_params)
-            oos_metrics = _run_backtest(
-                test_df["close"],
-                oos_entries,
-                oos_exits,
-                fees,
-                sl_stop,
-                freq,
-            )
-        except Exception as e:
-            logger.warning(f"Fold {fold} OOS failed: {e}")
+    results = []
+    for outcome in outcomes:
+        if "error" in outcome:
+            logger.warning(f"Fold {outcome['fold']} {outcome['error']}")
             continue
-
-        fold_result = {
-            "fold": fold,
-            "train_rows": len(train_df),
-            "test_rows": len(test_df),
-            "train_period": f"{train_df.index[0]} to {train_df.index[-1]}",
-            "test_period": f"{test_df.index[0]} to {test_df.index[-1]}",
-            "is_sharpe": is_metrics["sharpe_ratio"],
-            "is_return": is_metrics["total_return"],
-            "is_trades": is_metrics["num_trades"],
-            "oos_sharpe": oos_metrics["sharpe_ratio"],
-            "oos_return": oos_metrics["total_return"],
-            "oos_trades": oos_metrics["num_trades"],
-        }
-        results.append(fold_result)
+        results.append(outcome)
         logger.info(
-            f"  Fold {fold}: IS Sharpe={is_metrics['sharpe_ratio']:.3f}, "
-            f"OOS Sharpe={oos_metrics['sharpe_ratio']:.3f}",
+            f"  Fold {outcome['fold']}: IS Sharpe={outcome['is_sharpe']:.3f}, "
+            f"OOS Sharpe={outcome['oos_sharpe']:.3f}",
         )
 
     return results
 
 
+def _run_fold(
+    df: pd.DataFrame,
+    signal_fn: SignalFn,
+    best_params: dict,
+    fees: float,
+    sl_stop: float,
+    freq: str,
+    fold: int,
+    train_end: int,
+    test_end: int,
+) -> dict:
+    """Backtest one walk-forward fold in-sample and out-of-sample.
+
+    Returns:
+        The fold result, or ``{"fold": k, "error": ...}`` if either
+        backtest failed.
+
+    """
+    train_df = df.iloc[:train_end]
+    test_df = df.iloc[train_end:test_end]
+
+    try:
+        is_entries, is_exits = signal_fn(train_df, best_params)
+        is_metrics = _run_backtest(
+            train_df["close"],
+            is_entries,
+            is_exits,
+            fees,
+            sl_stop,
+            freq,
+        )
+    except Exception as e:
+        return {"fold": fold, "error": f"IS failed: {e}"}
+
+    try:
+        oos_entries, oos_exits = signal_fn(test_df, best_params)
+        oos_metrics = _run_backtest(
+            test_df["close"],
+            oos_entries,
+            oos_exits,
+            fees,
+            sl_stop,
+            freq,
+        )
+    except Exception as e:
+        return {"fold": fold, "error": f"OOS failed: {e}"}
+
+    return {
+        "fold": fold,
+        "train_rows": len(train_df),
+        "test_rows": len(test_df),
+        "train_period": f"{train_df.index[0]} to {train_df.index[-1]}",
+        "test_period": f"{test_df.index[0]} to {test_df.index[-1]}",
+        "is_sharpe": is_metrics["sharpe_ratio"],
+        "is_return": is_metrics["total_return"],
+        "is_trades": is_metrics["num_trades"],
+        "oos_sharpe": oos_metrics["sharpe_ratio"],
+        "oos_return": oos_metrics["total_return"],
+        "oos_trades": oos_metrics["num_trades"],
+    }
+
+
+# Per-process walk-forward state for pool workers (set by _init_fold_worker)
+_worker_folds: dict = {}
+
+
+def _init_fold_worker(spec, signal_fn, best_params, fees, sl_stop, freq) -> None:
+    from common.data_pipeline.shared_frame import attach_frame
+
+    _worker_folds.update(
+        df=attach_frame(spec),
+        args=(signal_fn, best_params, fees, sl_stop, freq),
+    )
+
+
+def _run_fold_in_worker(bounds: tuple[int, int, int]) -> dict:
+    return _run_fold(_worker_folds["df"], *_worker_folds["args"], *bounds)
+
+
 # ── Gate 3b: Parameter Perturbation ──────────────────────────
 
 
@@ -324,9 +664,7 @@ def perturbation_test(
 
     A robust strategy maintains positive Sharpe across perturbations.
     """
-    close = df["close"]
-    results = []
-
+    variants = []
     for param_name, original_value in best_params.items():
         for direction, factor in [
             ("+20%", 1 + perturbation_pct),
@@ -337,33 +675,40 @@ def perturbation_test(
                 perturbed_value = max(1, round(perturbed_value))
             else:
                 perturbed_value = round(perturbed_value, 2)
+            variants.append((param_name, original_value, perturbed_value, direction))
 
-            perturbed_params = {**best_params, param_name: perturbed_value}
-
-            try:
-                entries, exits = signal_fn(df, perturbed_params)
-                metrics = _run_backtest(close, entries, exits, fees, sl_stop, freq)
-            except Exception as e:
-                logger.debug(f"Perturbation {param_name} {direction} failed: {e}")
-                metrics = {
-                    "sharpe_ratio": float("nan"),
-                    "total_return": 0,
-                    "max_drawdown": 1.0,
-                    "num_trades": 0,
-                }
-
-            results.append(
-                {
-                    "param_name": param_name,
-                    "original_value": original_value,
-                    "perturbed_value": perturbed_value,
-                    "direction": direction,
-                    "sharpe_ratio": metrics["sharpe_ratio"],
-                    "total_return": metrics["total_return"],
-                    "max_drawdown": metrics["max_drawdown"],
-                    "num_trades": metrics["num_trades"],
-                },
-            )
+    # All perturbations share the unperturbed indicators and one portfolio
+    combos = [{**best_params, name: value} for name, _, value, _ in variants]
+    with indicator_cache(df):
+        batch_metrics = _evaluate_combos(df, signal_fn, combos, fees, sl_stop, freq)
+
+    results = []
+    for (param_name, original_value, perturbed_value, direction), metrics in zip(
+        variants,
+        batch_metrics,
+        strict=True,
+    ):
+        if metrics is None:
+            logger.debug(f"Perturbation {param_name} {direction} failed")
+            metrics = {
+                "sharpe_ratio": float("nan"),
+                "total_return": 0,
+                "max_drawdown": 1.0,
+                "num_trades": 0,
+            }
+
+        results.append(
+            {
+                "param_name": param_name,
+                "original_value": original_value,
+                "perturbed_value": perturbed_value,
+                "direction": direction,
+                "sharpe_ratio": metrics["sharpe_ratio"],
+                "total_return": metrics["total_return"],
+                "max_drawdown": metrics["max_drawdown"],
+                "num_trades": metrics["num_trades"],
+            },
+        )
 
     return results
 
@@ -402,7 +747,7 @@ def run_validation(
 
     # ── Gate 2: Parameter Sweep ──
     logger.info("\n-- Gate 2: Parameter Sweep --")
-    sweep_df = sweep_parameters(df, signal_fn, param_grid, fees, sl_stop, freq)
+    sweep_df = sweep_parameters(df, signal_fn, param_grid, fees, sl_stop, freq, early_stop=True)
 
     gate2_passed = False
     best_params = None
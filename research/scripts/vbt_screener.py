@@ -12,10 +12,15 @@ Workflow:
 
 import json
 import logging
+import multiprocessing
+import os
+import pickle
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 import vectorbt as vbt
 
@@ -39,6 +44,158 @@ RESULTS_DIR = PROJECT_ROOT / "research" / "results"
 RESULTS_DIR.mkdir(parents=True, exist_ok=True)
 
 
+# ──────────────────────────────────────────────
+# Parameter Grids
+# ──────────────────────────────────────────────
+
+# Metrics reported by the trade-based screens (everything except SMA crossover)
+_TRADE_METRICS = [
+    "total_return",
+    "sharpe_ratio",
+    "max_drawdown",
+    "win_rate",
+    "profit_factor",
+    "num_trades",
+]
+
+
+def _param_grid(**params: list) -> pd.MultiIndex:
+    """Build the cartesian product of parameter values as a named column index.
+
+    Each column of the signal matrices corresponds to one entry of the grid,
+    so the level names become the parameter columns of the result frame.
+    """
+    return pd.MultiIndex.from_product(list(params.values()), names=list(params))
+
+
+def _indicator_columns(fn, grid: pd.MultiIndex, level: str) -> np.ndarray:
+    """Evaluate a one-parameter indicator across a parameter grid.
+
+    The indicator is computed once per distinct value of ``level`` and then
+    fanned out to every grid column sharing that value.
+
+    Returns:
+        Float array of shape ``(n_rows, len(grid))``.
+
+    """
+    values = grid.get_level_values(level)
+    distinct = values.unique()
+    wide = np.column_stack([fn(v).to_numpy(dtype=float) for v in distinct])
+    return wide[:, distinct.get_indexer(values)]
+
+
+def _level_row(grid: pd.MultiIndex, level: str) -> np.ndarray:
+    """Parameter values of ``level`` as a ``(1, n_combos)`` row for broadcasting."""
+    return grid.get_level_values(level).to_numpy(dtype=float)[None, :]
+
+
+def _simulate_grid(
+    close: pd.Series,
+    entries: np.ndarray,
+    exits: np.ndarray,
+    grid: pd.MultiIndex,
+    fees: float,
+    metrics: list[str],
+    label: str,
+    freq: str = "1h",
+    **kwargs,
+) -> pd.DataFrame:
+    """Simulate every parameter combination in a single portfolio call.
+
+    Args:
+        close: Price series shared by all combinations.
+        entries: Boolean entry matrix, one column per grid entry.
+        exits: Boolean exit matrix, one column per grid entry.
+        grid: Parameter index labelling the signal columns.
+        fees: Trading fees.
+        metrics: Metric columns to report.
+        label: Screen name for log messages.
+        freq: Bar frequency used to annualise returns.
+        **kwargs: Extra arguments forwarded to ``Portfolio.from_signals``.
+
+    Returns:
+        DataFrame with one row per combination (parameter columns followed
+        by ``metrics``), sorted by Sharpe ratio.
+
+    """
+    try:
+        pf = vbt.Portfolio.from_signals(
+            close,
+            entries=pd.DataFrame(entries, index=close.index, columns=grid),
+            exits=pd.DataFrame(exits, index=close.index, columns=grid),
+            fees=fees,
+            freq=freq,
+            init_cash=10000,
+            **kwargs,
+        )
+        num_trades = pf.trades.count()
+        has_trades = num_trades > 0
+        extractors = {
+            "total_return": pf.total_return,
+            "sharpe_ratio": pf.sharpe_ratio,
+            "max_drawdown": pf.max_drawdown,
+            "win_rate": lambda: pf.trades.win_rate().where(has_trades, 0),
+            "profit_factor": lambda: pf.trades.profit_factor().where(has_trades, 0),
+            "num_trades": lambda: num_trades,
+        }
+        results = pd.DataFrame({name: extractors[name]() for name in metrics})
+    except Exception as e:
+        logger.warning(f"{label} grid simulation failed ({len(grid)} combos): {e}")
+        return pd.DataFrame()
+
+    results = results.reset_index()
+    return results.sort_values("sharpe_ratio", ascending=False)
+
+
+class IndicatorCache:
+    """Memoized indicator series for one OHLCV frame.
+
+    Several screens share the same inputs (RSI(14) feeds three of them,
+    EMA(20) two), so each ``(indicator, period)`` pair is computed once per
+    symbol and reused by every screen that receives this cache.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        self.df = df
+        self._series: dict[tuple, pd.Series | pd.DataFrame] = {}
+
+    def _get(self, key: tuple, compute):
+        if key not in self._series:
+            self._series[key] = compute()
+        return self._series[key]
+
+    def rsi(self, period: int) -> pd.Series:
+        return self._get(("rsi", period), lambda: rsi(self.df["close"], period))
+
+    def ema(self, period: int) -> pd.Series:
+        return self._get(("ema", period), lambda: ema(self.df["close"], period))
+
+    def sma(self, period: int) -> pd.Series:
+        return self._get(("sma", period), lambda: sma(self.df["close"], period))
+
+    def rolling_std(self, period: int) -> pd.Series:
+        return self._get(("std", period), lambda: self.df["close"].rolling(window=period).std())
+
+    def prior_high(self, period: int) -> pd.Series:
+        """Highest high of the previous ``period`` bars (excluding the current one)."""
+        return self._get(
+            ("prior_high", period),
+            lambda: self.df["high"].rolling(window=period).max().shift(1),
+        )
+
+    def volume_sma(self, period: int) -> pd.Series:
+        return self._get(("volume_sma", period), lambda: sma(self.df["volume"], period))
+
+    def adx(self, period: int) -> pd.Series:
+        return self._get(("adx", period), lambda: adx(self.df, period))
+
+    def bollinger(self, period: int, std_dev: float) -> pd.DataFrame:
+        return self._get(
+            ("bollinger", period, std_dev),
+            lambda: bollinger_bands(self.df["close"], period, std_dev),
+        )
+
+
 # ──────────────────────────────────────────────
 # Strategy Definitions
 # ──────────────────────────────────────────────
@@ -110,6 +267,7 @@ def screen_rsi_mean_reversion(
     oversold_levels: list = None,
     overbought_levels: list = None,
     fees: float = 0.001,
+    indicators: IndicatorCache | None = None,
 ) -> pd.DataFrame:
     """Screen RSI mean-reversion strategies.
 
@@ -123,49 +281,30 @@ def screen_rsi_mean_reversion(
         overbought_levels = [65, 70, 75, 80]
 
     close = df["close"]
-    results = []
+    grid = _param_grid(
+        rsi_period=rsi_periods,
+        oversold=oversold_levels,
+        overbought=overbought_levels,
+    )
+    grid = grid[grid.get_level_values("oversold") < grid.get_level_values("overbought")]
+    if grid.empty:
+        logger.info("RSI screening complete: 0 parameter combos tested")
+        return pd.DataFrame()
 
-    for period in rsi_periods:
-        rsi_values = rsi(close, period)
-        for os_level in oversold_levels:
-            for ob_level in overbought_levels:
-                if os_level >= ob_level:
-                    continue
-
-                entries = rsi_values < os_level
-                exits = rsi_values > ob_level
-
-                try:
-                    pf = vbt.Portfolio.from_signals(
-                        close,
-                        entries=entries,
-                        exits=exits,
-                        fees=fees,
-                        freq="1h",
-                        init_cash=10000,
-                    )
-
-                    results.append(
-                        {
-                            "rsi_period": period,
-                            "oversold": os_level,
-                            "overbought": ob_level,
-                            "total_return": pf.total_return(),
-                            "sharpe_ratio": pf.sharpe_ratio(),
-                            "max_drawdown": pf.max_drawdown(),
-                            "win_rate": pf.trades.win_rate() if pf.trades.count() > 0 else 0,
-                            "profit_factor": pf.trades.profit_factor()
-                            if pf.trades.count() > 0
-                            else 0,
-                            "num_trades": pf.trades.count(),
-                        }
-                    )
-                except Exception as e:
-                    logger.debug(f"Skipping RSI({period}, {os_level}, {ob_level}): {e}")
+    indicators = indicators or IndicatorCache(df)
+    rsi_values = _indicator_columns(indicators.rsi, grid, "rsi_period")
+    entries = rsi_values < _level_row(grid, "oversold")
+    exits = rsi_values > _level_row(grid, "overbought")
 
-    results_df = pd.DataFrame(results)
-    if not results_df.empty:
-        results_df = results_df.sort_values("sharpe_ratio", ascending=False)
+    results_df = _simulate_grid(
+        close,
+        entries,
+        exits,
+        grid,
+        fees=fees,
+        metrics=_TRADE_METRICS,
+        label="RSI",
+    )
     logger.info(f"RSI screening complete: {len(results_df)} parameter combos tested")
     return results_df
 
@@ -175,6 +314,7 @@ def screen_bollinger_breakout(
     bb_periods: list = None,
     bb_stds: list = None,
     fees: float = 0.001,
+    indicators: IndicatorCache | None = None,
 ) -> pd.DataFrame:
     """Screen Bollinger Band breakout strategies.
 
@@ -186,46 +326,26 @@ def screen_bollinger_breakout(
         bb_stds = [1.5, 2.0, 2.5, 3.0]
 
     close = df["close"]
-    results = []
-
-    for period in bb_periods:
-        mid = sma(close, period)
-        std = close.rolling(window=period).std()
-        for std_mult in bb_stds:
-            upper = mid + (std * std_mult)
-            lower = mid - (std * std_mult)
+    grid = _param_grid(bb_period=bb_periods, bb_std=bb_stds)
+    indicators = indicators or IndicatorCache(df)
 
-            entries = close > upper
-            exits = close < lower
+    mid = _indicator_columns(indicators.sma, grid, "bb_period")
+    std = _indicator_columns(indicators.rolling_std, grid, "bb_period")
+    band = std * _level_row(grid, "bb_std")
+    close_col = close.to_numpy(dtype=float)[:, None]
 
-            try:
-                pf = vbt.Portfolio.from_signals(
-                    close,
-                    entries=entries,
-                    exits=exits,
-                    fees=fees,
-                    freq="1h",
-                    init_cash=10000,
-                )
-                results.append(
-                    {
-                        "bb_period": period,
-                        "bb_std": std_mult,
-                        "total_return": pf.total_return(),
-                        "sharpe_ratio": pf.sharpe_ratio(),
-                        "max_drawdown": pf.max_drawdown(),
-                        "win_rate": pf.trades.win_rate() if pf.trades.count() > 0 else 0,
-                        "profit_factor": pf.trades.profit_factor() if pf.trades.count() > 0 else 0,
-                        "num_trades": pf.trades.count(),
-                    }
-                )
-            except Exception as e:
-                logger.debug(f"Skipping BB({period}, {std_mult}): {e}")
+    entries = close_col > mid + band
+    exits = close_col < mid - band
 
-    results_df = pd.DataFrame(results)
-    if not results_df.empty:
-        results_df = results_df.sort_values("sharpe_ratio", ascending=False)
-    return results_df
+    return _simulate_grid(
+        close,
+        entries,
+        exits,
+        grid,
+        fees=fees,
+        metrics=_TRADE_METRICS,
+        label="BB",
+    )
 
 
 def screen_ema_rsi_combo(
@@ -233,6 +353,7 @@ def screen_ema_rsi_combo(
     ema_periods: list = None,
     rsi_entry_levels: list = None,
     fees: float = 0.001,
+    indicators: IndicatorCache | None = None,
 ) -> pd.DataFrame:
     """Screen combined EMA trend + RSI momentum strategies.
 
@@ -245,44 +366,25 @@ def screen_ema_rsi_combo(
         rsi_entry_levels = [30, 35, 40]
 
     close = df["close"]
-    rsi_14 = rsi(close, 14)
-    results = []
-
-    for ema_p in ema_periods:
-        ema_val = ema(close, ema_p)
-        in_uptrend = close > ema_val
+    indicators = indicators or IndicatorCache(df)
+    rsi_14 = indicators.rsi(14).to_numpy(dtype=float)[:, None]
+    grid = _param_grid(ema_period=ema_periods, rsi_entry=rsi_entry_levels)
 
-        for rsi_entry in rsi_entry_levels:
-            entries = in_uptrend & (rsi_14 < rsi_entry)
-            exits = (close < ema_val) | (rsi_14 > 75)
+    ema_val = _indicator_columns(indicators.ema, grid, "ema_period")
+    close_col = close.to_numpy(dtype=float)[:, None]
 
-            try:
-                pf = vbt.Portfolio.from_signals(
-                    close,
-                    entries=entries,
-                    exits=exits,
-                    fees=fees,
-                    freq="1h",
-                    init_cash=10000,
-                )
-                results.append(
-                    {
-                        "ema_period": ema_p,
-                        "rsi_entry": rsi_entry,
-                        "total_return": pf.total_return(),
-                        "sharpe_ratio": pf.sharpe_ratio(),
-                        "max_drawdown": pf.max_drawdown(),
-                        "win_rate": pf.trades.win_rate() if pf.trades.count() > 0 else 0,
-                        "num_trades": pf.trades.count(),
-                    }
-                )
-            except Exception:
-                pass
+    entries = (close_col > ema_val) & (rsi_14 < _level_row(grid, "rsi_entry"))
+    exits = (close_col < ema_val) | (rsi_14 > 75)
 
-    results_df = pd.DataFrame(results)
-    if not results_df.empty:
-        results_df = results_df.sort_values("sharpe_ratio", ascending=False)
-    return results_df
+    return _simulate_grid(
+        close,
+        entries,
+        exits,
+        grid,
+        fees=fees,
+        metrics=["total_return", "sharpe_ratio", "max_drawdown", "win_rate", "num_trades"],
+        label="EMA+RSI",
+    )
 
 
 def screen_volatility_breakout(
@@ -291,6 +393,7 @@ def screen_volatility_breakout(
     volume_factors: list = None,
     adx_ranges: list = None,
     fees: float = 0.001,
+    indicators: IndicatorCache | None = None,
 ) -> pd.DataFrame:
     """Screen volatility breakout strategies.
 
@@ -306,69 +409,57 @@ def screen_volatility_breakout(
         adx_ranges = [(10, 25), (15, 30), (15, 25)]
 
     close = df["close"]
-    high = df["high"]
     volume = df["volume"]
-    rsi_14 = rsi(close, 14)
-    adx_14 = adx(df, 14)
-    ema_20 = ema(close, 20)
-    volume_sma = sma(volume, 20)
-    volume_ratio = volume / volume_sma
-    bb = bollinger_bands(close, 20, 2.0)
-    bb_width = bb["bb_width"]
+    indicators = indicators or IndicatorCache(df)
+    rsi_14 = indicators.rsi(14)
+    adx_14 = indicators.adx(14)
+    ema_20 = indicators.ema(20)
+    volume_ratio = volume / indicators.volume_sma(20)
+    bb_width = indicators.bollinger(20, 2.0)["bb_width"]
     bb_width_expanding = bb_width > bb_width.shift(1)
 
-    results = []
+    grid = pd.MultiIndex.from_tuples(
+        [
+            (bp, vf, adx_lo, adx_hi)
+            for bp in breakout_periods
+            for vf in volume_factors
+            for adx_lo, adx_hi in adx_ranges
+        ],
+        names=["breakout_period", "volume_factor", "adx_low", "adx_high"],
+    )
 
-    for bp in breakout_periods:
-        n_high = high.rolling(window=bp).max().shift(1)
-        breakout = close > n_high
-
-        for vf in volume_factors:
-            vol_ok = volume_ratio > vf
-
-            for adx_lo, adx_hi in adx_ranges:
-                adx_ok = (adx_14 >= adx_lo) & (adx_14 <= adx_hi) & (adx_14 > adx_14.shift(1))
-                rsi_ok = (rsi_14 >= 40) & (rsi_14 <= 70)
-
-                entries = breakout & vol_ok & bb_width_expanding & adx_ok & rsi_ok & (volume > 0)
-                exits = (rsi_14 > 85) | (
-                    (close < ema_20) & (close.shift(1) >= ema_20.shift(1)) & (volume_ratio > 1.0)
-                )
-                entries = entries.fillna(False)
-                exits = exits.fillna(False)
-
-                try:
-                    pf = vbt.Portfolio.from_signals(
-                        close,
-                        entries=entries,
-                        exits=exits,
-                        fees=fees,
-                        freq="1h",
-                        init_cash=10000,
-                        sl_stop=0.03,
-                    )
-                    results.append(
-                        {
-                            "breakout_period": bp,
-                            "volume_factor": vf,
-                            "adx_low": adx_lo,
-                            "adx_high": adx_hi,
-                            "total_return": pf.total_return(),
-                            "sharpe_ratio": pf.sharpe_ratio(),
-                            "max_drawdown": pf.max_drawdown(),
-                            "win_rate": pf.trades.win_rate() if pf.trades.count() > 0 else 0,
-                            "profit_factor": pf.trades.profit_factor()
-                            if pf.trades.count() > 0
-                            else 0,
-                            "num_trades": pf.trades.count(),
-                        }
-                    )
-                except Exception as e:
-                    logger.debug(f"Skipping VB({bp}, {vf}, {adx_lo}-{adx_hi}): {e}")
+    # Parameter-free filters are shared by every combination
+    rsi_ok = (rsi_14 >= 40) & (rsi_14 <= 70)
+    adx_rising = adx_14 > adx_14.shift(1)
+    shared = (bb_width_expanding & adx_rising & rsi_ok & (volume > 0)).to_numpy()[:, None]
+    exit_signal = (rsi_14 > 85) | (
+        (close < ema_20) & (close.shift(1) >= ema_20.shift(1)) & (volume_ratio > 1.0)
+    )
 
-    results_df = pd.DataFrame(results)
-    if not results_df.empty:
-        results_df = results_df.sort_values("sharpe_ratio", ascending=False)
+    n_high = _indicator_columns(indicators.prior_high, grid, "breakout_period")
+    close_col = close.to_numpy(dtype=float)[:, None]
+    ratio_col = volume_ratio.to_numpy(dtype=float)[:, None]
+    adx_col = adx_14.to_numpy(dtype=float)[:, None]
+
+    entries = (
+        (close_col > n_high)
+        & (ratio_col > _level_row(grid, "volume_factor"))
+        & (adx_col >= _level_row(grid, "adx_low"))
+        & (adx_col <= _level_row(grid, "adx_high"))
+        & shared
+    )
+    exits = np.broadcast_to(exit_signal.fillna(False).to_numpy(dtype=bool)[:, None], entries.shape)
+
+    results_df = _simulate_grid(
+        close,
+        entries,
+        exits,
+        grid,
+        fees=fees,
+        metrics=_TRADE_METRICS,
+        label="VB",
+        sl_stop=0.03,
+    )
     logger.info(f"Volatility breakout screening complete: {len(results_df)} combos tested")
     return results_df
 
@@ -402,45 +493,28 @@ def screen_relative_strength(
     close = close.loc[common_idx]
     bench_close = bench_close.loc[common_idx]
 
-    results = []
-
-    for lookback in lookback_periods:
+    def _relative_strength(lookback: int) -> pd.Series:
         # Relative strength = (asset return over lookback) / (benchmark return over lookback)
         asset_return = close / close.shift(lookback)
         bench_return = bench_close / bench_close.shift(lookback)
-        relative_strength = asset_return / bench_return.replace(0, float("nan"))
+        return asset_return / bench_return.replace(0, float("nan"))
 
-        for threshold in rs_thresholds:
-            entries = relative_strength > threshold
-            exits = relative_strength < 1.0
+    grid = _param_grid(lookback=lookback_periods, rs_threshold=rs_thresholds)
+    relative_strength = _indicator_columns(_relative_strength, grid, "lookback")
 
-            try:
-                pf = vbt.Portfolio.from_signals(
-                    close,
-                    entries=entries,
-                    exits=exits,
-                    fees=fees,
-                    freq="1d",
-                    init_cash=10000,
-                )
-                results.append(
-                    {
-                        "lookback": lookback,
-                        "rs_threshold": threshold,
-                        "total_return": pf.total_return(),
-                        "sharpe_ratio": pf.sharpe_ratio(),
-                        "max_drawdown": pf.max_drawdown(),
-                        "win_rate": pf.trades.win_rate() if pf.trades.count() > 0 else 0,
-                        "profit_factor": pf.trades.profit_factor() if pf.trades.count() > 0 else 0,
-                        "num_trades": pf.trades.count(),
-                    }
-                )
-            except Exception as e:
-                logger.debug(f"Skipping RS({lookback}, {threshold}): {e}")
+    entries = relative_strength > _level_row(grid, "rs_threshold")
+    exits = relative_strength < 1.0
 
-    results_df = pd.DataFrame(results)
-    if not results_df.empty:
-        results_df = results_df.sort_values("sharpe_ratio", ascending=False)
+    results_df = _simulate_grid(
+        close,
+        entries,
+        exits,
+        grid,
+        fees=fees,
+        metrics=_TRADE_METRICS,
+        label="RS",
+        freq="1d",
+    )
     logger.info(f"Relative strength screening complete: {len(results_df)} combos tested")
     return results_df
 
@@ -449,13 +523,36 @@ def screen_relative_strength(
 # Walk-Forward Out-of-Sample Validation
 # ──────────────────────────────────────────────
 
+
+# Walk-forward dispatch wrappers. Module-level (not lambdas) so they can be
+# pickled to fold worker processes; each resolves its screen at call time.
+def _wf_sma_crossover(df: pd.DataFrame, fees: float) -> pd.DataFrame:
+    return screen_sma_crossover(df["close"], fees=fees)
+
+
+def _wf_rsi_mean_reversion(df: pd.DataFrame, fees: float) -> pd.DataFrame:
+    return screen_rsi_mean_reversion(df, fees=fees)
+
+
+def _wf_bollinger_breakout(df: pd.DataFrame, fees: float) -> pd.DataFrame:
+    return screen_bollinger_breakout(df, fees=fees)
+
+
+def _wf_ema_rsi_combo(df: pd.DataFrame, fees: float) -> pd.DataFrame:
+    return screen_ema_rsi_combo(df, fees=fees)
+
+
+def _wf_volatility_breakout(df: pd.DataFrame, fees: float) -> pd.DataFrame:
+    return screen_volatility_breakout(df, fees=fees)
+
+
 # Strategy screen functions keyed by name for walk-forward dispatch
 SCREEN_FUNCTIONS = {
-    "sma_crossover": lambda df, fees: screen_sma_crossover(df["close"], fees=fees),
-    "rsi_mean_reversion": lambda df, fees: screen_rsi_mean_reversion(df, fees=fees),
-    "bollinger_breakout": lambda df, fees: screen_bollinger_breakout(df, fees=fees),
-    "ema_rsi_combo": lambda df, fees: screen_ema_rsi_combo(df, fees=fees),
-    "volatility_breakout": lambda df, fees: screen_volatility_breakout(df, fees=fees),
+    "sma_crossover": _wf_sma_crossover,
+    "rsi_mean_reversion": _wf_rsi_mean_reversion,
+    "bollinger_breakout": _wf_bollinger_breakout,
+    "ema_rsi_combo": _wf_ema_rsi_combo,
+    "volatility_breakout": _wf_volatility_breakout,
 }
 
 
@@ -465,6 +562,7 @@ def walk_forward_validate(
     n_splits: int = 3,
     train_ratio: float = 0.7,
     fees: float = 0.001,
+    max_workers: int | None = None,
 ) -> pd.DataFrame:
     """Walk-forward out-of-sample validation for a strategy screen.
 
@@ -475,12 +573,18 @@ def walk_forward_validate(
     This prevents curve-fitting by ensuring every reported metric
     comes from data the optimizer never saw.
 
+    Windows are independent, so they run concurrently in worker processes
+    that read the OHLCV data from one shared-memory segment. Rows come back
+    in split order regardless of which worker finishes first.
+
     Args:
         df: Full OHLCV DataFrame.
         strategy_name: Key in SCREEN_FUNCTIONS.
         n_splits: Number of walk-forward windows.
         train_ratio: Fraction of each window used for training.
         fees: Trading fees.
+        max_workers: Worker processes; defaults to one per CPU. ``1`` (or an
+            unpicklable screen function) runs the windows in-process.
 
     Returns:
         DataFrame with one row per split showing IS and OOS metrics.
@@ -494,13 +598,13 @@ def walk_forward_validate(
     screen_fn = SCREEN_FUNCTIONS[strategy_name]
     n_rows = len(df)
     window_size = n_rows // n_splits
-    results = []
 
     logger.info(
         f"Walk-forward validation: {strategy_name}, {n_splits} splits, "
         f"{n_rows} total rows, ~{window_size} per window",
     )
 
+    splits = []
     for i in range(n_splits):
         start = i * window_size
         end = min(start + window_size, n_rows)
@@ -508,102 +612,43 @@ def walk_forward_validate(
             logger.warning(f"Split {i + 1}: too few rows ({end - start}), skipping")
             continue
 
-        window_df = df.iloc[start:end].copy()
-        train_end = int(len(window_df) * train_ratio)
-
-        train_df = window_df.iloc[:train_end]
-        test_df = window_df.iloc[train_end:]
-
-        if len(train_df) < 50 or len(test_df) < 20:
-            logger.warning(
-                f"Split {i + 1}: insufficient data (train={len(train_df)}, test={len(test_df)})"
-            )
+        train_end = int((end - start) * train_ratio)
+        n_train, n_test = train_end, end - start - train_end
+        if n_train < 50 or n_test < 20:
+            logger.warning(f"Split {i + 1}: insufficient data (train={n_train}, test={n_test})")
             continue
+        splits.append((i + 1, start, end, train_end))
 
-        # Phase 1: Optimize on training data
-        try:
-            is_results = screen_fn(train_df, fees)
-        except Exception as e:
-            logger.error(f"Split {i + 1} IS screen failed: {e}")
-            continue
+    workers = _split_pool_size(max_workers, len(splits), screen_fn)
+    if workers <= 1:
+        outcomes = [_run_split(df, screen_fn, fees, *split) for split in splits]
+    else:
+        from common.data_pipeline.shared_frame import SharedFrame
+
+        with (
+            SharedFrame(df) as shared,
+            ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_split_worker,
+                initargs=(shared.spec, screen_fn, fees),
+            ) as pool,
+        ):
+            outcomes = list(pool.map(_run_split_in_worker, splits))
 
-        if is_results.empty:
-            logger.warning(f"Split {i + 1}: no valid IS results")
+    results = []
+    for outcome in outcomes:
+        if "error" in outcome:
+            logger.error(f"Split {outcome['split']} {outcome['error']}")
             continue
-
-        # Get best params from IS (first row after sort by sharpe)
-        best_row = is_results.iloc[0]
-        best_params = {
-            col: best_row[col]
-            for col in is_results.columns
-            if col
-            not in {
-                "total_return",
-                "sharpe_ratio",
-                "max_drawdown",
-                "win_rate",
-                "profit_factor",
-                "num_trades",
-                "avg_trade_pnl",
-            }
-        }
-
-        # Phase 2: Evaluate IS-best params on OOS test data
-        # Run full sweep on OOS, then extract only the IS-best param combo
-        try:
-            oos_results = screen_fn(test_df, fees)
-        except Exception as e:
-            logger.error(f"Split {i + 1} OOS screen failed: {e}")
+        if "warning" in outcome:
+            logger.warning(f"Split {outcome['split']}: {outcome['warning']}")
             continue
-
-        if oos_results.empty:
-            oos_sharpe = 0.0
-            oos_return = 0.0
-            oos_drawdown = 0.0
-        else:
-            # Match IS-best params in OOS results (not the OOS-best!)
-            param_cols = [col for col in best_params if col in oos_results.columns]
-            oos_match = oos_results
-            for col in param_cols:
-                oos_match = oos_match[oos_match[col] == best_params[col]]
-
-            if not oos_match.empty:
-                oos_best = oos_match.iloc[0]
-            else:
-                # Exact match not found — use closest by param distance
-                logger.debug("Split %d: no exact OOS param match, using closest", i + 1)
-                oos_best = oos_results.iloc[0]  # fallback to best OOS
-
-            oos_sharpe = float(oos_best.get("sharpe_ratio", 0))
-            oos_return = float(oos_best.get("total_return", 0))
-            oos_drawdown = float(oos_best.get("max_drawdown", 0))
-
-        is_sharpe = float(best_row.get("sharpe_ratio", 0))
-        is_return = float(best_row.get("total_return", 0))
-        is_drawdown = float(best_row.get("max_drawdown", 0))
-
-        # Degradation ratio: how much worse is OOS vs IS?
-        degradation = oos_sharpe / is_sharpe if is_sharpe > 0 else 0.0
-
-        results.append(
-            {
-                "split": i + 1,
-                "train_rows": len(train_df),
-                "test_rows": len(test_df),
-                "is_sharpe": round(is_sharpe, 4),
-                "is_return": round(is_return, 4),
-                "is_max_drawdown": round(is_drawdown, 4),
-                "oos_sharpe": round(oos_sharpe, 4),
-                "oos_return": round(oos_return, 4),
-                "oos_max_drawdown": round(oos_drawdown, 4),
-                "degradation_ratio": round(degradation, 4),
-                **{f"best_{k}": v for k, v in best_params.items()},
-            }
-        )
-
+        results.append(outcome)
         logger.info(
-            f"Split {i + 1}: IS Sharpe={is_sharpe:.3f}, OOS Sharpe={oos_sharpe:.3f}, "
-            f"degradation={degradation:.2f}",
+            f"Split {outcome['split']}: IS Sharpe={outcome['is_sharpe']:.3f}, "
+            f"OOS Sharpe={outcome['oos_sharpe']:.3f}, "
+            f"degradation={outcome['degradation_ratio']:.2f}",
         )
 
     results_df = pd.DataFrame(results)
@@ -622,6 +667,133 @@ def walk_forward_validate(
     return results_df
 
 
+def _split_pool_size(max_workers: int | None, n_splits: int, screen_fn) -> int:
+    """Worker processes for walk-forward, or 1 to run in-process."""
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    workers = max(1, min(max_workers, n_splits))
+    if workers > 1:
+        try:
+            pickle.dumps(screen_fn)
+        except Exception:
+            logger.debug("Screen function is not picklable; running walk-forward in-process")
+            return 1
+    return workers
+
+
+def _run_split(
+    df: pd.DataFrame,
+    screen_fn,
+    fees: float,
+    split: int,
+    start: int,
+    end: int,
+    train_end: int,
+) -> dict:
+    """Optimize one walk-forward window in-sample and score it out-of-sample.
+
+    Returns:
+        The split's result row, or ``{"split": n, "error"|"warning": msg}``
+        when the window produced no result.
+
+    """
+    window_df = df.iloc[start:end].copy()
+    train_df = window_df.iloc[:train_end]
+    test_df = window_df.iloc[train_end:]
+
+    # Phase 1: Optimize on training data
+    try:
+        is_results = screen_fn(train_df, fees)
+    except Exception as e:
+        return {"split": split, "error": f"IS screen failed: {e}"}
+
+    if is_results.empty:
+        return {"split": split, "warning": "no valid IS results"}
+
+    # Get best params from IS (first row after sort by sharpe)
+    best_row = is_results.iloc[0]
+    best_params = {
+        col: best_row[col]
+        for col in is_results.columns
+        if col
+        not in {
+            "total_return",
+            "sharpe_ratio",
+            "max_drawdown",
+            "win_rate",
+            "profit_factor",
+            "num_trades",
+            "avg_trade_pnl",
+        }
+    }
+
+    # Phase 2: Evaluate IS-best params on OOS test data
+    # Run full sweep on OOS, then extract only the IS-best param combo
+    try:
+        oos_results = screen_fn(test_df, fees)
+    except Exception as e:
+        return {"split": split, "error": f"OOS screen failed: {e}"}
+
+    if oos_results.empty:
+        oos_sharpe = 0.0
+        oos_return = 0.0
+        oos_drawdown = 0.0
+    else:
+        # Match IS-best params in OOS results (not the OOS-best!)
+        param_cols = [col for col in best_params if col in oos_results.columns]
+        oos_match = oos_results
+        for col in param_cols:
+            oos_match = oos_match[oos_match[col] == best_params[col]]
+
+        if not oos_match.empty:
+            oos_best = oos_match.iloc[0]
+        else:
+            # Exact match not found — use closest by param distance
+            logger.debug("Split %d: no exact OOS param match, using closest", split)
+            oos_best = oos_results.iloc[0]  # fallback to best OOS
+
+        oos_sharpe = float(oos_best.get("sharpe_ratio", 0))
+        oos_return = float(oos_best.get("total_return", 0))
+        oos_drawdown = float(oos_best.get("max_drawdown", 0))
+
+    is_sharpe = float(best_row.get("sharpe_ratio", 0))
+    is_return = float(best_row.get("total_return", 0))
+    is_drawdown = float(best_row.get("max_drawdown", 0))
+
+    # Degradation ratio: how much worse is OOS vs IS?
+    degradation = oos_sharpe / is_sharpe if is_sharpe > 0 else 0.0
+
+    return {
+        "split": split,
+        "train_rows": len(train_df),
+        "test_rows": len(test_df),
+        "is_sharpe": round(is_sharpe, 4),
+        "is_return": round(is_return, 4),
+        "is_max_drawdown": round(is_drawdown, 4),
+        "oos_sharpe": round(oos_sharpe, 4),
+        "oos_return": round(oos_return, 4),
+        "oos_max_drawdown": round(oos_drawdown, 4),
+        "degradation_ratio": round(degradation, 4),
+        **{f"best_{k}": v for k, v in best_params.items()},
+    }
+
+
+# Per-process walk-forward state for pool workers (set by _init_split_worker)
+_worker_split: dict = {}
+
+
+def _init_split_worker(spec, screen_fn, fees: float) -> None:
+    from common.data_pipeline.shared_frame import attach_frame
+
+    _worker_split.update(df=attach_frame(spec), screen_fn=screen_fn, fees=fees)
+
+
+def _run_split_in_worker(split: tuple[int, int, int, int]) -> dict:
+    return _run_split(
+        _worker_split["df"], _worker_split["screen_fn"], _worker_split["fees"], *split
+    )
+
+
 # ──────────────────────────────────────────────
 # Composite Screener
 # ──────────────────────────────────────────────
@@ -632,85 +804,94 @@ _ASSET_CLASS_FEES: dict[str, float] = {
     "forex": 0.0001,  # ~1 pip spread
 }
 
+# Symbols a batch worker process screens before it is replaced, so memory
+# held by pandas/numba caches is returned to the OS between symbols.
+MAX_SYMBOLS_PER_WORKER = 4
 
-def run_full_screen(
-    symbol: str = "BTC/USDT",
-    timeframe: str = "1h",
-    exchange: str = "kraken",
-    fees: float | None = None,
-    asset_class: str = "crypto",
-) -> dict:
-    """Run all strategy screens for a given symbol and return ranked results.
 
-    When asset_class is "equity", also runs a relative strength screen
-    using SPY as benchmark (if data available).
-    """
-    if fees is None:
-        fees = _ASSET_CLASS_FEES.get(asset_class, 0.001)
+def _data_source(asset_class: str, exchange: str) -> str:
+    return "yfinance" if asset_class in ("equity", "forex") else exchange
 
-    source = "yfinance" if asset_class in ("equity", "forex") else exchange
-    logger.info(f"=== Full strategy screen: {symbol} {timeframe} on {source} ({asset_class}) ===")
 
-    df = load_ohlcv(symbol, timeframe, source)
-    if df.empty:
-        logger.error(f"No data available for {symbol} {timeframe}. Run data pipeline first.")
-        return {}
+def _load_benchmark(timeframe: str) -> pd.DataFrame | None:
+    """Load the SPY benchmark used by the relative strength screen."""
+    try:
+        spy_df = load_ohlcv("SPY/USD", timeframe, "yfinance")
+    except Exception as e:
+        logger.error(f"Relative strength screen failed: {e}")
+        return None
+    if spy_df.empty:
+        logger.warning("SPY benchmark data not available, skipping relative strength")
+        return None
+    return spy_df
+
+
+def _run_screens(
+    df: pd.DataFrame,
+    fees: float,
+    strategies: list[str] | None = None,
+    benchmark_df: pd.DataFrame | None = None,
+) -> dict[str, pd.DataFrame]:
+    """Run the requested screens against one symbol's OHLCV.
+
+    All screens share a single :class:`IndicatorCache`, so an indicator
+    used by several screens is computed once. A failing screen is logged
+    and left out of the results.
+    """
+    indicators = IndicatorCache(df)
+    screens = {
+        "sma_crossover": lambda: screen_sma_crossover(df["close"], fees=fees),
+        "rsi_mean_reversion": lambda: screen_rsi_mean_reversion(
+            df, fees=fees, indicators=indicators
+        ),
+        "bollinger_breakout": lambda: screen_bollinger_breakout(
+            df, fees=fees, indicators=indicators
+        ),
+        "ema_rsi_combo": lambda: screen_ema_rsi_combo(df, fees=fees, indicators=indicators),
+        "volatility_breakout": lambda: screen_volatility_breakout(
+            df, fees=fees, indicators=indicators
+        ),
+    }
+    if benchmark_df is not None and not benchmark_df.empty:
+        screens["relative_strength"] = lambda: screen_relative_strength(df, benchmark_df, fees=fees)
 
-    close = df["close"]
     results = {}
+    for name, run in screens.items():
+        if strategies and name not in strategies:
+            continue
+        logger.info(f"Running {name} screen...")
+        try:
+            results[name] = run()
+        except Exception as e:
+            logger.error(f"{name} screen failed: {e}")
+    return results
 
-    # 1. SMA Crossover
-    logger.info("Running SMA crossover screen...")
-    try:
-        results["sma_crossover"] = screen_sma_crossover(close, fees=fees)
-    except Exception as e:
-        logger.error(f"SMA crossover screen failed: {e}")
 
-    # 2. RSI Mean Reversion
-    logger.info("Running RSI mean-reversion screen...")
-    try:
-        results["rsi_mean_reversion"] = screen_rsi_mean_reversion(df, fees=fees)
-    except Exception as e:
-        logger.error(f"RSI screen failed: {e}")
+def _finite_or_none(value, ndigits: int | None = None) -> float | None:
+    """Summary-safe float: NaN/inf (e.g. Sharpe of a flat equity curve) become None."""
+    value = float(value)
+    if not np.isfinite(value):
+        return None
+    return round(value, ndigits) if ndigits is not None else value
 
-    # 3. Bollinger Breakout
-    logger.info("Running Bollinger breakout screen...")
-    try:
-        results["bollinger_breakout"] = screen_bollinger_breakout(df, fees=fees)
-    except Exception as e:
-        logger.error(f"Bollinger screen failed: {e}")
 
-    # 4. EMA + RSI Combo
-    logger.info("Running EMA+RSI combo screen...")
-    try:
-        results["ema_rsi_combo"] = screen_ema_rsi_combo(df, fees=fees)
-    except Exception as e:
-        logger.error(f"EMA+RSI screen failed: {e}")
+def _save_results(
+    results: dict[str, pd.DataFrame],
+    df: pd.DataFrame,
+    symbol: str,
+    timeframe: str,
+    fees: float,
+    wf_max_workers: int | None = None,
+) -> dict:
+    """Write screen CSVs, walk-forward validation and summary.json.
 
-    # 5. Volatility Breakout
-    logger.info("Running Volatility breakout screen...")
-    try:
-        results["volatility_breakout"] = screen_volatility_breakout(df, fees=fees)
-    except Exception as e:
-        logger.error(f"Volatility breakout screen failed: {e}")
+    ``wf_max_workers`` is passed to :func:`walk_forward_validate`; batch
+    workers use 1 so they do not nest process pools.
 
-    # 6. Relative Strength (equities only, vs SPY benchmark)
-    if asset_class == "equity":
-        logger.info("Running Relative Strength screen (vs SPY)...")
-        try:
-            spy_df = load_ohlcv("SPY/USD", timeframe, "yfinance")
-            if not spy_df.empty:
-                results["relative_strength"] = screen_relative_strength(
-                    df,
-                    spy_df,
-                    fees=fees,
-                )
-            else:
-                logger.warning("SPY benchmark data not available, skipping relative strength")
-        except Exception as e:
-            logger.error(f"Relative strength screen failed: {e}")
+    Returns:
+        The JSON-serializable summary that was written.
 
-    # Save results
+    """
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     safe_symbol = symbol.replace("/", "_")
     output_dir = RESULTS_DIR / f"{safe_symbol}_{timeframe}_{timestamp}"
@@ -724,10 +905,10 @@ def run_full_screen(
             top = df_result.head(3)
             summary[name] = {
                 "total_combos": len(df_result),
-                "top_sharpe": float(top["sharpe_ratio"].iloc[0])
+                "top_sharpe": _finite_or_none(top["sharpe_ratio"].iloc[0])
                 if "sharpe_ratio" in top.columns
                 else None,
-                "top_return": float(top["total_return"].iloc[0])
+                "top_return": _finite_or_none(top["total_return"].iloc[0])
                 if "total_return" in top.columns
                 else None,
             }
@@ -737,15 +918,21 @@ def run_full_screen(
     logger.info("Running walk-forward OOS validation...")
     for name in results:
         try:
-            wf = walk_forward_validate(df, name, n_splits=3, fees=fees)
+            wf = walk_forward_validate(
+                df,
+                name,
+                n_splits=3,
+                fees=fees,
+                max_workers=wf_max_workers,
+            )
             if not wf.empty:
                 wf_path = output_dir / f"{name}_walkforward.csv"
                 wf.to_csv(wf_path, index=False)
                 avg_oos = float(wf["oos_sharpe"].mean())
                 avg_deg = float(wf["degradation_ratio"].mean())
                 wf_summary[name] = {
-                    "avg_oos_sharpe": round(avg_oos, 4),
-                    "avg_degradation": round(avg_deg, 4),
+                    "avg_oos_sharpe": _finite_or_none(avg_oos, 4),
+                    "avg_degradation": _finite_or_none(avg_deg, 4),
                     "robust": avg_oos > 0 and avg_deg > 0.5,
                     "splits": len(wf),
                 }
@@ -760,6 +947,183 @@ def run_full_screen(
 
     logger.info(f"Results saved to {output_dir}")
     logger.info(f"Summary: {json.dumps(summary, indent=2, default=str)}")
+    return summary
+
+
+def run_full_screen(
+    symbol: str = "BTC/USDT",
+    timeframe: str = "1h",
+    exchange: str = "kraken",
+    fees: float | None = None,
+    asset_class: str = "crypto",
+    df: pd.DataFrame | None = None,
+    strategies: list[str] | None = None,
+) -> dict:
+    """Run all strategy screens for a given symbol and return ranked results.
+
+    When asset_class is "equity", also runs a relative strength screen
+    using SPY as benchmark (if data available).
+
+    Args:
+        symbol: Trading pair or ticker.
+        timeframe: Candle timeframe.
+        exchange: Exchange to load data from (ignored for equity/forex).
+        fees: Trading fees; defaults to the asset-class fee.
+        asset_class: "crypto", "equity", or "forex".
+        df: Pre-loaded OHLCV; loaded from the data pipeline when omitted.
+        strategies: Optional subset of screen names to run.
+
+    Returns:
+        Dict of screen name to ranked results DataFrame.
+
+    """
+    if fees is None:
+        fees = _ASSET_CLASS_FEES.get(asset_class, 0.001)
+
+    source = _data_source(asset_class, exchange)
+    logger.info(f"=== Full strategy screen: {symbol} {timeframe} on {source} ({asset_class}) ===")
+
+    if df is None:
+        df = load_ohlcv(symbol, timeframe, source)
+    if df.empty:
+        logger.error(f"No data available for {symbol} {timeframe}. Run data pipeline first.")
+        return {}
+
+    benchmark_df = None
+    if asset_class == "equity":
+        logger.info("Loading SPY benchmark for relative strength screen...")
+        benchmark_df = _load_benchmark(timeframe)
+
+    results = _run_screens(df, fees, strategies, benchmark_df)
+    _save_results(results, df, symbol, timeframe, fees)
+    return results
+
+
+def screen_symbol_task(task: dict) -> dict:
+    """Batch worker entry point: load, screen and summarize one symbol.
+
+    Only the small JSON summary is returned to the parent process; the
+    OHLCV frame, indicators and result frames stay in the worker.
+    """
+    symbol = task["symbol"]
+    try:
+        df = load_ohlcv(symbol, task["timeframe"], task["source"])
+        if df is None or df.empty:
+            return {"symbol": symbol, "status": "skipped", "reason": "no data"}
+
+        logger.info(f"=== Batch screen: {symbol} {task['timeframe']} on {task['source']} ===")
+        results = _run_screens(df, task["fees"], task["strategies"], task["benchmark_df"])
+        summary = _save_results(
+            results,
+            df,
+            symbol,
+            task["timeframe"],
+            task["fees"],
+            wf_max_workers=task.get("wf_max_workers"),
+        )
+        return {"symbol": symbol, "status": "completed", "result": summary}
+    except Exception as e:
+        logger.warning(f"Screen failed for {symbol}: {e}")
+        return {"symbol": symbol, "status": "error", "error": str(e)}
+
+
+def build_screen_tasks(
+    symbols: list[str],
+    timeframe: str = "1h",
+    exchange: str = "kraken",
+    fees: float | None = None,
+    asset_class: str = "crypto",
+    strategies: list[str] | None = None,
+    wf_max_workers: int | None = None,
+) -> list[dict]:
+    """Build one picklable :func:`screen_symbol_task` payload per symbol.
+
+    The SPY benchmark for equity screens is loaded once and shared by
+    every task.
+    """
+    if fees is None:
+        fees = _ASSET_CLASS_FEES.get(asset_class, 0.001)
+    source = _data_source(asset_class, exchange)
+
+    benchmark_df = None
+    if asset_class == "equity":
+        benchmark_df = _load_benchmark(timeframe)
+
+    return [
+        {
+            "symbol": symbol,
+            "timeframe": timeframe,
+            "source": source,
+            "fees": fees,
+            "strategies": strategies,
+            "benchmark_df": benchmark_df,
+            "wf_max_workers": wf_max_workers,
+        }
+        for symbol in symbols
+    ]
+
+
+def run_batch_screen(
+    symbols: list[str],
+    timeframe: str = "1h",
+    exchange: str = "kraken",
+    fees: float | None = None,
+    asset_class: str = "crypto",
+    strategies: list[str] | None = None,
+    max_workers: int | None = None,
+) -> list[dict]:
+    """Screen a list of symbols in parallel worker processes.
+
+    Each symbol is loaded once in its worker, its indicators are computed
+    once and shared by every screen, and only the JSON summary is sent
+    back. At most ``max_workers`` symbols are in memory at a time, and
+    workers are recycled every ``MAX_SYMBOLS_PER_WORKER`` symbols. The
+    SPY benchmark for equity screens is loaded once and shared.
+
+    Args:
+        symbols: Symbols to screen.
+        timeframe: Candle timeframe.
+        exchange: Exchange to load data from (ignored for equity/forex).
+        fees: Trading fees; defaults to the asset-class fee.
+        asset_class: "crypto", "equity", or "forex".
+        strategies: Optional subset of screen names to run.
+        max_workers: Worker processes; defaults to one per CPU. ``1`` screens
+            in-process.
+
+    Returns:
+        One dict per symbol, in input order, with ``symbol``, ``status``
+        ("completed", "skipped" or "error") and ``result``, ``reason`` or
+        ``error``.
+
+    """
+    tasks = build_screen_tasks(symbols, timeframe, exchange, fees, asset_class, strategies)
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = max(1, min(max_workers, len(tasks)))
+
+    logger.info(
+        f"Batch screen: {len(tasks)} symbols ({asset_class} {timeframe}) "
+        f"on {max_workers} worker(s)",
+    )
+    if max_workers == 1:
+        return [screen_symbol_task(task) for task in tasks]
+
+    for task in tasks:
+        task["wf_max_workers"] = 1
+
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        max_tasks_per_child=MAX_SYMBOLS_PER_WORKER,
+    ) as pool:
+        futures = [pool.submit(screen_symbol_task, task) for task in tasks]
+        results = []
+        for task, future in zip(tasks, futures, strict=True):
+            try:
+                results.append(future.result())
+            except Exception as e:
+                logger.error(f"Screen worker for {task['symbol']} crashed: {e}")
+                results.append({"symbol": task["symbol"], "status": "error", "error": str(e)})
     return results
 
 
@@ -788,6 +1152,12 @@ if __name__ == "__main__":  # pragma: no cover
         help="Run walk-forward OOS validation for a single strategy instead of full screen",
     )
     parser.add_argument("--splits", type=int, default=3, help="Number of walk-forward splits")
+    parser.add_argument(
+        "--symbols",
+        nargs="+",
+        help="Screen several symbols in parallel (overrides --symbol)",
+    )
+    parser.add_argument("--workers", type=int, default=None, help="Batch worker processes")
 
     args = parser.parse_args()
     fees = args.fees if args.fees is not None else _ASSET_CLASS_FEES.get(args.asset_class, 0.001)
@@ -808,5 +1178,16 @@ if __name__ == "__main__":  # pragma: no cover
             )
             if not wf.empty:
                 print(wf.to_string(index=False))
+    elif args.symbols:
+        batch = run_batch_screen(
+            args.symbols,
+            args.timeframe,
+            args.exchange,
+            fees,
+            args.asset_class,
+            max_workers=args.workers,
+        )
+        for entry in batch:
+            print(f"{entry['symbol']}: {entry['status']}")
     else:
         run_full_screen(args.symbol, args.timeframe, args.exchange, fees, args.asset_class)
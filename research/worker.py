@@ -4,22 +4,34 @@ Runs inside the VectorBT Docker container. The Django backend calls
 this service to run parameter sweeps and screening without needing
 vectorbt installed in the main backend image.
 
+Screens run as background jobs in a bounded process pool, so a long
+batch never blocks ``/health`` or other requests. POST endpoints return
+202 with a job id; poll ``/jobs/{id}`` or stream ``/jobs/{id}/events``
+(server-sent events, one ``result`` event per symbol). Send
+``"wait": true`` to get the finished result in the response instead.
+
 Endpoints:
     GET  /health              — Liveness/readiness probe
     GET  /strategies          — List available screening strategies
     POST /screen              — Run screening on a single symbol
     POST /screen/batch        — Run screening across watchlist symbols
+    GET  /jobs/{id}           — Job status, progress and results so far
+    GET  /jobs/{id}/events    — Job progress as server-sent events
 """
 
+import asyncio
 import logging
-import traceback
+import os
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 
 from starlette.applications import Starlette
 from starlette.requests import Request
-from starlette.responses import JSONResponse
+from starlette.responses import JSONResponse, StreamingResponse
 from starlette.routing import Route
 
+from common.jobs import Job, JobManager, JobQueueFullError
+
 logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s %(message)s")
 logger = logging.getLogger("research.worker")
 
@@ -33,6 +45,19 @@ except ImportError:
     HAS_VBT = False
     VBT_VERSION = "not installed"
 
+# Process pool size for screening jobs (0 = one worker per CPU)
+SCREEN_MAX_WORKERS = int(os.environ.get("SCREEN_MAX_WORKERS", "0")) or None
+# Symbols queued or running across all jobs before new jobs get a 429
+SCREEN_MAX_QUEUE = int(os.environ.get("SCREEN_MAX_QUEUE", "64"))
+# Symbols a pool process screens before it is replaced (frees pandas/numba memory)
+SCREEN_TASKS_PER_CHILD = int(os.environ.get("SCREEN_TASKS_PER_CHILD", "4"))
+
+jobs = JobManager(
+    max_workers=SCREEN_MAX_WORKERS,
+    max_queue=SCREEN_MAX_QUEUE,
+    max_tasks_per_child=SCREEN_TASKS_PER_CHILD,
+)
+
 STRATEGY_TYPES = [
     {"name": "sma_crossover", "label": "SMA Crossover", "combos": 171},
     {"name": "rsi_mean_reversion", "label": "RSI Mean Reversion", "combos": 64},
@@ -49,6 +74,7 @@ async def health(request: Request) -> JSONResponse:
         "service": "vectorbt-worker",
         "vectorbt_available": HAS_VBT,
         "vectorbt_version": VBT_VERSION,
+        "jobs": jobs.stats(),
         "timestamp": datetime.now(timezone.utc).isoformat(),
     })
 
@@ -58,6 +84,28 @@ async def list_strategies(request: Request) -> JSONResponse:
     return JSONResponse({"strategies": STRATEGY_TYPES, "count": len(STRATEGY_TYPES)})
 
 
+def _screen_task_error(task: dict, exc: BaseException) -> dict:
+    return {"symbol": task["symbol"], "status": "error", "error": str(exc)}
+
+
+def _submit(kind: str, tasks: list[dict], meta: dict) -> Job | JSONResponse:
+    from research.scripts.vbt_screener import screen_symbol_task
+
+    try:
+        return jobs.submit(kind, screen_symbol_task, tasks, meta, on_error=_screen_task_error)
+    except JobQueueFullError as e:
+        return JSONResponse({"status": "error", "error": str(e)}, status_code=429)
+
+
+def _accepted(job: Job) -> JSONResponse:
+    return JSONResponse({
+        "job_id": job.id,
+        "status": job.status,
+        "status_url": f"/jobs/{job.id}",
+        "events_url": f"/jobs/{job.id}/events",
+    }, status_code=202)
+
+
 async def run_screen(request: Request) -> JSONResponse:
     """Run VectorBT screening on a single symbol.
 
@@ -67,6 +115,7 @@ async def run_screen(request: Request) -> JSONResponse:
         exchange: str       — Exchange (default: "kraken")
         asset_class: str    — "crypto", "equity", or "forex"
         strategies: list    — Optional subset of strategy names
+        wait: bool          — Return the finished result instead of a job id
     """
     try:
         body = await request.json()
@@ -83,44 +132,57 @@ async def run_screen(request: Request) -> JSONResponse:
             status_code=503,
         )
 
-    try:
-        from research.scripts.vbt_screener import run_full_screen
-        from common.data_pipeline.pipeline import load_ohlcv
-
-        timeframe = body.get("timeframe", "1h")
-        exchange = body.get("exchange", "kraken")
-        asset_class = body.get("asset_class", "crypto")
-
-        if asset_class in ("equity", "forex"):
-            exchange = "yfinance"
-
-        df = load_ohlcv(symbol, timeframe, exchange)
-        if df is None or df.empty:
-            return JSONResponse({
-                "status": "error",
-                "error": f"No data available for {symbol} {timeframe} on {exchange}",
-            }, status_code=404)
-
-        result = run_full_screen(
-            df=df,
-            symbol=symbol,
-            timeframe=timeframe,
-            strategies=body.get("strategies"),
-        )
+    from research.scripts.vbt_screener import build_screen_tasks
 
+    timeframe = body.get("timeframe", "1h")
+    exchange = body.get("exchange", "kraken")
+    asset_class = body.get("asset_class", "crypto")
+
+    if asset_class in ("equity", "forex"):
+        exchange = "yfinance"
+
+    tasks = await asyncio.to_thread(
+        build_screen_tasks,
+        [symbol],
+        timeframe=timeframe,
+        exchange=exchange,
+        asset_class=asset_class,
+        strategies=body.get("strategies"),
+        wf_max_workers=1,
+    )
+    meta = {"symbol": symbol, "timeframe": timeframe, "exchange": exchange}
+    job = _submit("screen", tasks, meta)
+    if isinstance(job, JSONResponse):
+        return job
+    if not body.get("wait"):
+        return _accepted(job)
+
+    await jobs.wait(job)
+    [entry] = job.finished_results
+    if entry["status"] == "skipped":
         return JSONResponse({
-            "status": "completed",
-            "symbol": symbol,
-            "timeframe": timeframe,
-            "exchange": exchange,
-            "result": result,
-        })
-    except Exception as e:
-        logger.error("Screen failed for %s: %s\n%s", symbol, e, traceback.format_exc())
-        return JSONResponse(
-            {"status": "error", "error": str(e)},
-            status_code=500,
-        )
+            "status": "error",
+            "error": f"No data available for {symbol} {timeframe} on {exchange}",
+        }, status_code=404)
+    if entry["status"] == "error":
+        logger.error("Screen failed for %s: %s", symbol, entry["error"])
+        return JSONResponse({"status": "error", "error": entry["error"]}, status_code=500)
+
+    return JSONResponse({
+        "status": "completed",
+        "symbol": symbol,
+        "timeframe": timeframe,
+        "exchange": exchange,
+        "result": entry["result"],
+    })
+
+
+def _batch_summary(results: list[dict]) -> dict:
+    return {
+        "symbols_screened": len(results),
+        "completed": sum(1 for r in results if r["status"] == "completed"),
+        "errors": sum(1 for r in results if r["status"] == "error"),
+    }
 
 
 async def run_screen_batch(request: Request) -> JSONResponse:
@@ -132,6 +194,7 @@ async def run_screen_batch(request: Request) -> JSONResponse:
         timeframe: str      — Timeframe (default: "1h")
         exchange: str       — Exchange (default: "kraken")
         strategies: list    — Optional subset of strategy names
+        wait: bool          — Return the finished results instead of a job id
     """
     try:
         body = await request.json()
@@ -160,46 +223,72 @@ async def run_screen_batch(request: Request) -> JSONResponse:
         except Exception:
             symbols = ["BTC/USDT"] if asset_class == "crypto" else ["AAPL/USD"]
 
-    from research.scripts.vbt_screener import run_full_screen
-    from common.data_pipeline.pipeline import load_ohlcv
-
-    results = []
-    for symbol in symbols:
-        try:
-            df = load_ohlcv(symbol, timeframe, exchange)
-            if df is None or df.empty:
-                results.append({"symbol": symbol, "status": "skipped", "reason": "no data"})
-                continue
-
-            result = run_full_screen(
-                df=df,
-                symbol=symbol,
-                timeframe=timeframe,
-                strategies=body.get("strategies"),
-            )
-            results.append({"symbol": symbol, "status": "completed", "result": result})
-        except Exception as e:
-            logger.warning("Screen failed for %s: %s", symbol, e)
-            results.append({"symbol": symbol, "status": "error", "error": str(e)})
-
-    completed = sum(1 for r in results if r["status"] == "completed")
+    from research.scripts.vbt_screener import build_screen_tasks
+
+    tasks = await asyncio.to_thread(
+        build_screen_tasks,
+        symbols,
+        timeframe=timeframe,
+        exchange=exchange,
+        asset_class=asset_class,
+        strategies=body.get("strategies"),
+        wf_max_workers=1,
+    )
+    meta = {"framework": "vectorbt", "asset_class": asset_class, "timeframe": timeframe}
+    job = _submit("screen_batch", tasks, meta)
+    if isinstance(job, JSONResponse):
+        return job
+    if not body.get("wait"):
+        return _accepted(job)
+
+    await jobs.wait(job)
+    results = job.finished_results
     return JSONResponse({
         "status": "completed",
         "framework": "vectorbt",
         "asset_class": asset_class,
-        "symbols_screened": len(results),
-        "completed": completed,
-        "errors": sum(1 for r in results if r["status"] == "error"),
+        **_batch_summary(results),
         "results": results,
     })
 
 
+async def get_job(request: Request) -> JSONResponse:
+    """Job status, progress and the results of finished symbols."""
+    job = jobs.get(request.path_params["job_id"])
+    if job is None:
+        return JSONResponse({"error": "job not found"}, status_code=404)
+    data = job.to_dict()
+    if job.kind == "screen_batch":
+        data.update(_batch_summary(data["results"]))
+    return JSONResponse(data)
+
+
+async def job_events(request: Request) -> StreamingResponse | JSONResponse:
+    """Stream a job's per-symbol results as server-sent events."""
+    job = jobs.get(request.path_params["job_id"])
+    if job is None:
+        return JSONResponse({"error": "job not found"}, status_code=404)
+    return StreamingResponse(
+        jobs.event_stream(job),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
+    )
+
+
+@asynccontextmanager
+async def lifespan(app: Starlette):
+    yield
+    jobs.shutdown()
+
+
 routes = [
     Route("/health", health),
     Route("/strategies", list_strategies),
     Route("/screen", run_screen, methods=["POST"]),
     Route("/screen/batch", run_screen_batch, methods=["POST"]),
+    Route("/jobs/{job_id}", get_job),
+    Route("/jobs/{job_id}/events", job_events),
 ]
 
-app = Starlette(routes=routes)
+app = Starlette(routes=routes, lifespan=lifespan)
 """ASGI app — run with: uvicorn research.worker:app --host 0.0.0.0 --port 4092"""
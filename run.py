@@ -411,8 +411,8 @@ def cmd_nautilus(args):
             print("❌ NautilusTrader not available (pip install nautilus_trader)")
 
     elif args.nt_command == "convert":
-        from nautilus.nautilus_runner import convert_ohlcv_to_nautilus_csv
-        path = convert_ohlcv_to_nautilus_csv(args.symbol, args.timeframe, args.exchange)
+        from nautilus.nautilus_runner import convert_ohlcv_to_nautilus_catalog
+        path = convert_ohlcv_to_nautilus_catalog(args.symbol, args.timeframe, args.exchange)
         if path:
             print(f"✅ Data converted: {path}")
 